@@ -0,0 +1,288 @@
+"""Per-year snapshots of the meeting archive, refreshed incrementally.
+
+An academic year's agendas and minutes stop changing once the year is over
+and its last minutes are approved, yet reading the archive in full costs two
+requests per year. Each year read is therefore stored as a snapshot, and a run
+reads again only the years that can still change: those still live, those
+with no snapshot, and those whose snapshot is older than a threshold, which
+catches the rare late correction to a closed year.
+
+Snapshots are decoded like any other payload crossing an I/O boundary. A
+snapshot that does not match the expected shape is an error rather than
+something to refetch quietly; a full rebuild replaces it. The one exception
+is a snapshot stored under an earlier ``SNAPSHOT_FORMAT``, which is known to
+be outdated rather than damaged and is simply read again.
+"""
+
+import hashlib
+import json
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import TypedDict
+
+from .client import ARCHIVE_YEARS, Fetcher, fetch_archive_years
+from .models import (
+    SNAPSHOT_FORMAT,
+    AsuciDecodeError,
+    MeetingLinks,
+    YearArchive,
+    YearSnapshot,
+    assemble_meeting_links,
+    decode_year_snapshot,
+    encode_year_snapshot,
+    require_object,
+)
+from .parse import academic_year_param
+
+# Month and day, in a year's closing calendar year, after which the year is
+# treated as settled. Minutes for the last spring meetings are approved over
+# the summer, so a year stays live until autumn term begins.
+SETTLED_AFTER = (9, 30)
+
+# Age after which even a settled year's snapshot is read again.
+DEFAULT_MAX_AGE = timedelta(days=30)
+
+
+class ArchiveRefresh(TypedDict):
+    """The outcome of an incremental archive read.
+
+    links: Agendas and minutes for every requested year.
+    archives: Each requested year's archive, in the order requested.
+    refreshed: Years read from upstream this run, newest first.
+    changed: Refreshed years whose upstream payload differed from the snapshot.
+    reused: Years served from their snapshot without a request.
+    """
+
+    links: MeetingLinks
+    archives: list[YearArchive]
+    refreshed: list[str]
+    changed: list[str]
+    reused: list[str]
+
+
+def is_live(year_label: str, today: date) -> bool:
+    """Decide whether an academic year's documents can still change.
+
+    Args:
+        year_label: Label such as "24-25".
+        today: The date to measure from.
+
+    Returns:
+        True until the settling date in the year's closing calendar year.
+
+    Raises:
+        ValueError: If the label is not two two-digit years separated by a dash.
+    """
+    closing_year = int(academic_year_param(year_label)[4:])
+    month, day = SETTLED_AFTER
+    return today <= date(closing_year, month, day)
+
+
+def snapshot_path(directory: Path, year_label: str) -> Path:
+    """Locate the snapshot file for a year.
+
+    Args:
+        directory: Directory holding the snapshots.
+        year_label: Academic year label.
+
+    Returns:
+        The snapshot's path.
+    """
+    return directory / f"{year_label}.json"
+
+
+def load_snapshot(directory: Path, year_label: str) -> YearSnapshot | None:
+    """Read a year's snapshot.
+
+    Args:
+        directory: Directory holding the snapshots.
+        year_label: Academic year label.
+
+    Returns:
+        The snapshot, or None when the year has none or it was stored under
+        another format.
+
+    Raises:
+        AsuciDecodeError: If the file is not JSON, does not match the expected
+            shape, or holds a different year.
+    """
+    path = snapshot_path(directory, year_label)
+    if not path.is_file():
+        return None
+
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as error:
+        raise AsuciDecodeError(f"snapshot {path} is not JSON: {error}") from error
+
+    if require_object(payload, f"snapshot {path}").get("format") != SNAPSHOT_FORMAT:
+        return None
+
+    snapshot = decode_year_snapshot(payload)
+    if snapshot["year"] != year_label:
+        raise AsuciDecodeError(f"snapshot {path} holds year {snapshot['year']!r}, expected {year_label!r}")
+    return snapshot
+
+
+def save_snapshot(directory: Path, snapshot: YearSnapshot) -> None:
+    """Write a year's snapshot, replacing any earlier one atomically.
+
+    Args:
+        directory: Directory holding the snapshots; created if absent.
+        snapshot: Snapshot to write.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    path = snapshot_path(directory, snapshot["year"])
+    staging = path.with_suffix(".tmp")
+    staging.write_text(
+        json.dumps(encode_year_snapshot(snapshot), ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+    os.replace(staging, path)
+
+
+def needs_refresh(year_label: str, snapshot: YearSnapshot | None, now: datetime, max_age: timedelta) -> bool:
+    """Decide whether a year must be read from upstream.
+
+    Args:
+        year_label: Academic year label.
+        snapshot: The year's stored snapshot, if any.
+        now: The current time, timezone-aware.
+        max_age: Age beyond which a settled year's snapshot is read again.
+
+    Returns:
+        True if the year is live, has no snapshot, or its snapshot is too old.
+
+    Raises:
+        AsuciDecodeError: If the snapshot's timestamp is not ISO 8601 with an
+            offset.
+    """
+    if snapshot is None or is_live(year_label, now.date()):
+        return True
+
+    try:
+        fetched_at = datetime.fromisoformat(snapshot["fetched_at"])
+    except ValueError as error:
+        raise AsuciDecodeError(
+            f"snapshot {year_label}: 'fetched_at' must be an ISO timestamp, got {snapshot['fetched_at']!r}"
+        ) from error
+    if fetched_at.tzinfo is None:
+        raise AsuciDecodeError(f"snapshot {year_label}: 'fetched_at' must carry a UTC offset")
+
+    return now - fetched_at >= max_age
+
+
+def refresh_archive(
+    fetcher: Fetcher,
+    directory: Path,
+    now: datetime,
+    years: tuple[str, ...] = ARCHIVE_YEARS,
+    max_age: timedelta = DEFAULT_MAX_AGE,
+    full: bool = False,
+    workers: int = 1,
+) -> ArchiveRefresh:
+    """Read the archive, refetching only the years that can have changed.
+
+    Every refetched year's snapshot is rewritten, so its age restarts. Nothing
+    is written unless every request succeeds.
+
+    Args:
+        fetcher: Transport used to retrieve the views.
+        directory: Directory holding the snapshots.
+        now: The current time, timezone-aware.
+        years: Academic year labels to read, newest first.
+        max_age: Age beyond which a settled year's snapshot is read again.
+        full: Refetch every year without reading the stored snapshots, which
+            also replaces any that are damaged.
+        workers: Maximum requests in flight at once.
+
+    Returns:
+        The assembled links and which years were refreshed or reused.
+
+    Raises:
+        AsuciFetchError: If a request fails.
+        AsuciDecodeError: If a response or a stored snapshot does not match
+            the expected shape.
+        ValueError: If ``now`` is naive, or ``workers`` is below one.
+    """
+    if now.tzinfo is None:
+        raise ValueError("now must be timezone-aware")
+
+    snapshots: dict[str, YearSnapshot | None] = {
+        year: None if full else load_snapshot(directory, year) for year in years
+    }
+    stale = tuple(year for year in years if full or needs_refresh(year, snapshots[year], now, max_age))
+    current: dict[str, YearArchive] = {
+        year: snapshot for year, snapshot in snapshots.items() if snapshot is not None
+    }
+
+    changed: list[str] = []
+    for archive in fetch_archive_years(fetcher, stale, workers):
+        year = archive["year"]
+        previous = snapshots[year]
+        if previous is None or previous["payload_hash"] != archive["payload_hash"]:
+            changed.append(year)
+        snapshot = YearSnapshot(
+            year=year,
+            agendas=archive["agendas"],
+            minutes=archive["minutes"],
+            payload_hash=archive["payload_hash"],
+            fetched_at=now.isoformat(),
+        )
+        save_snapshot(directory, snapshot)
+        current[year] = snapshot
+
+    archives = [current[year] for year in years]
+    return ArchiveRefresh(
+        links=assemble_meeting_links(archives),
+        archives=archives,
+        refreshed=list(stale),
+        changed=changed,
+        reused=[year for year in years if year not in stale],
+    )
+
+
+def archive_fingerprint(
+    fetcher: Fetcher,
+    directory: Path,
+    now: datetime,
+    years: tuple[str, ...] = ARCHIVE_YEARS,
+    max_age: timedelta = DEFAULT_MAX_AGE,
+    workers: int = 1,
+) -> str:
+    """Hash the archive as the next refresh would read it, without writing.
+
+    The years a refresh would read are requested, through whatever cache the
+    fetcher keeps; the rest are taken from their snapshots. Nothing is
+    stored, so a refresh that follows still sees every change.
+
+    Args:
+        fetcher: Transport used to retrieve the views.
+        directory: Directory holding the snapshots.
+        now: The current time, timezone-aware.
+        years: Academic year labels to read, newest first.
+        max_age: Age beyond which a settled year's snapshot is read again.
+        workers: Maximum requests in flight at once.
+
+    Returns:
+        The hex SHA-256 over each year's label and payload hash.
+
+    Raises:
+        AsuciFetchError: If a request fails.
+        AsuciDecodeError: If a response or a stored snapshot does not match
+            the expected shape.
+        ValueError: If ``now`` is naive, or ``workers`` is below one.
+    """
+    if now.tzinfo is None:
+        raise ValueError("now must be timezone-aware")
+
+    snapshots = {year: load_snapshot(directory, year) for year in years}
+    stale = tuple(year for year in years if needs_refresh(year, snapshots[year], now, max_age))
+    payload_hashes = {
+        year: snapshot["payload_hash"] for year, snapshot in snapshots.items() if snapshot is not None
+    }
+    for archive in fetch_archive_years(fetcher, stale, workers):
+        payload_hashes[archive["year"]] = archive["payload_hash"]
+
+    canonical = json.dumps([[year, payload_hashes[year]] for year in years], separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
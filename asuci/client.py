@@ -7,19 +7,29 @@ them directly instead of driving a browser: no page lifecycle, no selector
 waits, no dependence on how quickly a third party's scripts settle.
 
 Fetching sits behind the ``Fetcher`` protocol. Production passes the requests
-implementation; tests pass one that serves captured payloads, so the decoding
-and parsing paths run for real without touching the network.
+implementation, optionally behind an on-disk revalidation cache and a metrics
+recorder; tests pass one that serves captured payloads, so the decoding and
+parsing paths run for real without touching the network.
 """
 
+import hashlib
 import json
 import ssl
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
-from typing import Protocol
+from typing import Literal, Protocol, TypedDict
 
 import certifi
 import requests
-from requests.adapters import DEFAULT_POOLBLOCK, HTTPAdapter
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from shared.utils.http_cache import ResponseCache, cache_key, conditional_headers
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
+from .metrics import MetricsRecorder, RequestRecord, note_connect, note_response, probe
 from .models import (
     AGENDA_VIEW_ID,
     AGENDA_VIEW_SLUG,
@@ -29,6 +39,8 @@ from .models import (
     MeetingLink,
     MeetingLinks,
     SenateRoster,
+    YearArchive,
+    assemble_meeting_links,
     decode_view_response,
 )
 from .parse import academic_year_param, parse_meeting_links, parse_roster
@@ -63,6 +75,12 @@ BROWSER_HEADERS = {
 # Seconds to wait for a response before giving up on a request.
 REQUEST_TIMEOUT = 30
 
+# Requests kept in flight at once when reading the archive: one per view per
+# year, so a full read costs about one round-trip instead of one per request.
+# The production session keeps this many connections per host so none of them
+# is discarded on return to the pool.
+FETCH_WORKERS = 2 * len(ARCHIVE_YEARS)
+
 # How much of an unexpected body to quote when decoding fails.
 BODY_SNIPPET_CHARS = 200
 
@@ -94,6 +112,21 @@ class Fetcher(Protocol):
         ...
 
 
+class RevalidatedResponse(TypedDict):
+    """The outcome of a request that may have carried cache validators.
+
+    status: 200 with a new body, or 304 when the cached body is still current.
+    text: The body; empty on 304.
+    etag: ``ETag`` the server sent, empty when it sent none.
+    last_modified: ``Last-Modified`` the server sent, empty when it sent none.
+    """
+
+    status: int
+    text: str
+    etag: str
+    last_modified: str
+
+
 class RequestsFetcher:
     """Fetcher backed by a requests session."""
 
@@ -105,41 +138,284 @@ class RequestsFetcher:
         """
         self._session = session
 
-    def get_text(self, url: str, params: dict[str, str]) -> str:
-        """Fetch a URL and return its decoded body.
+    def _get(self, url: str, params: dict[str, str], headers: dict[str, str]) -> requests.Response:
+        """Send a GET request, translating transport failures.
 
         Args:
             url: Absolute URL to request.
             params: Query parameters to append.
+            headers: Headers to add to the session defaults.
 
         Returns:
-            The response body.
+            The response, whatever its status.
 
         Raises:
-            AsuciFetchError: If the request fails or the status is not success.
+            AsuciFetchError: If the request fails.
         """
         try:
-            response = self._session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+            response = self._session.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
         except requests.RequestException as error:
             raise AsuciFetchError(f"GET {url} failed: {error}") from error
 
+        note_response(response.status_code, len(response.content))
+        return response
+
+    def get_text(self, url: str, params: dict[str, str]) -> str:
+        """Fetch a URL and return its decoded body.
+
+        Args:
+            url: Absolute URL to request.
+            params: Query parameters to append.
+
+        Returns:
+            The response body.
+
+        Raises:
+            AsuciFetchError: If the request fails or the status is not success.
+        """
+        response = self._get(url, params, {})
         if response.status_code != 200:
             raise AsuciFetchError(f"GET {url} returned HTTP {response.status_code}")
 
         return response.text
 
+    def get_revalidated(
+        self, url: str, params: dict[str, str], headers: dict[str, str]
+    ) -> RevalidatedResponse:
+        """Fetch a URL conditionally, accepting 304 as well as success.
+
+        Args:
+            url: Absolute URL to request.
+            params: Query parameters to append.
+            headers: Conditional headers, e.g. ``If-None-Match``.
+
+        Returns:
+            The status, body, and whichever validators the server sent.
+
+        Raises:
+            AsuciFetchError: If the request fails or the status is neither
+                success nor not-modified.
+        """
+        response = self._get(url, params, headers)
+        if response.status_code not in (200, 304):
+            raise AsuciFetchError(f"GET {url} returned HTTP {response.status_code}")
+
+        return RevalidatedResponse(
+            status=response.status_code,
+            text=response.text if response.status_code == 200 else "",
+            etag=response.headers.get("ETag", ""),
+            last_modified=response.headers.get("Last-Modified", ""),
+        )
+
+
+class CachingFetcher:
+    """Fetcher that keeps bodies on disk and revalidates them with the server.
+
+    A cached body whose server sent validators is re-requested conditionally
+    and served from disk on 304. One without validators is served from disk
+    while younger than the cache's max age, and refetched after.
+    """
+
+    def __init__(self, inner: RequestsFetcher, cache: ResponseCache) -> None:
+        """Wrap a fetcher with a cache.
+
+        Args:
+            inner: Fetcher that performs the requests.
+            cache: Store holding bodies and their validators.
+        """
+        self._inner = inner
+        self._cache = cache
+        self._lock = threading.Lock()
+        self.outcomes: dict[str, int] = {"fresh": 0, "revalidated": 0, "fetched": 0}
+
+    def _count(self, outcome: str) -> None:
+        """Tally how a request was answered.
+
+        Args:
+            outcome: "fresh", "revalidated" or "fetched".
+        """
+        with self._lock:
+            self.outcomes[outcome] += 1
+
+    def get_text(self, url: str, params: dict[str, str]) -> str:
+        """Fetch a URL through the cache and return its decoded body.
+
+        Args:
+            url: Absolute URL to request.
+            params: Query parameters to append.
+
+        Returns:
+            The response body, from disk when the server confirms it current.
+
+        Raises:
+            AsuciFetchError: If the request fails, the status is neither
+                success nor not-modified, or the server answers 304 to a
+                request that carried no validators.
+        """
+        key = cache_key(url, params)
+        entry = self._cache.lookup(key)
+
+        if entry is not None and self._cache.is_fresh(entry):
+            self._count("fresh")
+            return entry["body"]
+
+        headers = conditional_headers(entry) if entry is not None else {}
+        response = self._inner.get_revalidated(url, params, headers)
+
+        if response["status"] == 304:
+            if entry is None:
+                raise AsuciFetchError(f"GET {url} returned HTTP 304 with nothing cached")
+            self._cache.store(
+                key,
+                url,
+                entry["body"],
+                response["etag"] or entry["etag"],
+                response["last_modified"] or entry["last_modified"],
+            )
+            self._count("revalidated")
+            return entry["body"]
+
+        self._cache.store(key, url, response["text"], response["etag"], response["last_modified"])
+        self._count("fetched")
+        return response["text"]
+
+
+class InstrumentedFetcher:
+    """Fetcher that records every request it passes to another fetcher.
+
+    Each call is timed and recorded with whatever the transport beneath noted
+    about it: status, body size, and connections opened. Fetchers that note
+    nothing, such as those serving captured payloads, are recorded with the
+    size of the body they returned and no connection.
+    """
+
+    def __init__(self, inner: Fetcher, recorder: MetricsRecorder) -> None:
+        """Wrap a fetcher with a recorder.
+
+        Args:
+            inner: Fetcher that answers the requests.
+            recorder: Where the records go.
+        """
+        self.inner = inner
+        self.recorder = recorder
+
+    def get_text(self, url: str, params: dict[str, str]) -> str:
+        """Fetch a URL through the wrapped fetcher, recording the request.
+
+        Args:
+            url: Absolute URL to request.
+            params: Query parameters to append.
+
+        Returns:
+            The response body.
+
+        Raises:
+            AsuciFetchError: If the wrapped fetcher raises it; the failure is
+                recorded first.
+        """
+        clock = self.recorder.clock
+        with probe() as notes:
+            started = clock()
+            try:
+                body = self.inner.get_text(url, params)
+            except AsuciFetchError as error:
+                self.recorder.record_request(
+                    RequestRecord(
+                        endpoint=url,
+                        seconds=clock() - started,
+                        bytes=notes.received_bytes,
+                        status=notes.status,
+                        connection=_connection_kind(notes.status, notes.connections_opened),
+                        connect_seconds=notes.connect_seconds,
+                        error=str(error),
+                    )
+                )
+                raise
+            seconds = clock() - started
+
+        self.recorder.record_request(
+            RequestRecord(
+                endpoint=url,
+                seconds=seconds,
+                bytes=notes.received_bytes if notes.status is not None else len(body.encode("utf-8")),
+                status=notes.status,
+                connection=_connection_kind(notes.status, notes.connections_opened),
+                connect_seconds=notes.connect_seconds,
+                error="",
+            )
+        )
+        return body
+
+
+def _connection_kind(status: int | None, opened: int) -> Literal["new", "reused", "none"]:
+    """Classify how a request reached the server.
+
+    Args:
+        status: Status received, or None if no response arrived.
+        opened: Connections opened while serving the request.
+
+    Returns:
+        "new" if a connection was opened, "reused" if a response arrived over
+        a pooled one, otherwise "none".
+    """
+    if opened:
+        return "new"
+    if status is not None:
+        return "reused"
+    return "none"
+
+
+class TrackingHTTPConnection(HTTPConnection):
+    """HTTP connection that notes when it opens and how long that takes."""
+
+    def connect(self) -> None:
+        """Open the connection, noting it against the request in progress."""
+        started = time.perf_counter()
+        super().connect()
+        note_connect(time.perf_counter() - started)
+
+
+class TrackingHTTPSConnection(TrackingHTTPConnection, HTTPSConnection):
+    """HTTPS connection that notes when it opens, handshake included.
+
+    The tracking ``connect`` comes first in the method order and hands on to
+    the HTTPS one, so the time noted covers the TLS handshake.
+    """
+
+
+class TrackingHTTPConnectionPool(HTTPConnectionPool):
+    """HTTP pool whose new connections are tracked."""
+
+    ConnectionCls = TrackingHTTPConnection
+
+
+class TrackingHTTPSConnectionPool(HTTPSConnectionPool):
+    """HTTPS pool whose new connections are tracked."""
+
+    ConnectionCls = TrackingHTTPSConnection
+
 
 class ChainCompletingAdapter(HTTPAdapter):
     """Transport adapter that verifies against certifi plus the extra chain cert."""
 
-    def __init__(self, context: ssl.SSLContext) -> None:
+    def __init__(
+        self,
+        context: ssl.SSLContext,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        track_connections: bool = False,
+    ) -> None:
         """Store the context every connection from this adapter will use.
 
         Args:
             context: Verification context to apply.
+            pool_maxsize: Maximum connections to keep per host.
+            track_connections: Build connections that note each time one is
+                opened, for metrics. Off by default, so no production
+                connection pays for it unless metrics are enabled.
         """
         self._context = context
-        super().__init__()
+        self._track_connections = track_connections
+        super().__init__(pool_maxsize=pool_maxsize)
 
     def init_poolmanager(
         self,
@@ -160,6 +436,11 @@ class ChainCompletingAdapter(HTTPAdapter):
         """
         pool_kwargs["ssl_context"] = self._context
         super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        if self._track_connections:
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": TrackingHTTPConnectionPool,
+                "https": TrackingHTTPSConnectionPool,
+            }
 
 
 def create_ssl_context(extra_cert: Path = CHAIN_COMPLETION_CERT) -> ssl.SSLContext:
@@ -186,17 +467,74 @@ def create_ssl_context(extra_cert: Path = CHAIN_COMPLETION_CERT) -> ssl.SSLConte
     return context
 
 
-def create_fetcher() -> RequestsFetcher:
-    """Build the production fetcher.
+def create_session(pool_size: int = FETCH_WORKERS, track_connections: bool = False) -> requests.Session:
+    """Build a session for the ASUCI hosts.
+
+    Args:
+        pool_size: Connections to keep per host, at least the number of
+            requests that will be in flight at once.
+        track_connections: Note each new connection for the metrics probe.
 
     Returns:
-        A fetcher over a session sending browser-like headers and verifying
-        against certifi plus the chain-completion certificate.
+        A session sending browser-like headers and verifying against certifi
+        plus the chain-completion certificate.
     """
     session = requests.Session()
     session.headers.update(BROWSER_HEADERS)
-    session.mount("https://", ChainCompletingAdapter(create_ssl_context()))
-    return RequestsFetcher(session)
+    adapter = ChainCompletingAdapter(
+        create_ssl_context(), pool_maxsize=pool_size, track_connections=track_connections
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Sessions built once per process, keyed by create_session's arguments.
+_cached_session = cache(create_session)
+
+
+def shared_session(pool_size: int = FETCH_WORKERS, track_connections: bool = False) -> requests.Session:
+    """Return the process's session for the ASUCI hosts, building it once.
+
+    When several runs share one interpreter, such as a probe followed by the
+    build it gates, the later ones reuse the connections, and the TLS
+    handshakes, the earlier ones opened.
+
+    Args:
+        pool_size: Connections to keep per host.
+        track_connections: Note each new connection for the metrics probe.
+
+    Returns:
+        The session built by ``create_session`` for these arguments.
+    """
+    # Passed positionally, so every spelling of a call shares one cache entry.
+    return _cached_session(pool_size, track_connections)
+
+
+def create_fetcher(
+    pool_size: int = FETCH_WORKERS,
+    cache: ResponseCache | None = None,
+    recorder: MetricsRecorder | None = None,
+) -> RequestsFetcher | CachingFetcher | InstrumentedFetcher:
+    """Build the production fetcher.
+
+    Args:
+        pool_size: Connections to keep per host, at least the number of
+            requests that will be in flight at once.
+        cache: On-disk response cache to revalidate against, or None to
+            fetch every body in full.
+        recorder: Where to record every request, or None to record nothing.
+
+    Returns:
+        A fetcher over the process's shared session, which sends browser-like
+        headers and verifies against certifi plus the chain-completion
+        certificate, behind the cache when one is given, and outermost the
+        recorder when one is given.
+    """
+    transport = RequestsFetcher(shared_session(pool_size, track_connections=recorder is not None))
+    fetcher = transport if cache is None else CachingFetcher(transport, cache)
+    if recorder is None:
+        return fetcher
+    return InstrumentedFetcher(fetcher, recorder)
 
 
 def fetch_roster(fetcher: Fetcher) -> SenateRoster:
@@ -214,8 +552,8 @@ def fetch_roster(fetcher: Fetcher) -> SenateRoster:
     return parse_roster(fetcher.get_text(SENATE_URL, {}))
 
 
-def fetch_view_links(fetcher: Fetcher, view_id: int, slug: str, year_label: str) -> list[MeetingLink]:
-    """Read one academic year of meeting documents from a view.
+def _fetch_view(fetcher: Fetcher, view_id: int, slug: str, year_label: str) -> tuple[str, list[MeetingLink]]:
+    """Read one academic year of one view, keeping the raw body.
 
     Args:
         fetcher: Transport used to retrieve the view.
@@ -224,7 +562,7 @@ def fetch_view_links(fetcher: Fetcher, view_id: int, slug: str, year_label: str)
         year_label: Academic year label, e.g. "24-25".
 
     Returns:
-        The meeting links published for that year.
+        The response body and the meeting links it publishes.
 
     Raises:
         AsuciFetchError: If the request fails.
@@ -234,6 +572,10 @@ def fetch_view_links(fetcher: Fetcher, view_id: int, slug: str, year_label: str)
     url = VIEW_URL.format(view_id=view_id)
     body = fetcher.get_text(url, {"year": academic_year_param(year_label)})
 
+    # Decode and parse times are taken only when a recorder will keep them.
+    recorder = fetcher.recorder if isinstance(fetcher, InstrumentedFetcher) else None
+    started = recorder.clock() if recorder is not None else 0.0
+
     try:
         payload = json.loads(body)
     except json.JSONDecodeError as error:
@@ -245,36 +587,149 @@ def fetch_view_links(fetcher: Fetcher, view_id: int, slug: str, year_label: str)
             f"first {BODY_SNIPPET_CHARS} chars: {snippet!r}"
         ) from error
 
-    return parse_meeting_links(decode_view_response(payload, slug)["rendered_html"])
+    rendered_html = decode_view_response(payload, slug)["rendered_html"]
+    if recorder is None:
+        return body, parse_meeting_links(rendered_html)
 
+    decoded = recorder.clock()
+    links = parse_meeting_links(rendered_html)
+    recorder.record_parse(url, decoded - started, recorder.clock() - decoded)
+    return body, links
 
-def fetch_meeting_links(fetcher: Fetcher, years: tuple[str, ...] = ARCHIVE_YEARS) -> MeetingLinks:
-    """Read every published academic year of agendas and minutes.
 
-    Years yielding no documents are omitted rather than stored empty, so the
-    dashboard shows only years that actually have records.
+def fetch_view_links(fetcher: Fetcher, view_id: int, slug: str, year_label: str) -> list[MeetingLink]:
+    """Read one academic year of meeting documents from a view.
+
+    Args:
+        fetcher: Transport used to retrieve the view.
+        view_id: Numeric Formidable view id.
+        slug: Slug the view is expected to carry.
+        year_label: Academic year label, e.g. "24-25".
+
+    Returns:
+        The meeting links published for that year.
+
+    Raises:
+        AsuciFetchError: If the request fails.
+        AsuciDecodeError: If the body is not JSON, or does not match the
+            expected view shape.
+    """
+    return _fetch_view(fetcher, view_id, slug, year_label)[1]
+
+
+def _fetch_views_in_order(
+    fetcher: Fetcher, requests_: list[tuple[int, str, str]], workers: int
+) -> list[tuple[str, list[MeetingLink]]]:
+    """Read several views, concurrently when allowed, in request order.
+
+    Results come back in the order requested, and so does failure: the error
+    raised is the one the earliest failing request produced, exactly as a
+    sequential read would report it. Requests not yet started when that error
+    surfaces are cancelled.
 
     Args:
         fetcher: Transport used to retrieve the views.
+        requests_: View id, slug and academic year label for each read.
+        workers: Maximum requests in flight at once.
+
+    Returns:
+        The body and links for each request, in the order given.
+
+    Raises:
+        AsuciFetchError: If a request fails.
+        AsuciDecodeError: If a response does not match the expected shape.
+        ValueError: If an academic year label is malformed.
+    """
+    if workers == 1 or len(requests_) <= 1:
+        return [_fetch_view(fetcher, view_id, slug, year) for view_id, slug, year in requests_]
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(requests_))) as pool:
+        futures: list[Future[tuple[str, list[MeetingLink]]]] = [
+            pool.submit(_fetch_view, fetcher, view_id, slug, year) for view_id, slug, year in requests_
+        ]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+
+
+def fetch_archive_years(
+    fetcher: Fetcher, years: tuple[str, ...] = ARCHIVE_YEARS, workers: int = 1
+) -> list[YearArchive]:
+    """Read agendas and minutes for each academic year, keeping years apart.
+
+    With more than one worker the agenda and minutes reads for every year are
+    issued concurrently. The result, its year order, and the error reported on
+    failure are the same as for a sequential read.
+
+    Args:
+        fetcher: Transport used to retrieve the views. Must be safe to call
+            from several threads when ``workers`` is above one.
         years: Academic year labels to read, newest first.
+        workers: Maximum requests in flight at once; 1 reads sequentially.
 
     Returns:
-        Agendas and minutes keyed by academic year label.
+        One archive per requested year, in the order given, including years
+        that publish nothing.
 
     Raises:
         AsuciFetchError: If a request fails.
         AsuciDecodeError: If a response does not match the expected shape.
+        ValueError: If ``workers`` is below one.
     """
-    agendas: dict[str, list[MeetingLink]] = {}
-    minutes: dict[str, list[MeetingLink]] = {}
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
 
+    requests_ = [
+        (view_id, slug, year_label)
+        for year_label in years
+        for view_id, slug in ((AGENDA_VIEW_ID, AGENDA_VIEW_SLUG), (MINUTES_VIEW_ID, MINUTES_VIEW_SLUG))
+    ]
+    results = iter(_fetch_views_in_order(fetcher, requests_, workers))
+
+    archives: list[YearArchive] = []
     for year_label in years:
-        agenda_links = fetch_view_links(fetcher, AGENDA_VIEW_ID, AGENDA_VIEW_SLUG, year_label)
-        if agenda_links:
-            agendas[year_label] = agenda_links
+        agenda_body, agenda_links = next(results)
+        minutes_body, minutes_links = next(results)
+
+        digest = hashlib.sha256()
+        for body in (agenda_body, minutes_body):
+            digest.update(body.encode("utf-8"))
+            digest.update(b"\0")
+
+        archives.append(
+            YearArchive(
+                year=year_label,
+                agendas=agenda_links,
+                minutes=minutes_links,
+                payload_hash=digest.hexdigest(),
+            )
+        )
+
+    return archives
+
+
+def fetch_meeting_links(
+    fetcher: Fetcher, years: tuple[str, ...] = ARCHIVE_YEARS, workers: int = 1
+) -> MeetingLinks:
+    """Read every published academic year of agendas and minutes.
+
+    Years yielding no documents are omitted rather than stored empty, so the
+    dashboard shows only years that actually have records.
 
-        minutes_links = fetch_view_links(fetcher, MINUTES_VIEW_ID, MINUTES_VIEW_SLUG, year_label)
-        if minutes_links:
-            minutes[year_label] = minutes_links
+    Args:
+        fetcher: Transport used to retrieve the views. Must be safe to call
+            from several threads when ``workers`` is above one.
+        years: Academic year labels to read, newest first.
+        workers: Maximum requests in flight at once; 1 reads sequentially.
 
-    return MeetingLinks(agendas=agendas, minutes=minutes)
+    Returns:
+        Agendas and minutes keyed by academic year label.
+
+    Raises:
+        AsuciFetchError: If a request fails.
+        AsuciDecodeError: If a response does not match the expected shape.
+        ValueError: If ``workers`` is below one.
+    """
+    return assemble_meeting_links(fetch_archive_years(fetcher, years, workers))
@@ -6,545 +6,358 @@ Run this script to generate a fresh HTML dashboard with live data.
 Reads the senate roster and the agenda and minutes archives over plain HTTP
 via the asuci client; no browser is involved.
 
+Responses are kept in an on-disk cache and revalidated with the upstream
+servers, so a body that has not changed since the last run is not downloaded
+again.
+
+The page is rendered from templates/index.html.j2 and written only when its
+content, apart from the generation time, differs from the page on disk.
+
+Each academic year of the archive is kept as a snapshot between runs. Only
+the years that can still change, and settled years whose snapshot has aged
+past a threshold, are read again. The page's meeting search index is built
+from those years the same way: only years whose archive changed are indexed
+again.
+
+The text of every linked agenda and set of minutes is then harvested, once
+per document, into one compressed shard per year under search/, which the
+page loads when someone searches document text. Stored documents of live
+years are revalidated on every run; --full revalidates every stored document.
+
+Senator portraits are downloaded once into a store shared by the dashboards,
+and published under portraits/ as thumbnails at the size the cards show them;
+only portraits that are new or changed upstream are resized again. --quick
+leaves them linked to the senate site.
+
+A page written without some documents or portraits, because they could not
+be fetched, is still written, but the run exits with PARTIAL_BUILD_EXIT so
+generate_all does not record it and builds it again next time.
+
+Each phase of the run - fetch, portraits, index, harvest, render, write - is
+timed as a span, which generate_all collects into its timing report.
+
 Usage:
-    python generate.py           # Full refresh
-    python generate.py --quick   # Skip the meeting archives
+    python -m asuci.generate              # Incremental refresh
+    python -m asuci.generate --full       # Read every archive year again
+    python -m asuci.generate --quick      # Skip the meeting archives
+    python -m asuci.generate --no-cache   # Download every response in full
+    python -m asuci.generate --metrics    # Also write run-report.json with request timings
+    python -m asuci.generate --probe      # Print a fingerprint of the upstream data and exit
 """
 
+import argparse
+import hashlib
 import json
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from asuci.client import create_fetcher, fetch_meeting_links, fetch_roster
-from asuci.models import MeetingLinks, encode_meeting_links, encode_roster
+from shared.utils.build_manifest import PARTIAL_BUILD_EXIT
+from shared.utils.http_cache import ResponseCache
+from shared.utils.page_render import CONTENT_DIGEST_MARK, GENERATED_AT_MARK, load_template, write_page
+from shared.utils.phase_timing import span
+from shared.utils.portraits import DisplaySize, PortraitPipeline, localize_photos, session_downloader
+
+from asuci.archive import DEFAULT_MAX_AGE, archive_fingerprint, is_live, refresh_archive
+from asuci.client import (
+    FETCH_WORKERS,
+    CachingFetcher,
+    InstrumentedFetcher,
+    RequestsFetcher,
+    create_fetcher,
+    create_session,
+    fetch_roster,
+    shared_session,
+)
+from asuci.harvest import HARVEST_WORKERS, DocumentStore, harvest_archive
+from asuci.metrics import REPORT_NAME, MetricsRecorder, write_report
+from asuci.models import MeetingLinks, encode_meeting_index, encode_meeting_links, encode_roster
+from asuci.search import build_index, merge_index
+
+# Caches shared between runs; the workflow restores them before each run.
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "asuci"
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+ARCHIVE_SNAPSHOT_DIR = CACHE_DIR / "archive"
+SEARCH_INDEX_DIR = CACHE_DIR / "search"
+DOCUMENT_STORE_DIR = CACHE_DIR / "documents"
+TEMPLATE_CACHE_DIR = CACHE_DIR / "templates"
+
+# Page template, rendered from the encoded roster and meeting links.
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+TEMPLATE_NAME = "index.html.j2"
+
+# Full-text shards, published beside the page and loaded by it on demand.
+TEXT_SHARD_DIR = Path(__file__).resolve().parent / "search"
+
+# Seconds a response from a host that sends no validators is reused without
+# asking again. Zero refetches those on every run.
+HTTP_CACHE_MAX_AGE = 0.0
+
+# Portrait originals are stored once for every dashboard; the thumbnails are
+# published beside the page, sized for .senator-card .photo.
+PORTRAIT_STORE_DIR = CACHE_DIR.parent / "portraits"
+PORTRAIT_DIR = Path(__file__).resolve().parent / "portraits"
+PORTRAIT_SIZE = DisplaySize(width=120, height=150)
+
+# Marks the senate logo standing in for a missing portrait. The page shows it
+# whole rather than cropped, so it stays linked.
+PLACEHOLDER_MARK = "senate-logo"
 
 
 def generate_html(data: dict) -> str:
-    """Generate the complete HTML dashboard."""
-
-    # Convert data to JSON for embedding
-    data_json = json.dumps(data, ensure_ascii=False)
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=1024, viewport-fit=cover, user-scalable=yes">
-    <title>ASUCI Senate Dashboard</title>
-    <link rel="stylesheet" href="https://cdn.datatables.net/1.13.7/css/jquery.dataTables.min.css">
-    <style>
-        :root {{
-            --primary: #0064a4;
-            --primary-dark: #003d66;
-            --primary-light: #e6f2fa;
-            --gold: #ffc72c;
-            --gold-light: #fff9e6;
-            --success: #16a34a;
-            --success-light: #dcfce7;
-            --warning: #ca8a04;
-            --warning-light: #fef3c7;
-            --danger: #dc2626;
-            --danger-light: #fee2e2;
-            --gray-50: #f9fafb;
-            --gray-100: #f3f4f6;
-            --gray-200: #e5e7eb;
-            --gray-600: #4b5563;
-            --gray-700: #374151;
-            --gray-800: #1f2937;
-            --gray-900: #111827;
-        }}
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Arial, sans-serif;
-            font-size: 1rem;
-            line-height: 1.6;
-            color: var(--gray-800);
-            background: var(--gray-100);
-        }}
-        .header-container {{
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            background: white;
-        }}
-        .header {{
-            background: linear-gradient(135deg, var(--primary) 0%, var(--primary-dark) 100%);
-            color: white;
-            padding: 1.5rem 2rem;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        .header h1 {{ font-size: 1.5rem; }}
-        .header .subtitle {{ font-size: 0.9rem; opacity: 0.9; margin-top: 0.25rem; }}
-        .tabs {{
-            display: flex;
-            gap: 0.25rem;
-            background: white;
-            padding: 0.5rem 2rem;
-            border-bottom: 1px solid var(--gray-200);
-            overflow-x: auto;
-        }}
-        .tab {{
-            padding: 0.75rem 1.25rem;
-            cursor: pointer;
-            border: none;
-            background: var(--gold-light);
-            font-size: 0.9rem;
-            font-weight: 500;
-            color: var(--gray-700);
-            border-radius: 6px 6px 0 0;
-            transition: all 0.2s;
-            white-space: nowrap;
-        }}
-        .tab:hover {{ background: var(--primary-light); }}
-        .tab.active {{
-            color: var(--primary-dark);
-            border-bottom: 3px solid var(--primary);
-            background: white;
-        }}
-        .tab-content {{
-            display: none;
-            padding: 2rem;
-            background: white;
-            min-height: calc(100vh - 150px);
-        }}
-        .tab-content.active {{ display: block; }}
-        .summary-cards {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-            gap: 1rem;
-            margin-bottom: 2rem;
-        }}
-        .card {{
-            background: var(--gray-50);
-            border-radius: 12px;
-            padding: 1.25rem;
-            border: 1px solid var(--gray-200);
-            transition: transform 0.2s, box-shadow 0.2s;
-        }}
-        .card:hover {{ transform: translateY(-2px); box-shadow: 0 4px 12px rgba(0,0,0,0.1); }}
-        .card.highlight {{ background: linear-gradient(135deg, var(--primary-light) 0%, #cce5f7 100%); border-color: var(--primary); }}
-        .card.gold {{ background: linear-gradient(135deg, var(--gold-light) 0%, #fff3cc 100%); border-color: var(--gold); }}
-        .card.success {{ background: linear-gradient(135deg, var(--success-light) 0%, #bbf7d0 100%); border-color: var(--success); }}
-        .card.warning {{ background: linear-gradient(135deg, var(--warning-light) 0%, #fde68a 100%); border-color: var(--warning); }}
-        .card h4 {{ font-size: 0.7rem; text-transform: uppercase; letter-spacing: 0.05em; color: var(--gray-600); margin-bottom: 0.25rem; }}
-        .card .value {{ font-size: 2rem; font-weight: 700; color: var(--gray-900); }}
-        .card .subtext {{ font-size: 0.75rem; color: var(--gray-600); }}
-        h2 {{ font-size: 1.25rem; margin-bottom: 1rem; color: var(--gray-800); border-bottom: 3px solid var(--gold); padding-bottom: 0.5rem; display: inline-block; }}
-        h3 {{ font-size: 1rem; margin: 1.5rem 0 0.75rem; color: var(--gray-700); }}
-        .section {{ margin-bottom: 2rem; }}
-        .alert {{ padding: 1rem; border-radius: 8px; margin: 1rem 0; font-size: 0.9rem; }}
-        .alert-info {{ background: var(--primary-light); border-left: 4px solid var(--primary); color: var(--primary-dark); }}
-        .links-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 1rem; margin: 1.5rem 0; }}
-        .link-card {{
-            background: white;
-            border: 1px solid var(--gray-200);
-            border-radius: 12px;
-            padding: 1.25rem;
-            text-decoration: none;
-            color: var(--gray-800);
-            transition: all 0.2s;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.05);
-        }}
-        .link-card:hover {{ border-color: var(--primary); box-shadow: 0 4px 12px rgba(0,100,164,0.15); transform: translateY(-3px); }}
-        .link-card h4 {{ color: var(--primary); margin-bottom: 0.5rem; font-size: 1rem; }}
-        .link-card p {{ font-size: 0.85rem; margin: 0; color: var(--gray-600); }}
-        .meeting-list {{ list-style: none; }}
-        .meeting-item {{
-            padding: 1rem 1.25rem;
-            border-bottom: 1px solid var(--gray-200);
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            transition: background 0.2s;
-        }}
-        .meeting-item:hover {{ background: var(--gray-50); }}
-        .meeting-date {{ font-weight: 600; color: var(--gray-800); }}
-        .meeting-stats {{ display: flex; gap: 1rem; font-size: 0.85rem; }}
-        .stat-present {{ color: var(--success); font-weight: 500; }}
-        .stat-excused {{ color: var(--warning); font-weight: 500; }}
-        .stat-absent {{ color: var(--danger); font-weight: 500; }}
-        .badge {{ display: inline-block; padding: 0.25rem 0.6rem; border-radius: 20px; font-size: 0.75rem; font-weight: 600; }}
-        .badge-present {{ background: var(--success-light); color: var(--success); }}
-        .badge-excused {{ background: var(--warning-light); color: var(--warning); }}
-        .badge-absent {{ background: var(--danger-light); color: var(--danger); }}
-        .next-meeting-banner {{
-            background: linear-gradient(135deg, var(--primary) 0%, var(--primary-dark) 100%);
-            color: white;
-            padding: 1.5rem 2rem;
-            border-radius: 12px;
-            margin-bottom: 2rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            box-shadow: 0 4px 15px rgba(0,100,164,0.3);
-        }}
-        .next-meeting-banner h3 {{ color: var(--gold); margin: 0 0 0.5rem 0; font-size: 0.85rem; text-transform: uppercase; letter-spacing: 0.1em; }}
-        .next-meeting-banner .date {{ font-size: 1.5rem; font-weight: 700; }}
-        .next-meeting-banner .location {{ opacity: 0.9; font-size: 0.9rem; margin-top: 0.25rem; }}
-        .next-meeting-banner .zoom-btn {{
-            background: var(--gold);
-            color: var(--primary-dark);
-            padding: 0.85rem 1.75rem;
-            border-radius: 8px;
-            text-decoration: none;
-            font-weight: 600;
-            transition: all 0.2s;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.2);
-        }}
-        .next-meeting-banner .zoom-btn:hover {{ background: #ffe066; transform: scale(1.05); }}
-        .year-select {{ padding: 0.6rem 1.25rem; border: 2px solid var(--gray-200); border-radius: 8px; font-size: 0.95rem; margin-bottom: 1.5rem; cursor: pointer; }}
-        .year-select:focus {{ border-color: var(--primary); outline: none; }}
-        .recent-meetings-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(320px, 1fr)); gap: 1rem; }}
-        .meeting-card {{
-            background: var(--gray-50);
-            border: 1px solid var(--gray-200);
-            border-radius: 12px;
-            padding: 1.25rem;
-            transition: all 0.2s;
-        }}
-        .meeting-card:hover {{ border-color: var(--primary); box-shadow: 0 4px 12px rgba(0,100,164,0.1); }}
-        .meeting-card .meeting-date {{ font-weight: 700; font-size: 1.1rem; color: var(--gray-900); margin-bottom: 0.5rem; }}
-        .meeting-card .meeting-links {{ display: flex; gap: 0.75rem; margin-bottom: 0.75rem; }}
-        .meeting-card .meeting-links a {{
-            font-size: 0.8rem;
-            color: var(--primary);
-            text-decoration: none;
-            padding: 0.25rem 0.5rem;
-            background: var(--primary-light);
-            border-radius: 4px;
-        }}
-        .meeting-card .meeting-links a:hover {{ background: var(--primary); color: white; }}
-        .meeting-card .meeting-attendance {{ font-size: 0.8rem; color: var(--gray-600); }}
-        table.dataTable {{ font-size: 0.85rem; }}
-        table.dataTable thead th {{ background: var(--primary); color: white; }}
-        table.dataTable tbody tr:hover {{ background: var(--primary-light) !important; }}
-        .refresh-time {{ font-size: 0.75rem; color: var(--gray-600); text-align: right; padding: 1rem 2rem; background: var(--gray-100); }}
-        table.dataTable tbody tr:hover {{ background: var(--primary-light) !important; }}
-        .dataTables_wrapper .dataTables_length,
-        .dataTables_wrapper .dataTables_filter,
-        .dataTables_wrapper .dataTables_info,
-        .dataTables_wrapper .dataTables_paginate {{ font-size: 0.85rem; }}
-        .senator-grid {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(200px, 1fr)); gap: 1rem; }}
-        .senator-card {{
-            background: var(--gray-50);
-            border: 1px solid var(--gray-200);
-            border-radius: 10px;
-            padding: 1rem;
-            text-align: center;
-        }}
-        .senator-card .photo {{
-            width: 120px;
-            height: 150px;
-            object-fit: cover;
-            object-position: top;
-            margin: 0 auto 0.75rem;
-            display: block;
-        }}
-        .senator-card .photo.placeholder {{
-            object-fit: contain;
-            object-position: center;
-        }}
-        .senator-card .name {{ font-weight: 600; color: var(--gray-900); margin-bottom: 0.25rem; }}
-        .senator-card .position {{ font-size: 0.85rem; color: var(--primary); }}
-        .senator-card .email {{ font-size: 0.75rem; color: var(--gray-600); margin-top: 0.5rem; }}
-        .senator-card .email a {{ color: var(--gray-600); text-decoration: none; }}
-        .senator-card .email a:hover {{ color: var(--primary); }}
-        @media (max-width: 768px) {{
-            .tabs {{ padding: 0.5rem 1rem; }}
-            .tab {{ padding: 0.5rem 0.75rem; font-size: 0.8rem; }}
-            .tab-content {{ padding: 1rem; }}
-            .summary-cards {{ grid-template-columns: repeat(2, 1fr); }}
-            .next-meeting-banner {{ flex-direction: column; text-align: center; gap: 1rem; }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="header-container">
-        <div class="header">
-            <h1>ASUCI Senate Dashboard</h1>
-            <div class="subtitle">Associated Students of UC Irvine - Senate Meeting Tracker</div>
-        </div>
-        <div class="tabs">
-            <button class="tab active" onclick="showTab('overview')">Overview</button>
-            <button class="tab" onclick="showTab('meetings')">Meetings</button>
-            <button class="tab" onclick="showTab('senators')">Senators</button>
-            <button class="tab" onclick="showTab('resources')">Resources</button>
-        </div>
-    </div>
-
-    <div id="overview" class="tab-content active">
-        <div class="next-meeting-banner">
-            <div>
-                <h3>Next Meeting</h3>
-                <div class="date" id="next-meeting-date">Loading...</div>
-                <div class="location">Balboa Island B (4th floor, Student Center) or Zoom</div>
-            </div>
-            <a href="https://uci.zoom.us/j/97062458514" target="_blank" class="zoom-btn">Join via Zoom</a>
-        </div>
-
-        <div class="section">
-            <h2>Recent Meetings</h2>
-            <div id="recent-meetings" class="recent-meetings-grid"></div>
-        </div>
-
-        <div class="section">
-            <h2>Quick Links</h2>
-            <div class="links-grid">
-                <a href="https://asuci.uci.edu/senate/agendas/" target="_blank" class="link-card">
-                    <h4>Current Agenda</h4>
-                    <p>See what's being discussed at upcoming meetings</p>
-                </a>
-                <a href="https://www.facebook.com/pg/associatedstudentsuci/videos/" target="_blank" class="link-card">
-                    <h4>Meeting Livestreams</h4>
-                    <p>Watch live or recorded meetings on Facebook</p>
-                </a>
-                <a href="https://docs.google.com/spreadsheets/d/1QacWHjtA3dm7VY3TufJlR4BQdmsgAn_65HKO1fBy2lM/edit" target="_blank" class="link-card">
-                    <h4>Attendance Records</h4>
-                    <p>Senator attendance tracking spreadsheet</p>
-                </a>
-                <a href="https://asuci.uci.edu/senate/legislation/" target="_blank" class="link-card">
-                    <h4>Legislation Archive</h4>
-                    <p>All resolutions and bills</p>
-                </a>
-            </div>
-        </div>
-    </div>
-
-    <div id="meetings" class="tab-content">
-        <h2>Meeting Archive</h2>
-        <p style="margin-bottom:1rem;color:var(--gray-600)">Select a year to view meeting agendas and minutes.</p>
-        <select class="year-select" id="year-select" onchange="loadYear(this.value)">
-            <option value="25-26">2025-26 (Current)</option>
-            <option value="24-25">2024-25</option>
-            <option value="23-24">2023-24</option>
-            <option value="22-23">2022-23</option>
-            <option value="21-22">2021-22</option>
-            <option value="20-21">2020-21</option>
-            <option value="19-20">2019-20</option>
-            <option value="18-19">2018-19</option>
-        </select>
-        <table id="meetings-table" class="display" style="width:100%">
-            <thead><tr><th>Date</th><th>Agenda</th><th>Minutes</th></tr></thead>
-            <tbody id="meetings-tbody"></tbody>
-        </table>
-    </div>
-
-    <div id="senators" class="tab-content">
-        <h2>2025-2026 Senate</h2>
-        <h3 style="margin-top:1.5rem;margin-bottom:1rem;color:var(--gray-700)">Leadership</h3>
-        <div id="leadership-grid" class="senator-grid"></div>
-        <h3 style="margin-top:2rem;margin-bottom:1rem;color:var(--gray-700)">Senators</h3>
-        <div id="senators-grid" class="senator-grid"></div>
-    </div>
-
-    <div id="resources" class="tab-content">
-        <h2>ASUCI Resources</h2>
-        <div class="section">
-            <h3>Governing Documents</h3>
-            <div class="links-grid">
-                <a href="https://asuci.uci.edu/wp-content/uploads/2012/09/constitution.pdf" target="_blank" class="link-card">
-                    <h4>ASUCI Constitution</h4>
-                    <p>The foundational governing document</p>
-                </a>
-                <a href="http://asuci.uci.edu/wp-content/uploads/2025/11/ASUCI-Operational-Policies-and-Procedures-as-of-October-15-2025-R61-15.pdf" target="_blank" class="link-card">
-                    <h4>Operational Policies</h4>
-                    <p>Policies and procedures manual</p>
-                </a>
-                <a href="https://docs.google.com/document/d/1hOXFx2yhf3Ox-C2C-PQkWsUJnWJ7s8dE61-e_xTcS1E/edit" target="_blank" class="link-card">
-                    <h4>ASUCI By-Laws</h4>
-                    <p>Supplementary rules and regulations</p>
-                </a>
-                <a href="https://docs.google.com/document/d/1iqSRs4cGUwwjNWBko5-mwlAL3TP_Mz69TNpEGJoSGjQ/edit" target="_blank" class="link-card">
-                    <h4>Ethics Code</h4>
-                    <p>Standards of conduct for members</p>
-                </a>
-            </div>
-        </div>
-        <div class="section">
-            <h3>Senate Resources</h3>
-            <div class="links-grid">
-                <a href="https://asuci.uci.edu/senate/committees/" target="_blank" class="link-card">
-                    <h4>Committees</h4>
-                    <p>Senate standing committees</p>
-                </a>
-                <a href="https://asuci.uci.edu/senate/legislation/" target="_blank" class="link-card">
-                    <h4>Legislation</h4>
-                    <p>Resolutions and bills archive</p>
-                </a>
-                <a href="https://docs.google.com/document/d/1QZuu0QOWiJTTVPMoGL4BjbMqZuSR21dpR5zoWMLIaEc/edit" target="_blank" class="link-card">
-                    <h4>Peter's Procedures</h4>
-                    <p>Parliamentary procedure guide</p>
-                </a>
-                <a href="https://asuci.uci.edu/senate/" target="_blank" class="link-card">
-                    <h4>Senate Home</h4>
-                    <p>Official Senate webpage</p>
-                </a>
-            </div>
-        </div>
-        <div class="alert alert-info" style="margin-top:2rem">
-            <strong>Regular Meetings:</strong> Tuesdays and Thursdays at 5:00 PM<br>
-            <strong>Location:</strong> Balboa Island B, 4th Floor, Student Center (G244)<br>
-            <strong>Zoom:</strong> <a href="https://uci.zoom.us/j/97062458514" target="_blank" style="color:var(--primary)">uci.zoom.us/j/97062458514</a><br>
-            <strong>Livestreams:</strong> <a href="https://www.facebook.com/pg/associatedstudentsuci/videos/" target="_blank" style="color:var(--primary)">Facebook Videos</a><br><br>
-            <em>Tip: Check the <a href="https://asuci.uci.edu/senate/agendas/" target="_blank" style="color:var(--primary)">Current Agenda</a> before meetings to see what legislation will be discussed!</em>
-        </div>
-    </div>
-
-    <div class="refresh-time">Data generated: {data["generated_at"]}</div>
-
-    <script src="https://code.jquery.com/jquery-3.7.1.min.js"></script>
-    <script src="https://cdn.datatables.net/1.13.7/js/jquery.dataTables.min.js"></script>
-    <script>
-        const DATA = {data_json};
-
-        function showTab(id) {{
-            document.querySelectorAll('.tab-content').forEach(el => el.classList.remove('active'));
-            document.querySelectorAll('.tab').forEach(el => el.classList.remove('active'));
-            document.getElementById(id).classList.add('active');
-            event.target.classList.add('active');
-        }}
-
-        function getNextMeeting() {{
-            const now = new Date();
-            const day = now.getDay();
-            const hour = now.getHours();
-            let daysUntilTue = (2 - day + 7) % 7;
-            let daysUntilThu = (4 - day + 7) % 7;
-            if (daysUntilTue === 0 && hour >= 17) daysUntilTue = 7;
-            if (daysUntilThu === 0 && hour >= 17) daysUntilThu = 7;
-            const daysUntil = Math.min(daysUntilTue, daysUntilThu);
-            const nextDate = new Date(now);
-            nextDate.setDate(now.getDate() + daysUntil);
-            return nextDate.toLocaleDateString('en-US', {{ weekday: 'long', year: 'numeric', month: 'long', day: 'numeric' }}) + ' at 5:00 PM';
-        }}
-
-        function init() {{
-            document.getElementById('next-meeting-date').textContent = getNextMeeting();
-
-            // Recent meetings - use meeting links from website (most current data)
-            const recentEl = document.getElementById('recent-meetings');
-            const currentYear = Object.keys(DATA.meeting_links.agendas || {{}}).sort().reverse()[0];
-            const meetings = (DATA.meeting_links.agendas[currentYear] || []).slice(0, 8);
-            let recentHtml = '';
-
-            meetings.forEach(m => {{
-                const agendaUrl = m.url || 'https://www.asuci.uci.edu/senate/agendas/print/?date=' + encodeURIComponent(m.date);
-                const minutesUrl = 'https://www.asuci.uci.edu/senate/minutes/print/?date=' + encodeURIComponent(m.date);
-
-                recentHtml += '<div class="meeting-card">' +
-                    '<div class="meeting-date">' + m.date + '</div>' +
-                    '<div class="meeting-links">' +
-                        '<a href="' + agendaUrl + '" target="_blank">Agenda</a>' +
-                        '<a href="' + minutesUrl + '" target="_blank">Minutes</a>' +
-                    '</div>' +
-                '</div>';
-            }});
-            recentEl.innerHTML = recentHtml || '<p>No recent meetings found</p>';
-
-            // Senators grid
-            function renderSenators(senators, containerId) {{
-                const container = document.getElementById(containerId);
-                let html = '';
-                senators.forEach(s => {{
-                    html += '<div class="senator-card">' +
-                        (s.photo ? '<img class="photo' + (s.photo.includes('senate-logo') ? ' placeholder' : '') + '" src="' + s.photo + '" alt="' + s.name + '">' : '') +
-                        '<div class="name">' + s.name + '</div>' +
-                        '<div class="position">' + s.position + '</div>' +
-                        (s.email ? '<div class="email"><a href="mailto:' + s.email + '">' + s.email + '</a></div>' : '') +
-                    '</div>';
-                }});
-                container.innerHTML = html || '<p>No senators found</p>';
-            }}
-            renderSenators(DATA.senators.leadership || [], 'leadership-grid');
-            renderSenators(DATA.senators.senators || [], 'senators-grid');
-
-            // Meetings table - default to current year
-            loadYear('25-26');
-        }}
-
-        function parseDate(dateStr) {{
-            // Parse "January 22, 2026" format to timestamp for sorting
-            const parsed = new Date(dateStr);
-            return isNaN(parsed.getTime()) ? 0 : parsed.getTime();
-        }}
-
-        function loadYear(year) {{
-            if ($.fn.DataTable.isDataTable('#meetings-table')) $('#meetings-table').DataTable().destroy();
-            const meetings = DATA.meeting_links.agendas[year] || [];
-
-            // Sort meetings reverse chronologically (newest first)
-            const sortedMeetings = [...meetings].sort((a, b) => parseDate(b.date) - parseDate(a.date));
-
-            const tbody = document.getElementById('meetings-tbody');
-            let html = '';
-            sortedMeetings.forEach(m => {{
-                const agendaUrl = m.url || 'https://www.asuci.uci.edu/senate/agendas/print/?date=' + encodeURIComponent(m.date);
-                const minutesUrl = 'https://www.asuci.uci.edu/senate/minutes/print/?date=' + encodeURIComponent(m.date);
-                const timestamp = parseDate(m.date);
-                html += '<tr data-sort="' + timestamp + '"><td data-order="' + timestamp + '">' + m.date + '</td><td><a href="' + agendaUrl + '" target="_blank">View Agenda</a></td><td><a href="' + minutesUrl + '" target="_blank">View Minutes</a></td></tr>';
-            }});
-            tbody.innerHTML = html || '<tr><td colspan="3">No meetings</td></tr>';
-            if (sortedMeetings.length > 0) $('#meetings-table').DataTable({{ paging: false, order: [[0, 'desc']] }});
-        }}
-
-        document.addEventListener('DOMContentLoaded', init);
-    </script>
-</body>
-</html>"""
-
-    return html
-
-
-def main(quick_mode=False):
+    """Render the dashboard page from the encoded roster and meeting links.
+
+    The template is compiled on first use and kept as bytecode in the cache
+    directory. The digest mark is left in place for write_page to fill.
+    """
+    template = load_template(TEMPLATE_DIR, TEMPLATE_NAME, TEMPLATE_CACHE_DIR)
+    return template.render(
+        generated_at=data["generated_at"],
+        data_json=json.dumps(data, ensure_ascii=False),
+        content_digest=CONTENT_DIGEST_MARK,
+    )
+
+
+def probe(use_cache=True, cache_max_age=HTTP_CACHE_MAX_AGE, snapshot_max_age=DEFAULT_MAX_AGE):
+    """Print a fingerprint of the data the next run would read, and nothing else.
+
+    The roster and the archive years a refresh would read are requested
+    through the response cache, so an unchanged upstream costs a handful of
+    conditional requests. Nothing but the cache is written, so the run that
+    follows still sees every change. generate_all skips the build when the
+    fingerprint matches the last successful one.
+    """
+    cache = ResponseCache(HTTP_CACHE_DIR, max_age=cache_max_age) if use_cache else None
+    fetcher = create_fetcher(cache=cache)
+    roster = encode_roster(fetch_roster(fetcher))
+    archive = archive_fingerprint(
+        fetcher,
+        ARCHIVE_SNAPSHOT_DIR,
+        datetime.now(timezone.utc),
+        max_age=snapshot_max_age,
+        workers=FETCH_WORKERS,
+    )
+    canonical = json.dumps([roster, archive], sort_keys=True, separators=(",", ":"))
+    print(f"fingerprint: {hashlib.sha256(canonical.encode('utf-8')).hexdigest()}")
+
+
+def save_run_report(recorder):
+    """Write the run report beside the dashboard and print its summary."""
+    report = recorder.report(datetime.now(timezone.utc).isoformat())
+    report_path = Path(__file__).parent / REPORT_NAME
+    write_report(report_path, report)
+    print(f"\n[*] Run report saved to: {report_path}")
+    for endpoint, summary in report["endpoints"].items():
+        print(
+            f"    {endpoint}: {summary['requests']} requests, "
+            f"p50 {summary['seconds_p50'] * 1000:.0f} ms, p95 {summary['seconds_p95'] * 1000:.0f} ms, "
+            f"{summary['connections']['new']} new connections"
+        )
+
+
+def main(
+    quick_mode=False,
+    use_cache=True,
+    cache_max_age=HTTP_CACHE_MAX_AGE,
+    full=False,
+    snapshot_max_age=DEFAULT_MAX_AGE,
+    metrics=False,
+):
     """Main function to generate the dashboard."""
     print("=" * 60)
     print("ASUCI Dashboard Generator")
     print("=" * 60)
 
-    fetcher = create_fetcher()
-
+    cache = ResponseCache(HTTP_CACHE_DIR, max_age=cache_max_age) if use_cache else None
+    recorder = MetricsRecorder() if metrics else None
+    fetcher = create_fetcher(cache=cache, recorder=recorder)
+
+    # The report is written even when a request fails, since a failing run is
+    # the one most worth diagnosing.
+    try:
+        return build_dashboard(fetcher, quick_mode, full, snapshot_max_age)
+    finally:
+        if recorder is not None:
+            save_run_report(recorder)
+
+
+def localize_portraits(senators):
+    """Point the senators' photos at thumbnails published beside the page.
+
+    Returns:
+        A note of how many photos are now local and how each was obtained,
+        and how many could not be fetched or read.
+    """
+    pipeline = PortraitPipeline(
+        PORTRAIT_STORE_DIR, PORTRAIT_DIR, PORTRAIT_SIZE, session_downloader(shared_session())
+    )
+    portraits = [s for s in senators if PLACEHOLDER_MARK not in s["photo"]]
+    localized = localize_photos(portraits, pipeline)
+    pipeline.prune()
+    return f"{localized} of {len(portraits)} local; {pipeline.describe()}", pipeline.outcomes["failed"]
+
+
+def build_dashboard(fetcher, quick_mode, full, snapshot_max_age):
+    """Fetch the data and write index.html.
+
+    Returns:
+        The page's path, and what the page was written without: portraits
+        or documents that could not be fetched. generate_all builds a page
+        written without some of them again on its next run.
+    """
+    incomplete = []
     # Fetch senators from website
     print("\n[*] Fetching current senators...")
-    roster = fetch_roster(fetcher)
+    with span("fetch"):
+        roster = fetch_roster(fetcher)
     print(f"    Leadership: {len(roster['leadership'])}")
     print(f"    Senators: {len(roster['senators'])}")
+    senators = encode_roster(roster)
+
+    if not quick_mode:
+        print("\n[*] Localizing portraits...")
+        with span("portraits"):
+            note, failed = localize_portraits(senators["leadership"] + senators["senators"])
+        print(f"    Portraits: {note}")
+        if failed:
+            incomplete.append(f"{failed} portraits")
 
     # Fetch meeting links
     if quick_mode:
         print("\n[*] Quick mode - skipping meeting archives...")
         meeting_links = MeetingLinks(agendas={}, minutes={})
+        search_index = merge_index([])
     else:
         print("\n[*] Fetching meeting links...")
-        meeting_links = fetch_meeting_links(fetcher)
+        with span("fetch"):
+            refresh = refresh_archive(
+                fetcher,
+                ARCHIVE_SNAPSHOT_DIR,
+                datetime.now(timezone.utc),
+                max_age=snapshot_max_age,
+                full=full,
+                workers=FETCH_WORKERS,
+            )
+        meeting_links = refresh["links"]
+        print(f"    Refreshed years: {', '.join(refresh['refreshed']) or 'none'}")
+        print(f"    Changed upstream: {', '.join(refresh['changed']) or 'none'}")
+        print(f"    Reused snapshots: {', '.join(refresh['reused']) or 'none'}")
         agenda_total = sum(len(v) for v in meeting_links["agendas"].values())
         minutes_total = sum(len(v) for v in meeting_links["minutes"].values())
         print(f"    Agendas: {agenda_total}")
         print(f"    Minutes: {minutes_total}")
 
-    # Compile data
+        with span("index"):
+            build = build_index(refresh["archives"], SEARCH_INDEX_DIR, full=full)
+        search_index = build["index"]
+        print(
+            f"    Search index: {len(search_index['documents'])} documents, "
+            f"{len(search_index['tokens'])} tokens (rebuilt: {', '.join(build['rebuilt']) or 'none'})"
+        )
+
+        print("\n[*] Harvesting document text...")
+        started = time.perf_counter()
+        today = datetime.now(timezone.utc).date()
+        with span("harvest"):
+            harvest = harvest_archive(
+                RequestsFetcher(create_session(HARVEST_WORKERS)),
+                refresh["archives"],
+                DocumentStore(DOCUMENT_STORE_DIR),
+                TEXT_SHARD_DIR,
+                workers=HARVEST_WORKERS,
+                revalidate=full,
+                live_years=[
+                    archive["year"] for archive in refresh["archives"] if is_live(archive["year"], today)
+                ],
+            )
+        documents = harvest["documents"]
+        print(
+            f"    Documents: {documents['fetched']} fetched, {documents['revalidated']} revalidated, "
+            f"{documents['reused']} reused ({time.perf_counter() - started:.1f}s)"
+        )
+        for url, error in documents["failed"].items():
+            print(f"    [!] Skipped {url}: {error}")
+        if documents["failed"]:
+            incomplete.append(f"{len(documents['failed'])} documents")
+        print(f"    Shards written: {', '.join(harvest['shards']['written']) or 'none'}")
+
+    transport = fetcher.inner if isinstance(fetcher, InstrumentedFetcher) else fetcher
+    if isinstance(transport, CachingFetcher):
+        outcomes = transport.outcomes
+        print(
+            f"    HTTP cache: {outcomes['fetched']} fetched, "
+            f"{outcomes['revalidated']} revalidated, {outcomes['fresh']} reused"
+        )
+
+    # Compile data. The timestamp is filled in only if the page is written,
+    # so a run with nothing new leaves index.html untouched.
     data = {
-        "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "senators": encode_roster(roster),
+        "generated_at": GENERATED_AT_MARK,
+        "senators": senators,
         "meeting_links": encode_meeting_links(meeting_links),
+        "search_index": encode_meeting_index(search_index),
     }
 
     # Generate HTML
     print("\n[*] Generating HTML...")
-    html = generate_html(data)
+    started = time.perf_counter()
+    with span("render"):
+        html = generate_html(data)
+    print(f"    Rendered in {(time.perf_counter() - started) * 1000:.1f} ms")
 
     # Save as index.html for GitHub Pages
     output_path = Path(__file__).parent / "index.html"
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    with span("write"):
+        outcome = write_page(output_path, html, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
-    print(f"\n[*] Dashboard saved to: {output_path}")
+    if outcome["status"] == "unchanged":
+        print(f"\n[*] Dashboard unchanged: {output_path} ({outcome['seconds'] * 1000:.1f} ms)")
+    else:
+        print(f"\n[*] Dashboard saved to: {output_path} ({outcome['seconds'] * 1000:.1f} ms)")
+
+    if incomplete:
+        print(f"[!] Written without {' and '.join(incomplete)}; the next run tries them again")
     print("[*] Ready for GitHub Pages!")
 
-    return str(output_path)
+    return str(output_path), incomplete
 
 
 if __name__ == "__main__":
-    import sys
-
-    quick = "--quick" in sys.argv
-    main(quick_mode=quick)
+    parser = argparse.ArgumentParser(description="Generate the ASUCI senate dashboard.")
+    parser.add_argument("--quick", action="store_true", help="skip the meeting archives")
+    parser.add_argument("--full", action="store_true", help="refetch every archive year")
+    parser.add_argument(
+        "--max-age-days",
+        type=float,
+        default=DEFAULT_MAX_AGE.days,
+        help="days after which a settled year's snapshot is refetched",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="download every response in full")
+    parser.add_argument("--metrics", action="store_true", help=f"write {REPORT_NAME} with request timings")
+    parser.add_argument(
+        "--probe", action="store_true", help="print a fingerprint of the upstream data and exit"
+    )
+    parser.add_argument(
+        "--cache-max-age",
+        type=float,
+        default=HTTP_CACHE_MAX_AGE,
+        help="seconds to reuse responses from hosts that send no validators",
+    )
+    args = parser.parse_args()
+    if args.probe:
+        probe(
+            use_cache=not args.no_cache,
+            cache_max_age=args.cache_max_age,
+            snapshot_max_age=timedelta(days=args.max_age_days),
+        )
+        raise SystemExit(0)
+    _, incomplete = main(
+        quick_mode=args.quick,
+        use_cache=not args.no_cache,
+        cache_max_age=args.cache_max_age,
+        full=args.full,
+        snapshot_max_age=timedelta(days=args.max_age_days),
+        metrics=args.metrics,
+    )
+    if incomplete:
+        raise SystemExit(PARTIAL_BUILD_EXIT)
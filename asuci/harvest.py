@@ -0,0 +1,536 @@
+"""Full text of the meeting documents, harvested into per-year search shards.
+
+The dashboard links to every agenda and set of minutes, but their contents
+live behind those links. This stage, run after the archive is read, downloads
+each linked document, keeps its visible text, and publishes one compressed
+inverted index per academic year beside the page, which the page loads only
+when someone searches document text.
+
+A document is stored, with the validators its server sent, under a key
+derived from its URL alone. The store is deliberately not content-addressed
+by URL plus validator: a validator is only known once the server has
+answered, so it cannot name the record a run looks up before asking.
+Instead the stored validators are sent back, and a 304 confirms the record.
+The print links are keyed by meeting date, so a document corrected while its
+year is live, such as minutes amended at the next meeting, keeps its URL:
+stored documents of live years are revalidated on every run, at the cost of
+one conditional request each. Those of settled years are not requested
+again, except by a full run, which revalidates every stored document so a
+late correction is still picked up. The document store is an optimisation
+rather than a source of truth, so a record that cannot be read is fetched
+again.
+
+A document that fails to download is reported and left out of its shard, and
+is tried again on the next run. A shard is rewritten only when the documents
+it covers, or their texts, change, and is compressed deterministically, so an
+unchanged year leaves its published file byte for byte as it was.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from collections.abc import Collection
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Protocol, TypedDict
+
+from shared.utils.http_cache import cache_key
+
+from .client import AsuciFetchError, RevalidatedResponse
+from .models import (
+    AsuciDecodeError,
+    DocumentRecord,
+    TextShard,
+    YearArchive,
+    decode_document_record,
+    decode_text_shard_fingerprint,
+    encode_document_record,
+    encode_text_shard,
+)
+from .parse import extract_document_text
+from .search import DOCUMENT_KINDS, tokenize
+
+# Documents downloaded at once. The documents share one host, so this stays
+# well below the archive's view concurrency.
+HARVEST_WORKERS = 4
+
+# Version of the shard layout and tokenizing rules, folded into every
+# fingerprint so a change to either rebuilds every shard.
+SHARD_FORMAT = 1
+
+# Suffix of a published shard.
+SHARD_SUFFIX = ".json.gz"
+
+# Shortest token indexed; single letters and digits match nearly everything.
+MIN_TOKEN_LENGTH = 2
+
+# Words too common in meeting documents to narrow a search.
+STOP_WORDS = frozenset(
+    {
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "in",
+        "is",
+        "it",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "this",
+        "to",
+        "was",
+        "with",
+    }
+)
+
+
+class DocumentFetcher(Protocol):
+    """Retrieves a document conditionally, keeping the server's validators."""
+
+    def get_revalidated(
+        self, url: str, params: dict[str, str], headers: dict[str, str]
+    ) -> RevalidatedResponse:
+        """Fetch a URL conditionally, accepting 304 as well as success.
+
+        Args:
+            url: Absolute URL to request.
+            params: Query parameters to append.
+            headers: Conditional headers, e.g. ``If-None-Match``.
+
+        Returns:
+            The status, body, and whichever validators the server sent.
+
+        Raises:
+            AsuciFetchError: If the request fails or the status is neither
+                success nor not-modified.
+        """
+        ...
+
+
+class HarvestResult(TypedDict):
+    """The outcome of harvesting documents.
+
+    records: Every document available after the run, keyed by URL.
+    fetched: Documents downloaded in full.
+    revalidated: Stored documents the server confirmed current.
+    reused: Stored documents served without a request.
+    failed: Error message for each URL that could not be harvested.
+    """
+
+    records: dict[str, DocumentRecord]
+    fetched: int
+    revalidated: int
+    reused: int
+    failed: dict[str, str]
+
+
+class ShardWrite(TypedDict):
+    """Which year shards a run wrote.
+
+    written: Years whose shard was written.
+    unchanged: Years whose published shard already matched.
+    """
+
+    written: list[str]
+    unchanged: list[str]
+
+
+class HarvestRun(TypedDict):
+    """The outcome of the whole stage.
+
+    documents: How the documents were harvested.
+    shards: Which shards were written.
+    """
+
+    documents: HarvestResult
+    shards: ShardWrite
+
+
+class DocumentStore:
+    """Harvested documents on disk, one file per URL whatever its validators."""
+
+    def __init__(self, directory: Path) -> None:
+        """Configure the store.
+
+        Args:
+            directory: Where record files are kept; created on first save.
+        """
+        self.directory = directory
+
+    def path(self, url: str) -> Path:
+        """Locate the record for a URL.
+
+        Args:
+            url: Document URL.
+
+        Returns:
+            The record's path.
+        """
+        return self.directory / f"{cache_key(url, {})}.json"
+
+    def load(self, url: str) -> DocumentRecord | None:
+        """Read a stored document.
+
+        Args:
+            url: Document URL.
+
+        Returns:
+            The record, or None if absent or unreadable. An unreadable record
+            is removed, so the document is fetched again.
+        """
+        path = self.path(url)
+        try:
+            raw = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+        try:
+            record = decode_document_record(json.loads(raw))
+        except (json.JSONDecodeError, AsuciDecodeError):
+            path.unlink(missing_ok=True)
+            return None
+        if record["url"] != url:
+            path.unlink(missing_ok=True)
+            return None
+        return record
+
+    def save(self, record: DocumentRecord) -> None:
+        """Store a document, replacing any earlier record atomically.
+
+        Args:
+            record: Record to store.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(record["url"])
+        staging = path.with_suffix(".tmp")
+        staging.write_text(json.dumps(encode_document_record(record), ensure_ascii=False), encoding="utf-8")
+        os.replace(staging, path)
+
+
+def document_urls(archives: list[YearArchive]) -> list[str]:
+    """List the documents linked from the archive.
+
+    Args:
+        archives: Each year's archive.
+
+    Returns:
+        Every distinct absolute URL, in archive order.
+    """
+    urls = [
+        link["url"]
+        for archive in archives
+        for links in (archive["agendas"], archive["minutes"])
+        for link in links
+        if link["url"].startswith(("http://", "https://"))
+    ]
+    return list(dict.fromkeys(urls))
+
+
+def _fetch_document(
+    fetcher: DocumentFetcher, url: str, stored: DocumentRecord | None
+) -> tuple[DocumentRecord, bool]:
+    """Download a document, or confirm a stored one is current.
+
+    Args:
+        fetcher: Transport used to retrieve the document.
+        url: Document URL.
+        stored: The stored record, whose validators are sent when present.
+
+    Returns:
+        The current record, and whether the server confirmed the stored one.
+
+    Raises:
+        AsuciFetchError: If the request fails, or the server answers 304 to a
+            request that carried no validators.
+    """
+    headers: dict[str, str] = {}
+    if stored is not None and stored["etag"]:
+        headers["If-None-Match"] = stored["etag"]
+    if stored is not None and stored["last_modified"]:
+        headers["If-Modified-Since"] = stored["last_modified"]
+
+    response = fetcher.get_revalidated(url, {}, headers)
+    if response["status"] == 304:
+        if stored is None or not headers:
+            raise AsuciFetchError(f"GET {url} returned HTTP 304 to an unconditional request")
+        return (
+            DocumentRecord(
+                url=url,
+                etag=response["etag"] or stored["etag"],
+                last_modified=response["last_modified"] or stored["last_modified"],
+                text_hash=stored["text_hash"],
+                text=stored["text"],
+            ),
+            True,
+        )
+
+    text = extract_document_text(response["text"])
+    record = DocumentRecord(
+        url=url,
+        etag=response["etag"],
+        last_modified=response["last_modified"],
+        text_hash=hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        text=text,
+    )
+    return record, False
+
+
+def harvest_documents(
+    fetcher: DocumentFetcher,
+    urls: list[str],
+    store: DocumentStore,
+    workers: int = HARVEST_WORKERS,
+    revalidate: bool = False,
+    revalidate_urls: Collection[str] = (),
+) -> HarvestResult:
+    """Bring the store up to date with the given documents.
+
+    Stored documents are served without a request unless ``revalidate`` is
+    set or they are among ``revalidate_urls``. The rest are downloaded with at
+    most ``workers`` requests in flight.
+
+    Args:
+        fetcher: Transport used to retrieve the documents. Must be safe to
+            call from several threads when ``workers`` is above one.
+        urls: Document URLs; repeats are harvested once.
+        store: Where documents are kept between runs.
+        workers: Maximum requests in flight at once.
+        revalidate: Ask the server about every stored document, sending its
+            validators.
+        revalidate_urls: Stored documents to ask the server about even when
+            ``revalidate`` is not set.
+
+    Returns:
+        The records and how each document was served.
+
+    Raises:
+        ValueError: If ``workers`` is below one.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+
+    always = frozenset(revalidate_urls)
+    records: dict[str, DocumentRecord] = {}
+    pending: list[tuple[str, DocumentRecord | None]] = []
+    for url in dict.fromkeys(urls):
+        stored = store.load(url)
+        if stored is not None and not revalidate and url not in always:
+            records[url] = stored
+        else:
+            pending.append((url, stored))
+
+    result = HarvestResult(records=records, fetched=0, revalidated=0, reused=len(records), failed={})
+    if not pending:
+        return result
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+        futures: list[tuple[str, Future[tuple[DocumentRecord, bool]]]] = [
+            (url, pool.submit(_fetch_document, fetcher, url, stored)) for url, stored in pending
+        ]
+        for url, future in futures:
+            try:
+                record, confirmed = future.result()
+            except AsuciFetchError as error:
+                result["failed"][url] = str(error)
+                continue
+            store.save(record)
+            records[url] = record
+            if confirmed:
+                result["revalidated"] += 1
+            else:
+                result["fetched"] += 1
+
+    return result
+
+
+def index_tokens(text: str) -> list[str]:
+    """Split document text into the tokens a shard indexes.
+
+    Args:
+        text: Document text.
+
+    Returns:
+        The distinct tokens, without stop words or single characters.
+    """
+    return [token for token in tokenize(text) if len(token) >= MIN_TOKEN_LENGTH and token not in STOP_WORDS]
+
+
+def year_documents(
+    archive: YearArchive, records: dict[str, DocumentRecord]
+) -> list[tuple[str, int, DocumentRecord]]:
+    """Pair a year's links with their harvested documents.
+
+    Args:
+        archive: The year's archive.
+        records: Harvested documents keyed by URL.
+
+    Returns:
+        The kind, position and record of each harvested document, agendas
+        first, each kind in published order.
+    """
+    documents: list[tuple[str, int, DocumentRecord]] = []
+    for kind in DOCUMENT_KINDS:
+        links = archive["agendas"] if kind == "agendas" else archive["minutes"]
+        for position, link in enumerate(links):
+            record = records.get(link["url"])
+            if record is not None:
+                documents.append((kind, position, record))
+    return documents
+
+
+def shard_fingerprint(documents: list[tuple[str, int, DocumentRecord]]) -> str:
+    """Hash what a shard is built from.
+
+    Args:
+        documents: The year's documents, as ``year_documents`` returns them.
+
+    Returns:
+        The hex SHA-256 over the shard format and each document's kind,
+        position, URL and text hash.
+    """
+    covered = [[kind, position, record["url"], record["text_hash"]] for kind, position, record in documents]
+    canonical = json.dumps([SHARD_FORMAT, covered], separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def build_text_shard(year: str, documents: list[tuple[str, int, DocumentRecord]]) -> TextShard:
+    """Build the full-text index over one year's documents.
+
+    Args:
+        year: Academic year label.
+        documents: The year's documents, as ``year_documents`` returns them.
+
+    Returns:
+        The shard, numbering documents in the order given.
+    """
+    postings: dict[str, list[int]] = {}
+    for number, (_, _, record) in enumerate(documents):
+        for token in index_tokens(record["text"]):
+            postings.setdefault(token, []).append(number)
+
+    tokens = sorted(postings)
+    return TextShard(
+        year=year,
+        fingerprint=shard_fingerprint(documents),
+        documents=[(kind, position) for kind, position, _ in documents],
+        tokens=tokens,
+        postings=[postings[token] for token in tokens],
+    )
+
+
+def shard_path(directory: Path, year_label: str) -> Path:
+    """Locate the published shard for a year.
+
+    Args:
+        directory: Directory the shards are published in.
+        year_label: Academic year label.
+
+    Returns:
+        The shard's path.
+    """
+    return directory / f"{year_label}{SHARD_SUFFIX}"
+
+
+def read_shard_fingerprint(path: Path) -> str | None:
+    """Read the fingerprint of a published shard.
+
+    Args:
+        path: Shard to inspect.
+
+    Returns:
+        The fingerprint, or None if the shard is absent or unreadable, in which
+        case it is rebuilt.
+    """
+    try:
+        return decode_text_shard_fingerprint(json.loads(gzip.decompress(path.read_bytes())))
+    except (OSError, EOFError, json.JSONDecodeError, AsuciDecodeError):
+        return None
+
+
+def write_shard(directory: Path, shard: TextShard) -> None:
+    """Publish a shard, replacing any earlier one atomically.
+
+    The archive carries no timestamp, so the same shard always compresses to
+    the same bytes.
+
+    Args:
+        directory: Directory the shards are published in; created if absent.
+        shard: Shard to publish.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    path = shard_path(directory, shard["year"])
+    body = json.dumps(encode_text_shard(shard), ensure_ascii=False, separators=(",", ":"))
+    staging = path.with_suffix(".tmp")
+    staging.write_bytes(gzip.compress(body.encode("utf-8"), mtime=0))
+    os.replace(staging, path)
+
+
+def write_year_shards(
+    archives: list[YearArchive], records: dict[str, DocumentRecord], directory: Path
+) -> ShardWrite:
+    """Publish a shard for each year whose documents changed.
+
+    Years with no harvested documents get no shard.
+
+    Args:
+        archives: Each year's archive.
+        records: Harvested documents keyed by URL.
+        directory: Directory the shards are published in.
+
+    Returns:
+        Which years were written and which were already current.
+    """
+    outcome = ShardWrite(written=[], unchanged=[])
+    for archive in archives:
+        documents = year_documents(archive, records)
+        if not documents:
+            continue
+        year = archive["year"]
+        if read_shard_fingerprint(shard_path(directory, year)) == shard_fingerprint(documents):
+            outcome["unchanged"].append(year)
+            continue
+        write_shard(directory, build_text_shard(year, documents))
+        outcome["written"].append(year)
+    return outcome
+
+
+def harvest_archive(
+    fetcher: DocumentFetcher,
+    archives: list[YearArchive],
+    store: DocumentStore,
+    shard_directory: Path,
+    workers: int = HARVEST_WORKERS,
+    revalidate: bool = False,
+    live_years: Collection[str] = (),
+) -> HarvestRun:
+    """Harvest every linked document and publish the year shards.
+
+    Args:
+        fetcher: Transport used to retrieve the documents.
+        archives: Each year's archive.
+        store: Where documents are kept between runs.
+        shard_directory: Directory the shards are published in.
+        workers: Maximum requests in flight at once.
+        revalidate: Ask the server about every stored document.
+        live_years: Years whose documents can still be corrected in place;
+            their stored documents are revalidated on every run.
+
+    Returns:
+        How the documents were harvested and which shards were written.
+
+    Raises:
+        ValueError: If ``workers`` is below one.
+    """
+    live_urls = document_urls([archive for archive in archives if archive["year"] in live_years])
+    documents = harvest_documents(fetcher, document_urls(archives), store, workers, revalidate, live_urls)
+    shards = write_year_shards(archives, documents["records"], shard_directory)
+    return HarvestRun(documents=documents, shards=shards)
@@ -0,0 +1,307 @@
+"""Per-request transport metrics for a generator run.
+
+When a scheduled run is slow, the question is where the time went: resolving
+and handshaking with the hosts, waiting on the view endpoint, or decoding and
+parsing what came back. An ``InstrumentedFetcher`` records each request here,
+and the run report summarises them per endpoint.
+
+Layers below the fetcher, which cannot see the recorder, annotate the request
+in progress through a probe held for the current thread: the transport notes
+the status and body size it received, and the tracking connections note each
+new connection they open and how long it took. With no probe open these notes
+are dropped, and production builds neither the probe nor the tracking
+connections unless metrics are enabled.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Literal, TypedDict
+
+# File name of the run report, written beside the dashboard page.
+REPORT_NAME = "run-report.json"
+
+
+class RequestRecord(TypedDict):
+    """One request as the fetcher's caller saw it.
+
+    endpoint: URL without its query parameters.
+    seconds: Wall time from call to return or failure.
+    bytes: Body bytes received, or for a request answered without going to
+        the network, the size of the body returned.
+    status: HTTP status received, or None if no response arrived.
+    connection: "new" if a connection was opened for the request, "reused"
+        if a pooled one carried it, "none" if no request was sent.
+    connect_seconds: Time spent opening connections, including DNS and TLS.
+    error: Failure message, empty on success.
+    """
+
+    endpoint: str
+    seconds: float
+    bytes: int
+    status: int | None
+    connection: Literal["new", "reused", "none"]
+    connect_seconds: float
+    error: str
+
+
+class ParseRecord(TypedDict):
+    """Time spent turning one response body into records.
+
+    endpoint: URL the body came from.
+    decode_seconds: Time to parse the JSON and check its shape.
+    parse_seconds: Time to read the records out of the markup.
+    """
+
+    endpoint: str
+    decode_seconds: float
+    parse_seconds: float
+
+
+class EndpointSummary(TypedDict):
+    """Requests to one endpoint, aggregated.
+
+    requests: Number of requests.
+    failures: Requests that raised.
+    bytes: Total bytes received.
+    statuses: Count of requests per status, keyed by the status as text.
+    connections: Count of requests per connection kind.
+    connect_seconds: Total time spent opening connections.
+    seconds_p50: Median request wall time.
+    seconds_p95: 95th percentile request wall time.
+    decode_seconds_p50: Median decode time, zero if nothing was decoded.
+    decode_seconds_p95: 95th percentile decode time, zero if nothing was decoded.
+    parse_seconds_p50: Median parse time, zero if nothing was parsed.
+    parse_seconds_p95: 95th percentile parse time, zero if nothing was parsed.
+    """
+
+    requests: int
+    failures: int
+    bytes: int
+    statuses: dict[str, int]
+    connections: dict[str, int]
+    connect_seconds: float
+    seconds_p50: float
+    seconds_p95: float
+    decode_seconds_p50: float
+    decode_seconds_p95: float
+    parse_seconds_p50: float
+    parse_seconds_p95: float
+
+
+class RunReport(TypedDict):
+    """Everything recorded during a run.
+
+    generated_at: When the report was produced, as an ISO timestamp.
+    wall_seconds: Time from the recorder's creation to the report.
+    endpoints: Summaries keyed by endpoint.
+    requests: Every request, in the order they finished.
+    parses: Every decode and parse, in the order they finished.
+    """
+
+    generated_at: str
+    wall_seconds: float
+    endpoints: dict[str, EndpointSummary]
+    requests: list[RequestRecord]
+    parses: list[ParseRecord]
+
+
+class RequestProbe:
+    """Notes the transport leaves about the request in progress on a thread.
+
+    status: HTTP status received, or None until a response arrives.
+    received_bytes: Body bytes received with that response.
+    connections_opened: Connections opened while serving the request.
+    connect_seconds: Time those connections took to open.
+    """
+
+    __slots__ = ("connect_seconds", "connections_opened", "received_bytes", "status")
+
+    def __init__(self) -> None:
+        """Start with nothing observed."""
+        self.status: int | None = None
+        self.received_bytes = 0
+        self.connections_opened = 0
+        self.connect_seconds = 0.0
+
+
+_local = threading.local()
+
+
+@contextmanager
+def probe() -> Iterator[RequestProbe]:
+    """Open a probe for a request made on this thread.
+
+    Yields:
+        The probe the transport annotates while the block runs.
+    """
+    notes = RequestProbe()
+    previous: RequestProbe | None = getattr(_local, "probe", None)
+    _local.probe = notes
+    try:
+        yield notes
+    finally:
+        _local.probe = previous
+
+
+def note_response(status: int, received_bytes: int) -> None:
+    """Record the response to the request in progress, if it is probed.
+
+    Args:
+        status: HTTP status received.
+        received_bytes: Body bytes received.
+    """
+    notes: RequestProbe | None = getattr(_local, "probe", None)
+    if notes is not None:
+        notes.status = status
+        notes.received_bytes = received_bytes
+
+
+def note_connect(seconds: float) -> None:
+    """Record a connection opened for the request in progress, if it is probed.
+
+    Args:
+        seconds: Time the connection took to open.
+    """
+    notes: RequestProbe | None = getattr(_local, "probe", None)
+    if notes is not None:
+        notes.connections_opened += 1
+        notes.connect_seconds += seconds
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Pick a nearest-rank percentile.
+
+    Args:
+        values: Observations, in any order.
+        fraction: Percentile as a fraction, e.g. 0.95.
+
+    Returns:
+        The smallest observation at or above the given fraction of the data,
+        or zero when there are none.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+class MetricsRecorder:
+    """Collects request and parse records from any number of threads."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        """Start recording.
+
+        Args:
+            clock: Monotonic clock in seconds, used for every measurement.
+        """
+        self.clock = clock
+        self._started = clock()
+        self._lock = threading.Lock()
+        self._requests: list[RequestRecord] = []
+        self._parses: list[ParseRecord] = []
+
+    def record_request(self, record: RequestRecord) -> None:
+        """Add a finished request.
+
+        Args:
+            record: The request.
+        """
+        with self._lock:
+            self._requests.append(record)
+
+    def record_parse(self, endpoint: str, decode_seconds: float, parse_seconds: float) -> None:
+        """Add a finished decode and parse.
+
+        Args:
+            endpoint: URL the body came from.
+            decode_seconds: Time to parse the JSON and check its shape.
+            parse_seconds: Time to read the records out of the markup.
+        """
+        with self._lock:
+            self._parses.append(
+                ParseRecord(endpoint=endpoint, decode_seconds=decode_seconds, parse_seconds=parse_seconds)
+            )
+
+    def report(self, generated_at: str) -> RunReport:
+        """Summarise everything recorded so far.
+
+        Args:
+            generated_at: Timestamp to stamp the report with.
+
+        Returns:
+            The report, with endpoints in the order first requested.
+        """
+        with self._lock:
+            requests = list(self._requests)
+            parses = list(self._parses)
+
+        endpoints: dict[str, EndpointSummary] = {}
+        for endpoint in dict.fromkeys(record["endpoint"] for record in requests):
+            endpoints[endpoint] = _summarise(
+                [record for record in requests if record["endpoint"] == endpoint],
+                [record for record in parses if record["endpoint"] == endpoint],
+            )
+
+        return RunReport(
+            generated_at=generated_at,
+            wall_seconds=self.clock() - self._started,
+            endpoints=endpoints,
+            requests=requests,
+            parses=parses,
+        )
+
+
+def _summarise(requests: list[RequestRecord], parses: list[ParseRecord]) -> EndpointSummary:
+    """Aggregate one endpoint's records.
+
+    Args:
+        requests: The endpoint's requests.
+        parses: The endpoint's decodes and parses.
+
+    Returns:
+        The summary.
+    """
+    statuses: dict[str, int] = {}
+    connections: dict[str, int] = {"new": 0, "reused": 0, "none": 0}
+    for record in requests:
+        status = "none" if record["status"] is None else str(record["status"])
+        statuses[status] = statuses.get(status, 0) + 1
+        connections[record["connection"]] += 1
+
+    seconds = [record["seconds"] for record in requests]
+    decode_seconds = [record["decode_seconds"] for record in parses]
+    parse_seconds = [record["parse_seconds"] for record in parses]
+
+    return EndpointSummary(
+        requests=len(requests),
+        failures=sum(1 for record in requests if record["error"]),
+        bytes=sum(record["bytes"] for record in requests),
+        statuses=statuses,
+        connections=connections,
+        connect_seconds=sum(record["connect_seconds"] for record in requests),
+        seconds_p50=percentile(seconds, 0.5),
+        seconds_p95=percentile(seconds, 0.95),
+        decode_seconds_p50=percentile(decode_seconds, 0.5),
+        decode_seconds_p95=percentile(decode_seconds, 0.95),
+        parse_seconds_p50=percentile(parse_seconds, 0.5),
+        parse_seconds_p95=percentile(parse_seconds, 0.95),
+    )
+
+
+def write_report(path: Path, report: RunReport) -> None:
+    """Write a run report as JSON, replacing any earlier one atomically.
+
+    Args:
+        path: File to write.
+        report: The report.
+    """
+    staging = path.with_suffix(".tmp")
+    staging.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    os.replace(staging, path)
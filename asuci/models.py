@@ -22,6 +22,10 @@ MINUTES_VIEW_ID = 1694
 AGENDA_VIEW_SLUG = "asuci-public-senate-agenda-homepage-view"
 MINUTES_VIEW_SLUG = "asuci-public-council-minutes-view"
 
+# Layout version of stored year snapshots. A snapshot stored under another
+# version is read again from upstream rather than decoded.
+SNAPSHOT_FORMAT = 2
+
 
 class AsuciDecodeError(ValueError):
     """Raised when an upstream payload does not match the expected shape."""
@@ -46,10 +50,13 @@ class MeetingLink(TypedDict):
     """A link to one meeting document.
 
     date: Human-readable meeting date exactly as published.
+    iso_date: The same date as "YYYY-MM-DD", empty if the published date
+        names a day the calendar does not have.
     url: Absolute URL to the printable agenda or minutes.
     """
 
     date: str
+    iso_date: str
     url: str
 
 
@@ -80,12 +87,122 @@ class ViewResponse(TypedDict):
     rendered_html: str
 
 
-def require_str(payload: dict[str, object], field: str) -> str:
+class YearArchive(TypedDict):
+    """One academic year of meeting documents, as read from both views.
+
+    year: Academic year label, e.g. "24-25".
+    agendas: Agenda links in published order.
+    minutes: Minutes links in published order.
+    payload_hash: SHA-256 over both view bodies, to tell whether anything
+        upstream changed since the year was last read.
+    """
+
+    year: str
+    agendas: list[MeetingLink]
+    minutes: list[MeetingLink]
+    payload_hash: str
+
+
+class YearSnapshot(YearArchive):
+    """A year archive persisted between runs.
+
+    fetched_at: When the year was read, as an ISO 8601 timestamp with offset.
+    """
+
+    fetched_at: str
+
+
+class IndexEntry(TypedDict):
+    """One meeting document as the search index sees it.
+
+    kind: "agendas" or "minutes".
+    position: Index of the link within its year and kind.
+    iso_date: The link's ISO date, empty if it has none.
+    tokens: Distinct lowercase words the document is found by.
+    """
+
+    kind: str
+    position: int
+    iso_date: str
+    tokens: list[str]
+
+
+class YearIndex(TypedDict):
+    """The search entries for one academic year, stored between runs.
+
+    year: Academic year label.
+    payload_hash: Hash of the archive the entries were built from.
+    entries: One entry per agenda, then per minutes, in published order.
+    """
+
+    year: str
+    payload_hash: str
+    entries: list[IndexEntry]
+
+
+class MeetingIndex(TypedDict):
+    """The search index embedded in the dashboard page.
+
+    Documents are numbered by date, so a date range is a slice found by binary
+    search over ``ordinals``, and a keyword is a binary search over ``tokens``
+    followed by a read of its postings.
+
+    ordinals: Days since 1970-01-01 of each dated document, ascending.
+    documents: The (kind, year, position) of every document, locating its
+        link in the page's meeting links. The first ``len(ordinals)`` are the
+        dated documents in the order of ``ordinals``; undated ones follow.
+    tokens: Every indexed word, sorted.
+    postings: For each token, the ascending numbers of the documents holding it.
+    """
+
+    ordinals: list[int]
+    documents: list[tuple[str, str, int]]
+    tokens: list[str]
+    postings: list[list[int]]
+
+
+class DocumentRecord(TypedDict):
+    """A harvested meeting document, stored between runs.
+
+    url: URL the document was read from.
+    etag: ``ETag`` the server sent, empty when it sent none.
+    last_modified: ``Last-Modified`` the server sent, empty when it sent none.
+    text_hash: SHA-256 of ``text``, to tell whether a document's content moved.
+    text: The document's visible text.
+    """
+
+    url: str
+    etag: str
+    last_modified: str
+    text_hash: str
+    text: str
+
+
+class TextShard(TypedDict):
+    """Full-text index over one academic year's harvested documents.
+
+    year: Academic year label.
+    fingerprint: Hash over the documents and texts the shard was built from.
+    documents: The (kind, position) of each document, locating its link
+        within the year's meeting links.
+    tokens: Every indexed word, sorted.
+    postings: For each token, the ascending numbers of the documents holding it.
+    """
+
+    year: str
+    fingerprint: str
+    documents: list[tuple[str, int]]
+    tokens: list[str]
+    postings: list[list[int]]
+
+
+def require_str(payload: dict[str, object], field: str, context: str = "view response") -> str:
     """Read a required string field.
 
     Args:
         payload: Decoded JSON object.
         field: Field name to read.
+        context: Description of the object, used in error messages.
 
     Returns:
         The field value.
@@ -95,11 +212,11 @@ def require_str(payload: dict[str, object], field: str) -> str:
     """
     value = payload.get(field)
     if not isinstance(value, str):
-        raise AsuciDecodeError(f"view response: {field!r} must be a string, got {type(value).__name__}")
+        raise AsuciDecodeError(f"{context}: {field!r} must be a string, got {type(value).__name__}")
     return value
 
 
-def require_int(payload: dict[str, object], field: str) -> int:
+def require_int(payload: dict[str, object], field: str, context: str = "view response") -> int:
     """Read a required integer field.
 
     Booleans are rejected even though Python treats them as integers.
@@ -107,6 +224,7 @@ def require_int(payload: dict[str, object], field: str) -> int:
     Args:
         payload: Decoded JSON object.
         field: Field name to read.
+        context: Description of the object, used in error messages.
 
     Returns:
         The field value.
@@ -116,10 +234,188 @@ def require_int(payload: dict[str, object], field: str) -> int:
     """
     value = payload.get(field)
     if isinstance(value, bool) or not isinstance(value, int):
-        raise AsuciDecodeError(f"view response: {field!r} must be an integer, got {type(value).__name__}")
+        raise AsuciDecodeError(f"{context}: {field!r} must be an integer, got {type(value).__name__}")
     return value
 
 
+def require_str_list(payload: dict[str, object], field: str, context: str) -> list[str]:
+    """Read a required list of strings.
+
+    Args:
+        payload: Decoded JSON object.
+        field: Field name to read.
+        context: Description of the object, used in error messages.
+
+    Returns:
+        The strings, in stored order.
+
+    Raises:
+        AsuciDecodeError: If the field is absent, not a list, or holds
+            anything but strings.
+    """
+    value = payload.get(field)
+    if not isinstance(value, list):
+        raise AsuciDecodeError(f"{context}: {field!r} must be a list, got {type(value).__name__}")
+    items: list[str] = []
+    for item in value:
+        if not isinstance(item, str):
+            raise AsuciDecodeError(f"{context}: {field!r} must hold strings, got {type(item).__name__}")
+        items.append(item)
+    return items
+
+
+def require_object(value: object, context: str) -> dict[str, object]:
+    """Read a value that must be a JSON object.
+
+    Args:
+        value: Decoded JSON value.
+        context: Description of the value, used in error messages.
+
+    Returns:
+        The object, with its keys as strings.
+
+    Raises:
+        AsuciDecodeError: If the value is not an object.
+    """
+    if not isinstance(value, dict):
+        raise AsuciDecodeError(f"{context}: expected an object, got {type(value).__name__}")
+    return {str(key): item for key, item in value.items()}
+
+
+def decode_meeting_links_list(value: object, context: str) -> list[MeetingLink]:
+    """Decode a stored list of meeting links.
+
+    Args:
+        value: Decoded JSON value.
+        context: Description of the list, used in error messages.
+
+    Returns:
+        The links, in stored order.
+
+    Raises:
+        AsuciDecodeError: If the value is not a list of date, iso_date and url
+            objects.
+    """
+    if not isinstance(value, list):
+        raise AsuciDecodeError(f"{context}: expected a list, got {type(value).__name__}")
+
+    links: list[MeetingLink] = []
+    for index, raw in enumerate(value):
+        item_context = f"{context}[{index}]"
+        fields = require_object(raw, item_context)
+        links.append(
+            MeetingLink(
+                date=require_str(fields, "date", item_context),
+                iso_date=require_str(fields, "iso_date", item_context),
+                url=require_str(fields, "url", item_context),
+            )
+        )
+    return links
+
+
+def decode_year_snapshot(payload: object) -> YearSnapshot:
+    """Decode a persisted year snapshot.
+
+    Args:
+        payload: Object parsed from the snapshot file's JSON.
+
+    Returns:
+        The validated snapshot.
+
+    Raises:
+        AsuciDecodeError: If the payload or any link does not match the shape,
+            or the snapshot was stored under another format.
+    """
+    fields = require_object(payload, "year snapshot")
+    snapshot_format = require_int(fields, "format", "year snapshot")
+    if snapshot_format != SNAPSHOT_FORMAT:
+        raise AsuciDecodeError(f"year snapshot: expected format {SNAPSHOT_FORMAT}, got {snapshot_format}")
+    return YearSnapshot(
+        year=require_str(fields, "year", "year snapshot"),
+        agendas=decode_meeting_links_list(fields.get("agendas"), "year snapshot.agendas"),
+        minutes=decode_meeting_links_list(fields.get("minutes"), "year snapshot.minutes"),
+        payload_hash=require_str(fields, "payload_hash", "year snapshot"),
+        fetched_at=require_str(fields, "fetched_at", "year snapshot"),
+    )
+
+
+def decode_year_index(payload: object) -> YearIndex:
+    """Decode a stored year of search entries.
+
+    Args:
+        payload: Object parsed from the index file's JSON.
+
+    Returns:
+        The validated year index.
+
+    Raises:
+        AsuciDecodeError: If the payload or any entry does not match the shape.
+    """
+    fields = require_object(payload, "year index")
+    raw_entries = fields.get("entries")
+    if not isinstance(raw_entries, list):
+        raise AsuciDecodeError(f"year index: 'entries' must be a list, got {type(raw_entries).__name__}")
+
+    entries: list[IndexEntry] = []
+    for index, raw in enumerate(raw_entries):
+        context = f"year index.entries[{index}]"
+        entry = require_object(raw, context)
+        entries.append(
+            IndexEntry(
+                kind=require_str(entry, "kind", context),
+                position=require_int(entry, "position", context),
+                iso_date=require_str(entry, "iso_date", context),
+                tokens=require_str_list(entry, "tokens", context),
+            )
+        )
+
+    return YearIndex(
+        year=require_str(fields, "year", "year index"),
+        payload_hash=require_str(fields, "payload_hash", "year index"),
+        entries=entries,
+    )
+
+
+def decode_document_record(payload: object) -> DocumentRecord:
+    """Decode a stored meeting document.
+
+    Args:
+        payload: Object parsed from the record file's JSON.
+
+    Returns:
+        The validated record.
+
+    Raises:
+        AsuciDecodeError: If the payload does not match the shape.
+    """
+    fields = require_object(payload, "document record")
+    return DocumentRecord(
+        url=require_str(fields, "url", "document record"),
+        etag=require_str(fields, "etag", "document record"),
+        last_modified=require_str(fields, "last_modified", "document record"),
+        text_hash=require_str(fields, "text_hash", "document record"),
+        text=require_str(fields, "text", "document record"),
+    )
+
+
+def decode_text_shard_fingerprint(payload: object) -> str:
+    """Read the fingerprint of a stored full-text shard.
+
+    Only the fingerprint is checked: a shard is compared with what it would be
+    rebuilt from, never read back into records.
+
+    Args:
+        payload: Object parsed from the shard's JSON.
+
+    Returns:
+        The fingerprint.
+
+    Raises:
+        AsuciDecodeError: If the payload is not an object with a fingerprint.
+    """
+    return require_str(require_object(payload, "text shard"), "fingerprint", "text shard")
+
+
 def decode_view_response(payload: object, expected_slug: str) -> ViewResponse:
     """Decode a Formidable view response.
 
@@ -154,6 +450,30 @@ def decode_view_response(payload: object, expected_slug: str) -> ViewResponse:
     )
 
 
+def assemble_meeting_links(archives: list[YearArchive]) -> MeetingLinks:
+    """Group per-year archives by document type.
+
+    Years yielding no documents are omitted rather than stored empty, so the
+    dashboard shows only years that actually have records.
+
+    Args:
+        archives: Year archives, newest first.
+
+    Returns:
+        Agendas and minutes keyed by academic year label, in archive order.
+    """
+    agendas: dict[str, list[MeetingLink]] = {}
+    minutes: dict[str, list[MeetingLink]] = {}
+
+    for archive in archives:
+        if archive["agendas"]:
+            agendas[archive["year"]] = archive["agendas"]
+        if archive["minutes"]:
+            minutes[archive["year"]] = archive["minutes"]
+
+    return MeetingLinks(agendas=agendas, minutes=minutes)
+
+
 def encode_senator(senator: Senator) -> dict[str, str]:
     """Render a senator as a plain dictionary for HTML generation.
 
@@ -178,9 +498,105 @@ def encode_meeting_link(link: MeetingLink) -> dict[str, str]:
         link: Record to encode.
 
     Returns:
-        A dictionary with the date and url fields.
+        A dictionary with the date, iso_date and url fields.
+    """
+    return {"date": link["date"], "iso_date": link["iso_date"], "url": link["url"]}
+
+
+def encode_year_snapshot(snapshot: YearSnapshot) -> dict[str, object]:
+    """Render a year snapshot as a plain dictionary for storage.
+
+    Args:
+        snapshot: Snapshot to encode.
+
+    Returns:
+        A dictionary that ``decode_year_snapshot`` reads back unchanged.
+    """
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "year": snapshot["year"],
+        "fetched_at": snapshot["fetched_at"],
+        "payload_hash": snapshot["payload_hash"],
+        "agendas": [encode_meeting_link(link) for link in snapshot["agendas"]],
+        "minutes": [encode_meeting_link(link) for link in snapshot["minutes"]],
+    }
+
+
+def encode_year_index(year_index: YearIndex) -> dict[str, object]:
+    """Render a year index as a plain dictionary for storage.
+
+    Args:
+        year_index: Year index to encode.
+
+    Returns:
+        A dictionary that ``decode_year_index`` reads back unchanged.
+    """
+    return {
+        "year": year_index["year"],
+        "payload_hash": year_index["payload_hash"],
+        "entries": [
+            {
+                "kind": entry["kind"],
+                "position": entry["position"],
+                "iso_date": entry["iso_date"],
+                "tokens": list(entry["tokens"]),
+            }
+            for entry in year_index["entries"]
+        ],
+    }
+
+
+def encode_meeting_index(index: MeetingIndex) -> dict[str, object]:
+    """Render a search index as plain lists for HTML generation.
+
+    Args:
+        index: Index to encode.
+
+    Returns:
+        A dictionary of the index's four arrays, documents as lists.
     """
-    return {"date": link["date"], "url": link["url"]}
+    return {
+        "ordinals": list(index["ordinals"]),
+        "documents": [list(document) for document in index["documents"]],
+        "tokens": list(index["tokens"]),
+        "postings": [list(ids) for ids in index["postings"]],
+    }
+
+
+def encode_document_record(record: DocumentRecord) -> dict[str, str]:
+    """Render a meeting document as a plain dictionary for storage.
+
+    Args:
+        record: Record to encode.
+
+    Returns:
+        A dictionary that ``decode_document_record`` reads back unchanged.
+    """
+    return {
+        "url": record["url"],
+        "etag": record["etag"],
+        "last_modified": record["last_modified"],
+        "text_hash": record["text_hash"],
+        "text": record["text"],
+    }
+
+
+def encode_text_shard(shard: TextShard) -> dict[str, object]:
+    """Render a full-text shard as plain lists for publishing.
+
+    Args:
+        shard: Shard to encode.
+
+    Returns:
+        A dictionary of the shard's fields, documents as lists.
+    """
+    return {
+        "year": shard["year"],
+        "fingerprint": shard["fingerprint"],
+        "documents": [list(document) for document in shard["documents"]],
+        "tokens": list(shard["tokens"]),
+        "postings": [list(ids) for ids in shard["postings"]],
+    }
 
 
 def encode_roster(roster: SenateRoster) -> dict[str, list[dict[str, str]]]:
@@ -10,11 +10,22 @@ The senate site is an Avada/Fusion WordPress theme. Two structures matter:
   address. The photo lives on the nearest enclosing ``.fusion-layout-column``.
 - Meeting documents arrive as a markup fragment of ``<a>`` elements whose text
   is the meeting date.
+- Each linked document is a printable page whose visible text is what the
+  full-text search indexes.
+
+Meeting fragments are read by a streaming tokenizer that never builds a tree.
+It handles the flat anchor lists Formidable renders; on anything whose meaning
+depends on the tree, such as a nested anchor or a character reference in a
+date, it defers to the BeautifulSoup reading, which stays the reference.
 """
 
 import re
+from datetime import date
+from html.parser import HTMLParser
 
 from bs4 import BeautifulSoup, Tag
+from bs4.element import NavigableString, PageElement
+from bs4.filter import SoupStrainer
 
 from .models import MeetingLink, SenateRoster, Senator
 
@@ -34,12 +45,47 @@ LEADERSHIP_TITLES = (
 # Marks a roster block as an unfilled seat.
 VACANT_MARKER = "vacant"
 
-# A published meeting date, e.g. "June 5, 2025".
-MEETING_DATE = re.compile(
-    r"(January|February|March|April|May|June|July|August|September|October|November|December)"
-    r"\s+\d{1,2},?\s*\d{4}"
+# Month names as published, in calendar order.
+MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
 )
 
+# A published meeting date, e.g. "June 5, 2025", capturing month, day and year.
+MEETING_DATE = re.compile(rf"({'|'.join(MONTH_NAMES)})\s+(\d{{1,2}}),?\s*(\d{{4}})")
+
+
+# Class marking a roster text block, and the layout column holding its portrait.
+TEXT_BLOCK_CLASS = "fusion-text"
+LAYOUT_COLUMN_CLASS = "fusion-layout-column"
+
+# Keeps only the layout columns when parsing, for ``parse_roster(columns_only=True)``.
+# While the tree is being built the class attribute is still one unsplit
+# string, so the class is matched as a whole word within it.
+COLUMN_STRAINER = SoupStrainer(class_=re.compile(rf"(?:^|\s){LAYOUT_COLUMN_CLASS}(?:\s|$)"))
+
+
+def _text_lines(text: str) -> list[str]:
+    """Split text into its stripped, non-empty lines.
+
+    Args:
+        text: Text to split.
+
+    Returns:
+        The lines in order.
+    """
+    return [line.strip() for line in text.split("\n") if line.strip()]
+
 
 def _block_lines(block: Tag) -> list[str]:
     """Split a roster block into its non-empty text lines.
@@ -50,8 +96,24 @@ def _block_lines(block: Tag) -> list[str]:
     Returns:
         Stripped, non-empty lines in document order.
     """
-    text = block.get_text(separator="\n")
-    return [line.strip() for line in text.split("\n") if line.strip()]
+    return _text_lines(block.get_text(separator="\n"))
+
+
+def _image_source(image: Tag) -> str:
+    """Read a portrait's URL, preferring ``src`` over the lazy-load attribute.
+
+    Args:
+        image: An ``<img>`` element.
+
+    Returns:
+        The URL, or an empty string when the image names none.
+    """
+    for attribute in ("src", "data-orig-src"):
+        value = image.get(attribute)
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+
+    return ""
 
 
 def _photo_for(block: Tag) -> str:
@@ -66,7 +128,7 @@ def _photo_for(block: Tag) -> str:
     Returns:
         The image URL, or an empty string when the block has no portrait.
     """
-    column = block.find_parent(class_="fusion-layout-column")
+    column = block.find_parent(class_=LAYOUT_COLUMN_CLASS)
     if not isinstance(column, Tag):
         return ""
 
@@ -74,12 +136,7 @@ def _photo_for(block: Tag) -> str:
     if not isinstance(image, Tag):
         return ""
 
-    for attribute in ("src", "data-orig-src"):
-        value = image.get(attribute)
-        if isinstance(value, str) and value.strip():
-            return value.strip()
-
-    return ""
+    return _image_source(image)
 
 
 def is_leadership(position: str) -> bool:
@@ -95,17 +152,17 @@ def is_leadership(position: str) -> bool:
     return any(title in lowered for title in LEADERSHIP_TITLES)
 
 
-def parse_senator_block(block: Tag) -> Senator | None:
-    """Read one roster block.
+def _senator_from_lines(lines: list[str], photo: str) -> Senator | None:
+    """Read a senator from a roster block's text lines.
 
     Args:
-        block: A ``.fusion-text`` element.
+        lines: The block's stripped, non-empty lines.
+        photo: The block's portrait URL, or an empty string.
 
     Returns:
         The senator, or None when the block is not a filled seat: no ASUCI
         address, too few lines to carry a name, or an explicitly vacant seat.
     """
-    lines = _block_lines(block)
     if not any(ASUCI_EMAIL_DOMAIN in line for line in lines):
         return None
     if len(lines) < 2:
@@ -124,15 +181,190 @@ def parse_senator_block(block: Tag) -> Senator | None:
         elif not position:
             position = line
 
-    return Senator(name=name, position=position, email=email, photo=_photo_for(block))
+    return Senator(name=name, position=position, email=email, photo=photo)
+
+
+def parse_senator_block(block: Tag) -> Senator | None:
+    """Read one roster block.
+
+    Args:
+        block: A ``.fusion-text`` element.
+
+    Returns:
+        The senator, or None when the block is not a filled seat: no ASUCI
+        address, too few lines to carry a name, or an explicitly vacant seat.
+    """
+    return _senator_from_lines(_block_lines(block), _photo_for(block))
+
+
+class _Column:
+    """A layout column met during the roster walk.
+
+    photo: URL of the column's first image, an empty string if that image
+        names none, or None until an image has been met.
+    """
+
+    __slots__ = ("photo",)
+
+    def __init__(self) -> None:
+        """Start with no image seen."""
+        self.photo: str | None = None
+
+
+class _RosterWalk:
+    """State of a single traversal of the roster page.
+
+    Open layout columns and text blocks are kept on stacks, so a block's text
+    is gathered as its strings stream past and a column's first image is
+    recorded when it is reached, whether it comes before or after the blocks
+    beside it.
+    """
+
+    def __init__(self) -> None:
+        """Start outside any column or block."""
+        self.blocks: list[tuple[list[str], _Column | None]] = []
+        self._open_blocks: list[list[str]] = []
+        self._columns: list[_Column] = []
+
+    def enter(self, tag: Tag) -> None:
+        """Open a column or block, or record an image for the open columns.
+
+        Args:
+            tag: Element being entered.
+        """
+        classes = tag.get_attribute_list("class")
+        if LAYOUT_COLUMN_CLASS in classes:
+            self._columns.append(_Column())
+        if TEXT_BLOCK_CLASS in classes:
+            lines: list[str] = []
+            self._open_blocks.append(lines)
+            self.blocks.append((lines, self._columns[-1] if self._columns else None))
+        if tag.name == "img":
+            photo = _image_source(tag)
+            for column in self._columns:
+                if column.photo is None:
+                    column.photo = photo
+
+    def leave(self, tag: Tag) -> None:
+        """Close the column or block an element opened.
+
+        Args:
+            tag: Element being left.
+        """
+        classes = tag.get_attribute_list("class")
+        if TEXT_BLOCK_CLASS in classes:
+            self._open_blocks.pop()
+        if LAYOUT_COLUMN_CLASS in classes:
+            self._columns.pop()
+
+    def text(self, string: str) -> None:
+        """Add a string's lines to every open block.
+
+        Args:
+            string: Text of a plain string node.
+        """
+        if self._open_blocks:
+            lines = _text_lines(string)
+            for block in self._open_blocks:
+                block.extend(lines)
+
+    def senators(self) -> list[Senator]:
+        """Read the blocks met so far.
+
+        Returns:
+            Every filled seat in document order, duplicates included.
+        """
+        senators: list[Senator] = []
+        for lines, column in self.blocks:
+            photo = column.photo if column is not None and column.photo is not None else ""
+            senator = _senator_from_lines(lines, photo)
+            if senator is not None:
+                senators.append(senator)
+        return senators
+
+
+def _walk_roster(root: Tag) -> list[Senator]:
+    """Read every roster block in one traversal of the tree.
+
+    Each element is visited once, on an explicit stack so deep theme markup
+    cannot exhaust the recursion limit.
+
+    Args:
+        root: The parsed page.
+
+    Returns:
+        Every filled seat in document order, duplicates included.
+    """
+    walk = _RosterWalk()
+    pending: list[tuple[PageElement, bool]] = [(root, False)]
+
+    while pending:
+        node, leaving = pending.pop()
+        if isinstance(node, Tag):
+            if leaving:
+                walk.leave(node)
+                continue
+            walk.enter(node)
+            pending.append((node, True))
+            pending.extend((child, False) for child in reversed(node.contents))
+        elif type(node) is NavigableString:
+            # Only plain strings count, as in ``get_text``: comments, CDATA,
+            # and script or style bodies are skipped.
+            walk.text(node)
+
+    return walk.senators()
 
 
-def parse_roster(html: str) -> SenateRoster:
+def _assemble_roster(senators: list[Senator]) -> SenateRoster:
+    """Split senators into the roster's lists, deduplicating by email.
+
+    Leadership is resolved first, so someone listed both as a senator and as
+    an officer appears once, under their officer role.
+
+    Args:
+        senators: Filled seats in document order.
+
+    Returns:
+        The roster.
+    """
+    leadership = [senator for senator in senators if is_leadership(senator["position"])]
+    general = [senator for senator in senators if not is_leadership(senator["position"])]
+
+    seen: set[str] = set()
+    return SenateRoster(
+        leadership=_dedupe_by_email(leadership, seen),
+        senators=_dedupe_by_email(general, seen),
+    )
+
+
+def parse_roster(html: str, columns_only: bool = False) -> SenateRoster:
     """Read the senate roster from the senate page markup.
 
-    Records are deduplicated by email with the first occurrence winning, and
-    leadership is resolved first, so someone listed both as a senator and as an
-    officer appears once, under their officer role.
+    The tree is walked once, pairing each text block with the portrait of its
+    layout column as both are reached. Records are deduplicated by email with
+    the first occurrence winning, and leadership is resolved first, so someone
+    listed both as a senator and as an officer appears once, under their
+    officer role.
+
+    Args:
+        html: Markup of the senate page.
+        columns_only: Build the tree from the layout columns alone, skipping
+            the page's navigation, scripts and footer. Blocks outside any
+            column are then not read.
+
+    Returns:
+        The roster, split into leadership and general senators.
+    """
+    soup = BeautifulSoup(html, "html.parser", parse_only=COLUMN_STRAINER if columns_only else None)
+    return _assemble_roster(_walk_roster(soup))
+
+
+def parse_roster_by_block(html: str) -> SenateRoster:
+    """Read the senate roster one block at a time.
+
+    Each block's text and portrait are found by searching around the block,
+    which revisits the enclosing column for every block in it. This is the
+    reference reading ``parse_roster`` must agree with.
 
     Args:
         html: Markup of the senate page.
@@ -142,23 +374,13 @@ def parse_roster(html: str) -> SenateRoster:
     """
     soup = BeautifulSoup(html, "html.parser")
 
-    leadership: list[Senator] = []
     senators: list[Senator] = []
-
-    for block in soup.find_all(class_="fusion-text"):
+    for block in soup.find_all(class_=TEXT_BLOCK_CLASS):
         senator = parse_senator_block(block)
-        if senator is None:
-            continue
-        if is_leadership(senator["position"]):
-            leadership.append(senator)
-        else:
+        if senator is not None:
             senators.append(senator)
 
-    seen: set[str] = set()
-    return SenateRoster(
-        leadership=_dedupe_by_email(leadership, seen),
-        senators=_dedupe_by_email(senators, seen),
-    )
+    return _assemble_roster(senators)
 
 
 def _dedupe_by_email(records: list[Senator], seen: set[str]) -> list[Senator]:
@@ -181,8 +403,253 @@ def _dedupe_by_email(records: list[Senator], seen: set[str]) -> list[Senator]:
     return kept
 
 
-def parse_meeting_links(rendered_html: str) -> list[MeetingLink]:
-    """Read meeting document links from a rendered view fragment.
+# Tags whose text BeautifulSoup stores as a special string type that
+# ``get_text`` leaves out, and tags that would nest one anchor in another. The
+# streaming reader defers to the tree on any of these.
+TREE_ONLY_TAGS = frozenset({"a", "script", "style", "template", "rt", "rp"})
+
+
+class _UnsupportedMarkupError(Exception):
+    """Raised by the streaming reader on markup only the tree reads faithfully."""
+
+
+class _AnchorStream(HTMLParser):
+    """Collect anchors and their text from a fragment without building a tree.
+
+    An anchor's text is gathered the way ``Tag.get_text(strip=True)`` gathers
+    it: each run of text between two markup events is stripped, and the
+    non-empty runs are joined. Tags opened inside the anchor are tracked so a
+    stray end tag, which in the tree would close the anchor early, is noticed
+    rather than misread.
+    """
+
+    def __init__(self) -> None:
+        """Start with no anchor open."""
+        super().__init__(convert_charrefs=False)
+        self.anchors: list[tuple[str | None, str]] = []
+        self._href: str | None = None
+        self._open = False
+        self._inner: list[str] = []
+        self._runs: list[str] = []
+        self._run: list[str] = []
+
+    def _end_run(self) -> None:
+        """Close the run of text in progress, keeping it if it is not blank."""
+        if self._run:
+            text = "".join(self._run).strip()
+            if text:
+                self._runs.append(text)
+            self._run = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Open an anchor, or note a tag opened inside one.
+
+        Args:
+            tag: Lowercased tag name.
+            attrs: Attributes in source order; a later duplicate wins.
+
+        Raises:
+            _UnsupportedMarkupError: If the tag nests an anchor or holds text
+                the tree keeps apart.
+        """
+        if tag in {"template", "rt", "rp"}:
+            raise _UnsupportedMarkupError(tag)
+        if not self._open:
+            if tag == "a":
+                self._open = True
+                values = dict(attrs)
+                # The tree reads a valueless ``href`` as an empty string.
+                self._href = (values["href"] or "") if "href" in values else None
+                self._runs = []
+            return
+        if tag in TREE_ONLY_TAGS:
+            raise _UnsupportedMarkupError(tag)
+        self._end_run()
+        self._inner.append(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        """Close an anchor, or a tag opened inside one.
+
+        Args:
+            tag: Lowercased tag name.
+
+        Raises:
+            _UnsupportedMarkupError: If the end tag matches nothing opened
+                inside the anchor, so the tree might close the anchor on it.
+        """
+        if not self._open:
+            return
+        self._end_run()
+        if tag == "a":
+            self.anchors.append((self._href, "".join(self._runs)))
+            self._open = False
+            self._inner = []
+            return
+        if tag not in self._inner:
+            raise _UnsupportedMarkupError(tag)
+        depth = len(self._inner) - 1 - self._inner[::-1].index(tag)
+        del self._inner[depth:]
+
+    def handle_data(self, data: str) -> None:
+        """Add text to the run in progress inside an anchor.
+
+        Args:
+            data: Text between two markup events.
+        """
+        if self._open:
+            self._run.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        """End the run of text; the tree keeps comment text out of an anchor's.
+
+        Args:
+            data: Comment body.
+        """
+        if self._open:
+            self._end_run()
+
+    def _reject_in_anchor(self, markup: str) -> None:
+        """Defer to the tree if an anchor is open.
+
+        Args:
+            markup: The construct met, for the record.
+
+        Raises:
+            _UnsupportedMarkupError: If an anchor is open.
+        """
+        if self._open:
+            raise _UnsupportedMarkupError(markup)
+
+    def handle_charref(self, name: str) -> None:
+        """Defer a character reference inside an anchor to the tree.
+
+        Args:
+            name: The reference's number.
+        """
+        self._reject_in_anchor(f"&#{name};")
+
+    def handle_entityref(self, name: str) -> None:
+        """Defer a named reference inside an anchor to the tree.
+
+        Args:
+            name: The entity's name.
+        """
+        self._reject_in_anchor(f"&{name};")
+
+    def unknown_decl(self, data: str) -> None:
+        """Defer a CDATA section inside an anchor to the tree.
+
+        Args:
+            data: The section's body.
+        """
+        self._reject_in_anchor(f"<![{data}]>")
+
+    def handle_decl(self, decl: str) -> None:
+        """Defer a declaration inside an anchor to the tree.
+
+        Args:
+            decl: The declaration's body.
+        """
+        self._reject_in_anchor(f"<!{decl}>")
+
+    def handle_pi(self, data: str) -> None:
+        """Defer a processing instruction inside an anchor to the tree.
+
+        Args:
+            data: The instruction's body.
+        """
+        self._reject_in_anchor(f"<?{data}>")
+
+    def close(self) -> None:
+        """Flush the tokenizer, rejecting an anchor left open.
+
+        Raises:
+            _UnsupportedMarkupError: If the fragment ends inside an anchor.
+        """
+        super().close()
+        if self._open:
+            raise _UnsupportedMarkupError("unclosed anchor")
+
+
+def meeting_date_iso(text: str) -> str:
+    """Normalise the meeting date in a link's text to ISO 8601.
+
+    Args:
+        text: Link text, e.g. "June 5, 2025" or "Special Meeting - June 5, 2025".
+
+    Returns:
+        The first date in the text as "YYYY-MM-DD", or an empty string if the
+        text holds none or names a day the calendar does not have.
+    """
+    match = MEETING_DATE.search(text)
+    return "" if match is None else _iso_date(match)
+
+
+def _iso_date(match: re.Match[str]) -> str:
+    """Convert a ``MEETING_DATE`` match to ISO 8601.
+
+    Args:
+        match: The match.
+
+    Returns:
+        The date as "YYYY-MM-DD", or an empty string if the calendar has no
+        such day.
+    """
+    month, day, year = match.groups()
+    try:
+        return date(int(year), MONTH_NAMES.index(month) + 1, int(day)).isoformat()
+    except ValueError:
+        return ""
+
+
+def _meeting_link(text: str, url: str) -> MeetingLink | None:
+    """Build a meeting link from an anchor, if its text reads as a date.
+
+    Args:
+        text: The anchor's text.
+        url: The anchor's target.
+
+    Returns:
+        The link with its date normalised, or None if the text holds no date.
+    """
+    match = MEETING_DATE.search(text)
+    if match is None:
+        return None
+    return MeetingLink(date=text, iso_date=_iso_date(match), url=url)
+
+
+def _stream_meeting_links(rendered_html: str) -> list[MeetingLink] | None:
+    """Read meeting links with the streaming tokenizer.
+
+    Args:
+        rendered_html: The ``renderedHtml`` fragment from a view response.
+
+    Returns:
+        The dated links in document order, or None when the fragment holds
+        markup only the tree reads faithfully.
+    """
+    stream = _AnchorStream()
+    try:
+        stream.feed(rendered_html)
+        stream.close()
+    except _UnsupportedMarkupError:
+        return None
+
+    links: list[MeetingLink] = []
+    for href, text in stream.anchors:
+        if href is None:
+            continue
+        link = _meeting_link(text, href)
+        if link is not None:
+            links.append(link)
+    return links
+
+
+def parse_meeting_links_tree(rendered_html: str) -> list[MeetingLink]:
+    """Read meeting document links by building the fragment's tree.
+
+    This is the reference reading: the streaming path must agree with it, and
+    falls back to it on markup it does not model.
 
     Args:
         rendered_html: The ``renderedHtml`` fragment from a view response.
@@ -197,14 +664,134 @@ def parse_meeting_links(rendered_html: str) -> list[MeetingLink]:
         href = anchor.get("href")
         if not isinstance(href, str):
             continue
-        text = anchor.get_text(strip=True)
-        if not MEETING_DATE.search(text):
-            continue
-        links.append(MeetingLink(date=text, url=href))
+        link = _meeting_link(anchor.get_text(strip=True), href)
+        if link is not None:
+            links.append(link)
 
     return links
 
 
+def parse_meeting_links(rendered_html: str) -> list[MeetingLink]:
+    """Read meeting document links from a rendered view fragment.
+
+    Streams the fragment without building a tree, falling back to
+    ``parse_meeting_links_tree`` on markup the stream does not model.
+
+    Args:
+        rendered_html: The ``renderedHtml`` fragment from a view response.
+
+    Returns:
+        Every link whose text reads as a meeting date, in document order.
+    """
+    links = _stream_meeting_links(rendered_html)
+    if links is None:
+        return parse_meeting_links_tree(rendered_html)
+    return links
+
+
+# Elements whose content is never shown as document text.
+HIDDEN_TEXT_TAGS = frozenset({"script", "style", "noscript", "template"})
+
+# Elements that break text into separate words at their edges.
+BLOCK_TAGS = frozenset(
+    {
+        "address",
+        "article",
+        "aside",
+        "blockquote",
+        "br",
+        "dd",
+        "div",
+        "dl",
+        "dt",
+        "figcaption",
+        "footer",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "header",
+        "hr",
+        "li",
+        "main",
+        "nav",
+        "ol",
+        "p",
+        "pre",
+        "section",
+        "table",
+        "td",
+        "th",
+        "title",
+        "tr",
+        "ul",
+    }
+)
+
+
+class _TextStream(HTMLParser):
+    """Collect the visible text of a page without building a tree."""
+
+    def __init__(self) -> None:
+        """Start outside any hidden element."""
+        super().__init__(convert_charrefs=True)
+        self.pieces: list[str] = []
+        self._hidden = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Enter a hidden element, or break words at a block edge.
+
+        Args:
+            tag: Lowercased tag name.
+            attrs: Attributes in source order; unused.
+        """
+        if tag in HIDDEN_TEXT_TAGS:
+            self._hidden += 1
+        elif tag in BLOCK_TAGS:
+            self.pieces.append(" ")
+
+    def handle_endtag(self, tag: str) -> None:
+        """Leave a hidden element, or break words at a block edge.
+
+        Args:
+            tag: Lowercased tag name.
+        """
+        if tag in HIDDEN_TEXT_TAGS:
+            self._hidden = max(0, self._hidden - 1)
+        elif tag in BLOCK_TAGS:
+            self.pieces.append(" ")
+
+    def handle_data(self, data: str) -> None:
+        """Keep text outside hidden elements.
+
+        Args:
+            data: Text with character references already resolved.
+        """
+        if not self._hidden:
+            self.pieces.append(data)
+
+
+def extract_document_text(html: str) -> str:
+    """Read the visible text of a meeting document.
+
+    Scripts, styles and other content never shown are dropped. Text on either
+    side of a block element is kept apart, while inline markup such as
+    ``<b>`` joins the text around it.
+
+    Args:
+        html: Markup of the printable document page.
+
+    Returns:
+        The text, with each run of whitespace collapsed to one space.
+    """
+    stream = _TextStream()
+    stream.feed(html)
+    stream.close()
+    return " ".join("".join(stream.pieces).split())
+
+
 def academic_year_param(label: str) -> str:
     """Convert an academic year label into the API's year parameter.
 
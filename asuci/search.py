@@ -0,0 +1,239 @@
+"""The meeting search index embedded in the dashboard page.
+
+Without an index, a search in the browser has to walk every link of every
+year and parse each free-form date again. The generator instead ships a
+prebuilt index: documents numbered in date order with their day numbers, so a
+date range is two binary searches, and a sorted token list with postings, so
+a keyword or word prefix is a binary search and a read of the ids that follow.
+
+Each year's entries are built from that year's archive and stored between
+runs, keyed by the archive's payload hash. A run tokenizes only the years
+whose archive changed and merges the stored entries of the rest. Like the
+archive snapshots, a stored year that does not match the expected shape is an
+error; a full rebuild replaces it.
+"""
+
+import json
+import os
+import re
+from datetime import date
+from pathlib import Path
+from typing import TypedDict
+
+from .models import (
+    AsuciDecodeError,
+    IndexEntry,
+    MeetingIndex,
+    YearArchive,
+    YearIndex,
+    decode_year_index,
+    encode_year_index,
+)
+
+# Document kinds, in the order their entries are stored within a year.
+DOCUMENT_KINDS = ("agendas", "minutes")
+
+# A word as indexed and as searched for in the browser.
+TOKEN = re.compile(r"[a-z0-9]+")
+
+# Ordinal of the day the index counts from, matching ``Date.UTC`` in the page.
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class IndexBuild(TypedDict):
+    """The outcome of building the search index.
+
+    index: The merged index over every year given.
+    rebuilt: Years whose entries were built this run.
+    reused: Years whose stored entries were merged as they were.
+    """
+
+    index: MeetingIndex
+    rebuilt: list[str]
+    reused: list[str]
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into index tokens.
+
+    Args:
+        text: Text to split.
+
+    Returns:
+        The distinct lowercase words in the text, in order of first appearance.
+    """
+    return list(dict.fromkeys(TOKEN.findall(text.lower())))
+
+
+def day_number(iso_date: str) -> int:
+    """Count the days from 1970-01-01 to a date.
+
+    Args:
+        iso_date: Date as "YYYY-MM-DD".
+
+    Returns:
+        The number of days, as the page computes it with ``Date.UTC``.
+
+    Raises:
+        ValueError: If the text is not an ISO date.
+    """
+    return date.fromisoformat(iso_date).toordinal() - EPOCH_ORDINAL
+
+
+def index_year(archive: YearArchive) -> YearIndex:
+    """Build the search entries for one year.
+
+    Each document is found by the words of its link text and by its kind.
+
+    Args:
+        archive: The year's archive.
+
+    Returns:
+        The year's entries, agendas first, each kind in published order.
+    """
+    entries: list[IndexEntry] = []
+    for kind in DOCUMENT_KINDS:
+        links = archive["agendas"] if kind == "agendas" else archive["minutes"]
+        for position, link in enumerate(links):
+            entries.append(
+                IndexEntry(
+                    kind=kind,
+                    position=position,
+                    iso_date=link["iso_date"],
+                    tokens=tokenize(f"{link['date']} {kind}"),
+                )
+            )
+    return YearIndex(year=archive["year"], payload_hash=archive["payload_hash"], entries=entries)
+
+
+def index_path(directory: Path, year_label: str) -> Path:
+    """Locate the stored entries for a year.
+
+    Args:
+        directory: Directory holding the stored entries.
+        year_label: Academic year label.
+
+    Returns:
+        The file's path.
+    """
+    return directory / f"{year_label}.json"
+
+
+def load_year_index(directory: Path, year_label: str) -> YearIndex | None:
+    """Read a year's stored entries.
+
+    Args:
+        directory: Directory holding the stored entries.
+        year_label: Academic year label.
+
+    Returns:
+        The entries, or None when the year has none stored.
+
+    Raises:
+        AsuciDecodeError: If the file is not JSON, does not match the expected
+            shape, or holds a different year.
+    """
+    path = index_path(directory, year_label)
+    if not path.is_file():
+        return None
+
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as error:
+        raise AsuciDecodeError(f"year index {path} is not JSON: {error}") from error
+
+    year_index = decode_year_index(payload)
+    if year_index["year"] != year_label:
+        raise AsuciDecodeError(
+            f"year index {path} holds year {year_index['year']!r}, expected {year_label!r}"
+        )
+    return year_index
+
+
+def save_year_index(directory: Path, year_index: YearIndex) -> None:
+    """Store a year's entries, replacing any earlier ones atomically.
+
+    Args:
+        directory: Directory holding the stored entries; created if absent.
+        year_index: Entries to store.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    path = index_path(directory, year_index["year"])
+    staging = path.with_suffix(".tmp")
+    staging.write_text(json.dumps(encode_year_index(year_index), ensure_ascii=False), encoding="utf-8")
+    os.replace(staging, path)
+
+
+def merge_index(year_indexes: list[YearIndex]) -> MeetingIndex:
+    """Merge years of entries into one index.
+
+    Args:
+        year_indexes: Entries for each year, in any order.
+
+    Returns:
+        The index, with dated documents numbered by date, then kind, year and
+        position, and undated documents after them in the order given.
+
+    Raises:
+        ValueError: If an entry's date is not empty and not an ISO date.
+    """
+    dated: list[tuple[int, tuple[str, str, int], list[str]]] = []
+    undated: list[tuple[tuple[str, str, int], list[str]]] = []
+    for year_index in year_indexes:
+        for entry in year_index["entries"]:
+            document = (entry["kind"], year_index["year"], entry["position"])
+            if entry["iso_date"]:
+                dated.append((day_number(entry["iso_date"]), document, entry["tokens"]))
+            else:
+                undated.append((document, entry["tokens"]))
+    dated.sort(key=lambda item: (item[0], item[1]))
+
+    documents = [document for _, document, _ in dated] + [document for document, _ in undated]
+    postings: dict[str, list[int]] = {}
+    for number, tokens in enumerate([tokens for _, _, tokens in dated] + [tokens for _, tokens in undated]):
+        for token in tokens:
+            postings.setdefault(token, []).append(number)
+
+    tokens = sorted(postings)
+    return MeetingIndex(
+        ordinals=[ordinal for ordinal, _, _ in dated],
+        documents=documents,
+        tokens=tokens,
+        postings=[postings[token] for token in tokens],
+    )
+
+
+def build_index(archives: list[YearArchive], directory: Path, full: bool = False) -> IndexBuild:
+    """Build the search index, reusing the stored entries of unchanged years.
+
+    A year's stored entries are reused when they were built from an archive
+    with the same payload hash; otherwise they are built again and stored.
+
+    Args:
+        archives: Each year's archive.
+        directory: Directory holding the stored entries.
+        full: Build every year again without reading the stored entries,
+            which also replaces any that are damaged.
+
+    Returns:
+        The merged index and which years were rebuilt or reused.
+
+    Raises:
+        AsuciDecodeError: If stored entries do not match the expected shape.
+        ValueError: If a link's ISO date is not a date.
+    """
+    year_indexes: list[YearIndex] = []
+    rebuilt: list[str] = []
+    reused: list[str] = []
+    for archive in archives:
+        stored = None if full else load_year_index(directory, archive["year"])
+        if stored is not None and stored["payload_hash"] == archive["payload_hash"]:
+            year_indexes.append(stored)
+            reused.append(archive["year"])
+            continue
+        year_index = index_year(archive)
+        save_year_index(directory, year_index)
+        year_indexes.append(year_index)
+        rebuilt.append(archive["year"])
+
+    return IndexBuild(index=merge_index(year_indexes), rebuilt=rebuilt, reused=reused)
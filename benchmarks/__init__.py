@@ -0,0 +1,6 @@
+"""Micro-benchmarks for the parsing hot paths.
+
+These are run by hand, not by the test suite: each module is a script that
+times a parser over captured payloads inflated to stress sizes and prints the
+results.
+"""
@@ -0,0 +1,202 @@
+"""Time the Irvine Granicus listing readers over a synthetic archive.
+
+The ViewPublisher listing for the Irvine council grows by a row every
+meeting. The link reader visits every anchor in a full tree of the page and
+climbs from each agenda link to its row; the row reader streams the page
+without building a tree and reads each row once. This times both over
+archives of a few thousand rows, laid out as Granicus lays out its listing,
+and checks at every size that they read the same meetings.
+
+The synthetic rows cover what the readers must agree on: archived meetings
+with clip links and minutes, upcoming meetings with event ids, the
+pre-publication placeholder id, repeated ids, rows without a date, and
+meetings of other bodies. Captured listings are checked too: the test
+fixture, any listing the generator's HTTP cache holds, and any given with
+``--listing``. The benchmark fails if there is none to check.
+
+Usage:
+    python -m benchmarks.granicus_listing
+    python -m benchmarks.granicus_listing --rows 1000 10000 --repeat 7
+    python -m benchmarks.granicus_listing --listing page.html
+"""
+
+import argparse
+import json
+import runpy
+import timeit
+from collections.abc import Callable
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+GENERATOR = ROOT / "irvine-city-council" / "generate.py"
+
+# Where the generator caches the listing it last read, one JSON entry per URL.
+HTTP_CACHE_DIR = ROOT / ".cache" / "irvine-city-council" / "http"
+
+# The listing the test suite reads, checked on every run.
+FIXTURE_LISTING = ROOT / "tests" / "fixtures" / "granicus_viewpublisher.html"
+
+BASE_URL = "https://irvine.granicus.com"
+
+# Row counts timed when none are given.
+DEFAULT_SIZES = (1_000, 5_000)
+
+# Maps a listing's markup and base URL to its meetings.
+Reader = Callable[[str, str], list[dict[str, object]]]
+
+_BODIES = (
+    "City Council Regular Meeting",
+    "City Council Special Meeting",
+    "Planning Commission Regular Meeting",
+    "City Council Regular Meeting Open Only in Windows Media Player",
+)
+
+
+def archive_row(index: int, day: date) -> str:
+    """One archived meeting, with its agenda, minutes and video.
+
+    Args:
+        index: Row number, used for the clip id and to vary the row.
+        day: Meeting date.
+
+    Returns:
+        The row's markup.
+    """
+    name = _BODIES[index % len(_BODIES)]
+    # Alternate the full and abbreviated month names Granicus has used.
+    shown = day.strftime("%b %d, %Y" if index % 2 else "%B %d, %Y").replace(" ", "&nbsp;")
+    minutes = (
+        f'<td class="listItem"><a href="//irvine.granicus.com/MinutesViewer.php?view_id=68&amp;'
+        f'clip_id={index}&amp;doc_id=d{index}">Minutes</a></td>'
+        if index % 3
+        else '<td class="listItem"></td>'
+    )
+    return (
+        '<tr class="listingRow">'
+        f'<td class="listItem" headers="Name" scope="row">{name}</td>'
+        f'<td class="listItem" headers="Date {name}">{shown}</td>'
+        '<td class="listItem" headers="Duration">02h 14m</td>'
+        f'<td class="listItem"><a href="//irvine.granicus.com/AgendaViewer.php?view_id=68&amp;'
+        f'clip_id={index}" target="_blank">Agenda</a></td>'
+        f"{minutes}"
+        f'<td class="listItem"><a href="javascript:void(0);" onclick="window.open('
+        f"'//irvine.granicus.com/MediaPlayer.php?view_id=68&amp;clip_id={index}')\">Video</a></td>"
+        "</tr>"
+    )
+
+
+def upcoming_row(index: int, day: date) -> str:
+    """One upcoming meeting, linked by event id.
+
+    Every fifth carries the pre-publication placeholder id, every seventh
+    repeats the id of the row before, and every eleventh has no date.
+
+    Args:
+        index: Row number.
+        day: Meeting date.
+
+    Returns:
+        The row's markup.
+    """
+    event_id = 99999 if index % 5 == 0 else 5000 + index - (1 if index % 7 == 0 else 0)
+    shown = "" if index % 11 == 0 else day.strftime("%B %d, %Y")
+    return (
+        '<tr class="listingRow">'
+        '<td class="listItem" headers="Name" scope="row">City Council Regular Meeting</td>'
+        f'<td class="listItem" headers="Date">{shown}</td>'
+        f'<td class="listItem"><a href="//irvine.granicus.com/AgendaViewer.php?view_id=68&amp;'
+        f'event_id={event_id}">Agenda</a></td>'
+        "</tr>"
+    )
+
+
+def synthetic_listing(rows: int) -> str:
+    """Build a ViewPublisher page with an upcoming table and a long archive.
+
+    Args:
+        rows: Archived meetings wanted.
+
+    Returns:
+        The page's markup.
+    """
+    start = date(2026, 10, 1)
+    upcoming = "".join(upcoming_row(index, start + timedelta(days=7 * index)) for index in range(1, 25))
+    archive = "".join(archive_row(index, start - timedelta(days=3 * index)) for index in range(rows))
+    return (
+        "<html><head><title>Irvine</title></head><body>"
+        '<div class="header"><a href="/ViewPublisher.php?view_id=68">Home</a></div>'
+        f'<table class="listingTable" id="upcoming"><tbody>{upcoming}</tbody></table>'
+        '<table class="listingTable" id="archive">'
+        '<tr class="listingHeader"><th id="Name">Name</th><th id="Date">Date</th></tr>'
+        f"<tbody>{archive}</tbody></table>"
+        "</body></html>"
+    )
+
+
+def cached_listings() -> list[str]:
+    """Read the fixture listing and any listings the generator's HTTP cache holds.
+
+    Returns:
+        The fixture, if present, then each cached ViewPublisher body.
+    """
+    bodies: list[str] = []
+    if FIXTURE_LISTING.is_file():
+        bodies.append(FIXTURE_LISTING.read_text(encoding="utf-8"))
+    for path in sorted(HTTP_CACHE_DIR.glob("*.json")):
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(entry, dict) and "ViewPublisher" in str(entry.get("url")):
+            bodies.append(str(entry.get("body")))
+    return bodies
+
+
+def time_reader(reader: Reader, markup: str, repeat: int) -> float:
+    """Time one reader over a listing.
+
+    Args:
+        reader: The reader.
+        markup: Listing to read.
+        repeat: Number of timed runs; the fastest is kept.
+
+    Returns:
+        Seconds taken by the fastest run.
+    """
+    return min(timeit.repeat(lambda: reader(markup, BASE_URL), number=1, repeat=repeat))
+
+
+def main() -> None:
+    """Check the readers agree, then time both at each size and print a table."""
+    parser = argparse.ArgumentParser(description="Time the Irvine Granicus listing readers.")
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per reader; the fastest is kept")
+    parser.add_argument("--listing", type=Path, nargs="*", default=[], help="captured listings to check")
+    args = parser.parse_args()
+
+    generator = runpy.run_path(str(GENERATOR), run_name="granicus_listing_benchmark")
+    rows_reader: Reader = generator["_parse_granicus_rows"]
+    links_reader: Reader = generator["_parse_granicus_links"]
+
+    captured = cached_listings() + [path.read_text(encoding="utf-8") for path in args.listing]
+    if not captured:
+        raise SystemExit(f"no captured listing to check; expected {FIXTURE_LISTING.relative_to(ROOT)}")
+    for index, markup in enumerate(captured):
+        if rows_reader(markup, BASE_URL) != links_reader(markup, BASE_URL):
+            raise SystemExit(f"readers disagree on captured listing {index}")
+    print(f"Readers agree on {len(captured)} captured listing(s)\n")
+
+    print(f"{'rows':>8}  {'meetings':>8}  {'rows ms':>10}  {'links ms':>10}  {'speed-up':>8}")
+    for rows in args.rows:
+        markup = synthetic_listing(rows)
+        meetings = rows_reader(markup, BASE_URL)
+        if meetings != links_reader(markup, BASE_URL):
+            raise SystemExit(f"readers disagree at {rows} rows")
+        by_row = time_reader(rows_reader, markup, args.repeat)
+        by_link = time_reader(links_reader, markup, args.repeat)
+        print(
+            f"{rows:>8}  {len(meetings):>8}  {by_row * 1000:>10.2f}  {by_link * 1000:>10.2f}  "
+            f"{by_link / by_row:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
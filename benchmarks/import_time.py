@@ -0,0 +1,326 @@
+"""Time how long each generator entry point takes to import, against a budget.
+
+Every scheduled run, and every probe, starts a fresh interpreter, so what an
+entry point imports at load is paid on each of them before any work is done.
+Each entry point is imported in a fresh interpreter under ``-X importtime``,
+and its cost is the cumulative time of every top-level import the statement
+made, less the modules a bare ``import runpy`` already loads. Entry points in
+directories that are not importable are loaded with ``runpy`` under a name
+other than ``__main__``, so their module body runs but their ``main`` does not.
+Each entry point reports the median of several runs and, of the modules it
+imports directly, those that cost the most.
+
+With ``--check``, the run fails if any entry point takes longer than its
+budget. Budgets are in milliseconds in ``import_budget.json`` and can be
+edited by hand; ``--update-budget`` sets each to the measured cost plus the
+headroom. Timings depend on the machine, so the budget should be regenerated
+on the machine that checks against it.
+
+Usage:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --check
+    python -m benchmarks.import_time --update-budget --headroom 0.5
+    python -m benchmarks.import_time --repeat 9
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+from asuci.models import require_object
+
+ROOT = Path(__file__).resolve().parent.parent
+
+BUDGET = Path(__file__).resolve().parent / "import_budget.json"
+
+# Statement the interpreter runs before anything an entry point imports; the
+# modules it loads are not charged to the entry point.
+REFERENCE = "import runpy"
+
+# Default allowance over the measured cost when a budget is written.
+DEFAULT_HEADROOM = 0.5
+
+# Modules listed per entry point, most expensive first.
+TOP_MODULES = 5
+
+
+class EntryPoint(NamedTuple):
+    """Something the workflow imports at the start of a run.
+
+    name: Budget key, the module or script path.
+    statement: Code that imports it without running it.
+    """
+
+    name: str
+    statement: str
+
+
+def module_entry(module: str) -> EntryPoint:
+    """An entry point imported by module name.
+
+    Args:
+        module: Dotted module name.
+
+    Returns:
+        The entry point.
+    """
+    return EntryPoint(name=module, statement=f"{REFERENCE}; import {module}")
+
+
+def script_entry(path: str) -> EntryPoint:
+    """An entry point loaded by path, for directories that are not importable.
+
+    Args:
+        path: Script path relative to the repository root.
+
+    Returns:
+        The entry point.
+    """
+    return EntryPoint(
+        name=path, statement=f"{REFERENCE}; runpy.run_path({path!r}, run_name='__import_time__')"
+    )
+
+
+ENTRY_POINTS = (
+    module_entry("generate_all"),
+    module_entry("asuci.generate"),
+    script_entry("irvine-city-council/generate.py"),
+    script_entry("oc-city-councils/build_dashboard.py"),
+    module_entry("shared.scrapers.legistar"),
+)
+
+
+class ImportLine(NamedTuple):
+    """One line of ``-X importtime`` output.
+
+    module: Module imported.
+    depth: Nesting level; zero for imports the statement made itself.
+    cumulative_us: Time including the module's own imports, in microseconds.
+    """
+
+    module: str
+    depth: int
+    cumulative_us: int
+
+
+def parse_importtime(stderr: str) -> list[ImportLine]:
+    """Read the lines ``-X importtime`` writes to stderr.
+
+    Args:
+        stderr: Everything the interpreter wrote to stderr.
+
+    Returns:
+        One entry per import, in the order they finished; other lines and the
+        header are skipped.
+    """
+    lines: list[ImportLine] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        lines.append(
+            ImportLine(
+                module=stripped,
+                depth=(len(name) - len(stripped) - 1) // 2,
+                cumulative_us=int(fields[1]),
+            )
+        )
+    return lines
+
+
+def run_importtime(statement: str) -> list[ImportLine]:
+    """Run a statement in a fresh interpreter from the repository root.
+
+    Args:
+        statement: Code to run.
+
+    Returns:
+        The imports it made.
+
+    Raises:
+        RuntimeError: If the statement fails.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=str(ROOT),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{statement!r} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def charged_imports(lines: list[ImportLine], preloaded: set[str], depth: int = 0) -> dict[str, int]:
+    """Pick the imports an entry point is charged for.
+
+    Args:
+        lines: Imports made by one run.
+        preloaded: Modules the reference statement loads.
+        depth: Nesting level to read.
+
+    Returns:
+        Cumulative microseconds of each import at that level not preloaded.
+    """
+    return {
+        line.module: line.cumulative_us
+        for line in lines
+        if line.depth == depth and line.module not in preloaded
+    }
+
+
+def direct_imports(entry: EntryPoint, lines: list[ImportLine], preloaded: set[str]) -> dict[str, int]:
+    """Pick the imports an entry point makes itself.
+
+    Args:
+        entry: The entry point.
+        lines: Imports made by one run.
+        preloaded: Modules the reference statement loads.
+
+    Returns:
+        Cumulative microseconds of each: the imports nested one level inside
+        a module entry point, or the top-level imports of a script.
+    """
+    if any(line.depth == 0 and line.module == entry.name for line in lines):
+        return charged_imports(lines, preloaded, depth=1)
+    return charged_imports(lines, preloaded)
+
+
+class Measurement(NamedTuple):
+    """What importing one entry point cost.
+
+    milliseconds: Median cumulative import time.
+    top: The costliest direct imports of the median run, in milliseconds.
+    """
+
+    milliseconds: float
+    top: list[tuple[str, float]]
+
+
+def measure(entry: EntryPoint, preloaded: set[str], repeat: int) -> Measurement:
+    """Import an entry point in several fresh interpreters.
+
+    Args:
+        entry: The entry point.
+        preloaded: Modules the reference statement loads.
+        repeat: Number of runs; the median is kept.
+
+    Returns:
+        The measurement.
+    """
+    runs = [run_importtime(entry.statement) for _ in range(repeat)]
+    totals = [sum(charged_imports(lines, preloaded).values()) for lines in runs]
+    median = sorted(zip(totals, range(repeat), strict=True))[repeat // 2][1]
+    direct = direct_imports(entry, runs[median], preloaded)
+    top = sorted(direct.items(), key=lambda item: item[1], reverse=True)[:TOP_MODULES]
+    return Measurement(
+        milliseconds=statistics.median(totals) / 1000,
+        top=[(module, micros / 1000) for module, micros in top],
+    )
+
+
+def load_budget(path: Path) -> dict[str, float]:
+    """Read stored budgets.
+
+    Args:
+        path: Budget file.
+
+    Returns:
+        Milliseconds keyed by entry point, empty if the file is absent.
+
+    Raises:
+        ValueError: If a budget is not a non-negative number.
+    """
+    if not path.is_file():
+        return {}
+
+    stored = require_object(json.loads(path.read_text(encoding="utf-8")), "import budget")
+    budgets: dict[str, float] = {}
+    for name, value in stored.items():
+        if not isinstance(value, float | int) or value < 0:
+            raise ValueError(f"import budget {name!r}: expected milliseconds")
+        budgets[name] = float(value)
+    return budgets
+
+
+def save_budget(path: Path, results: dict[str, Measurement], headroom: float) -> None:
+    """Store measurements, plus headroom, as the new budget.
+
+    Entry points not measured in this run keep their stored budgets.
+
+    Args:
+        path: Budget file.
+        results: Measurements keyed by entry point.
+        headroom: Allowance over each measurement, as a fraction.
+    """
+    budgets = load_budget(path)
+    for name, result in results.items():
+        budgets[name] = round(result.milliseconds * (1 + headroom), 1)
+    path.write_text(json.dumps(budgets, indent=2) + "\n", encoding="utf-8")
+
+
+def over_budget(results: dict[str, Measurement], budgets: dict[str, float]) -> list[str]:
+    """Compare measurements with their budgets.
+
+    Args:
+        results: Measurements keyed by entry point.
+        budgets: Milliseconds keyed by entry point. Entry points without one
+            are not compared.
+
+    Returns:
+        One message per budget exceeded.
+    """
+    messages: list[str] = []
+    for name, result in results.items():
+        budget = budgets.get(name)
+        if budget is not None and result.milliseconds > budget:
+            slowest = ", ".join(f"{module} {ms:.1f} ms" for module, ms in result.top)
+            messages.append(f"{name}: {result.milliseconds:.1f} ms against {budget:.1f} ms ({slowest})")
+    return messages
+
+
+def main() -> None:
+    """Time every entry point, print a table, and check or update the budget."""
+    parser = argparse.ArgumentParser(description="Time how long each generator entry point takes to import.")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per entry point")
+    parser.add_argument("--check", action="store_true", help="fail if an entry point exceeds its budget")
+    parser.add_argument("--update-budget", action="store_true", help="store this run, plus headroom")
+    parser.add_argument(
+        "--headroom", type=float, default=DEFAULT_HEADROOM, help="allowance written with the budget"
+    )
+    args = parser.parse_args()
+
+    preloaded = {line.module for line in run_importtime(REFERENCE)}
+    budgets = load_budget(BUDGET)
+    results: dict[str, Measurement] = {}
+    print(f"{'entry point':<38}  {'ms':>8}  {'budget':>8}  costliest imports")
+    for entry in ENTRY_POINTS:
+        result = measure(entry, preloaded, args.repeat)
+        results[entry.name] = result
+        budget = f"{budgets[entry.name]:.1f}" if entry.name in budgets else "-"
+        slowest = ", ".join(f"{module} {ms:.0f}" for module, ms in result.top[:3])
+        print(f"{entry.name:<38}  {result.milliseconds:>8.1f}  {budget:>8}  {slowest}")
+
+    if args.update_budget:
+        save_budget(BUDGET, results, args.headroom)
+        print(f"\nBudget written to {BUDGET}")
+        return
+
+    if args.check:
+        failures = over_budget(results, budgets)
+        if failures:
+            raise SystemExit("Imports exceeded the budget:\n  " + "\n  ".join(failures))
+        print("\nEvery entry point within its budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Time the meeting-link readers over inflated view fragments.
+
+The captured agenda view holds about sixty anchors. Real years never hold many
+more, but timing a fragment of a few thousand shows how each reader scales
+and makes the gap between the streaming and tree readers measurable above
+timer noise.
+
+Usage:
+    python -m benchmarks.meeting_links
+    python -m benchmarks.meeting_links --anchors 1000 10000 --repeat 7
+"""
+
+import argparse
+import json
+import re
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+from asuci.models import AGENDA_VIEW_SLUG, MeetingLink, decode_view_response
+from asuci.parse import parse_meeting_links, parse_meeting_links_tree
+
+FIXTURE = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "view_agendas_20242025.json"
+
+# One table row of the rendered fragment, each holding a single anchor.
+ROW = re.compile(r"<tr>\s*<td><a .*?</a></td>\s*</tr>", re.DOTALL)
+
+# Anchor counts timed when none are given.
+DEFAULT_SIZES = (1_000, 5_000, 10_000)
+
+
+def load_fragment() -> str:
+    """Read the captured agenda fragment.
+
+    Returns:
+        The ``renderedHtml`` of the captured 24-25 agenda view.
+    """
+    payload = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    return decode_view_response(payload, AGENDA_VIEW_SLUG)["rendered_html"]
+
+
+def inflate(fragment: str, anchors: int) -> str:
+    """Grow a fragment by repeating its rows until it holds a given number of anchors.
+
+    Args:
+        fragment: A rendered view fragment.
+        anchors: Number of anchor rows wanted.
+
+    Returns:
+        The fragment with its rows replaced by ``anchors`` repeated rows.
+
+    Raises:
+        ValueError: If the fragment holds no anchor rows.
+    """
+    matches = list(ROW.finditer(fragment))
+    if not matches:
+        raise ValueError("fragment holds no anchor rows to repeat")
+
+    rows = [match.group(0) for match in matches]
+    body = "\n".join(rows[index % len(rows)] for index in range(anchors))
+    return fragment[: matches[0].start()] + body + fragment[matches[-1].end() :]
+
+
+def time_reader(reader: Callable[[str], list[MeetingLink]], fragment: str, repeat: int) -> float:
+    """Time one reader over a fragment.
+
+    Args:
+        reader: Function mapping a fragment to its links.
+        fragment: Fragment to read.
+        repeat: Number of timed runs; the fastest is kept.
+
+    Returns:
+        Seconds taken by the fastest run.
+    """
+    return min(timeit.repeat(lambda: reader(fragment), number=1, repeat=repeat))
+
+
+def main() -> None:
+    """Time both readers at each size and print a table."""
+    parser = argparse.ArgumentParser(description="Time the meeting-link readers.")
+    parser.add_argument("--anchors", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per reader; the fastest is kept")
+    args = parser.parse_args()
+
+    fragment = load_fragment()
+    print(f"{'anchors':>8}  {'stream ms':>10}  {'tree ms':>10}  {'speed-up':>8}")
+    for anchors in args.anchors:
+        inflated = inflate(fragment, anchors)
+        if parse_meeting_links(inflated) != parse_meeting_links_tree(inflated):
+            raise SystemExit(f"readers disagree at {anchors} anchors")
+        stream = time_reader(parse_meeting_links, inflated, args.repeat)
+        tree = time_reader(parse_meeting_links_tree, inflated, args.repeat)
+        print(f"{anchors:>8}  {stream * 1000:>10.2f}  {tree * 1000:>10.2f}  {tree / stream:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
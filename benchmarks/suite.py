@@ -0,0 +1,335 @@
+"""Time the ASUCI decode and parse pipeline against a stored baseline.
+
+Each case runs one stage of the pipeline over a captured fixture, either as
+captured or inflated to a multiple of its size: ``decode_view_response`` and
+``parse_meeting_links`` over the agenda view with its anchors repeated, and
+``parse_roster`` over the senate page with its roster columns repeated.
+Every case reports the fastest of several timed runs, the throughput that
+implies, and the peak memory of one further run under ``tracemalloc``.
+
+With ``--check``, the run fails if any case is slower, or peaks higher, than
+its baseline by more than the margin. Timings depend on the machine, so the
+baseline should be regenerated with ``--update-baseline`` on the machine
+that checks against it.
+
+Usage:
+    python -m benchmarks.suite
+    python -m benchmarks.suite --check --margin 0.5
+    python -m benchmarks.suite --update-baseline
+    python -m benchmarks.suite --scales 1 10 --repeat 7
+"""
+
+import argparse
+import json
+import re
+import time
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import TypedDict
+
+from asuci.models import AGENDA_VIEW_SLUG, ViewResponse, decode_view_response, require_object
+from asuci.parse import ASUCI_EMAIL_DOMAIN, parse_meeting_links, parse_roster
+
+from benchmarks.meeting_links import inflate
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+AGENDA_FIXTURE = FIXTURES / "view_agendas_20242025.json"
+ROSTER_FIXTURE = FIXTURES / "senate_roster.html"
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+# Multiples of the captured fixtures timed when none are given.
+DEFAULT_SCALES = (1, 10, 100, 1000)
+
+# The roster is read into a full tree, which at 1000x the captured page runs
+# to several gigabytes; larger roster scales are skipped.
+MAX_ROSTER_SCALE = 100
+
+# Allowed slowdown or memory growth over the baseline, as a fraction.
+DEFAULT_MARGIN = 0.5
+
+# Cases faster than this are run again until they have run this long, so
+# the fastest run of a small case is not at the mercy of a single hiccup.
+MIN_TIMED_SECONDS = 0.25
+
+# Opening tag of a layout column on the senate page.
+ROSTER_COLUMN = re.compile(r'<div class="fusion-layout-column')
+
+
+class Case(TypedDict):
+    """One stage of the pipeline over one input.
+
+    name: Stage and scale, e.g. ``parse_roster@10x``; the baseline key.
+    items: Anchors or roster records the input holds.
+    size_bytes: Size of the input in UTF-8.
+    run: Runs the stage once over the input.
+    """
+
+    name: str
+    items: int
+    size_bytes: int
+    run: Callable[[], object]
+
+
+class Measurement(TypedDict):
+    """How one case performed.
+
+    seconds: Fastest timed run.
+    peak_bytes: Peak memory allocated during one traced run.
+    items_per_second: Anchors or records read per second.
+    megabytes_per_second: Input read per second, in MB.
+    """
+
+    seconds: float
+    peak_bytes: int
+    items_per_second: float
+    megabytes_per_second: float
+
+
+class Baseline(TypedDict):
+    """A case's stored limits.
+
+    seconds: Fastest timed run when the baseline was taken.
+    peak_bytes: Peak traced memory when the baseline was taken.
+    """
+
+    seconds: float
+    peak_bytes: int
+
+
+def inflate_roster(html: str, copies: int) -> str:
+    """Grow the senate page by repeating its roster columns.
+
+    Every column but the last is repeated as a run, with each copy's
+    addresses made distinct so that deduplication does not fold the copies
+    back together.
+
+    Args:
+        html: Markup of the senate page.
+        copies: Number of copies of the columns wanted.
+
+    Returns:
+        The page with its columns repeated ``copies`` times.
+
+    Raises:
+        ValueError: If the page holds fewer than two layout columns.
+    """
+    starts = [match.start() for match in ROSTER_COLUMN.finditer(html)]
+    if len(starts) < 2:
+        raise ValueError("page holds too few layout columns to repeat")
+
+    columns = html[starts[0] : starts[-1]]
+    runs = [
+        columns if copy == 0 else columns.replace(ASUCI_EMAIL_DOMAIN, f".copy{copy}{ASUCI_EMAIL_DOMAIN}")
+        for copy in range(copies)
+    ]
+    return html[: starts[0]] + "".join(runs) + html[starts[-1] :]
+
+
+def decode_body(body: str) -> ViewResponse:
+    """Decode a view response body as the client does.
+
+    Args:
+        body: JSON text of the response.
+
+    Returns:
+        The validated response.
+    """
+    return decode_view_response(json.loads(body), AGENDA_VIEW_SLUG)
+
+
+def build_cases(scales: list[int]) -> list[Case]:
+    """Prepare every case at the given scales.
+
+    Args:
+        scales: Multiples of the captured fixtures to time.
+
+    Returns:
+        The cases, grouped by stage and in the order of ``scales``.
+    """
+    payload = require_object(json.loads(AGENDA_FIXTURE.read_text(encoding="utf-8")), "agenda fixture")
+    fragment = decode_view_response(payload, AGENDA_VIEW_SLUG)["rendered_html"]
+    anchors = len(parse_meeting_links(fragment))
+    roster_page = ROSTER_FIXTURE.read_text(encoding="utf-8")
+
+    decode_cases: list[Case] = []
+    link_cases: list[Case] = []
+    roster_cases: list[Case] = []
+    for scale in scales:
+        inflated = fragment if scale == 1 else inflate(fragment, anchors * scale)
+        body = json.dumps({**payload, "renderedHtml": inflated})
+        decode_cases.append(
+            Case(
+                name=f"decode_view_response@{scale}x",
+                items=anchors * scale,
+                size_bytes=len(body.encode("utf-8")),
+                run=partial(decode_body, body),
+            )
+        )
+        link_cases.append(
+            Case(
+                name=f"parse_meeting_links@{scale}x",
+                items=anchors * scale,
+                size_bytes=len(inflated.encode("utf-8")),
+                run=partial(parse_meeting_links, inflated),
+            )
+        )
+        if scale <= MAX_ROSTER_SCALE:
+            page = inflate_roster(roster_page, scale)
+            roster = parse_roster(page)
+            roster_cases.append(
+                Case(
+                    name=f"parse_roster@{scale}x",
+                    items=len(roster["leadership"]) + len(roster["senators"]),
+                    size_bytes=len(page.encode("utf-8")),
+                    run=partial(parse_roster, page),
+                )
+            )
+
+    return decode_cases + link_cases + roster_cases
+
+
+def measure(case: Case, repeat: int) -> Measurement:
+    """Time a case and trace its memory.
+
+    Args:
+        case: The case.
+        repeat: Least number of timed runs; the fastest is kept.
+
+    Returns:
+        The measurement.
+    """
+    seconds = float("inf")
+    runs = 0
+    spent = 0.0
+    while runs < repeat or spent < MIN_TIMED_SECONDS:
+        started = time.perf_counter()
+        case["run"]()
+        elapsed = time.perf_counter() - started
+        seconds = min(seconds, elapsed)
+        runs += 1
+        spent += elapsed
+
+    tracemalloc.start()
+    try:
+        case["run"]()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Measurement(
+        seconds=seconds,
+        peak_bytes=peak_bytes,
+        items_per_second=case["items"] / seconds,
+        megabytes_per_second=case["size_bytes"] / seconds / 1e6,
+    )
+
+
+def load_baseline(path: Path) -> dict[str, Baseline]:
+    """Read stored baselines.
+
+    Args:
+        path: Baseline file.
+
+    Returns:
+        Baselines keyed by case name, empty if the file is absent.
+
+    Raises:
+        ValueError: If an entry is not a pair of non-negative numbers.
+    """
+    if not path.is_file():
+        return {}
+
+    stored = require_object(json.loads(path.read_text(encoding="utf-8")), "baseline")
+    baselines: dict[str, Baseline] = {}
+    for name, value in stored.items():
+        entry = require_object(value, f"baseline {name!r}")
+        seconds = entry.get("seconds")
+        peak_bytes = entry.get("peak_bytes")
+        if not isinstance(seconds, float | int) or not isinstance(peak_bytes, int) or seconds < 0:
+            raise ValueError(f"baseline {name!r}: expected seconds and peak_bytes")
+        baselines[name] = Baseline(seconds=float(seconds), peak_bytes=peak_bytes)
+    return baselines
+
+
+def save_baseline(path: Path, results: dict[str, Measurement]) -> None:
+    """Store measurements as the new baseline.
+
+    Cases not measured in this run keep their stored baselines.
+
+    Args:
+        path: Baseline file.
+        results: Measurements keyed by case name.
+    """
+    baselines = load_baseline(path)
+    for name, result in results.items():
+        baselines[name] = Baseline(seconds=round(result["seconds"], 6), peak_bytes=result["peak_bytes"])
+    path.write_text(json.dumps(baselines, indent=2) + "\n", encoding="utf-8")
+
+
+def regressions(results: dict[str, Measurement], baselines: dict[str, Baseline], margin: float) -> list[str]:
+    """Compare measurements with their baselines.
+
+    Args:
+        results: Measurements keyed by case name.
+        baselines: Stored baselines keyed by case name. Cases without one
+            are not compared.
+        margin: Allowed growth over the baseline, as a fraction.
+
+    Returns:
+        One message per limit exceeded.
+    """
+    messages: list[str] = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            continue
+        if result["seconds"] > baseline["seconds"] * (1 + margin):
+            messages.append(
+                f"{name}: {result['seconds'] * 1000:.2f} ms against a baseline of "
+                f"{baseline['seconds'] * 1000:.2f} ms"
+            )
+        if result["peak_bytes"] > baseline["peak_bytes"] * (1 + margin):
+            messages.append(
+                f"{name}: peak {result['peak_bytes'] / 1e6:.1f} MB against a baseline of "
+                f"{baseline['peak_bytes'] / 1e6:.1f} MB"
+            )
+    return messages
+
+
+def main() -> None:
+    """Time every case, print a table, and check or update the baseline."""
+    parser = argparse.ArgumentParser(description="Time the ASUCI decode and parse pipeline.")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES))
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case; the fastest is kept")
+    parser.add_argument("--check", action="store_true", help="fail if a case exceeds its baseline")
+    parser.add_argument("--margin", type=float, default=DEFAULT_MARGIN, help="allowed growth, as a fraction")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the baseline")
+    args = parser.parse_args()
+
+    results: dict[str, Measurement] = {}
+    print(f"{'case':<28}  {'ms':>10}  {'items/s':>12}  {'MB/s':>8}  {'peak MB':>8}")
+    for case in build_cases(args.scales):
+        result = measure(case, args.repeat)
+        results[case["name"]] = result
+        print(
+            f"{case['name']:<28}  {result['seconds'] * 1000:>10.2f}  {result['items_per_second']:>12,.0f}  "
+            f"{result['megabytes_per_second']:>8.1f}  {result['peak_bytes'] / 1e6:>8.1f}"
+        )
+
+    if args.update_baseline:
+        save_baseline(BASELINE, results)
+        print(f"\nBaseline written to {BASELINE}")
+        return
+
+    if args.check:
+        failures = regressions(results, load_baseline(BASELINE), args.margin)
+        if failures:
+            raise SystemExit("Benchmarks exceeded the baseline:\n  " + "\n  ".join(failures))
+        print(f"\nAll cases within {args.margin:.0%} of the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,82 +1,797 @@
 #!/usr/bin/env python3
 """Generate every dashboard.
 
-Each dashboard runs independently and writes its own index.html. A dashboard
-that fails does not stop the others, and it does not discard their output: the
+Each dashboard runs independently and writes its own output. A dashboard that
+fails does not stop the others, and it does not discard their output: the
 workflow commits whatever regenerated and still reports the failure, so a slow
 morning at one upstream site no longer leaves every dashboard stale.
 
+Builds are incremental, make-style. Each dashboard declares the files its
+generator reads and the files it writes, and a manifest records a fingerprint
+of the inputs after every successful build. A dashboard whose inputs hash as
+they did last time, and whose outputs are still what that build left, is
+skipped. Dashboards fed from upstream sites also declare a probe: a cheap,
+conditional read of the upstream data that prints a fingerprint of it, so a
+quiet day skips their render too. ``--force`` builds everything regardless.
+A generator that exits with ``PARTIAL_BUILD_EXIT`` wrote its page without
+everything it reads upstream: it does not count as failed, but it is not
+recorded either, so the next run builds it again.
+
+With ``--jobs`` above one, the generators run side by side, since most of each
+one's time is spent waiting on its own upstream site. Their output is captured
+and printed afterwards as one block per dashboard, so the logs do not
+interleave. ``--timeout`` bounds each dashboard's whole turn, probe included:
+the generator, and anything it started, is killed once the turn has run for
+that long, and it then counts as failed like any other.
+
+With ``--in-process``, each probe and generator runs inside this interpreter
+instead of a fresh one, so the interpreter start and the cold imports of
+requests, bs4 and certifi are paid once rather than per command, and an
+upstream connection opened by a probe is still open for the build it gates.
+Each run is isolated as far as one interpreter allows: it sees its own
+``sys.argv`` and the repository root as its working directory, ``sys.path``
+and the working directory are restored after it, and an exception or
+``SystemExit`` it raises becomes its exit status rather than ending the whole
+run. In-process runs go one at a time and cannot be killed, so this mode
+takes neither ``--jobs`` nor ``--timeout``.
+
+Generators time their fetch, parse, render and write phases with
+``shared.utils.phase_timing``. Each run's totals, with every dashboard's wall
+time, are stored in ``.cache/generate_all/timings.json``, the run before in
+``timings.previous.json``, and any phase that got noticeably slower between
+the two is listed in the summary. ``--compare`` lists them again without
+generating anything, and exits non-zero if there are any. ``--profile`` also
+runs each generator under cProfile and writes its stats to
+``.cache/generate_all/profiles/<dashboard>.prof``.
+
 Invocation is declared per dashboard rather than guessed, because the directory
 names are not all importable as modules.
+
+Usage:
+    python generate_all.py                  # One dashboard at a time
+    python generate_all.py --jobs 2         # Run up to two at once
+    python generate_all.py --timeout 1800   # Kill any dashboard's turn after 30 minutes
+    python generate_all.py --force          # Rebuild even when nothing changed
+    python generate_all.py --in-process     # Run every generator in this interpreter
+    python generate_all.py --profile        # Also write a cProfile dump per dashboard
+    python generate_all.py --compare        # List phases slower than in the run before
 """
 
+import argparse
+import contextlib
+import cProfile
+import io
+import logging
+import os
+import runpy
+import signal
 import subprocess
 import sys
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import NamedTuple
 
+from shared.utils.build_manifest import (
+    PARTIAL_BUILD_EXIT,
+    BuildRecord,
+    hash_inputs,
+    is_up_to_date,
+    load_manifest,
+    record_build,
+    save_manifest,
+)
+from shared.utils.phase_timing import (
+    TIMINGS_ENV,
+    DashboardTiming,
+    PhaseTotal,
+    TimingReport,
+    find_slowdowns,
+    load_report,
+    read_phases,
+    reset,
+    save_report,
+    snapshot,
+)
+
 ROOT = Path(__file__).parent
 
+# Fingerprints of the last successful build of each dashboard. Kept with the
+# other caches the workflow restores between runs.
+MANIFEST_PATH = ROOT / ".cache" / "generate_all" / "manifest.json"
+
+# Phase timings of this run and the one before, compared after every run.
+TIMINGS_PATH = ROOT / ".cache" / "generate_all" / "timings.json"
+PREVIOUS_TIMINGS_PATH = ROOT / ".cache" / "generate_all" / "timings.previous.json"
+
+# Where a generator in its own interpreter leaves its phase totals.
+PHASES_DIR = ROOT / ".cache" / "generate_all" / "phases"
+
+# cProfile dumps, one per dashboard, written with --profile.
+PROFILE_DIR = ROOT / ".cache" / "generate_all" / "profiles"
+
+# A probe reports its fingerprint on a line starting with this.
+PROBE_PREFIX = "fingerprint: "
+
+# Code every generator shares.
+SHARED_INPUTS = ("shared/utils/*.py",)
+
+# Libraries every generator imports cold when it starts in a fresh interpreter;
+# timed once to estimate what an in-process run saves.
+COLD_START_IMPORTS = "import requests, bs4, certifi"
+
 
 class Dashboard(NamedTuple):
     """A dashboard and how to regenerate it.
 
     name: Directory holding the dashboard.
     argv: Arguments passed to the interpreter, relative to the repository root.
+    inputs: Glob patterns, relative to the repository root, for the files
+        the generator reads. A dashboard that declares none is always built.
+    outputs: Paths of the files and directories the generator writes.
+    probe: Arguments for a cheap run that prints a fingerprint of the
+        upstream data, on a line starting with ``PROBE_PREFIX``. Empty for
+        dashboards built from files alone.
     """
 
     name: str
     argv: tuple[str, ...]
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    probe: tuple[str, ...] = ()
+
+
+class DashboardRun(NamedTuple):
+    """How one dashboard's turn ended.
+
+    name: Directory holding the dashboard.
+    returncode: The generator's exit status; zero when skipped, and
+        ``PARTIAL_BUILD_EXIT`` when it wrote its page without everything
+        upstream.
+    seconds: Wall-clock time spent, probe included.
+    timed_out: Whether the generator was killed for running too long.
+    output: Everything printed for the dashboard, when it was captured.
+    skipped: Whether the build was skipped because nothing had changed.
+    fingerprint: Hash over the inputs the build read; empty when they could
+        not be fingerprinted, in which case the build is not recorded.
+    commands: Probe and generator runs made for the dashboard.
+    phases: Phase totals the generator reported; empty when it was skipped
+        or reported none.
+    """
+
+    name: str
+    returncode: int
+    seconds: float
+    timed_out: bool
+    output: str
+    skipped: bool = False
+    fingerprint: str = ""
+    commands: int = 0
+    phases: Mapping[str, PhaseTotal] = MappingProxyType({})
+
+    @property
+    def ok(self) -> bool:
+        """Whether the generator finished in time and wrote its outputs."""
+        return self.returncode in (0, PARTIAL_BUILD_EXIT) and not self.timed_out
+
+    @property
+    def partial(self) -> bool:
+        """Whether the generator wrote its outputs without everything upstream."""
+        return self.returncode == PARTIAL_BUILD_EXIT and not self.timed_out
 
 
 DASHBOARDS: tuple[Dashboard, ...] = (
     # asuci is a package, so it runs as a module and can import its own client.
-    Dashboard(name="asuci", argv=("-m", "asuci.generate")),
+    # Its run report records where a slow morning's time went.
+    Dashboard(
+        name="asuci",
+        argv=("-m", "asuci.generate", "--metrics"),
+        inputs=("asuci/*.py", "asuci/templates", "asuci/certs", *SHARED_INPUTS),
+        outputs=("asuci/index.html", "asuci/search", "asuci/portraits"),
+        probe=("-m", "asuci.generate", "--probe"),
+    ),
     # The directory name is not a valid module name, so this one runs by path.
-    Dashboard(name="irvine-city-council", argv=("irvine-city-council/generate.py",)),
+    Dashboard(
+        name="irvine-city-council",
+        argv=("irvine-city-council/generate.py",),
+        inputs=(
+            "irvine-city-council/generate.py",
+            "irvine-city-council/schedule.json",
+            # The curated roster the generator falls back on.
+            "oc-city-councils/_council_data/irvine.yaml",
+            *SHARED_INPUTS,
+        ),
+        outputs=("irvine-city-council/index.html", "irvine-city-council/portraits"),
+        probe=("irvine-city-council/generate.py", "--probe"),
+    ),
+    # Built from the curated council files and any scraped meetings, so it runs
+    # only when they or the shared code change.
+    Dashboard(
+        name="oc-city-councils",
+        argv=("oc-city-councils/build_dashboard.py",),
+        inputs=(
+            "oc-city-councils/build_dashboard.py",
+            "oc-city-councils/_council_data",
+            # Written by shared.scrapers.batch; absent until it has run.
+            "oc-city-councils/meetings_snapshot.json",
+            *SHARED_INPUTS,
+        ),
+        outputs=("oc-city-councils/dashboard_data.json", "oc-city-councils/portraits"),
+    ),
 )
 
 
-def run_dashboard(dashboard: Dashboard) -> bool:
-    """Regenerate one dashboard.
+def kill_tree(process: subprocess.Popen[str]) -> None:
+    """Kill a generator and every process it started.
+
+    Generators may drive a browser, whose processes would otherwise outlive
+    the generator and keep its output pipe open.
+
+    Args:
+        process: The generator, started as the leader of its own process
+            group on POSIX.
+    """
+    if os.name == "nt":
+        subprocess.run(
+            ["taskkill", "/F", "/T", "/PID", str(process.pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        return
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(process.pid, signal.SIGKILL)
+
+
+def run_command(
+    argv: tuple[str, ...], timeout: float | None, capture: bool, extra_env: dict[str, str] | None = None
+) -> tuple[int, str, bool]:
+    """Run the interpreter with the given arguments from the repository root.
+
+    Args:
+        argv: Arguments passed to the interpreter.
+        timeout: Seconds after which the command and anything it started are
+            killed; None waits however long it takes.
+        capture: Collect the output instead of letting it stream to this
+            console.
+        extra_env: Variables to set for the command on top of this
+            process's environment.
+
+    Returns:
+        The exit status, the captured output, and whether it timed out.
+    """
+    extra = dict(extra_env or {})
+    if capture:
+        # Captured output is decoded as UTF-8 whatever the console's encoding.
+        extra["PYTHONIOENCODING"] = "utf-8"
+    env = {**os.environ, **extra} if extra else None
+    process = subprocess.Popen(
+        [sys.executable, *argv],
+        cwd=str(ROOT),
+        stdout=subprocess.PIPE if capture else None,
+        stderr=subprocess.STDOUT if capture else None,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        env=env,
+        start_new_session=os.name != "nt",
+    )
+
+    timed_out = False
+    try:
+        output, _ = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        timed_out = True
+        kill_tree(process)
+        output, _ = process.communicate()
+    except BaseException:
+        # An interrupted run must not leave generators running in their own
+        # process groups, out of reach of the terminal's Ctrl+C.
+        kill_tree(process)
+        process.wait()
+        raise
+
+    return process.returncode, output or "", timed_out
+
+
+def exit_status(code: object) -> int:
+    """Translate a ``SystemExit`` code into a process exit status.
+
+    Args:
+        code: The code the generator exited with.
+
+    Returns:
+        0 for None, the code itself for an integer, and 1 for anything else,
+        which ``sys.exit`` would have printed.
+    """
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def call_in_process(
+    argv: tuple[str, ...], capture: bool, profiler: cProfile.Profile | None = None
+) -> tuple[int, str, bool]:
+    """Run a generator's entry point inside this interpreter.
+
+    The generator runs as ``__main__``, exactly as the interpreter would run
+    it: by module name for ``-m`` arguments, otherwise by path, so
+    directories that are not importable work too. Imported libraries, and
+    anything they keep per process such as connection pools, are shared.
+
+    Args:
+        argv: Arguments that would be passed to the interpreter.
+        capture: Collect stdout and stderr instead of letting them stream to
+            this console.
+        profiler: Profiler to enable while the generator runs, if any.
+
+    Returns:
+        The exit status, the captured output, and False, since an in-process
+        run is never timed out.
+    """
+    saved_argv, saved_path, saved_cwd = sys.argv[:], sys.path[:], Path.cwd()
+    buffer = io.StringIO()
+    returncode = 0
+    with contextlib.ExitStack() as stack:
+        if capture:
+            stack.enter_context(contextlib.redirect_stdout(buffer))
+            stack.enter_context(contextlib.redirect_stderr(buffer))
+        if profiler is not None:
+            stack.enter_context(profiler)
+        try:
+            os.chdir(ROOT)
+            if argv[0] == "-m":
+                sys.argv = [argv[1], *argv[2:]]
+                runpy.run_module(argv[1], run_name="__main__", alter_sys=True)
+            else:
+                sys.argv = [str(ROOT / argv[0]), *argv[1:]]
+                runpy.run_path(str(ROOT / argv[0]), run_name="__main__")
+        except SystemExit as exit_:
+            returncode = exit_status(exit_.code)
+        except Exception:
+            # Reported with its traceback, as an uncaught error in a child
+            # interpreter would be, and counted as that dashboard's failure.
+            logging.getLogger("generate_all").exception("Generator raised")
+            returncode = 1
+        finally:
+            sys.argv[:] = saved_argv
+            sys.path[:] = saved_path
+            os.chdir(saved_cwd)
+    return returncode, buffer.getvalue(), False
+
+
+def run_generator(
+    argv: tuple[str, ...], timeout: float | None, capture: bool, in_process: bool
+) -> tuple[int, str, bool]:
+    """Run a probe or generator in a fresh interpreter or in this one.
+
+    Args:
+        argv: Arguments passed to the interpreter.
+        timeout: Seconds after which a fresh interpreter is killed.
+        capture: Collect the output instead of letting it stream.
+        in_process: Run inside this interpreter.
+
+    Returns:
+        The exit status, the captured output, and whether it timed out.
+    """
+    if in_process:
+        return call_in_process(argv, capture)
+    return run_command(argv, timeout, capture)
+
+
+def run_build(
+    dashboard: Dashboard, timeout: float | None, capture: bool, in_process: bool, profile: bool
+) -> tuple[tuple[int, str, bool], dict[str, PhaseTotal]]:
+    """Run a dashboard's generator and collect the phases it timed.
+
+    Args:
+        dashboard: The dashboard to build.
+        timeout: Seconds after which a fresh interpreter is killed.
+        capture: Collect the output instead of letting it stream.
+        in_process: Run inside this interpreter.
+        profile: Run under cProfile and dump the stats to ``PROFILE_DIR``.
+
+    Returns:
+        What ``run_generator`` returns, and the generator's phase totals,
+        empty if it reported none.
+    """
+    profile_path = PROFILE_DIR / f"{dashboard.name}.prof"
+    if profile:
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+
+    if in_process:
+        reset()
+        profiler = cProfile.Profile() if profile else None
+        result = call_in_process(dashboard.argv, capture, profiler)
+        if profiler is not None:
+            profiler.dump_stats(profile_path)
+        return result, snapshot()
+
+    # A generator killed before it could exit leaves no totals, rather than
+    # the totals of an earlier run.
+    phases_path = PHASES_DIR / f"{dashboard.name}.json"
+    phases_path.unlink(missing_ok=True)
+    argv = ("-m", "cProfile", "-o", str(profile_path), *dashboard.argv) if profile else dashboard.argv
+    result = run_command(argv, timeout, capture, {TIMINGS_ENV: str(phases_path)})
+    return result, read_phases(phases_path)
+
+
+def measure_cold_start() -> float:
+    """Time a fresh interpreter starting and importing the shared libraries.
+
+    Returns:
+        Seconds from launch to exit.
+    """
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", COLD_START_IMPORTS], cwd=str(ROOT), check=False)
+    return time.perf_counter() - started
+
+
+def probe_upstream(
+    dashboard: Dashboard, timeout: float | None, in_process: bool = False
+) -> tuple[str | None, str]:
+    """Ask a dashboard's probe for the fingerprint of its upstream data.
+
+    Args:
+        dashboard: The dashboard, which declares a probe.
+        timeout: Seconds after which the probe is killed.
+        in_process: Run the probe inside this interpreter.
+
+    Returns:
+        The fingerprint, or None if the probe failed, with a note saying why.
+    """
+    returncode, output, timed_out = run_generator(dashboard.probe, timeout, True, in_process)
+    lines = [
+        line[len(PROBE_PREFIX) :].strip() for line in output.splitlines() if line.startswith(PROBE_PREFIX)
+    ]
+    if timed_out or returncode != 0 or not lines:
+        reason = "timed out" if timed_out else f"exit {returncode}" if returncode != 0 else "no fingerprint"
+        tail = "\n".join(output.strip().splitlines()[-5:])
+        return None, f"[!] Probe failed ({reason}); building anyway\n{tail}".rstrip() + "\n"
+    return lines[-1], ""
+
+
+def run_dashboard(
+    dashboard: Dashboard,
+    record: BuildRecord | None = None,
+    force: bool = False,
+    timeout: float | None = None,
+    capture: bool = False,
+    in_process: bool = False,
+    profile: bool = False,
+) -> DashboardRun:
+    """Regenerate one dashboard unless nothing it reads has changed.
 
     Args:
         dashboard: The dashboard to run.
+        record: Its last successful build, if any.
+        force: Build even when the inputs are unchanged.
+        timeout: Seconds the whole turn may take, probe included; whichever
+            of the probe or the generator is running then is killed.
+        capture: Collect everything printed for the dashboard instead of
+            letting it stream to this console.
+        in_process: Run the probe and generator inside this interpreter.
+        profile: Run the generator under cProfile.
 
     Returns:
-        True if the generator exited successfully.
+        How the dashboard's turn ended.
     """
-    print(f"\n{'=' * 60}")
-    print(f"[*] Generating: {dashboard.name}")
-    print("=" * 60)
+    started = time.perf_counter()
+    log: list[str] = []
 
-    result = subprocess.run(
-        [sys.executable, *dashboard.argv],
-        cwd=str(ROOT),
-        check=False,
+    def remaining() -> float | None:
+        """Seconds left before the turn's deadline, or None without one."""
+        if timeout is None:
+            return None
+        return max(timeout - (time.perf_counter() - started), 0.0)
+
+    def say(text: str) -> None:
+        """Print a note now, or keep it with the captured output."""
+        if capture:
+            log.append(text)
+        else:
+            print(text, end="", flush=True)
+
+    if not capture:
+        say(f"\n{'=' * 60}\n[*] Generating: {dashboard.name}\n{'=' * 60}\n")
+
+    fingerprint = ""
+    commands = 0
+    if dashboard.inputs:
+        upstream: str | None = ""
+        note = ""
+        if dashboard.probe:
+            upstream, note = probe_upstream(dashboard, remaining(), in_process)
+            commands += 1
+        say(note)
+        if upstream is not None:
+            fingerprint = hash_inputs(ROOT, dashboard.inputs, (*dashboard.argv, upstream))
+        if not force and fingerprint and is_up_to_date(ROOT, record, fingerprint, dashboard.outputs):
+            return DashboardRun(
+                name=dashboard.name,
+                returncode=0,
+                seconds=time.perf_counter() - started,
+                timed_out=False,
+                output="".join(log),
+                skipped=True,
+                fingerprint=fingerprint,
+                commands=commands,
+            )
+
+    (returncode, output, timed_out), phases = run_build(dashboard, remaining(), capture, in_process, profile)
+    return DashboardRun(
+        name=dashboard.name,
+        returncode=returncode,
+        seconds=time.perf_counter() - started,
+        timed_out=timed_out,
+        output="".join(log) + output,
+        fingerprint=fingerprint,
+        commands=commands + 1,
+        phases=phases,
     )
 
-    if result.returncode != 0:
-        print(f"[!] Failed: {dashboard.name} (exit {result.returncode})")
-        return False
 
-    print(f"[+] Done: {dashboard.name}")
-    return True
+def report_run(run: DashboardRun, timeout: float | None) -> None:
+    """Print how one dashboard's turn ended.
+
+    Args:
+        run: The finished run.
+        timeout: The timeout it ran under, for the message when it hit it.
+    """
+    if run.skipped:
+        print(f"[=] Skipped: {run.name} (inputs unchanged, {run.seconds:.1f}s)")
+    elif run.timed_out:
+        print(f"[!] Timed out: {run.name} (killed at its {timeout:g}s limit)")
+    elif not run.ok:
+        print(f"[!] Failed: {run.name} (exit {run.returncode})")
+    elif run.partial:
+        print(f"[~] Done, incomplete: {run.name} ({run.seconds:.1f}s; built again next run)")
+    else:
+        print(f"[+] Done: {run.name} ({run.seconds:.1f}s)")
+
+
+def run_all(
+    dashboards: tuple[Dashboard, ...],
+    jobs: int,
+    timeout: float | None,
+    manifest: dict[str, BuildRecord],
+    force: bool = False,
+    in_process: bool = False,
+    profile: bool = False,
+) -> list[DashboardRun]:
+    """Regenerate dashboards, up to ``jobs`` at once.
+
+    Args:
+        dashboards: The dashboards to run.
+        jobs: Most generators running at once. With one, each streams its
+            output as it runs; with more, output is captured and printed as
+            one block per dashboard once all have finished.
+        timeout: Seconds each dashboard's turn may take, probe included.
+        manifest: Last successful build of each dashboard, by name.
+        force: Build every dashboard even when its inputs are unchanged.
+        in_process: Run every probe and generator inside this interpreter;
+            ``jobs`` must then be one.
+        profile: Run every generator under cProfile.
+
+    Returns:
+        Each run, in the order the dashboards were given.
+    """
+    if jobs == 1:
+        runs: list[DashboardRun] = []
+        for dashboard in dashboards:
+            run = run_dashboard(
+                dashboard,
+                manifest.get(dashboard.name),
+                force,
+                timeout,
+                in_process=in_process,
+                profile=profile,
+            )
+            report_run(run, timeout)
+            runs.append(run)
+        return runs
+
+    print(f"\n[*] Running {len(dashboards)} dashboards, up to {jobs} at once...", flush=True)
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        runs = list(
+            pool.map(
+                lambda dashboard: run_dashboard(
+                    dashboard, manifest.get(dashboard.name), force, timeout, capture=True, profile=profile
+                ),
+                dashboards,
+            )
+        )
+
+    for run in runs:
+        print(f"\n{'=' * 60}")
+        print(f"[*] Generated: {run.name}")
+        print("=" * 60)
+        print(run.output, end="" if run.output.endswith("\n") or not run.output else "\n")
+        report_run(run, timeout)
+    return runs
+
+
+def timing_report(runs: list[DashboardRun], previous: TimingReport | None = None) -> TimingReport:
+    """Collect the timings of a run of every dashboard.
+
+    A skipped dashboard reports no phases of its own, so it keeps those of
+    its last build, and the next build is compared against them.
+
+    Args:
+        runs: The finished runs.
+        previous: The report of the run before, if there is one.
+
+    Returns:
+        The report, stamped with the current time.
+    """
+    earlier = previous["dashboards"] if previous is not None else {}
+    dashboards: dict[str, DashboardTiming] = {}
+    for run in runs:
+        status = "skipped" if run.skipped else ("ok" if run.ok else "failed")
+        phases = dict(run.phases)
+        if run.skipped and run.name in earlier:
+            phases = earlier[run.name]["phases"]
+        dashboards[run.name] = DashboardTiming(seconds=run.seconds, status=status, phases=phases)
+    return TimingReport(generated_at=datetime.now(UTC).isoformat(), dashboards=dashboards)
+
+
+def print_slowdowns(previous: TimingReport | None, current: TimingReport) -> int:
+    """List the phases that got slower than in the previous run.
+
+    Args:
+        previous: The earlier report, if there is one.
+        current: The report to check.
+
+    Returns:
+        How many phases were flagged.
+    """
+    if previous is None:
+        print("    No earlier timings to compare against.")
+        return 0
+    slowdowns = find_slowdowns(previous, current)
+    if not slowdowns:
+        print(f"    No phase slower than in the run of {previous['generated_at']}.")
+    for slowdown in slowdowns:
+        print(
+            f"    [!] {slowdown.dashboard} {slowdown.phase}: "
+            f"{slowdown.previous:.1f}s -> {slowdown.current:.1f}s"
+        )
+    return len(slowdowns)
+
+
+def compare_timings() -> int:
+    """Compare the stored timings of the last run against the run before.
+
+    Returns:
+        1 if a phase got slower or there is no last run, otherwise 0.
+    """
+    current = load_report(TIMINGS_PATH)
+    if current is None:
+        print(f"[!] No timings stored at {TIMINGS_PATH}; run the generators first.")
+        return 1
+    print(f"Phase timings of the run of {current['generated_at']}:")
+    return 1 if print_slowdowns(load_report(PREVIOUS_TIMINGS_PATH), current) else 0
+
+
+def print_summary(runs: list[DashboardRun], wall: float, in_process: bool) -> None:
+    """Print how every dashboard's turn ended and what the run cost.
+
+    Args:
+        runs: The finished runs.
+        wall: Seconds the whole run took.
+        in_process: Whether the generators ran inside this interpreter.
+    """
+    for run in runs:
+        if run.skipped:
+            status = "skipped"
+        else:
+            status = "ok" if run.ok else ("timed out" if run.timed_out else f"exit {run.returncode}")
+            if run.partial:
+                status = "incomplete"
+        print(f"    {run.name:<24} {run.seconds:>8.1f}s  {status}")
+    serial = sum(run.seconds for run in runs)
+    print(f"    Wall time {wall:.1f}s for {serial:.1f}s of generator time ({serial / wall:.2f}x speed-up)")
+    if in_process:
+        commands = sum(run.commands for run in runs)
+        cold_start = measure_cold_start()
+        print(
+            f"    In-process: {commands} interpreter starts avoided, "
+            f"about {commands * cold_start:.1f}s saved at {cold_start:.2f}s per cold start"
+        )
+
+
+def store_timings(runs: list[DashboardRun]) -> None:
+    """Store this run's timings, print each dashboard's phases and flag slowdowns.
+
+    The report of the run before is kept beside it, so ``--compare`` can be
+    repeated.
+
+    Args:
+        runs: The finished runs.
+    """
+    previous = load_report(TIMINGS_PATH)
+    timings = timing_report(runs, previous)
+    if previous is not None:
+        save_report(PREVIOUS_TIMINGS_PATH, previous)
+    save_report(TIMINGS_PATH, timings)
+    print("\n    Phases:")
+    for name, timing in timings["dashboards"].items():
+        phases = ", ".join(f"{phase} {total['seconds']:.1f}s" for phase, total in timing["phases"].items())
+        if timing["status"] == "skipped":
+            phases = f"skipped; last build {phases}" if phases else "skipped"
+        print(f"    {name:<24} {phases or 'none reported'}")
+    print_slowdowns(previous, timings)
+
+
+def record_runs(
+    manifest: dict[str, BuildRecord], runs: list[DashboardRun], dashboards: tuple[Dashboard, ...]
+) -> None:
+    """Record every build that succeeded in full, so it can be skipped next time.
+
+    A failed or incomplete build is left out, so it is retried, and a
+    skipped one keeps the record it was skipped on.
+
+    Args:
+        manifest: Last successful build of each dashboard, updated in place.
+        runs: The finished runs.
+        dashboards: The dashboards, for the outputs each declares.
+    """
+    outputs = {dashboard.name: dashboard.outputs for dashboard in dashboards}
+    for run in runs:
+        if run.ok and not run.partial and not run.skipped and run.fingerprint:
+            manifest[run.name] = record_build(ROOT, run.fingerprint, outputs[run.name])
 
 
 def main() -> int:
-    """Regenerate every dashboard.
+    """Regenerate every dashboard whose inputs changed.
 
     Returns:
         1 if any dashboard failed, otherwise 0.
     """
+    parser = argparse.ArgumentParser(description="Generate every dashboard.")
+    parser.add_argument("--jobs", type=int, default=1, help="most generators running at once")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds a dashboard's turn may take")
+    parser.add_argument("--force", action="store_true", help="build even when the inputs are unchanged")
+    parser.add_argument("--in-process", action="store_true", help="run every generator in this interpreter")
+    parser.add_argument("--profile", action="store_true", help="write a cProfile dump per dashboard")
+    parser.add_argument(
+        "--compare", action="store_true", help="list phases slower than in the run before, and exit"
+    )
+    args = parser.parse_args()
+    if args.compare:
+        return compare_timings()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.in_process and (args.jobs > 1 or args.timeout is not None):
+        parser.error(
+            "--in-process runs one generator at a time and cannot kill it; drop --jobs and --timeout"
+        )
+
     print("=" * 60)
     print("Generating all dashboards...")
     print("=" * 60)
 
-    failed = [d.name for d in DASHBOARDS if not run_dashboard(d)]
+    manifest = load_manifest(MANIFEST_PATH)
+    started = time.perf_counter()
+    runs = run_all(DASHBOARDS, args.jobs, args.timeout, manifest, args.force, args.in_process, args.profile)
+    wall = time.perf_counter() - started
+
+    record_runs(manifest, runs, DASHBOARDS)
+    save_manifest(MANIFEST_PATH, manifest)
 
     print("\n" + "=" * 60)
+    print_summary(runs, wall, args.in_process)
+    store_timings(runs)
+    if args.profile:
+        print(f"    Profiles written to {PROFILE_DIR}")
+
+    failed = [run.name for run in runs if not run.ok]
     if failed:
         print(f"[!] Failed dashboards: {', '.join(failed)}")
         print("[*] Dashboards that succeeded were still written and will be committed.")
@@ -3,23 +3,68 @@ Irvine City Council Dashboard HTML Generator
 
 Run this script to generate a fresh HTML dashboard with live data.
 
-Reads meetings from Granicus over plain HTTP. The next meeting comes from
-actual dates - the curated schedule.json merged with anything Granicus already
-publishes - never from a recurrence rule.
+Reads meetings from Granicus, and the council roster from the city's City
+Council page, over plain HTTP. The next meeting comes from actual dates - the
+curated schedule.json merged with anything Granicus already publishes - never
+from a recurrence rule.
+
+The listing is read over one pooled, keep-alive session. The response is kept
+in an on-disk cache with its validators, so an unchanged listing comes back as
+a 304 instead of the whole archive, and the meetings parsed from it are kept
+beside it keyed by the body's hash and the parser's version, so an unchanged
+body is not parsed again until the parser changes. The run log says which of
+those happened.
+
+The roster page is read while the listing is, and cached the same way. When
+it cannot be read, or no longer lists the council, the curated Irvine entry
+in oc-city-councils/_council_data is used instead; it also supplies the
+emails and bios the page does not show.
+
+The agenda of every upcoming meeting in the listing is then read the same
+way, a few at once, and its numbered items are shown with the meeting. Items
+are kept per event id with the hash of the agenda they came from, so only
+agendas that are new or changed are parsed; the rest cost a 304.
 
 Usage:
-    python generate.py           # Full refresh
-    python generate.py --quick   # Skip the Granicus scrape
+    python generate.py              # Full refresh
+    python generate.py --quick      # Skip the Granicus scrape; use the curated roster
+    python generate.py --no-cache   # Download and parse the listing in full
+    python generate.py --probe      # Print a fingerprint of the upstream pages and exit
+
+Council portraits are downloaded once into a store shared by the dashboards,
+and published beside the page as thumbnails at the size the cards show them;
+only portraits that are new or changed upstream are resized again.
+
+The page is written only when its content, apart from the generation time,
+differs from the page on disk. A page written with the curated roster in
+place of the city's, or without some agendas or portraits, because they
+could not be read, is still written, but the run exits with
+PARTIAL_BUILD_EXIT so generate_all does not record it and builds it again
+next time.
+
+The roster, the Granicus fetch and parse, the agendas, the portraits, the
+render and the write are timed as spans, which generate_all collects into
+its timing report.
+
+requests and BeautifulSoup are imported when Granicus is first read, so a
+--quick run, or anything importing this module, does not pay for them.
 """
 
+from __future__ import annotations
+
+import hashlib
 import json
+import os
 import re
 import sys
 from datetime import date, datetime
+from html.parser import HTMLParser
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import requests
-from bs4 import BeautifulSoup, Tag
+if TYPE_CHECKING:
+    import requests
+    from bs4 import Tag
 
 # The directory name is not importable, so the repository root is added
 # explicitly to reach the shared utilities.
@@ -32,6 +77,64 @@ from shared.utils.meeting_schedule import (  # noqa: E402
     select_next_meeting,
     upcoming_meetings,
 )
+from shared.utils.http_cache import (  # noqa: E402
+    ResponseCache,
+    cache_key,
+    conditional_headers,
+)
+from shared.utils.build_manifest import PARTIAL_BUILD_EXIT  # noqa: E402
+from shared.utils.http_sessions import host_session  # noqa: E402
+from shared.utils.page_render import (  # noqa: E402
+    CONTENT_DIGEST_MARK,
+    GENERATED_AT_MARK,
+    write_page,
+)
+from shared.utils.phase_timing import span  # noqa: E402
+
+# Caches shared between runs; the workflow restores them before each run.
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "irvine-city-council"
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+LISTING_CACHE_PATH = CACHE_DIR / "listing.json"
+ROSTER_CACHE_PATH = CACHE_DIR / "roster.json"
+AGENDA_CACHE_PATH = CACHE_DIR / "agendas.json"
+
+# Versions of the parsers whose results those files keep. Bump one whenever
+# its parser reads a page differently, so results stored by the old parser
+# are parsed again rather than reused for an unchanged body.
+LISTING_FORMAT = 1
+ROSTER_FORMAT = 1
+AGENDA_FORMAT = 1
+
+# Seconds a listing served without validators is reused without asking again.
+# Zero refetches it on every run.
+HTTP_CACHE_MAX_AGE = 0.0
+
+# The council as the city publishes it, and the curated roster used when that
+# page cannot be read. A page listing fewer members than ROSTER_MINIMUM is
+# taken to have changed layout, and the curated roster is used instead.
+ROSTER_URL = "https://cityofirvine.gov/city-council"
+ROSTER_FALLBACK_PATH = (
+    Path(__file__).resolve().parent.parent / "oc-city-councils" / "_council_data" / "irvine.yaml"
+)
+ROSTER_MINIMUM = 5
+
+# Upcoming agendas read at once; granicus_session keeps as many connections.
+AGENDA_WORKERS = 4
+
+# Items kept per agenda, and characters kept per item title.
+AGENDA_ITEM_LIMIT = 60
+AGENDA_TITLE_LIMIT = 200
+
+# Portrait originals are stored once for every dashboard; the thumbnails are
+# published beside the page, sized for .council-card .photo.
+PORTRAIT_STORE_DIR = CACHE_DIR.parent / "portraits"
+PORTRAIT_DIR = Path(__file__).resolve().parent / "portraits"
+PORTRAIT_SIZE = (140, 175)
+
+# Portraits downloaded at once. city_session keeps as many connections, the
+# pool host_downloader keeps per host, so every dashboard in a run shares one
+# cityofirvine.gov session.
+PORTRAIT_WORKERS = 4
 
 
 def granicus_upcoming_dates(meetings: list[dict]) -> list[date]:
@@ -50,93 +153,223 @@ def granicus_upcoming_dates(meetings: list[dict]) -> list[date]:
     found: set[date] = set()
 
     for meeting in meetings:
-        raw = meeting.get("date")
-        if not isinstance(raw, str):
-            continue
-        for fmt in ("%B %d, %Y", "%b %d, %Y", "%Y-%m-%d"):
-            try:
-                parsed = datetime.strptime(raw.strip(), fmt).date()
-            except ValueError:
-                continue
-            if parsed >= today:
-                found.add(parsed)
-            break
+        parsed = _meeting_date(meeting)
+        if parsed is not None and parsed >= today:
+            found.add(parsed)
 
     return sorted(found)
 
 
-def fetch_council_members():
-    """Fetch current council members from City of Irvine website."""
-    # Hardcoded data since the city website structure is stable
-    # Photos and links are scraped from https://cityofirvine.gov/city-council
-    members = [
-        {
-            "name": "Larry Agran",
-            "position": "Mayor",
-            "district": "At-Large",
-            "photo": "https://cityofirvine.gov/sites/default/files/city-files/PIO/Images/Website/Ziba%20Photo%20Video%20-%20Mayor%20Larry%20Agran%203.jpg",
-            "email": "LarryAgran@cityofirvine.org",
-            "bio": "First served on Irvine City Council 1978-1990, including six years as Mayor. Elected Mayor in 2024 for his eighth nonconsecutive term. Harvard Law School graduate.",
-            "website": "https://mayorlarryagran.org"
-        },
-        {
-            "name": "James Mai",
-            "position": "Vice Mayor",
-            "district": "District 3",
-            "photo": "https://cityofirvine.gov/sites/default/files/file-repository/CM%20Mai_5x7.jpg",
-            "email": "JamesMai@cityofirvine.org",
-            "bio": "Vice Mayor representing District 3 on the Irvine City Council.",
-            "website": None
-        },
-        {
-            "name": "Melinda Liu",
-            "position": "Councilmember",
-            "district": "District 1",
-            "photo": "https://cityofirvine.gov/sites/default/files/file-repository/CM%20Liu_5x7.jpg",
-            "email": "MelindaLiu@cityofirvine.org",
-            "bio": "Councilmember representing District 1.",
-            "website": "https://www.melindaliuirvine.com"
-        },
-        {
-            "name": "William Go",
-            "position": "Councilmember",
-            "district": "District 2",
-            "photo": "https://cityofirvine.gov/sites/default/files/file-repository/CM%20Go_5x7.jpg",
-            "email": "WilliamGo@cityofirvine.org",
-            "bio": "Councilmember representing District 2.",
-            "website": None
-        },
-        {
-            "name": "Mike Carroll",
-            "position": "Councilmember",
-            "district": "District 4",
-            "photo": "https://cityofirvine.gov/sites/default/files/City%20Council/2024/Mike%20Carroll_with%20pin_.png",
-            "email": "MikeCarroll@cityofirvine.org",
-            "bio": "Serving second term on City Council. Vice Chairman of the Great Park. Corporate attorney, OCTA Board Member, and New York Times bestselling author.",
-            "website": None
-        },
-        {
-            "name": "Betty Martinez Franco",
-            "position": "Councilmember",
-            "district": "District 5",
-            "photo": "https://cityofirvine.gov/sites/default/files/City%20Council/2024/Betty%20Martinez%20Franco_400x560px.jpg",
-            "email": "BettyMartinezFranco@cityofirvine.org",
-            "bio": "Councilmember representing District 5.",
-            "website": None
-        },
+def _meeting_date(meeting: dict) -> date | None:
+    """Parse a meeting's date, or return None if it has none that parses."""
+    raw = meeting.get("date")
+    if not isinstance(raw, str):
+        return None
+    for fmt in ("%B %d, %Y", "%b %d, %Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(raw.strip(), fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+# Position titles the city puts before a member's name, longest first.
+_POSITIONS = ("Vice Mayor", "Mayor Pro Tem", "Mayor", "Councilmember", "Council Member")
+
+# A member's profile link on the roster, such as
+# /city-council/vice-mayor-james-mai-district-3.
+_PROFILE_PATTERN = re.compile(
+    r"/city-council/(?:vice-mayor|mayor-pro-tem|mayor|councilmember|council-member)-[^/?#]+$"
+)
+_DISTRICT_PATTERN = re.compile(r"\bDistrict\s+(\d+)\b", re.IGNORECASE)
+
+
+def parse_council_roster(markup: str) -> list[dict]:
+    """Read the council members out of the city's City Council page.
+
+    Each member is found by the link to their profile page, whose card also
+    holds their portrait. The title, name and district come from the link's
+    text, or from its path when the text is only "Read more".
+
+    Returns:
+        The members in page order, each with its name, position, district,
+        photo and profile URL; empty if the page has no profile links.
+    """
+    from urllib.parse import unquote, urljoin
+
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(markup, "html.parser")
+    members: list[dict] = []
+    seen: set[str] = set()
+
+    for link in soup.find_all("a", href=True):
+        href = urljoin(ROSTER_URL, link["href"]).split("#")[0]
+        if not _PROFILE_PATTERN.search(href) or href in seen:
+            continue
+        seen.add(href)
+
+        text = _clean_text(link)
+        if not any(text.startswith(position) for position in _POSITIONS):
+            # Rebuild the text from the path: vice-mayor-james-mai-district-3.
+            slug = unquote(href.rsplit("/", 1)[1]).replace("–", " ")
+            text = " ".join(word.capitalize() for word in slug.split("-") if word)
+        position = next(p for p in _POSITIONS if text.lower().startswith(p.lower()))
+        district_match = _DISTRICT_PATTERN.search(text)
+        name = text[len(position):]
+        if district_match:
+            name = name[: name.lower().rfind("district")]
+        name = name.strip(" ,–-")
+        if not name:
+            continue
+
+        # The portrait is the first image in the smallest block around the
+        # link that holds no other member's profile link.
+        card = link
+        image = None
+        while image is None and card.parent is not None and card.name != "body":
+            card = card.parent
+            if any(
+                _PROFILE_PATTERN.search(other)
+                and urljoin(ROSTER_URL, other).split("#")[0] != href
+                for other in (a["href"] for a in card.find_all("a", href=True))
+            ):
+                break
+            image = card.find("img", src=True)
+
+        members.append({
+            "name": name,
+            "position": "Councilmember" if position == "Council Member" else position,
+            "district": f"District {district_match.group(1)}" if district_match else "At-Large",
+            "photo": urljoin(ROSTER_URL, image["src"]) if image is not None else "",
+            "city_page": href,
+        })
+
+    return members
+
+
+def load_fallback_roster() -> list[dict]:
+    """Read the curated Irvine roster kept by the OC city councils dashboard."""
+    import yaml
+
+    with open(ROSTER_FALLBACK_PATH, encoding="utf-8") as f:
+        city = yaml.safe_load(f)
+    return [
         {
-            "name": "Kathleen Treseder",
-            "position": "Councilmember",
-            "district": "At-Large",
-            "photo": "https://cityofirvine.gov/sites/default/files/City%20Council/2024/CM%20Treseder_2x3.jpg",
-            "email": "KathleenTreseder@cityofirvine.org",
-            "bio": "At-Large Councilmember on the Irvine City Council.",
-            "website": None
-        },
+            "name": member["name"],
+            "position": member.get("position") or "Councilmember",
+            "district": member.get("district") or "At-Large",
+            "photo": member.get("photo_url") or "",
+            "city_page": member.get("city_page"),
+            "email": member.get("email") or "",
+            "bio": member.get("bio") or "",
+            "website": member.get("website"),
+        }
+        for member in city.get("members") or []
     ]
+
+
+def _with_curated_details(members: list[dict], curated: list[dict]) -> list[dict]:
+    """Fill in what the roster page does not show from the curated entries.
+
+    Members are matched by name; the roster page wins where both have a value.
+    """
+    by_name = {member["name"].casefold(): member for member in curated}
+    for member in members:
+        known = by_name.get(member["name"].casefold(), {})
+        for key in ("email", "bio", "website", "photo", "city_page"):
+            if not member.get(key):
+                member[key] = known.get(key) or ("" if key in ("email", "bio", "photo") else None)
     return members
 
 
+def fetch_council_members(use_cache=True) -> tuple[list[dict], str, bool]:
+    """Read the current council from the city's City Council page.
+
+    The page goes through the revalidating response cache, and the members
+    parsed from it are kept beside it keyed by the body's hash and
+    ROSTER_FORMAT, so an unchanged page is not parsed again. When the page
+    cannot be read, or lists fewer than ROSTER_MINIMUM members, the curated
+    roster in oc-city-councils is used instead.
+
+    Returns:
+        The members, a note saying where they came from, and whether the
+        curated roster stood in for the page.
+    """
+    import requests
+
+    curated = load_fallback_roster()
+    cache = ResponseCache(HTTP_CACHE_DIR, max_age=HTTP_CACHE_MAX_AGE) if use_cache else None
+    try:
+        markup, fetched = fetch_page(ROSTER_URL, {}, cache, city_session())
+    except (requests.RequestException, NotHtmlError) as exc:
+        return curated, f"curated roster; city page unreachable ({type(exc).__name__})", True
+
+    digest = hashlib.sha256(markup.encode("utf-8")).hexdigest()
+    stored = None
+    if use_cache:
+        try:
+            stored = json.loads(ROSTER_CACHE_PATH.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            stored = None
+    # Like the HTTP cache, never a source of truth: anything unexpected is
+    # parsed again.
+    if (
+        isinstance(stored, dict)
+        and stored.get("format") == ROSTER_FORMAT
+        and stored.get("body_sha256") == digest
+        and isinstance(stored.get("members"), list)
+    ):
+        members, parsed = stored["members"], "reused"
+    else:
+        members, parsed = parse_council_roster(markup), "reparsed"
+        if use_cache:
+            ROSTER_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            staging = ROSTER_CACHE_PATH.with_suffix(".tmp")
+            staging.write_text(
+                json.dumps({"format": ROSTER_FORMAT, "body_sha256": digest, "members": members}),
+                encoding="utf-8",
+            )
+            os.replace(staging, ROSTER_CACHE_PATH)
+
+    if len(members) < ROSTER_MINIMUM:
+        return curated, f"curated roster; city page {fetched} but listed {len(members)} members", True
+    return _with_curated_details(members, curated), f"city page {fetched}, {parsed}", False
+
+
+def _timed_roster(use_cache: bool) -> tuple[list[dict], str, bool]:
+    """Run fetch_council_members as the "roster" phase, for a worker thread."""
+    with span("roster"):
+        return fetch_council_members(use_cache)
+
+
+def city_session() -> requests.Session:
+    """Return the interpreter's keep-alive session for cityofirvine.gov."""
+    return host_session("cityofirvine.gov", PORTRAIT_WORKERS)
+
+
+def localize_portraits(members: list[dict]) -> tuple[str, int]:
+    """Point the members' photos at thumbnails published beside the page.
+
+    Returns:
+        A note of how many photos are now local and how each was obtained,
+        and how many could not be fetched or read.
+    """
+    from shared.utils.portraits import DisplaySize, PortraitPipeline, localize_photos, session_downloader
+
+    # The portraits are on cityofirvine.gov, so they reuse the roster's
+    # connections.
+    pipeline = PortraitPipeline(
+        PORTRAIT_STORE_DIR,
+        PORTRAIT_DIR,
+        DisplaySize(*PORTRAIT_SIZE),
+        session_downloader(city_session()),
+    )
+    localized = localize_photos(members, pipeline, workers=PORTRAIT_WORKERS)
+    pipeline.prune()
+    return f"{localized} of {len(members)} local; {pipeline.describe()}", pipeline.outcomes["failed"]
+
+
 # Granicus meeting-list constants — mirror mcp-shared/.../granicus/constants.ts
 _VIEW_ID = 68
 _SUBDOMAIN = "irvine"
@@ -155,7 +388,11 @@ _MONTH_TO_FULL = {
 
 
 def _clean_text(node) -> str:
-    return re.sub(r"\s+", " ", node.get_text(" ", strip=True)).strip()
+    return _collapse_space(node.get_text(" ", strip=True))
+
+
+def _collapse_space(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip()
 
 
 def _normalize_url(url: str, base_url: str) -> str:
@@ -177,7 +414,8 @@ def _parse_date_display(text: str) -> str | None:
 def _find_parent_row(node: Tag) -> Tag | None:
     parent = node.parent
     while parent is not None:
-        if isinstance(parent, Tag) and parent.name == "tr":
+        # Parents are always tags, so the name alone identifies a row.
+        if parent.name == "tr":
             return parent
         parent = parent.parent
     return None
@@ -188,10 +426,16 @@ def _extract_meeting_name(row: Tag | None) -> str:
     # scraping row text — leaves no room for trailing link-label artifacts.
     if row is None:
         return ""
-    cell = row.select_one('td[headers~="Name"]')
+    return _meeting_name_from_cell(row.select_one('td[headers~="Name"]'))
+
+
+def _meeting_name_from_cell(cell: Tag | None) -> str:
     if cell is None:
         return ""
-    name = _clean_text(cell)
+    return _clean_meeting_name(_clean_text(cell))
+
+
+def _clean_meeting_name(name: str) -> str:
     return re.sub(r"\s*Open Only in Windows Media Player\s*$", "", name, flags=re.IGNORECASE).strip()
 
 
@@ -205,17 +449,488 @@ def _find_minutes_url(row: Tag | None, base_url: str) -> str | None:
     return None
 
 
-def fetch_meetings_granicus():
+def granicus_session() -> requests.Session:
+    """Return the interpreter's keep-alive session for Granicus.
+
+    It is kept in shared.utils.http_sessions rather than in this module,
+    which generate_all's in-process mode runs afresh for the probe and the
+    build, so the build reuses the connections its probe opened.
+    """
+    return host_session(f"{_SUBDOMAIN}.granicus.com", AGENDA_WORKERS)
+
+
+class NotHtmlError(ValueError):
+    """Raised when a server answers with something other than a page, such as a PDF."""
+
+
+def fetch_page(
+    url: str, params: dict[str, str], cache: ResponseCache | None, session: requests.Session
+) -> tuple[str, str]:
+    """Read a page, revalidating a cached copy.
+
+    Only HTML is read and cached; anything else is closed unread.
+
+    Returns:
+        The page markup, and how it was obtained: "fresh" when a cached
+        copy without validators was young enough to use unasked,
+        "revalidated" when the server answered 304, otherwise "fetched".
+
+    Raises:
+        NotHtmlError: If the response is not HTML.
+    """
+    import requests
+
+    key = cache_key(url, params)
+    entry = cache.lookup(key) if cache is not None else None
+    if entry is not None and cache.is_fresh(entry):
+        return entry["body"], "fresh"
+
+    headers = conditional_headers(entry) if entry is not None else {}
+    resp = session.get(url, params=params, headers=headers, timeout=30, stream=True)
+    with resp:
+        if resp.status_code == 304:
+            if entry is None:
+                raise requests.HTTPError(f"GET {url} returned HTTP 304 with nothing cached", response=resp)
+            cache.store(
+                key,
+                url,
+                entry["body"],
+                resp.headers.get("ETag", "") or entry["etag"],
+                resp.headers.get("Last-Modified", "") or entry["last_modified"],
+            )
+            return entry["body"], "revalidated"
+
+        resp.raise_for_status()
+        content_type = resp.headers.get("Content-Type", "text/html")
+        if "html" not in content_type:
+            raise NotHtmlError(f"GET {url} returned {content_type}")
+        if cache is not None:
+            cache.store(key, url, resp.text, resp.headers.get("ETag", ""), resp.headers.get("Last-Modified", ""))
+        return resp.text, "fetched"
+
+
+def fetch_granicus_listing(use_cache=True) -> tuple[str, str]:
+    """Read the ViewPublisher listing, revalidating a cached copy.
+
+    Returns:
+        The listing markup, and how it was obtained, as fetch_page reports it.
+    """
+    url = f"https://{_SUBDOMAIN}.granicus.com/ViewPublisher.php"
+    cache = ResponseCache(HTTP_CACHE_DIR, max_age=HTTP_CACHE_MAX_AGE) if use_cache else None
+    return fetch_page(url, {"view_id": str(_VIEW_ID)}, cache, granicus_session())
+
+
+def parse_granicus_listing(markup: str, base_url: str, use_cache=True) -> tuple[list[dict], str]:
+    """Read the meetings out of the listing, reusing the last parse of the same body.
+
+    Granicus does not always send validators, so a listing may be downloaded
+    in full yet be unchanged; the hash of the body still catches that. A
+    parse stored under another LISTING_FORMAT is not reused.
+
+    Returns:
+        The meetings, newest first, and "reused" if they came from the
+        previous parse or "reparsed" if the body was parsed again.
+    """
+    digest = hashlib.sha256(markup.encode("utf-8")).hexdigest()
+    if use_cache:
+        try:
+            stored = json.loads(LISTING_CACHE_PATH.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            stored = None
+        # Like the HTTP cache, never a source of truth: anything unexpected
+        # is parsed again.
+        if (
+            isinstance(stored, dict)
+            and stored.get("format") == LISTING_FORMAT
+            and stored.get("body_sha256") == digest
+            and isinstance(stored.get("meetings"), list)
+        ):
+            return stored["meetings"], "reused"
+
+    meetings = _parse_granicus_rows(markup, base_url)
+    if use_cache:
+        LISTING_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        staging = LISTING_CACHE_PATH.with_suffix(".tmp")
+        staging.write_text(
+            json.dumps({"format": LISTING_FORMAT, "body_sha256": digest, "meetings": meetings}),
+            encoding="utf-8",
+        )
+        os.replace(staging, LISTING_CACHE_PATH)
+    return meetings, "reparsed"
+
+
+def fetch_meetings_granicus(use_cache=True):
     """Fetch meeting data from Granicus via plain HTTP + BeautifulSoup.
 
     Ports mcp-shared/src/clients/granicus/meeting-list-walker.ts. The
     ViewPublisher listing is server-rendered HTML — no JS execution
     needed, so no Playwright / Chromium install.
+
+    Returns:
+        The meetings, newest first, and a note saying whether the listing
+        was fetched, revalidated or fresh, and whether it was parsed again.
     """
     base_url = f"https://{_SUBDOMAIN}.granicus.com"
-    resp = requests.get(f"{base_url}/ViewPublisher.php?view_id={_VIEW_ID}", timeout=30)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
+    with span("fetch"):
+        markup, fetched = fetch_granicus_listing(use_cache)
+    with span("parse"):
+        meetings, parsed = parse_granicus_listing(markup, base_url, use_cache)
+    return meetings, f"listing {fetched}, {parsed}"
+
+
+# An agenda item: a number such as "3." or "4.2" opening a line, then a title
+# in capitals or title case. A bare "1 Civic Center Plaza" is not an item.
+_AGENDA_ITEM_PATTERN = re.compile(r"^(\d{1,2}(?:\.\d{1,2})+|\d{1,2}\.)\s+([A-Z].*)$")
+_AGENDA_NUMBER_PATTERN = re.compile(r"^(\d{1,2}(?:\.\d{1,2})+|\d{1,2}\.)$")
+
+
+def parse_agenda_items(markup: str) -> list[dict]:
+    """Read the numbered items out of an HTML agenda.
+
+    Granicus agendas put an item's number either on the same line as its
+    title or in a cell of its own before it; both are read. Repeated numbers,
+    such as a table of contents followed by the items, are kept once.
+
+    Returns:
+        Items in agenda order, each with its number and title, at most
+        AGENDA_ITEM_LIMIT of them.
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(markup, "html.parser")
+    for tag in soup(["script", "style"]):
+        tag.decompose()
+
+    items: list[dict] = []
+    seen: set[str] = set()
+    pending: str | None = None
+    for raw in soup.get_text("\n").splitlines():
+        line = _collapse_space(raw)
+        if not line:
+            continue
+        if pending is not None and line[:1].isupper():
+            number, title = pending, line
+        elif number_only := _AGENDA_NUMBER_PATTERN.match(line):
+            pending = number_only.group(1)
+            continue
+        elif numbered := _AGENDA_ITEM_PATTERN.match(line):
+            number, title = numbered.groups()
+        else:
+            pending = None
+            continue
+        pending = None
+
+        number = number.rstrip(".")
+        if number in seen:
+            continue
+        seen.add(number)
+        items.append({"number": number, "title": title[:AGENDA_TITLE_LIMIT]})
+        if len(items) == AGENDA_ITEM_LIMIT:
+            break
+    return items
+
+
+def _load_agenda_cache() -> dict:
+    """Read the items parsed on earlier runs, keyed by event id.
+
+    Items stored under another AGENDA_FORMAT are dropped, so every agenda is
+    parsed again by the current parser.
+    """
+    try:
+        stored = json.loads(AGENDA_CACHE_PATH.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    # Like the HTTP cache, never a source of truth: anything unexpected is
+    # fetched and parsed again.
+    if not isinstance(stored, dict) or stored.get("format") != AGENDA_FORMAT:
+        return {}
+    agendas = stored.get("agendas")
+    if not isinstance(agendas, dict):
+        return {}
+    return {
+        event_id: entry
+        for event_id, entry in agendas.items()
+        if isinstance(entry, dict)
+        and isinstance(entry.get("body_sha256"), str)
+        and isinstance(entry.get("items"), list)
+    }
+
+
+def fetch_agenda_items(meetings: list[dict], use_cache=True) -> tuple[str, int]:
+    """Attach the numbered items of every upcoming agenda to its meeting.
+
+    Each upcoming meeting with an event id has its AgendaViewer page read,
+    AGENDA_WORKERS at once, and gains an "agenda_items" list. The items are
+    kept per event id with the hash of the page they came from, so a page
+    that has not changed is not parsed again. A meeting whose agenda cannot
+    be read keeps the items read on an earlier run, if any; one whose agenda
+    is not HTML, such as a PDF, gets none.
+
+    Returns:
+        A note of how many agendas were read and how, and how many could
+        not be read.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    import requests
+
+    today = date.today()
+    upcoming = [
+        meeting
+        for meeting in meetings
+        if meeting.get("event_id") and (_meeting_date(meeting) or date.min) >= today
+    ]
+    stored = _load_agenda_cache() if use_cache else {}
+    cache = ResponseCache(HTTP_CACHE_DIR, max_age=HTTP_CACHE_MAX_AGE) if use_cache else None
+
+    def read(meeting: dict) -> tuple[dict, str]:
+        markup, _ = fetch_page(meeting["agenda_url"], {}, cache, granicus_session())
+        digest = hashlib.sha256(markup.encode("utf-8")).hexdigest()
+        previous = stored.get(meeting["event_id"])
+        if previous is not None and previous["body_sha256"] == digest:
+            return previous, "reused"
+        return {"body_sha256": digest, "items": parse_agenda_items(markup)}, "parsed"
+
+    counts = {"parsed": 0, "reused": 0, "not HTML": 0, "failed": 0}
+    kept: dict[str, dict] = {}
+    with ThreadPoolExecutor(max_workers=AGENDA_WORKERS) as pool:
+        futures = [(meeting, pool.submit(read, meeting)) for meeting in upcoming]
+        for meeting, future in futures:
+            event_id = meeting["event_id"]
+            try:
+                entry, outcome = future.result()
+            except NotHtmlError:
+                entry, outcome = {"body_sha256": "", "items": []}, "not HTML"
+            except requests.RequestException:
+                entry, outcome = stored.get(event_id), "failed"
+            counts[outcome] += 1
+            if entry is None:
+                continue
+            kept[event_id] = entry
+            meeting["agenda_items"] = entry["items"]
+
+    # Only upcoming events are kept, so the cache does not grow with the
+    # archive.
+    if use_cache:
+        AGENDA_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        staging = AGENDA_CACHE_PATH.with_suffix(".tmp")
+        staging.write_text(json.dumps({"format": AGENDA_FORMAT, "agendas": kept}), encoding="utf-8")
+        os.replace(staging, AGENDA_CACHE_PATH)
+
+    note = f"{len(upcoming)} upcoming; " + ", ".join(f"{count} {name}" for name, count in counts.items())
+    return note, counts["failed"]
+
+
+def _newest_first(meetings: list[dict]) -> list[dict]:
+    """Sort meetings by date, newest first, keeping listing order within a day."""
+    def _sort_key(m: dict) -> datetime:
+        try:
+            return datetime.strptime(m["date"], "%B %d, %Y")
+        except ValueError:
+            return datetime.min
+
+    meetings.sort(key=_sort_key, reverse=True)
+    return meetings
+
+
+# Entities the row reader resolves itself; anything else in a row is left to
+# the tree, whose reading of unusual references differs in corner cases.
+_ROW_ENTITIES = {"nbsp": "\xa0", "amp": "&", "lt": "<", "gt": ">", "quot": '"', "apos": "'"}
+
+# Tags whose text the tree keeps out of get_text, or whose end would close an
+# open row in the tree. The row reader defers to the tree on any of these.
+_ROW_TREE_ONLY_STARTS = frozenset({"tr", "script", "style", "template", "rt", "rp"})
+_ROW_TREE_ONLY_ENDS = frozenset({"table", "tbody", "thead", "tfoot", "body", "html"})
+
+
+class _UnsupportedListingError(Exception):
+    """Raised by the row reader on markup only the tree reads faithfully."""
+
+
+class _RowStream(HTMLParser):
+    """Collect each table row's text, name cell and links without building a tree.
+
+    Text is gathered as get_text(" ", strip=True) gathers it: each run between
+    two markup events is stripped, and the non-empty runs are kept. Anything
+    the tree might read differently - a nested row, a row closed by its table,
+    text the tree keeps apart, an unusual reference - raises instead.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=False)
+        # (row runs, name-cell runs or None, agenda hrefs, first minutes href)
+        self.rows: list[tuple[list[str], list[str] | None, list[str], str | None]] = []
+        self._open = False
+        self._runs: list[str] = []
+        self._name: list[str] | None = None
+        self._in_name = False
+        self._agendas: list[str] = []
+        self._minutes: str | None = None
+        self._run: list[str] = []
+
+    def _end_run(self) -> None:
+        if self._run:
+            text = "".join(self._run).strip()
+            if text:
+                self._runs.append(text)
+                if self._in_name and self._name is not None:
+                    self._name.append(text)
+            self._run = []
+
+    def _end_row(self) -> None:
+        self._end_run()
+        self.rows.append((self._runs, self._name, self._agendas, self._minutes))
+        self._open = False
+        self._in_name = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if not self._open:
+            if tag == "tr":
+                self._open = True
+                self._runs, self._name, self._agendas, self._minutes = [], None, [], None
+            return
+        if tag in _ROW_TREE_ONLY_STARTS or (tag == "td" and self._in_name):
+            raise _UnsupportedListingError(tag)
+        self._end_run()
+        values = dict(attrs)
+        if tag == "td" and self._name is None and "Name" in (values.get("headers") or "").split():
+            self._name = []
+            self._in_name = True
+        elif tag == "a":
+            # The tree reads a valueless href as an empty string.
+            href = values.get("href") or ""
+            if "AgendaViewer" in href:
+                self._agendas.append(href)
+            if self._minutes is None and "MinutesViewer" in href:
+                self._minutes = href
+
+    def handle_endtag(self, tag: str) -> None:
+        if not self._open:
+            return
+        if tag in _ROW_TREE_ONLY_ENDS:
+            raise _UnsupportedListingError(f"/{tag}")
+        self._end_run()
+        if tag == "tr":
+            self._end_row()
+        elif tag == "td":
+            self._in_name = False
+
+    def handle_data(self, data: str) -> None:
+        if self._open:
+            self._run.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        # The tree keeps comment text out of get_text.
+        if self._open:
+            self._end_run()
+
+    def handle_entityref(self, name: str) -> None:
+        if not self._open:
+            return
+        if name not in _ROW_ENTITIES:
+            raise _UnsupportedListingError(f"&{name};")
+        self._run.append(_ROW_ENTITIES[name])
+
+    def handle_charref(self, name: str) -> None:
+        if not self._open:
+            return
+        try:
+            code = int(name[1:], 16) if name[:1] in ("x", "X") else int(name)
+        except ValueError:
+            raise _UnsupportedListingError(f"&#{name};") from None
+        # Control and out-of-range references are remapped by the tree.
+        if not (0x20 <= code < 0x7F or 0xA0 <= code < 0xD800 or 0xE000 <= code < 0x110000):
+            raise _UnsupportedListingError(f"&#{name};")
+        self._run.append(chr(code))
+
+    def unknown_decl(self, data: str) -> None:
+        if self._open:
+            raise _UnsupportedListingError(f"<![{data}]>")
+
+    def handle_decl(self, decl: str) -> None:
+        if self._open:
+            raise _UnsupportedListingError(f"<!{decl}>")
+
+    def handle_pi(self, data: str) -> None:
+        if self._open:
+            raise _UnsupportedListingError(f"<?{data}>")
+
+    def close(self) -> None:
+        super().close()
+        # The tree closes a row left open at the end of the page there.
+        if self._open:
+            self._end_row()
+
+
+def _parse_granicus_rows(markup: str, base_url: str) -> list[dict]:
+    """Read the council meetings out of the listing row by row, newest first.
+
+    The page is streamed rather than built into a tree, and each table row
+    is read once: its name cell, its agenda links, its first minutes link and
+    its text all come from the same pass. The meetings are the same, in the
+    same order, as _parse_granicus_links reads, which this falls back to on
+    markup it cannot read exactly as the tree does.
+    """
+    stream = _RowStream()
+    try:
+        stream.feed(markup)
+        stream.close()
+    except _UnsupportedListingError:
+        return _parse_granicus_links(markup, base_url)
+
+    meetings: list[dict] = []
+    seen_event_ids: set[str] = set()
+
+    for runs, name_runs, agenda_hrefs, minutes_href in stream.rows:
+        if not agenda_hrefs:
+            continue
+        date_str = _parse_date_display(_collapse_space(" ".join(runs)))
+        name = _clean_meeting_name(_collapse_space(" ".join(name_runs))) if name_runs is not None else ""
+        name = name[:100] or "City Council Meeting"
+        minutes_url = _normalize_url(minutes_href, base_url) if minutes_href is not None else None
+
+        for href in agenda_hrefs:
+            agenda_url = _normalize_url(href, base_url)
+            raw_event_id = _EVENT_ID_PATTERN.search(agenda_url)
+            raw_event_id = raw_event_id.group(1) if raw_event_id else None
+            # 99999 is Granicus's pre-publication sentinel, not an id.
+            event_id = None if raw_event_id == _PLACEHOLDER_EVENT_ID else raw_event_id
+            clip_match = _CLIP_ID_PATTERN.search(agenda_url)
+            clip_id = clip_match.group(1) if clip_match else None
+
+            # A repeated id is remembered even from a row that is then
+            # dropped, as the link reader does.
+            if event_id is not None and event_id in seen_event_ids:
+                continue
+            if event_id is not None:
+                seen_event_ids.add(event_id)
+
+            if date_str is None or "CITY COUNCIL" not in name.upper():
+                continue
+
+            meetings.append({
+                "name": name,
+                "date": date_str,
+                "agenda_url": agenda_url,
+                "minutes_url": minutes_url,
+                "video_url": f"{base_url}/player/clip/{clip_id}?view_id={_VIEW_ID}" if clip_id else None,
+                "event_id": event_id,
+            })
+
+    return _newest_first(meetings)
+
+
+def _parse_granicus_links(markup: str, base_url: str) -> list[dict]:
+    """Read the council meetings out of the listing link by link, newest first.
+
+    The reference reader: the whole page is built into a tree, every anchor
+    is visited, and each agenda link climbs to its row. _parse_granicus_rows
+    reads the same meetings faster and falls back to this on markup it cannot
+    stream; benchmarks/granicus_listing.py checks they agree.
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(markup, "html.parser")
 
     meetings: list[dict] = []
     seen_event_ids: set[str] = set()
@@ -265,14 +980,7 @@ def fetch_meetings_granicus():
             "event_id": event_id,
         })
 
-    def _sort_key(m: dict) -> datetime:
-        try:
-            return datetime.strptime(m["date"], "%B %d, %Y")
-        except ValueError:
-            return datetime.min
-
-    meetings.sort(key=_sort_key, reverse=True)
-    return meetings
+    return _newest_first(meetings)
 
 
 def generate_html(data: dict) -> str:
@@ -282,6 +990,7 @@ def generate_html(data: dict) -> str:
     data_json = json.dumps(data, ensure_ascii=False)
 
     html = f'''<!DOCTYPE html>
+<!-- content-digest: {CONTENT_DIGEST_MARK} -->
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -434,6 +1143,10 @@ def generate_html(data: dict) -> str:
             box-shadow: 0 2px 8px rgba(0,0,0,0.2);
         }}
         .next-meeting-banner .zoom-btn:hover {{ background: #6bb8e0; transform: scale(1.05); }}
+        .meeting-card .agenda-items {{ list-style: none; margin: 0.75rem 0 0; padding: 0.75rem 0 0; border-top: 1px solid var(--gray-200); font-size: 0.85rem; }}
+        .meeting-card .agenda-items li {{ margin-bottom: 0.35rem; color: var(--gray-700); }}
+        .meeting-card .agenda-items .number {{ font-weight: 600; color: var(--primary); margin-right: 0.4rem; }}
+        .meeting-card .agenda-items .more {{ color: var(--gray-600); font-style: italic; }}
         .recent-meetings-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(320px, 1fr)); gap: 1rem; }}
         .meeting-card {{
             background: rgba(255, 255, 255, 0.75);
@@ -670,6 +1383,22 @@ def generate_html(data: dict) -> str:
             return 'Not yet published';
         }}
 
+        function escapeHtml(text) {{
+            return String(text).replace(/[&<>"']/g, c => ({{
+                '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+            }})[c]);
+        }}
+
+        // Numbered items of an upcoming agenda, read by the generator.
+        function agendaItemsHtml(items) {{
+            if (!items || items.length === 0) return '';
+            const shown = items.slice(0, 6).map(item =>
+                '<li><span class="number">' + escapeHtml(item.number) + '</span>' + escapeHtml(item.title) + '</li>'
+            ).join('');
+            const more = items.length > 6 ? '<li class="more">+' + (items.length - 6) + ' more items</li>' : '';
+            return '<ul class="agenda-items">' + shown + more + '</ul>';
+        }}
+
         function parseDate(dateStr) {{
             const parsed = new Date(dateStr);
             return isNaN(parsed.getTime()) ? 0 : parsed.getTime();
@@ -692,6 +1421,7 @@ def generate_html(data: dict) -> str:
                         (m.minutes_url ? '<a href="' + m.minutes_url + '" target="_blank">Minutes</a>' : '') +
                         (m.video_url ? '<a href="' + m.video_url + '" target="_blank">Video</a>' : '') +
                     '</div>' +
+                    agendaItemsHtml(m.agenda_items) +
                 '</div>';
             }});
             recentEl.innerHTML = recentHtml || '<p>No recent meetings found</p>';
@@ -701,11 +1431,13 @@ def generate_html(data: dict) -> str:
             let councilHtml = '';
             (DATA.council_members || []).forEach(m => {{
                 councilHtml += '<div class="council-card">' +
+                    (m.photo_webp ? '<picture><source srcset="' + m.photo_webp + '" type="image/webp">' : '') +
                     '<img class="photo" src="' + m.photo + '" alt="' + m.name + '">' +
+                    (m.photo_webp ? '</picture>' : '') +
                     '<div class="name">' + m.name + '</div>' +
                     '<div class="position">' + m.position + '</div>' +
                     '<div class="district">' + m.district + '</div>' +
-                    '<div class="email"><a href="mailto:' + m.email + '">' + m.email + '</a></div>' +
+                    (m.email ? '<div class="email"><a href="mailto:' + m.email + '">' + m.email + '</a></div>' : '') +
                 '</div>';
             }});
             councilEl.innerHTML = councilHtml;
@@ -742,29 +1474,14 @@ def generate_html(data: dict) -> str:
     return html
 
 
-def main(quick_mode=False):
-    """Main function to generate the dashboard."""
-    print("=" * 60)
-    print("Irvine City Council Dashboard Generator")
-    print("=" * 60)
-
-    # Fetch council members
-    print("\n[*] Loading council member data...")
-    council_members = fetch_council_members()
-    print(f"    Council members: {len(council_members)}")
+def resolve_upcoming(meetings: list[dict]) -> tuple[list[date], dict]:
+    """Merge the curated schedule with the dates Granicus already publishes.
 
-    # Fetch meetings
-    if quick_mode:
-        print("\n[*] Quick mode - skipping Playwright scrape...")
-        meetings = []
-    else:
-        print("\n[*] Fetching meetings from Granicus (HTTP)...")
-        meetings = fetch_meetings_granicus()
-        print(f"    Meetings found: {len(meetings)}")
+    Never inferred from a recurrence rule.
 
-    # Upcoming meetings: curated dates merged with whatever Granicus already
-    # publishes. Never inferred from a recurrence rule.
-    print("\n[*] Resolving upcoming meetings...")
+    Returns:
+        The upcoming meeting dates, soonest first, and the schedule.
+    """
     schedule = load_schedule(Path(__file__).parent / "schedule.json")
     today = date.today()
     upcoming = merge_upcoming(
@@ -772,37 +1489,142 @@ def main(quick_mode=False):
         granicus_upcoming_dates(meetings),
         today,
     )
+    return upcoming, schedule
+
+
+def probe(use_cache=True):
+    """Print a fingerprint of the pages the build reads, and nothing else.
+
+    Only the listing and the roster page are requested, through the response
+    cache, so an unchanged day costs a conditional request each. The listing
+    is parsed as the build parses it, reusing the stored parse of an
+    unchanged body, to resolve the upcoming dates. The fingerprint is taken
+    over the hashes of the two bodies and those dates, so it moves when
+    either page changes or a meeting passes, but not merely because a day
+    has; schedule.json and the curated roster are inputs generate_all hashes
+    itself. No agenda is read and no portrait is touched, so the build that
+    follows still finds every change. An agenda revised without the listing
+    changing is read by the next build.
+    """
+    listing, _ = fetch_granicus_listing(use_cache)
+    meetings, _ = parse_granicus_listing(listing, f"https://{_SUBDOMAIN}.granicus.com", use_cache)
+    cache = ResponseCache(HTTP_CACHE_DIR, max_age=HTTP_CACHE_MAX_AGE) if use_cache else None
+    roster, _ = fetch_page(ROSTER_URL, {}, cache, city_session())
+    upcoming, _ = resolve_upcoming(meetings)
+    canonical = json.dumps(
+        {
+            "listing": hashlib.sha256(listing.encode("utf-8")).hexdigest(),
+            "roster": hashlib.sha256(roster.encode("utf-8")).hexdigest(),
+            "upcoming": [d.isoformat() for d in upcoming],
+        },
+        sort_keys=True,
+    )
+    print(f"fingerprint: {hashlib.sha256(canonical.encode('utf-8')).hexdigest()}")
+
+
+def collect_data(quick_mode=False, use_cache=True):
+    """Read everything the page shows, except the time it was generated.
+
+    Returns:
+        The page's data: the upcoming meeting dates and time, the council
+        members and the meetings. Then what it was read without: the city's
+        roster, when the curated one stood in for it, or agendas that could
+        not be read.
+    """
+    incomplete = []
+    if quick_mode:
+        print("\n[*] Quick mode - curated roster, skipping the Granicus scrape...")
+        council_members = load_fallback_roster()
+        print(f"    Council members: {len(council_members)}")
+        meetings = []
+    else:
+        # The roster and the listing are on different hosts, so the roster is
+        # read while the listing is fetched and parsed.
+        from concurrent.futures import ThreadPoolExecutor
+
+        print("\n[*] Fetching the council roster and meetings from Granicus (HTTP)...")
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            roster = pool.submit(_timed_roster, use_cache)
+            meetings, note = fetch_meetings_granicus(use_cache)
+            council_members, roster_note, curated = roster.result()
+        print(f"    Council members: {len(council_members)} ({roster_note})")
+        print(f"    Meetings found: {len(meetings)} ({note})")
+        if curated:
+            incomplete.append("the city roster")
+
+        with span("agendas"):
+            note, failed = fetch_agenda_items(meetings, use_cache)
+        print(f"    Upcoming agendas: {note}")
+        if failed:
+            incomplete.append(f"{failed} agendas")
+
+    print("\n[*] Resolving upcoming meetings...")
+    upcoming, schedule = resolve_upcoming(meetings)
     next_meeting = select_next_meeting(upcoming)
     if next_meeting is None:
         print("    No upcoming meeting known; the dashboard will say so.")
     else:
         print(f"    Next meeting: {format_meeting(next_meeting, schedule['meeting_time'])}")
 
-    # Compile data
     data = {
-        "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "upcoming_meetings": [d.isoformat() for d in upcoming],
         "meeting_time": schedule["meeting_time"],
         "council_members": council_members,
         "meetings": meetings,
     }
+    return data, incomplete
+
+
+def main(quick_mode=False, use_cache=True):
+    """Main function to generate the dashboard.
+
+    Returns:
+        The page's path, and what the page was written without. generate_all
+        builds a page written without some of it again on its next run.
+    """
+    print("=" * 60)
+    print("Irvine City Council Dashboard Generator")
+    print("=" * 60)
+
+    collected, incomplete = collect_data(quick_mode, use_cache)
+    if not quick_mode:
+        with span("portraits"):
+            note, failed = localize_portraits(collected["council_members"])
+        print(f"    Portraits: {note}")
+        if failed:
+            incomplete.append(f"{failed} portraits")
+
+    # The timestamp is filled in only if the page is written, so a run with
+    # nothing new leaves index.html untouched.
+    data = {"generated_at": GENERATED_AT_MARK, **collected}
 
     # Generate HTML
     print("\n[*] Generating HTML...")
-    html = generate_html(data)
+    with span("render"):
+        html = generate_html(data)
 
     # Save as index.html
     output_path = Path(__file__).parent / "index.html"
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    with span("write"):
+        outcome = write_page(output_path, html, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
-    print(f"\n[*] Dashboard saved to: {output_path}")
+    if outcome["status"] == "unchanged":
+        print(f"\n[*] Dashboard unchanged: {output_path}")
+    else:
+        print(f"\n[*] Dashboard saved to: {output_path}")
+    if incomplete:
+        print(f"[!] Written without {' and '.join(incomplete)}; the next run tries them again")
     print("[*] Ready for GitHub Pages!")
 
-    return str(output_path)
+    return str(output_path), incomplete
 
 
 if __name__ == "__main__":
     import sys
+    if "--probe" in sys.argv:
+        probe(use_cache="--no-cache" not in sys.argv)
+        sys.exit(0)
     quick = "--quick" in sys.argv
-    main(quick_mode=quick)
+    _, incomplete = main(quick_mode=quick, use_cache="--no-cache" not in sys.argv)
+    if incomplete:
+        sys.exit(PARTIAL_BUILD_EXIT)
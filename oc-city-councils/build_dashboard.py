@@ -1,32 +1,112 @@
 #!/usr/bin/env python3
-"""Build dashboard JSON from YAML council data."""
+"""Build dashboard JSON from YAML council data.
+
+Meetings scraped by ``python -m shared.scrapers.batch`` are attached to each
+city as recent_meetings when its snapshot is present.
+
+Member portraits are downloaded once into a store shared by the dashboards,
+and published under portraits/ as thumbnails at the size the cards show them;
+only portraits that are new or changed upstream are resized again. Pass
+--no-portraits to keep linking them from the city websites.
+
+Reading the YAML, the portraits and writing the JSON are timed as spans, which
+generate_all collects into its timing report.
+"""
 import json
+import sys
 from pathlib import Path
 import yaml
 
+# The directory name is not importable, so the repository root is added
+# explicitly to reach the shared utilities.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from shared.utils.phase_timing import span  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Portrait originals are stored once for every dashboard; the thumbnails are
+# published beside the page, sized for .council-card .photo.
+PORTRAIT_STORE_DIR = ROOT / ".cache" / "portraits"
+PORTRAIT_DIR = Path(__file__).resolve().parent / "portraits"
+PORTRAIT_SIZE = (140, 175)
+
+# Written by python -m shared.scrapers.batch, keyed by city slug.
+MEETINGS_SNAPSHOT = Path(__file__).resolve().parent / "meetings_snapshot.json"
+
 def slug_to_name(slug):
     """Convert slug to city name: 'aliso-viejo' -> 'Aliso Viejo'"""
     return ' '.join(word.capitalize() for word in slug.split('-'))
 
-def build_dashboard():
+def localize_portraits(cities):
+    """Point every member's photo_url at thumbnails published beside the page.
+
+    Returns:
+        A note of how many photos are now local and how each was obtained.
+    """
+    # Imported here so a build without portraits needs only PyYAML.
+    from shared.utils.portraits import DisplaySize, PortraitPipeline, host_downloader, localize_photos
+
+    # The portraits are spread over every city's site, so each is fetched
+    # over the shared session for its host.
+    pipeline = PortraitPipeline(
+        PORTRAIT_STORE_DIR,
+        PORTRAIT_DIR,
+        DisplaySize(*PORTRAIT_SIZE),
+        host_downloader(),
+    )
+    members = [member for city in cities for member in city.get("members") or []]
+    localized = localize_photos(members, pipeline, field="photo_url")
+    pipeline.prune()
+    return f"{localized} of {len(members)} local; {pipeline.describe()}"
+
+def attach_meetings(cities, snapshot_path):
+    """Attach each city's scraped meetings from the batch snapshot, if there is one.
+
+    Returns:
+        The number of cities given meetings.
+    """
+    if not snapshot_path.is_file():
+        return 0
+    with open(snapshot_path, encoding="utf-8") as f:
+        scraped = json.load(f).get("cities", {})
+    attached = 0
+    for city in cities:
+        entry = scraped.get(city.get("city"))
+        if entry and entry.get("meetings"):
+            city["recent_meetings"] = entry["meetings"]
+            attached += 1
+    return attached
+
+def build_dashboard(portraits=True):
     data_dir = Path(__file__).parent / "_council_data"
     cities = []
 
-    for yaml_file in sorted(data_dir.glob("*.yaml")):
-        with open(yaml_file, encoding="utf-8") as f:
-            city = yaml.safe_load(f)
-            # Generate city_name from slug if missing
-            if not city.get("city_name"):
-                city["city_name"] = slug_to_name(city.get("city", yaml_file.stem))
-            cities.append(city)
+    with span("parse"):
+        for yaml_file in sorted(data_dir.glob("*.yaml")):
+            with open(yaml_file, encoding="utf-8") as f:
+                city = yaml.safe_load(f)
+                # Generate city_name from slug if missing
+                if not city.get("city_name"):
+                    city["city_name"] = slug_to_name(city.get("city", yaml_file.stem))
+                cities.append(city)
+        attached = attach_meetings(cities, MEETINGS_SNAPSHOT)
 
     cities.sort(key=lambda c: c.get("city_name", ""))
 
+    if attached:
+        print(f"Meetings: attached to {attached} cities from {MEETINGS_SNAPSHOT.name}")
+
+    if portraits:
+        with span("portraits"):
+            note = localize_portraits(cities)
+        print(f"Portraits: {note}")
+
     output = Path(__file__).parent / "dashboard_data.json"
-    with open(output, "w", encoding="utf-8") as f:
+    with span("write"), open(output, "w", encoding="utf-8") as f:
         json.dump(cities, f, indent=2)
 
     print(f"Built {output} with {len(cities)} cities")
 
 if __name__ == "__main__":
-    build_dashboard()
+    build_dashboard(portraits="--no-portraits" not in sys.argv)
@@ -22,6 +22,10 @@ GUARDED_MODULES = (
     "asuci/models.py",
     "asuci/parse.py",
     "asuci/client.py",
+    "asuci/archive.py",
+    "asuci/metrics.py",
+    "asuci/search.py",
+    "asuci/harvest.py",
 )
 
 # Modules that run on the daily schedule and must stay browser-free.
@@ -29,6 +33,10 @@ DAILY_PATH_MODULES = (
     "asuci/models.py",
     "asuci/parse.py",
     "asuci/client.py",
+    "asuci/archive.py",
+    "asuci/metrics.py",
+    "asuci/search.py",
+    "asuci/harvest.py",
     "asuci/generate.py",
     "generate_all.py",
 )
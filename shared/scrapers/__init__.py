@@ -1,5 +1,45 @@
+"""Scrapers for city council meeting systems.
+
+The concrete scrapers are loaded on first access, so importing one does not
+pull in the others' dependencies: ``LegistarClient`` needs only requests,
+while ``GranicusScraper`` needs requests and BeautifulSoup, and Playwright
+only for cities whose listing must be read in a browser. ``BrowserPool``
+shares one such browser across scrapers, and ``scrape_cities`` runs the
+right scraper for every city at once.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from .base import BaseScraper
-from .granicus import GranicusScraper
-from .legistar import LegistarClient
 
-__all__ = ["BaseScraper", "GranicusScraper", "LegistarClient"]
+if TYPE_CHECKING:
+    from .batch import scrape_cities
+    from .browser_pool import BrowserPool
+    from .granicus import GranicusScraper
+    from .legistar import LegistarClient
+
+__all__ = ["BaseScraper", "BrowserPool", "GranicusScraper", "LegistarClient", "scrape_cities"]
+
+# Export name -> submodule defining it.
+_LAZY_EXPORTS = {
+    "BrowserPool": ".browser_pool",
+    "GranicusScraper": ".granicus",
+    "LegistarClient": ".legistar",
+    "scrape_cities": ".batch",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import a scraper the first time it is asked for."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # Cached on the package, so later lookups skip this function.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
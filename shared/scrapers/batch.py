@@ -0,0 +1,395 @@
+"""Scrape every city's meetings in one run.
+
+Each city config is the YAML under oc-city-councils/_council_data. A city
+names its platform in a ``scraping`` section, as the scrapers expect; cities
+without one are matched by their portal links, so a Legistar calendar or a
+Granicus ViewPublisher page is enough to scrape them.
+
+Cities are scraped concurrently, up to a global number of workers and a
+smaller number per host: Granicus tenants share servers, as do all Legistar
+clients, and neither should see the whole county at once. A city that fails
+is reported and the rest carry on. The meetings are written as one JSON
+snapshot, keyed by the city slug that build_dashboard.py keys its cities by.
+
+Usage:
+    python -m shared.scrapers.batch
+    python -m shared.scrapers.batch --cities irvine fullerton --workers 4 --per-host 1
+    python -m shared.scrapers.batch --browser
+"""
+
+import argparse
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, Optional
+from urllib.parse import urlparse
+
+from .base import BaseScraper, Meeting
+
+if TYPE_CHECKING:
+    from .browser_pool import BrowserPool
+
+ROOT = Path(__file__).resolve().parents[2]
+
+DATA_DIR = ROOT / "oc-city-councils" / "_council_data"
+
+SNAPSHOT_PATH = ROOT / "oc-city-councils" / "meetings_snapshot.json"
+
+# Cities scraped at once, and at once against any one host.
+DEFAULT_WORKERS = 8
+DEFAULT_PER_HOST = 4
+
+# Platform -> (submodule, scraper class), imported when first needed.
+PLATFORMS = {
+    "granicus": (".granicus", "GranicusScraper"),
+    "legistar": (".legistar", "LegistarClient"),
+}
+
+# Platforms whose scrapers take the shared browser.
+BROWSER_PLATFORMS = frozenset({"granicus"})
+
+# Portal links checked for a platform, in order of preference: the agenda
+# calendar is where a city's meetings are listed.
+PORTAL_ORDER = ("agendas", "document_center", "video_archive", "live_stream")
+
+_LEGISTAR_PATTERN = re.compile(r"^https?://([\w-]+)\.legistar\.com/", re.IGNORECASE)
+_GRANICUS_PATTERN = re.compile(
+    r"^https?://([\w-]+)\.granicus\.com/ViewPublisher\.php\?view_id=(\d+)", re.IGNORECASE
+)
+
+# A city's YAML, and the config the scrapers are built from: the city's
+# name and slug under "city" and its platform's settings under "scraping".
+CityConfig = Mapping[str, object]
+ScraperConfig = dict[str, dict[str, object]]
+
+# Builds a scraper from its config and the shared browser, if any.
+ScraperFactory = Callable[[ScraperConfig, Optional[object]], BaseScraper]
+
+
+class CityScrape(NamedTuple):
+    """What scraping one city produced.
+
+    slug: City slug, as in its YAML file name.
+    city_name: Display name.
+    platform: Platform scraped, or None if the city has no supported one.
+    meetings: Meetings read, newest first; empty if the scrape failed.
+    seconds: Wall time spent on the city, including any wait for its host.
+    error: Why the scrape failed, or None.
+    """
+
+    slug: str
+    city_name: str
+    platform: Optional[str]
+    meetings: list[Meeting]
+    seconds: float
+    error: Optional[str]
+
+
+def scraping_config(city: CityConfig) -> Optional[dict[str, object]]:
+    """Find how a city's meetings are scraped.
+
+    Args:
+        city: City config as read from its YAML.
+
+    Returns:
+        The city's ``scraping`` section if it has one, else one derived from
+        the first Legistar or Granicus listing among its portals, else None.
+    """
+    scraping = city.get("scraping")
+    if isinstance(scraping, dict) and scraping:
+        return scraping
+
+    portals = city.get("portals")
+    if not isinstance(portals, dict):
+        return None
+    for portal in PORTAL_ORDER:
+        url = portals.get(portal)
+        if not isinstance(url, str):
+            continue
+        legistar = _LEGISTAR_PATTERN.match(url)
+        if legistar:
+            return {"legistar": {"client_name": legistar.group(1).lower()}}
+        granicus = _GRANICUS_PATTERN.match(url)
+        if granicus:
+            return {"granicus": {"subdomain": granicus.group(1).lower(), "view_id": int(granicus.group(2))}}
+    return None
+
+
+def scraper_config(city: CityConfig, slug: str) -> Optional[ScraperConfig]:
+    """Shape a city's YAML as the scrapers' config.
+
+    Args:
+        city: City config as read from its YAML.
+        slug: City slug.
+
+    Returns:
+        A config with ``city.name`` and ``scraping`` set, or None if the city
+        has no supported platform.
+    """
+    scraping = scraping_config(city)
+    if scraping is None or not any(platform in scraping for platform in PLATFORMS):
+        return None
+    return {"city": {"name": city.get("city_name") or slug, "slug": slug}, "scraping": scraping}
+
+
+def platform_of(config: ScraperConfig) -> str:
+    """Name the platform a scraper config is for.
+
+    Args:
+        config: Scraper config with a supported platform.
+
+    Returns:
+        The first supported platform configured.
+    """
+    return next(platform for platform in PLATFORMS if platform in config["scraping"])
+
+
+def default_factory(platform: str) -> ScraperFactory:
+    """Build the package's scraper for a platform, importing it on first use.
+
+    Args:
+        platform: Platform name.
+
+    Returns:
+        A factory handing the shared browser to scrapers that take one.
+    """
+    module, name = PLATFORMS[platform]
+    scraper_class = getattr(import_module(module, __package__), name)
+    if platform in BROWSER_PLATFORMS:
+        return lambda config, browser: scraper_class(config, browser=browser)
+    return lambda config, browser: scraper_class(config)
+
+
+def scraper_host(scraper: BaseScraper) -> str:
+    """Name the servers a scraper fetches from, for the per-host cap.
+
+    Tenants of one platform are counted together, since they share servers:
+    every *.granicus.com city is one host, as is the Legistar API.
+
+    Args:
+        scraper: The scraper.
+
+    Returns:
+        The last two labels of the host the scraper reads.
+    """
+    url: str = getattr(scraper, "archive_url", "") or getattr(scraper, "api_base", "")
+    hostname = urlparse(url).hostname or ""
+    return ".".join(hostname.split(".")[-2:])
+
+
+class ScrapeJob(NamedTuple):
+    """A city ready to scrape."""
+
+    slug: str
+    city_name: str
+    platform: str
+    scraper: BaseScraper
+
+
+def interleave_by_host(jobs: list[ScrapeJob]) -> Iterator[ScrapeJob]:
+    """Order jobs so consecutive ones go to different hosts where possible.
+
+    Workers take jobs in order, so this keeps them from all queueing on one
+    host's cap while another host sits idle.
+
+    Args:
+        jobs: Cities to scrape.
+
+    Yields:
+        The same jobs, taking one from each host in turn.
+    """
+    by_host: dict[str, list[ScrapeJob]] = {}
+    for job in jobs:
+        by_host.setdefault(scraper_host(job.scraper), []).append(job)
+    queues = list(by_host.values())
+    while queues:
+        for queue in queues:
+            yield queue.pop(0)
+        queues = [queue for queue in queues if queue]
+
+
+def scrape_cities(
+    cities: Mapping[str, CityConfig],
+    workers: int = DEFAULT_WORKERS,
+    per_host: int = DEFAULT_PER_HOST,
+    browser: Optional[object] = None,
+    factories: Optional[dict[str, ScraperFactory]] = None,
+    clock: Callable[[], float] = time.perf_counter,
+) -> list[CityScrape]:
+    """Scrape every city's meetings concurrently.
+
+    Args:
+        cities: City configs keyed by slug.
+        workers: Cities scraped at once.
+        per_host: Cities scraped at once against any one host.
+        browser: BrowserPool shared by every scraper that needs a browser.
+        factories: Scraper builder per platform; the package's scrapers by
+            default.
+        clock: Monotonic clock, in seconds.
+
+    Returns:
+        One result per city, in slug order. Cities without a supported
+        platform are listed with platform None.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    results: dict[str, CityScrape] = {}
+    jobs: list[ScrapeJob] = []
+    for slug, city in sorted(cities.items()):
+        name = str(city.get("city_name") or slug)
+        config = scraper_config(city, slug)
+        if config is None:
+            results[slug] = CityScrape(slug, name, None, [], 0.0, None)
+            continue
+        platform = platform_of(config)
+        factory = (factories or {}).get(platform) or default_factory(platform)
+        started = clock()
+        try:
+            scraper = factory(config, browser)
+        except Exception as e:  # noqa: BLE001 - a bad config fails only its city
+            results[slug] = CityScrape(slug, name, platform, [], clock() - started, f"{type(e).__name__}: {e}")
+            continue
+        jobs.append(ScrapeJob(slug, name, platform, scraper))
+
+    host_slots: dict[str, threading.BoundedSemaphore] = {}
+    for job in jobs:
+        host_slots.setdefault(scraper_host(job.scraper), threading.BoundedSemaphore(max(1, per_host)))
+
+    def scrape(job: ScrapeJob) -> CityScrape:
+        started = clock()
+        try:
+            with host_slots[scraper_host(job.scraper)]:
+                meetings = job.scraper.fetch_meetings()
+        except Exception as e:  # noqa: BLE001 - one city's failure must not stop the rest
+            error = f"{type(e).__name__}: {e}"
+            return CityScrape(job.slug, job.city_name, job.platform, [], clock() - started, error)
+        return CityScrape(job.slug, job.city_name, job.platform, meetings, clock() - started, None)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(scrape, job) for job in interleave_by_host(jobs)]
+        for future in futures:
+            result = future.result()
+            results[result.slug] = result
+
+    return [results[slug] for slug in sorted(results)]
+
+
+def load_city_configs(data_dir: Path = DATA_DIR, slugs: Optional[list[str]] = None) -> dict[str, CityConfig]:
+    """Read the city configs.
+
+    Args:
+        data_dir: Directory of city YAML files.
+        slugs: Cities to read; all of them when omitted.
+
+    Returns:
+        Configs keyed by slug, the YAML file's stem.
+    """
+    import yaml
+
+    cities: dict[str, CityConfig] = {}
+    for path in sorted(data_dir.glob("*.yaml")):
+        if slugs and path.stem not in slugs:
+            continue
+        with open(path, encoding="utf-8") as f:
+            cities[path.stem] = yaml.safe_load(f) or {}
+    return cities
+
+
+def snapshot(results: list[CityScrape], generated_at: str) -> dict[str, object]:
+    """Lay results out as the snapshot build_dashboard.py reads.
+
+    Args:
+        results: Per-city results.
+        generated_at: ISO timestamp of the run.
+
+    Returns:
+        The snapshot: the run time, and each city's platform, timing, error
+        and meetings keyed by slug.
+    """
+    return {
+        "generated_at": generated_at,
+        "cities": {
+            result.slug: {
+                "city_name": result.city_name,
+                "platform": result.platform,
+                "seconds": round(result.seconds, 3),
+                "error": result.error,
+                "meetings": [meeting.to_dict() for meeting in result.meetings],
+            }
+            for result in results
+        },
+    }
+
+
+def write_snapshot(path: Path, results: list[CityScrape], generated_at: str) -> None:
+    """Write the snapshot, replacing any earlier one atomically.
+
+    Args:
+        path: Snapshot file; its directory is created if absent.
+        results: Per-city results.
+        generated_at: ISO timestamp of the run.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_suffix(".tmp")
+    staging.write_text(json.dumps(snapshot(results, generated_at), indent=2) + "\n", encoding="utf-8")
+    os.replace(staging, path)
+
+
+def describe(results: list[CityScrape]) -> str:
+    """Summarize a run, one line per city scraped.
+
+    Args:
+        results: Per-city results.
+
+    Returns:
+        The summary.
+    """
+    lines = []
+    for result in results:
+        if result.platform is None:
+            continue
+        outcome = f"failed: {result.error}" if result.error else f"{len(result.meetings)} meetings"
+        lines.append(f"{result.slug:<24} {result.platform:<9} {result.seconds:>6.1f}s  {outcome}")
+    scraped = sum(1 for result in results if result.platform is not None)
+    failed = sum(1 for result in results if result.error)
+    lines.append(f"{scraped} of {len(results)} cities scraped, {failed} failed")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Scrape the cities named, or all of them, and write the snapshot."""
+    parser = argparse.ArgumentParser(description="Scrape every city's meetings into one snapshot.")
+    parser.add_argument("--cities", nargs="*", help="city slugs to scrape; all by default")
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR)
+    parser.add_argument("--output", type=Path, default=SNAPSHOT_PATH)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST)
+    parser.add_argument("--browser", action="store_true", help="share one browser across every city")
+    args = parser.parse_args()
+
+    cities = load_city_configs(args.data_dir, args.cities)
+    started = time.perf_counter()
+    with ExitStack() as stack:
+        browser: Optional[BrowserPool] = None
+        if args.browser:
+            from .browser_pool import BrowserPool
+
+            browser = stack.enter_context(BrowserPool(max_pages=args.per_host))
+        results = scrape_cities(cities, workers=args.workers, per_host=args.per_host, browser=browser)
+    print(describe(results))
+    if browser is not None:
+        print(f"Browser: {browser.describe()}")
+
+    write_snapshot(args.output, results, datetime.now(timezone.utc).isoformat(timespec="seconds"))
+    print(f"Wrote {args.output} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
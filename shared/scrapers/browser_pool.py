@@ -0,0 +1,197 @@
+"""A headless browser shared by every scraper in a run.
+
+Launching Chromium costs about a second, and a scraper that opened its own
+for the listing and again for each agenda paid it every time. A pool is
+launched once and hands each task a fresh context, so tasks share no
+cookies or storage. It caps how many pages are open at once and aborts
+image, font and media requests, which no scraper reads.
+
+Playwright's sync API can only be used from the thread that started it, so
+the pool runs the async API on a thread of its own. ``run`` may be called
+from any thread: the task runs there, and the caller waits for its result.
+A Playwright failure, such as a page that times out or a browser that will
+not launch, is raised as ``BrowserError``, so callers can catch it without
+importing Playwright.
+
+Usage:
+    with BrowserPool(max_pages=4) as browser:
+        scraper = GranicusScraper(config, browser=browser)
+        meetings = scraper.fetch_meetings()
+    print(browser.describe())
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import TYPE_CHECKING, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page, Playwright, PlaywrightContextManager, Route
+
+T = TypeVar("T")
+
+# Resource types no scraper reads, aborted before they are fetched.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Pages open at once, across every task.
+DEFAULT_MAX_PAGES = 4
+
+
+class BrowserError(RuntimeError):
+    """Playwright failed to launch the browser or to run a task."""
+
+
+class BrowserPool:
+    """One headless Chromium, handing out a fresh context and page per task."""
+
+    def __init__(
+        self,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        blocked_types: frozenset[str] = BLOCKED_RESOURCE_TYPES,
+        headless: bool = True,
+    ):
+        if max_pages < 1:
+            raise ValueError(f"a browser pool needs at least one page, not {max_pages}")
+        self.max_pages = max_pages
+        self.blocked_types = blocked_types
+        self.headless = headless
+
+        # Seconds the launch took, and what the pool has done since.
+        self.launch_seconds = 0.0
+        self.pages_opened = 0
+        self.requests_blocked = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._playwright: Optional["Playwright"] = None
+        self._browser: Optional["Browser"] = None
+        self._pages: Optional[asyncio.Semaphore] = None
+        # Playwright's error type, known once it has been imported.
+        self._errors: tuple[type[Exception], ...] = ()
+
+    def __enter__(self) -> "BrowserPool":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Launch the browser on the pool's own thread.
+
+        Raises:
+            ImportError: If Playwright is not installed.
+            BrowserError: If the browser could not be launched.
+        """
+        from playwright.async_api import Error, async_playwright
+
+        self._errors = (Error,)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="browser-pool", daemon=True)
+        self._thread.start()
+        try:
+            self._call(self._launch(async_playwright))
+        except BaseException as e:
+            self._stop_loop()
+            if isinstance(e, self._errors):
+                raise BrowserError(f"could not launch the browser: {e}") from e
+            raise
+
+    async def _launch(self, async_playwright: Callable[[], "PlaywrightContextManager"]) -> None:
+        started = time.perf_counter()
+        playwright = await async_playwright().start()
+        self._playwright = playwright
+        self._browser = await playwright.chromium.launch(headless=self.headless)
+        self._pages = asyncio.Semaphore(self.max_pages)
+        self.launch_seconds = time.perf_counter() - started
+
+    def run(self, task: Callable[["Page"], Awaitable[T]]) -> T:
+        """Run a task on a fresh page and wait for its result.
+
+        Args:
+            task: Coroutine function taking a Playwright page.
+
+        Returns:
+            What the task returned.
+
+        Raises:
+            RuntimeError: If the pool has not been started.
+            BrowserError: If Playwright failed while running the task.
+        """
+        try:
+            return self._call(self._run(task))
+        except self._errors as e:
+            raise BrowserError(str(e)) from e
+
+    async def _run(self, task: Callable[["Page"], Awaitable[T]]) -> T:
+        if self._browser is None or self._pages is None:
+            raise RuntimeError("the browser pool has not been started")
+        async with self._pages:
+            context = await self._browser.new_context()
+            try:
+                await context.route("**/*", self._route)
+                page = await context.new_page()
+                self.pages_opened += 1
+                return await task(page)
+            finally:
+                await context.close()
+
+    async def _route(self, route: "Route") -> None:
+        """Abort requests for resources no scraper reads."""
+        if route.request.resource_type in self.blocked_types:
+            self.requests_blocked += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _call(self, coroutine: Coroutine[object, object, T]) -> T:
+        """Run a coroutine on the pool's thread and wait for its result.
+
+        Raises:
+            RuntimeError: If the pool has not been started.
+        """
+        if self._loop is None:
+            coroutine.close()
+            raise RuntimeError("the browser pool has not been started")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def close(self) -> None:
+        """Close the browser and stop the pool's thread."""
+        if self._loop is None:
+            return
+        try:
+            self._call(self._shutdown())
+        finally:
+            self._stop_loop()
+
+    async def _shutdown(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._browser = None
+        self._playwright = None
+
+    def _stop_loop(self) -> None:
+        loop, thread = self._loop, self._thread
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+        self._loop = None
+        self._thread = None
+
+    @property
+    def saved_seconds(self) -> float:
+        """Launch time saved: every page after the first would have launched its own browser."""
+        return self.launch_seconds * max(self.pages_opened - 1, 0)
+
+    def describe(self) -> str:
+        """Summarize the pool's use for a run's log."""
+        return (
+            f"{self.pages_opened} pages in one browser launched in {self.launch_seconds:.1f}s, "
+            f"saving about {self.saved_seconds:.1f}s of launches; "
+            f"{self.requests_blocked} image, font and media requests blocked"
+        )
@@ -2,197 +2,457 @@
 
 Granicus is used by 21 Orange County cities including Irvine, Anaheim,
 Huntington Beach, Newport Beach, Santa Ana, and others.
+
+The ViewPublisher listing and the agenda pages are served as HTML, so they
+are read over plain HTTP by default. A city whose listing is only filled in
+by script can set ``scraping.granicus.mode: browser``; any city whose listing
+reads as empty over HTTP is retried in the browser. An agenda is opened in
+the browser only when its page over HTTP looks filled in by script. Playwright
+is only imported when the browser is used. Pass a ``BrowserPool`` to share
+one browser across scrapers and calls.
 """
 
 import re
+import time
+from collections.abc import Awaitable, Callable, Mapping
 from datetime import datetime
+from typing import Any, NamedTuple, Optional, Protocol, TypeVar
 
-from playwright.sync_api import sync_playwright
+import requests
 
 from .base import BaseScraper, Meeting
+from .browser_pool import BrowserError, BrowserPool
+
+T = TypeVar("T")
+
+# Ways to read a listing, set per city as scraping.granicus.mode.
+HTTP_MODE = "http"
+BROWSER_MODE = "browser"
+MODES = (HTTP_MODE, BROWSER_MODE)
+
+# Seconds to wait for a listing or agenda page over HTTP.
+REQUEST_TIMEOUT = 30
+
+# Milliseconds between checks on a page that is still loading.
+SETTLE_POLL_MS = 250
+
+# Seconds a page must go unchanged to count as loaded.
+SETTLE_QUIET = 1.0
+
+# Seconds after which a page still changing is read as it stands.
+SETTLE_CEILING = 30.0
+
+# Meeting names are cut to this many characters.
+NAME_LIMIT = 100
+
+# Agenda item titles are cut to this many characters.
+TITLE_LIMIT = 200
+
+# An agenda page that runs scripts and shows fewer characters of text than
+# this over HTTP is taken to be filled in by script.
+SCRIPT_FILLED_TEXT = 200
+
+# "Jan 13, 2026" or "January 27, 2026"
+_DATE_PATTERN = re.compile(r"([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})")
+_CLIP_ID_PATTERN = re.compile(r"clip_id=(\d+)")
+_EVENT_ID_PATTERN = re.compile(r"event_id=(\d+)")
+_SPACE_PATTERN = re.compile(r"\s+")
+# Section headings are numbered "3. CONSENT CALENDAR"; items "3.1 Title".
+_SECTION_PATTERN = re.compile(r"^\d+\.\s+")
+_ITEM_PATTERN = re.compile(r"^(\d+\.\d+)\s+(.+)")
+
+_SECTION_HEADINGS = frozenset({
+    "CLOSED SESSION", "PRESENTATIONS", "CONSENT CALENDAR",
+    "PUBLIC HEARINGS", "COUNCIL BUSINESS",
+})
+
+# Reads the row around every agenda link in one round trip, as the
+# (cell texts, agenda href, minutes href) rows _meetings_from_rows takes.
+_ROWS_SCRIPT = """() => Array.from(document.querySelectorAll('a[href*="AgendaViewer"]'), link => {
+    const row = link.closest('tr');
+    if (!row) return null;
+    const minutes = row.querySelector('a[href*="MinutesViewer"]');
+    return [
+        Array.from(row.querySelectorAll('td, th'), cell => cell.innerText),
+        link.getAttribute('href'),
+        minutes ? minutes.getAttribute('href') : null,
+    ];
+}).filter(row => row !== null)"""
+
+# Counts the agenda links loaded so far; the listing grows as it is scrolled.
+_AGENDA_LINKS_SCRIPT = "() => document.querySelectorAll('a[href*=\"AgendaViewer\"]').length"
+_SCROLL_SCRIPT = "() => window.scrollTo(0, document.body.scrollHeight)"
+# Measures an agenda's text; it is loaded once this stops changing.
+_TEXT_LENGTH_SCRIPT = "() => document.body ? document.body.innerText.length : 0"
+_TEXT_SCRIPT = "() => document.body ? document.body.innerText : ''"
+
+_MONTHS = {
+    "Jan": "January", "Feb": "February", "Mar": "March",
+    "Apr": "April", "May": "May", "Jun": "June",
+    "Jul": "July", "Aug": "August", "Sep": "September",
+    "Oct": "October", "Nov": "November", "Dec": "December",
+}
+
+
+def _absolute(url: Optional[str]) -> Optional[str]:
+    """Give a protocol-relative Granicus link its scheme."""
+    if url and url.startswith("//"):
+        return "https:" + url
+    return url
+
+
+class GranicusResponse(Protocol):
+    """The parts of a requests response the scraper reads."""
+
+    @property
+    def text(self) -> str: ...
+
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+
+    def raise_for_status(self) -> None: ...
+
+
+class GranicusSession(Protocol):
+    """Sends the scraper's HTTP requests, as a ``requests.Session`` does."""
+
+    def get(self, url: str, *, timeout: float) -> GranicusResponse: ...
+
+
+class PageRunner(Protocol):
+    """Runs a task on a browser page and waits for it, as a ``BrowserPool`` does."""
+
+    def run(self, task: Callable[[Any], Awaitable[T]]) -> T: ...
+
+
+class PageLoad(NamedTuple):
+    """How long a page took to stop changing.
+
+    size: What was measured when it stopped, such as rows loaded.
+    seconds: Time spent waiting.
+    settled: False if the ceiling was reached while it was still changing.
+    """
+
+    size: int
+    seconds: float
+    settled: bool
+
+
+async def wait_until_stable(
+    page,
+    measure: str,
+    step: Optional[str] = None,
+    poll_ms: int = SETTLE_POLL_MS,
+    quiet: float = SETTLE_QUIET,
+    ceiling: float = SETTLE_CEILING,
+    clock=time.monotonic,
+) -> PageLoad:
+    """Wait until a measure of a page stops changing, instead of for a fixed time.
+
+    Args:
+        page: Playwright page, from the async API.
+        measure: Script returning a number that grows as the page loads.
+        step: Script run before each check, such as a scroll to the bottom.
+        poll_ms: Milliseconds between checks.
+        quiet: Seconds the measure must hold steady.
+        ceiling: Seconds after which to stop regardless.
+        clock: Monotonic clock, in seconds.
+
+    Returns:
+        The last measure and how long it took to settle.
+    """
+    start = clock()
+    size = await page.evaluate(measure)
+    steady_since = start
+    while True:
+        now = clock()
+        if now - steady_since >= quiet:
+            return PageLoad(size=size, seconds=now - start, settled=True)
+        if now - start >= ceiling:
+            return PageLoad(size=size, seconds=now - start, settled=False)
+        if step:
+            await page.evaluate(step)
+        await page.wait_for_timeout(poll_ms)
+        latest = await page.evaluate(measure)
+        if latest != size:
+            size = latest
+            steady_since = clock()
+
+
+def _visible_text(markup: str) -> tuple[str, bool]:
+    """Read a page's visible text, one element per line, and whether it runs scripts."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(markup, "html.parser")
+    hidden = soup(["script", "style"])
+    scripted = any(tag.name == "script" for tag in hidden)
+    for tag in hidden:
+        tag.decompose()
+    body = soup.body or soup
+    return body.get_text("\n"), scripted
+
+
+def _agenda_items_from_lines(lines: list[str]) -> list[dict]:
+    """Read numbered agenda items, with their sections, from an agenda's text."""
+    agenda_items = []
+    current_section = None
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        if _SECTION_PATTERN.match(line) or line.upper() in _SECTION_HEADINGS:
+            current_section = line
+
+        item_match = _ITEM_PATTERN.match(line)
+        if item_match:
+            agenda_items.append({
+                "number": item_match.group(1),
+                "title": item_match.group(2)[:TITLE_LIMIT],
+                "section": current_section,
+            })
+
+    return agenda_items
 
 
 class GranicusScraper(BaseScraper):
     """Scraper for cities using Granicus meeting management."""
 
-    def __init__(self, config: dict):
+    def __init__(
+        self,
+        config: dict,
+        session: Optional[GranicusSession] = None,
+        browser: Optional[PageRunner] = None,
+    ):
         super().__init__(config)
         scraping = config.get("scraping", {}).get("granicus", {})
         self.subdomain = scraping.get("subdomain")
         self.view_id = scraping.get("view_id")
         self.filter_text = scraping.get("filter_text", "CITY COUNCIL")
+        self.mode = scraping.get("mode", HTTP_MODE)
 
         if not self.subdomain or not self.view_id:
             raise ValueError(
                 f"Granicus config requires 'subdomain' and 'view_id' for {self.city_name}"
             )
+        if self.mode not in MODES:
+            raise ValueError(
+                f"Granicus mode for {self.city_name} must be one of {', '.join(MODES)}, not {self.mode!r}"
+            )
+
+        self.session = session or requests.Session()
+        # Shared browser for pages that need one; without it, each such
+        # fetch launches a browser of its own.
+        self.browser = browser
+        # How the last listing was read: "http" or "browser".
+        self.last_mode: Optional[str] = None
+        # How long the last listing read in the browser took to load.
+        self.last_load: Optional[PageLoad] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"https://{self.subdomain}.granicus.com"
 
     @property
     def archive_url(self) -> str:
-        return f"https://{self.subdomain}.granicus.com/ViewPublisher.php?view_id={self.view_id}"
+        return f"{self.base_url}/ViewPublisher.php?view_id={self.view_id}"
 
-    def fetch_meetings(self) -> list[Meeting]:
-        """Fetch meeting data from Granicus portal using Playwright."""
-        meetings = []
-        seen_keys = set()
+    def agenda_url(self, event_id: str) -> str:
+        return f"{self.base_url}/AgendaViewer.php?view_id={self.view_id}&event_id={event_id}"
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
+    def fetch_meetings(self) -> list[Meeting]:
+        """Fetch meetings from the Granicus listing, over HTTP unless the city needs a browser.
 
+        A listing that cannot be fetched, or that holds no meetings, over HTTP
+        is read again in the browser.
+        """
+        if self.mode == HTTP_MODE:
             try:
-                page.goto(self.archive_url, wait_until="networkidle")
-                page.wait_for_timeout(2000)
+                meetings = self._fetch_meetings_http()
+            except requests.RequestException as e:
+                print(f"Error fetching Granicus listing for {self.city_name} over HTTP: {e}")
+                meetings = []
+            if meetings:
+                self.last_mode = HTTP_MODE
+                return meetings
+            print(f"No meetings in the {self.city_name} Granicus listing over HTTP; trying the browser")
 
-                # Scroll to load all content (Granicus lazy loads)
-                for _ in range(10):
-                    page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    page.wait_for_timeout(500)
-
-                # Get all links that have AgendaViewer - these are meeting rows
-                agenda_links = page.query_selector_all('a[href*="AgendaViewer"]')
+        try:
+            meetings = self._fetch_meetings_browser()
+        except ImportError:
+            print(f"Playwright is not installed; cannot read the {self.city_name} listing in a browser")
+            return []
+        except BrowserError as e:
+            print(f"Error reading the {self.city_name} Granicus listing in a browser: {e}")
+            return []
+        self.last_mode = BROWSER_MODE
+        return meetings
 
-                for link in agenda_links:
-                    meeting = self._parse_meeting_row(link)
-                    if meeting:
-                        key = f"{meeting.date}|{meeting.event_id or meeting.agenda_url}"
-                        if key not in seen_keys:
-                            seen_keys.add(key)
-                            meetings.append(meeting)
+    def _get_html(self, url: str) -> Optional[str]:
+        """Fetch a page over HTTP, or None if it is not HTML (an agenda PDF, say)."""
+        response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        if "html" not in response.headers.get("Content-Type", "text/html"):
+            return None
+        return response.text
+
+    def _fetch_meetings_http(self) -> list[Meeting]:
+        """Fetch and parse the listing without a browser."""
+        markup = self._get_html(self.archive_url)
+        return self.parse_listing(markup) if markup else []
+
+    def parse_listing(self, markup: str) -> list[Meeting]:
+        """Read the meetings out of a ViewPublisher listing's markup, newest first."""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(markup, "html.parser")
+        rows = []
+        for link in soup.select('a[href*="AgendaViewer"]'):
+            row = link.find_parent("tr")
+            if row is None:
+                continue
+            minutes_link = row.select_one('a[href*="MinutesViewer"]')
+            rows.append((
+                [cell.get_text(" ", strip=True) for cell in row.find_all(["td", "th"])],
+                link.get("href"),
+                minutes_link.get("href") if minutes_link else None,
+            ))
+        return self._meetings_from_rows(rows)
+
+    def _meetings_from_rows(self, rows: list) -> list[Meeting]:
+        """Build meetings from (cell texts, agenda href, minutes href) rows, newest first.
+
+        The rows come from the parsed listing or, as JSON arrays, from the
+        browser, and are all read in this one pass.
+
+        A row is skipped if it does not mention filter_text or has no date,
+        and repeats of a meeting already read are dropped.
+        """
+        meetings = []
+        seen_keys = set()
 
-            finally:
-                browser.close()
+        for cells, agenda_href, minutes_href in rows:
+            meeting = self._meeting_from_row(cells, agenda_href, minutes_href)
+            if meeting:
+                key = f"{meeting.date}|{meeting.event_id or meeting.agenda_url}"
+                if key not in seen_keys:
+                    seen_keys.add(key)
+                    meetings.append(meeting)
 
-        # Sort by date (newest first)
         meetings.sort(key=lambda m: self._parse_date(m.date), reverse=True)
         return meetings
 
-    def _parse_meeting_row(self, link) -> Meeting | None:
-        """Parse a meeting from an agenda link element."""
-        try:
-            row = link.evaluate_handle("el => el.closest('tr')")
-            if not row:
-                return None
-
-            row_el = row.as_element()
-            if not row_el:
-                return None
-
-            row_text = row_el.inner_text()
-
-            # Skip non-matching meetings
-            if self.filter_text and self.filter_text.upper() not in row_text.upper():
-                return None
-
-            # Parse date - handles "Jan 13, 2026" or "January 27, 2026"
-            row_text_clean = row_text.replace("\xa0", " ")
-            date_match = re.search(r"([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})", row_text_clean)
-            if not date_match:
-                return None
-
-            month_str = date_match.group(1)
-            day_str = date_match.group(2)
-            year_str = date_match.group(3)
-
-            # Normalize month names
-            month_map = {
-                "Jan": "January", "Feb": "February", "Mar": "March",
-                "Apr": "April", "May": "May", "Jun": "June",
-                "Jul": "July", "Aug": "August", "Sep": "September",
-                "Oct": "October", "Nov": "November", "Dec": "December",
-            }
-            if month_str in month_map:
-                month_str = month_map[month_str]
-
-            date_str = f"{month_str} {day_str}, {year_str}"
-
-            # Get meeting name
-            lines = [line.strip() for line in row_text.split("\n") if line.strip()]
-            name_text = lines[0] if lines else "City Council Meeting"
-            name_text = re.sub(r"\s+", " ", name_text).strip()[:100]
-
-            # Get agenda URL
-            agenda_url = link.get_attribute("href")
-            if agenda_url and agenda_url.startswith("//"):
-                agenda_url = "https:" + agenda_url
-
-            # Get minutes URL
-            minutes_link = row_el.query_selector('a[href*="MinutesViewer"]')
-            minutes_url = minutes_link.get_attribute("href") if minutes_link else None
-            if minutes_url and minutes_url.startswith("//"):
-                minutes_url = "https:" + minutes_url
-
-            # Build video player URL from clip_id
-            video_url = None
-            if agenda_url:
-                clip_match = re.search(r"clip_id=(\d+)", agenda_url)
-                if clip_match:
-                    clip_id = clip_match.group(1)
-                    video_url = f"https://{self.subdomain}.granicus.com/player/clip/{clip_id}?view_id={self.view_id}"
-
-            # Get event_id for agenda fetching
-            event_id = None
-            if agenda_url:
-                event_match = re.search(r"event_id=(\d+)", agenda_url)
-                if event_match:
-                    event_id = event_match.group(1)
-
-            return Meeting(
-                name=name_text,
-                date=date_str,
-                agenda_url=agenda_url,
-                minutes_url=minutes_url,
-                video_url=video_url,
-                event_id=event_id,
-            )
+    def _meeting_from_row(
+        self, cells: list[str], agenda_href: Optional[str], minutes_href: Optional[str]
+    ) -> Meeting | None:
+        """Build a meeting from one listing row, or None if the row is not one."""
+        cells = [_SPACE_PATTERN.sub(" ", cell.replace("\xa0", " ")).strip() for cell in cells]
+        row_text = " ".join(cells)
+
+        if self.filter_text and self.filter_text.upper() not in row_text.upper():
+            return None
 
-        except Exception:
+        date_match = _DATE_PATTERN.search(row_text)
+        if not date_match:
             return None
+        month, day, year = date_match.groups()
+        date_str = f"{_MONTHS.get(month, month)} {day}, {year}"
+
+        name = next((cell for cell in cells if cell), "")[:NAME_LIMIT] or "City Council Meeting"
+        agenda_url = _absolute(agenda_href)
+
+        video_url = None
+        event_id = None
+        if agenda_url:
+            clip_match = _CLIP_ID_PATTERN.search(agenda_url)
+            if clip_match:
+                video_url = f"{self.base_url}/player/clip/{clip_match.group(1)}?view_id={self.view_id}"
+            event_match = _EVENT_ID_PATTERN.search(agenda_url)
+            if event_match:
+                event_id = event_match.group(1)
+
+        return Meeting(
+            name=name,
+            date=date_str,
+            agenda_url=agenda_url,
+            minutes_url=_absolute(minutes_href),
+            video_url=video_url,
+            event_id=event_id,
+        )
+
+    def _in_browser(self, task):
+        """Run a page task in the shared browser, or in one launched for it alone."""
+        if self.browser is not None:
+            return self.browser.run(task)
+        with BrowserPool(max_pages=1) as browser:
+            return browser.run(task)
+
+    def _fetch_meetings_browser(self) -> list[Meeting]:
+        """Fetch the listing in a headless browser, for listings filled in by script.
+
+        Every row is read in the page by a single evaluate call rather than
+        several round trips per agenda link.
+        """
+        self.last_load, rows = self._in_browser(self._read_listing_page)
+        load = self.last_load
+        print(
+            f"Loaded {load.size} agenda links for {self.city_name} in {load.seconds:.1f}s"
+            + ("" if load.settled else " (still loading at the ceiling; the listing may be cut short)")
+        )
+        return self._meetings_from_rows(rows)
+
+    async def _read_listing_page(self, page) -> tuple[PageLoad, list]:
+        """Load the listing, scrolled to its end, and read its rows."""
+        await page.goto(self.archive_url, wait_until="networkidle")
+        # Granicus lazy loads: scroll for as long as rows keep coming.
+        load = await wait_until_stable(page, _AGENDA_LINKS_SCRIPT, step=_SCROLL_SCRIPT)
+        return load, await page.evaluate(_ROWS_SCRIPT)
 
     def fetch_agenda_items(self, event_id: str) -> list[dict]:
-        """Fetch agenda items for an upcoming meeting."""
-        agenda_items = []
+        """Fetch agenda items for an upcoming meeting.
+
+        The agenda is read over HTTP unless the city is set to the browser.
+        It is opened in the browser only if the page holds no items and looks
+        filled in by script; an agenda that is not HTML, such as a PDF, or
+        that cannot be fetched, has no items.
+        """
+        if self.mode == HTTP_MODE:
+            try:
+                markup = self._get_html(self.agenda_url(event_id))
+            except requests.RequestException as e:
+                print(f"Error fetching Granicus agenda {event_id} for {self.city_name} over HTTP: {e}")
+                return []
+            if markup is None:
+                return []
+            text, scripted = _visible_text(markup)
+            agenda_items = _agenda_items_from_lines(text.split("\n"))
+            if agenda_items or not scripted or len(_SPACE_PATTERN.sub(" ", text).strip()) >= SCRIPT_FILLED_TEXT:
+                return agenda_items
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
+        try:
+            return self._fetch_agenda_items_browser(event_id)
+        except ImportError:
+            print(f"Playwright is not installed; cannot read the {self.city_name} agenda {event_id} in a browser")
+            return []
+        except BrowserError as e:
+            print(f"Error reading Granicus agenda {event_id} for {self.city_name} in a browser: {e}")
+            return []
 
-            try:
-                url = f"https://{self.subdomain}.granicus.com/AgendaViewer.php?view_id={self.view_id}&event_id={event_id}"
-                page.goto(url, wait_until="networkidle")
-                page.wait_for_timeout(2000)
-
-                body = page.query_selector("body")
-                text = body.inner_text() if body else ""
-
-                lines = text.split("\n")
-                current_section = None
-
-                for line in lines:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    # Detect section headers
-                    if re.match(r"^\d+\.\s+", line) or line.upper() in [
-                        "CLOSED SESSION", "PRESENTATIONS", "CONSENT CALENDAR",
-                        "PUBLIC HEARINGS", "COUNCIL BUSINESS"
-                    ]:
-                        current_section = line
-
-                    # Detect agenda items (numbered like 3.1, 4.1, etc.)
-                    item_match = re.match(r"^(\d+\.\d+)\s+(.+)", line)
-                    if item_match:
-                        agenda_items.append({
-                            "number": item_match.group(1),
-                            "title": item_match.group(2)[:200],
-                            "section": current_section,
-                        })
-
-            finally:
-                browser.close()
-
-        return agenda_items
+    @staticmethod
+    def parse_agenda(markup: str) -> list[dict]:
+        """Read the numbered items out of an agenda page's markup."""
+        return _agenda_items_from_lines(_visible_text(markup)[0].split("\n"))
+
+    def _fetch_agenda_items_browser(self, event_id: str) -> list[dict]:
+        """Fetch agenda items in a headless browser."""
+
+        async def read_agenda(page) -> str:
+            await page.goto(self.agenda_url(event_id), wait_until="networkidle")
+            await wait_until_stable(page, _TEXT_LENGTH_SCRIPT)
+            return await page.evaluate(_TEXT_SCRIPT)
+
+        return _agenda_items_from_lines(self._in_browser(read_agenda).split("\n"))
 
     @staticmethod
     def _parse_date(date_str: str) -> datetime:
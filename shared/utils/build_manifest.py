@@ -0,0 +1,209 @@
+"""Input fingerprints that let a dashboard build be skipped, make-style.
+
+A dashboard declares the files its generator reads and the files it writes.
+After a successful build, a manifest records a fingerprint of the inputs and
+a digest of each output. The next run rebuilds only when the inputs hash
+differently, or an output is no longer what the build left.
+
+Inputs are glob patterns relative to the repository root. A match that is a
+directory is hashed recursively, leaving out bytecode caches. A pattern that
+matches nothing still counts, so a file appearing later changes the
+fingerprint. Inputs that live upstream rather than on disk are folded in as
+an extra fingerprint the caller obtains, typically from a cheap conditional
+fetch.
+
+A build that wrote its outputs without everything it reads upstream, such
+as documents that failed to download, says so by exiting with
+``PARTIAL_BUILD_EXIT``. It is not recorded, so it is not skipped next time
+while its inputs look unchanged.
+
+Like the other caches, the manifest is never a source of truth: one that
+cannot be read is treated as empty, and every dashboard is built.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TypedDict
+
+# Directories whose contents never affect a build.
+IGNORED_DIRECTORIES = frozenset({"__pycache__", ".pytest_cache", ".mypy_cache", ".ruff_cache"})
+
+# Exit status of a generator that wrote its outputs but could not read
+# everything upstream. The build counts as done and is not recorded.
+PARTIAL_BUILD_EXIT = 3
+
+
+class BuildRecord(TypedDict):
+    """What a dashboard's last successful build read and wrote.
+
+    fingerprint: Hash over the build's inputs.
+    outputs: SHA-256 of each output, keyed by its declared path.
+    """
+
+    fingerprint: str
+    outputs: dict[str, str]
+
+
+def _files_under(path: Path) -> list[Path]:
+    """List the files a path covers.
+
+    Args:
+        path: A file or directory.
+
+    Returns:
+        The file itself, or every file below the directory outside the
+        ignored directories, in sorted order.
+    """
+    if not path.is_dir():
+        return [path]
+    files: list[Path] = []
+    for directory, subdirectories, names in os.walk(path):
+        subdirectories[:] = sorted(name for name in subdirectories if name not in IGNORED_DIRECTORIES)
+        files.extend(Path(directory) / name for name in sorted(names))
+    return files
+
+
+def hash_inputs(root: Path, patterns: tuple[str, ...], extra: tuple[str, ...] = ()) -> str:
+    """Fingerprint a build's inputs.
+
+    Args:
+        root: Directory the patterns are relative to.
+        patterns: Glob patterns naming input files and directories.
+        extra: Further values the build depends on, such as its command line
+            or an upstream fingerprint.
+
+    Returns:
+        The hex SHA-256 over each pattern, the path and content of every file
+        it covers, and the extra values.
+    """
+    digest = hashlib.sha256()
+    for pattern in patterns:
+        digest.update(f"pattern\0{pattern}\0".encode())
+        for match in sorted(root.glob(pattern)):
+            for path in _files_under(match):
+                digest.update(f"file\0{path.relative_to(root).as_posix()}\0".encode())
+                digest.update(hashlib.sha256(path.read_bytes()).digest())
+    for value in extra:
+        digest.update(f"extra\0{value}\0".encode())
+    return digest.hexdigest()
+
+
+def hash_output(path: Path) -> str | None:
+    """Digest one output as it is now.
+
+    Args:
+        path: An output file or directory.
+
+    Returns:
+        The hex SHA-256 over the file, or over the relative paths and
+        contents of every file in the directory; None if the output is absent.
+    """
+    if not path.exists():
+        return None
+    if not path.is_dir():
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    digest = hashlib.sha256()
+    for file in _files_under(path):
+        digest.update(f"{file.relative_to(path).as_posix()}\0".encode())
+        digest.update(hashlib.sha256(file.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def record_build(root: Path, fingerprint: str, outputs: tuple[str, ...]) -> BuildRecord:
+    """Describe a build that has just succeeded.
+
+    Args:
+        root: Directory the outputs are relative to.
+        fingerprint: Hash over the inputs the build read.
+        outputs: Declared output paths.
+
+    Returns:
+        The record, with a digest of each output that exists.
+    """
+    digests: dict[str, str] = {}
+    for output in outputs:
+        digest = hash_output(root / output)
+        if digest is not None:
+            digests[output] = digest
+    return BuildRecord(fingerprint=fingerprint, outputs=digests)
+
+
+def is_up_to_date(root: Path, record: BuildRecord | None, fingerprint: str, outputs: tuple[str, ...]) -> bool:
+    """Decide whether a build can be skipped.
+
+    Args:
+        root: Directory the outputs are relative to.
+        record: The last successful build, if any.
+        fingerprint: Hash over the inputs as they are now.
+        outputs: Declared output paths.
+
+    Returns:
+        True if the inputs are unchanged and every output is still exactly
+        what that build left.
+    """
+    if record is None or record["fingerprint"] != fingerprint:
+        return False
+    return all(record["outputs"].get(output) == hash_output(root / output) for output in outputs)
+
+
+def _decode_record(payload: object) -> BuildRecord | None:
+    """Validate one stored build record.
+
+    Args:
+        payload: Object parsed from the manifest.
+
+    Returns:
+        The record, or None if it does not match the expected shape.
+    """
+    if not isinstance(payload, dict):
+        return None
+    fingerprint = payload.get("fingerprint")
+    outputs = payload.get("outputs")
+    if not isinstance(fingerprint, str) or not isinstance(outputs, dict):
+        return None
+    digests: dict[str, str] = {}
+    for output, digest in outputs.items():
+        if not isinstance(output, str) or not isinstance(digest, str):
+            return None
+        digests[output] = digest
+    return BuildRecord(fingerprint=fingerprint, outputs=digests)
+
+
+def load_manifest(path: Path) -> dict[str, BuildRecord]:
+    """Read the build records of every dashboard.
+
+    Args:
+        path: Manifest file.
+
+    Returns:
+        Records keyed by dashboard name. Empty if the file is absent or not
+        JSON; records that do not match the expected shape are left out.
+    """
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+
+    manifest: dict[str, BuildRecord] = {}
+    for name, value in payload.items():
+        record = _decode_record(value)
+        if record is not None:
+            manifest[name] = record
+    return manifest
+
+
+def save_manifest(path: Path, manifest: dict[str, BuildRecord]) -> None:
+    """Store the build records, replacing the manifest atomically.
+
+    Args:
+        path: Manifest file; its directory is created if absent.
+        manifest: Records keyed by dashboard name.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_suffix(".tmp")
+    staging.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(staging, path)
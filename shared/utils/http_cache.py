@@ -0,0 +1,258 @@
+"""On-disk HTTP response cache with revalidation.
+
+A cached response keeps the validators its server sent, ``ETag`` and
+``Last-Modified``, so the next request for the same URL can ask whether the
+body changed and, when the answer is 304, be served from disk. Hosts that send
+no validators can instead be trusted for a fixed age.
+
+Entries live one file each under a directory. The cache is bounded in bytes
+and evicts the least recently used entries first; recency is the file's
+modification time, refreshed on every hit, so it survives between runs.
+
+This is an optimisation, never a source of truth: an entry that cannot be read
+is treated as absent and removed, and the caller fetches the URL again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypedDict
+
+# Bytes the cache may occupy on disk before it evicts entries.
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+# Suffix of an entry file; anything else in the directory is left alone.
+ENTRY_SUFFIX = ".json"
+
+
+class CacheEntry(TypedDict):
+    """One cached response.
+
+    url: URL the body was fetched from, for auditing.
+    body: Decoded response body.
+    etag: ``ETag`` the server sent, empty when it sent none.
+    last_modified: ``Last-Modified`` the server sent, empty when it sent none.
+    stored_at: When the body was last confirmed current, in epoch seconds.
+    """
+
+    url: str
+    body: str
+    etag: str
+    last_modified: str
+    stored_at: float
+
+
+def cache_key(url: str, params: dict[str, str]) -> str:
+    """Name the entry for a request.
+
+    Args:
+        url: Absolute URL being requested.
+        params: Query parameters; their order does not matter.
+
+    Returns:
+        A filesystem-safe key unique to the URL and parameters.
+    """
+    canonical = json.dumps([url, sorted(params.items())], separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def has_validators(entry: CacheEntry) -> bool:
+    """Decide whether an entry can be revalidated with the server.
+
+    Args:
+        entry: Cached response.
+
+    Returns:
+        True if the server sent an ETag or a Last-Modified date.
+    """
+    return bool(entry["etag"] or entry["last_modified"])
+
+
+def conditional_headers(entry: CacheEntry) -> dict[str, str]:
+    """Build the headers asking the server whether an entry is still current.
+
+    Args:
+        entry: Cached response.
+
+    Returns:
+        ``If-None-Match`` and ``If-Modified-Since`` for whichever validators
+        the entry holds.
+    """
+    headers: dict[str, str] = {}
+    if entry["etag"]:
+        headers["If-None-Match"] = entry["etag"]
+    if entry["last_modified"]:
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def _decode_entry(payload: object) -> CacheEntry | None:
+    """Decode an entry file's contents.
+
+    Args:
+        payload: Object parsed from the file's JSON.
+
+    Returns:
+        The entry, or None if the payload does not match the shape.
+    """
+    if not isinstance(payload, dict):
+        return None
+
+    url = payload.get("url")
+    body = payload.get("body")
+    etag = payload.get("etag")
+    last_modified = payload.get("last_modified")
+    stored_at = payload.get("stored_at")
+
+    if not (
+        isinstance(url, str)
+        and isinstance(body, str)
+        and isinstance(etag, str)
+        and isinstance(last_modified, str)
+        and isinstance(stored_at, int | float)
+        and not isinstance(stored_at, bool)
+    ):
+        return None
+
+    return CacheEntry(url=url, body=body, etag=etag, last_modified=last_modified, stored_at=float(stored_at))
+
+
+class ResponseCache:
+    """Size-bounded, least-recently-used store of HTTP responses on disk.
+
+    Safe to share between threads: every disk operation holds one lock, while
+    the network requests around it run outside.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: float = 0.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Configure the cache.
+
+        Args:
+            directory: Where entry files are kept; created on first store.
+            max_bytes: Disk budget; least recently used entries are evicted
+                beyond it.
+            max_age: Seconds an entry without validators is served without
+                asking the server. Zero always refetches such entries.
+            clock: Source of the current time in epoch seconds.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        """Locate the file for a key.
+
+        Args:
+            key: Entry key from ``cache_key``.
+
+        Returns:
+            The entry's path.
+        """
+        return self.directory / f"{key}{ENTRY_SUFFIX}"
+
+    def lookup(self, key: str) -> CacheEntry | None:
+        """Read an entry and mark it as recently used.
+
+        Args:
+            key: Entry key from ``cache_key``.
+
+        Returns:
+            The entry, or None if absent or unreadable for any reason, be it
+            damaged content or a file the run may not open. An unreadable
+            entry is removed where possible.
+        """
+        path = self._path(key)
+        with self._lock:
+            try:
+                entry = _decode_entry(json.loads(path.read_text(encoding="utf-8")))
+            except FileNotFoundError:
+                return None
+            except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+                entry = None
+
+            try:
+                if entry is None:
+                    path.unlink(missing_ok=True)
+                    return None
+                now = self._clock()
+                os.utime(path, (now, now))
+            except OSError:
+                # An entry that cannot be removed or touched is still only
+                # skipped; the caller fetches the URL again.
+                return None
+            return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Decide whether an entry may be served without asking the server.
+
+        Only entries without validators qualify: anything the server can
+        revalidate is revalidated.
+
+        Args:
+            entry: Cached response.
+
+        Returns:
+            True if the entry has no validators and is younger than max_age.
+        """
+        if has_validators(entry):
+            return False
+        return self._clock() - entry["stored_at"] < self.max_age
+
+    def store(self, key: str, url: str, body: str, etag: str, last_modified: str) -> CacheEntry:
+        """Write an entry, then evict until the cache fits its budget.
+
+        Args:
+            key: Entry key from ``cache_key``.
+            url: URL the body came from.
+            body: Decoded response body.
+            etag: ``ETag`` the server sent, or empty.
+            last_modified: ``Last-Modified`` the server sent, or empty.
+
+        Returns:
+            The stored entry.
+        """
+        now = self._clock()
+        entry = CacheEntry(url=url, body=body, etag=etag, last_modified=last_modified, stored_at=now)
+        path = self._path(key)
+
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            staging = path.with_suffix(".tmp")
+            staging.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+            os.replace(staging, path)
+            os.utime(path, (now, now))
+            self._evict(keep=path)
+
+        return entry
+
+    def _evict(self, keep: Path) -> None:
+        """Remove least recently used entries until the cache fits its budget.
+
+        The entry just written is never evicted, so a single body larger than
+        the budget is still served on the next run.
+
+        Args:
+            keep: Entry to retain regardless of size.
+        """
+        entries = [(path.stat(), path) for path in self.directory.glob(f"*{ENTRY_SUFFIX}")]
+        total = sum(stat.st_size for stat, _ in entries)
+
+        for stat, path in sorted(entries, key=lambda item: item[0].st_mtime):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink()
+            total -= stat.st_size
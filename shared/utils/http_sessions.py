@@ -0,0 +1,53 @@
+"""Keep-alive sessions that outlive a generator run in the same interpreter.
+
+generate_all's in-process mode runs a generator that lives in a directory
+that is not importable, such as irvine-city-council, by path, so its module
+body runs afresh for the probe and again for the build. A session it caches
+in its own module is therefore built twice, and the build opens every
+connection the probe already had. Sessions kept here belong to an imported
+module instead, so every run in the interpreter shares them, and the build
+reuses the connections, and TLS handshakes, its probe opened.
+
+requests is imported when the first session is built, not with this module,
+so a run that never makes a request does not pay for it.
+"""
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+
+@cache
+def _build_session(host: str, pool_size: int) -> "requests.Session":
+    """Build a session keeping a pool of connections per host.
+
+    Args:
+        host: Host the session is for; it only keys the cache.
+        pool_size: Connections kept open to each host.
+
+    Returns:
+        The session.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+    return session
+
+
+def host_session(host: str, pool_size: int = 1) -> "requests.Session":
+    """Return the interpreter's session for a host, building it once.
+
+    Args:
+        host: Host the session talks to, such as "irvine.granicus.com".
+        pool_size: Connections kept open to the host, enough for the
+            requests the caller sends at once.
+
+    Returns:
+        The same session for every call with these arguments.
+    """
+    # Passed positionally, so every spelling of a call shares one cache entry.
+    return _build_session(host, pool_size)
@@ -0,0 +1,150 @@
+"""Template rendering and change-aware writes for dashboard pages.
+
+Pages are rendered from Jinja2 templates compiled once per process and kept
+as bytecode on disk between runs, so a scheduled run neither re-parses the
+template source nor rebuilds the page by string concatenation.
+
+Every page carries a generation timestamp, so two renders of the same data
+never match byte for byte. Pages are therefore rendered with placeholders
+standing in for the timestamp and for the page's own digest. The digest is
+taken over that stable render and embedded in the page, and a write is
+skipped when the page on disk already carries the same digest: a run whose
+data has not changed leaves the file, the commit history, and the Pages cache
+alone.
+
+Jinja2 is imported when the first template is compiled, not with this module,
+so a run that only probes upstream, or writes a page it already has, does not
+pay for it.
+"""
+
+import hashlib
+import os
+import re
+import time
+from functools import cache
+from pathlib import Path
+from typing import Literal, Protocol, TypedDict
+
+# Stands in for the generation timestamp while the page is rendered and hashed.
+# It must survive JSON and HTML encoding unchanged, so it uses neither quotes,
+# backslashes, nor markup characters.
+GENERATED_AT_MARK = "@@generated-at@@"
+
+# Stands in for the page's own digest. Templates record it near the top of the
+# page as ``<!-- content-digest: {{ content_digest }} -->``, so the next run can
+# compare without re-rendering what is on disk.
+CONTENT_DIGEST_MARK = "@@content-digest@@"
+
+# Only the start of an existing page is read when looking for its digest.
+DIGEST_SEARCH_CHARS = 4096
+
+_DIGEST_PATTERN = re.compile(r"<!-- content-digest: ([0-9a-f]{64}) -->")
+
+
+class PageTemplate(Protocol):
+    """A compiled template, as ``load_template`` returns it."""
+
+    def render(self, **context: object) -> str:
+        """Render the template with the given variables.
+
+        Args:
+            context: Variables the template reads.
+
+        Returns:
+            The rendered page.
+        """
+        ...
+
+
+class PageWrite(TypedDict):
+    """The outcome of writing a rendered page.
+
+    status: "written" if the file was replaced, "unchanged" if it already
+        held the same content apart from its timestamp.
+    digest: Digest of the page's stable content.
+    seconds: Time spent comparing and, when needed, writing.
+    """
+
+    status: Literal["written", "unchanged"]
+    digest: str
+    seconds: float
+
+
+@cache
+def load_template(template_dir: Path, name: str, bytecode_dir: Path) -> PageTemplate:
+    """Compile a template once per process, reusing bytecode between runs.
+
+    Args:
+        template_dir: Directory holding the template source.
+        name: Template file name within that directory.
+        bytecode_dir: Where compiled bytecode is kept; created if absent.
+
+    Returns:
+        The compiled template. Later calls with the same arguments return the
+        same object.
+    """
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+    bytecode_dir.mkdir(parents=True, exist_ok=True)
+    environment = Environment(
+        loader=FileSystemLoader(template_dir),
+        bytecode_cache=FileSystemBytecodeCache(str(bytecode_dir)),
+        autoescape=select_autoescape(default=True),
+        auto_reload=False,
+    )
+    return environment.get_template(name)
+
+
+def content_digest(stable_page: str) -> str:
+    """Hash a page rendered with placeholders.
+
+    Args:
+        stable_page: The page as rendered with the timestamp and digest marks.
+
+    Returns:
+        The hex SHA-256 of the page.
+    """
+    return hashlib.sha256(stable_page.encode("utf-8")).hexdigest()
+
+
+def read_page_digest(path: Path) -> str | None:
+    """Read the digest recorded in a page on disk.
+
+    Args:
+        path: Page to inspect.
+
+    Returns:
+        The recorded digest, or None if the page is absent or carries none.
+    """
+    try:
+        with path.open(encoding="utf-8") as page:
+            head = page.read(DIGEST_SEARCH_CHARS)
+    except FileNotFoundError:
+        return None
+
+    match = _DIGEST_PATTERN.search(head)
+    return match.group(1) if match else None
+
+
+def write_page(path: Path, stable_page: str, generated_at: str) -> PageWrite:
+    """Write a page unless the file already holds the same content.
+
+    Args:
+        path: Page to write.
+        stable_page: The page rendered with ``GENERATED_AT_MARK`` in place of
+            the timestamp and ``CONTENT_DIGEST_MARK`` in place of the digest.
+        generated_at: Timestamp to show in a page that is written.
+
+    Returns:
+        Whether the page was written, its digest, and the time taken.
+    """
+    started = time.perf_counter()
+    digest = content_digest(stable_page)
+    if read_page_digest(path) == digest:
+        return PageWrite(status="unchanged", digest=digest, seconds=time.perf_counter() - started)
+
+    page = stable_page.replace(CONTENT_DIGEST_MARK, digest).replace(GENERATED_AT_MARK, generated_at)
+    staging = path.with_suffix(".tmp")
+    staging.write_text(page, encoding="utf-8")
+    os.replace(staging, path)
+    return PageWrite(status="written", digest=digest, seconds=time.perf_counter() - started)
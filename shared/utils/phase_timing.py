@@ -0,0 +1,280 @@
+"""Phase timings for dashboard generators.
+
+A generator wraps each phase of its run, such as fetch, parse, render and
+write, in a ``span``. Spans with the same name add up, so a phase entered once
+per year or once per page still reports a single total. Phases are meant to
+follow one another; a span opened inside another counts toward both.
+
+Timings reach generate_all in one of two ways. A generator running in its own
+interpreter writes its totals on exit to the file named by ``TIMINGS_ENV``,
+which generate_all sets for it. One running inside generate_all's interpreter
+shares this module, so generate_all resets the totals before the run and reads
+them straight after.
+
+generate_all keeps the report of the previous run and compares each phase
+against it. Like the other caches, a stored report that cannot be read is
+treated as absent.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import NamedTuple, TypedDict
+
+# Environment variable naming the file a generator writes its totals to on exit.
+TIMINGS_ENV = "DASHBOARD_TIMINGS"
+
+# A phase is flagged as slower when it took this many times as long as before...
+SLOWDOWN_RATIO = 1.2
+
+# ...and at least this many seconds longer, so jitter in short phases is ignored.
+SLOWDOWN_FLOOR = 0.5
+
+
+class PhaseTotal(TypedDict):
+    """Time spent in one phase over a run.
+
+    seconds: Total wall time across every span of the phase.
+    count: Number of spans.
+    """
+
+    seconds: float
+    count: int
+
+
+class DashboardTiming(TypedDict):
+    """How one dashboard's turn was spent.
+
+    seconds: Wall time of the whole turn, probe included.
+    status: "ok", "skipped" or "failed".
+    phases: Totals reported by the generator, keyed by phase, in the order
+        each phase was first entered.
+    """
+
+    seconds: float
+    status: str
+    phases: dict[str, PhaseTotal]
+
+
+class TimingReport(TypedDict):
+    """Phase timings for one run of every dashboard.
+
+    generated_at: When the report was produced, as an ISO timestamp.
+    dashboards: Timings keyed by dashboard name.
+    """
+
+    generated_at: str
+    dashboards: dict[str, DashboardTiming]
+
+
+class Slowdown(NamedTuple):
+    """A phase that took noticeably longer than in the previous run.
+
+    dashboard: Dashboard the phase belongs to.
+    phase: Name of the phase.
+    previous: Seconds it took in the previous run.
+    current: Seconds it took in this run.
+    """
+
+    dashboard: str
+    phase: str
+    previous: float
+    current: float
+
+
+_lock = threading.Lock()
+_totals: dict[str, PhaseTotal] = {}
+
+
+@contextmanager
+def span(phase: str, clock: Callable[[], float] = time.perf_counter) -> Iterator[None]:
+    """Time a block as part of a phase.
+
+    The time is recorded even when the block raises, since a failing run is
+    the one most worth diagnosing.
+
+    Args:
+        phase: Name of the phase, such as "fetch" or "render".
+        clock: Monotonic clock in seconds.
+
+    Yields:
+        Nothing; the block is timed while it runs.
+    """
+    started = clock()
+    try:
+        yield
+    finally:
+        seconds = clock() - started
+        with _lock:
+            total = _totals.setdefault(phase, PhaseTotal(seconds=0.0, count=0))
+            total["seconds"] += seconds
+            total["count"] += 1
+
+
+def snapshot() -> dict[str, PhaseTotal]:
+    """Read the totals recorded so far.
+
+    Returns:
+        A copy of each phase's total, in the order the phases were first entered.
+    """
+    with _lock:
+        return {phase: PhaseTotal(seconds=t["seconds"], count=t["count"]) for phase, t in _totals.items()}
+
+
+def reset() -> None:
+    """Forget every total, before a generator runs in this interpreter."""
+    with _lock:
+        _totals.clear()
+
+
+def _decode_phases(payload: object) -> dict[str, PhaseTotal]:
+    """Validate stored phase totals.
+
+    Args:
+        payload: Object parsed from JSON.
+
+    Returns:
+        The totals; empty if the payload is not a mapping, and entries that
+        do not match the expected shape are left out.
+    """
+    if not isinstance(payload, dict):
+        return {}
+    phases: dict[str, PhaseTotal] = {}
+    for phase, value in payload.items():
+        if not isinstance(phase, str) or not isinstance(value, dict):
+            continue
+        seconds = value.get("seconds")
+        count = value.get("count")
+        if isinstance(seconds, int | float) and isinstance(count, int):
+            phases[phase] = PhaseTotal(seconds=float(seconds), count=count)
+    return phases
+
+
+def write_phases(path: Path, phases: dict[str, PhaseTotal]) -> None:
+    """Store phase totals, replacing any earlier ones atomically.
+
+    Args:
+        path: File to write; its directory is created if absent.
+        phases: Totals keyed by phase.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_suffix(".tmp")
+    staging.write_text(json.dumps(phases), encoding="utf-8")
+    os.replace(staging, path)
+
+
+def read_phases(path: Path) -> dict[str, PhaseTotal]:
+    """Read phase totals a generator stored.
+
+    Args:
+        path: File written by ``write_phases``.
+
+    Returns:
+        The totals; empty if the file is absent or not JSON.
+    """
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return _decode_phases(payload)
+
+
+def _flush() -> None:
+    """Write this process's totals where ``TIMINGS_ENV`` says, if it is set."""
+    target = os.environ.get(TIMINGS_ENV)
+    if target:
+        write_phases(Path(target), snapshot())
+
+
+# A generator in its own interpreter hands its totals over as it exits,
+# whether or not it succeeded.
+atexit.register(_flush)
+
+
+def load_report(path: Path) -> TimingReport | None:
+    """Read a stored timing report.
+
+    Args:
+        path: Report file.
+
+    Returns:
+        The report, or None if the file is absent, not JSON, or not shaped
+        like a report. Dashboards that do not match the expected shape are
+        left out.
+    """
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    generated_at = payload.get("generated_at")
+    dashboards = payload.get("dashboards")
+    if not isinstance(generated_at, str) or not isinstance(dashboards, dict):
+        return None
+
+    timings: dict[str, DashboardTiming] = {}
+    for name, value in dashboards.items():
+        if not isinstance(name, str) or not isinstance(value, dict):
+            continue
+        seconds = value.get("seconds")
+        status = value.get("status")
+        if isinstance(seconds, int | float) and isinstance(status, str):
+            timings[name] = DashboardTiming(
+                seconds=float(seconds), status=status, phases=_decode_phases(value.get("phases"))
+            )
+    return TimingReport(generated_at=generated_at, dashboards=timings)
+
+
+def save_report(path: Path, report: TimingReport) -> None:
+    """Store a timing report, replacing any earlier one atomically.
+
+    Args:
+        path: Report file; its directory is created if absent.
+        report: The report.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_suffix(".tmp")
+    staging.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    os.replace(staging, path)
+
+
+def find_slowdowns(
+    previous: TimingReport,
+    current: TimingReport,
+    ratio: float = SLOWDOWN_RATIO,
+    floor: float = SLOWDOWN_FLOOR,
+) -> list[Slowdown]:
+    """Compare every phase against the previous run.
+
+    Only phases present in both runs are compared, so a dashboard that was
+    skipped, or a phase added since, is never flagged.
+
+    Args:
+        previous: The earlier report.
+        current: The report to check.
+        ratio: How many times as long a phase must take to be flagged.
+        floor: How many seconds longer a phase must take to be flagged.
+
+    Returns:
+        Phases that took at least ``ratio`` times as long and ``floor``
+        seconds longer, in the current report's order.
+    """
+    slowdowns: list[Slowdown] = []
+    for name, timing in current["dashboards"].items():
+        before = previous["dashboards"].get(name)
+        if before is None:
+            continue
+        for phase, total in timing["phases"].items():
+            earlier = before["phases"].get(phase)
+            if earlier is None:
+                continue
+            now, then = total["seconds"], earlier["seconds"]
+            if now >= then * ratio and now - then >= floor:
+                slowdowns.append(Slowdown(dashboard=name, phase=phase, previous=then, current=now))
+    return slowdowns
@@ -0,0 +1,596 @@
+"""Local, resized copies of the portraits the dashboards show.
+
+The dashboards list council members and senators with portraits that live on
+city and campus websites, often as multi-megabyte originals shown in a card a
+hundred-odd pixels wide. Linked directly, every visit downloads them in full
+from servers the dashboards do not control.
+
+Instead, each portrait is downloaded once into a content-addressed store: the
+original's bytes are kept under their SHA-256, and a small entry per source
+URL records which original it last served along with the validators the
+server sent, so later runs only ask whether it changed. From each original,
+thumbnails at the dashboard's display size are written as WebP and JPEG into
+the dashboard's own directory. They are named after the original's hash and
+the size, so an unchanged original is never resized again, and a changed one
+gets new names that no browser cache can confuse with the old.
+
+Like the other caches, the store is never a source of truth: a portrait that
+cannot be fetched or decoded keeps linking to its source, and an entry that
+cannot be read is treated as absent.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import NamedTuple, Protocol, TypedDict
+from urllib.parse import urlsplit
+
+from shared.utils.http_cache import cache_key
+from shared.utils.http_sessions import host_session
+
+# Seconds a stored portrait is used before its source is asked again.
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60.0
+
+# Seconds to wait on a portrait's server.
+DOWNLOAD_TIMEOUT = 20.0
+
+# Portraits downloaded at once.
+DEFAULT_WORKERS = 4
+
+# Pixels per CSS pixel in the thumbnails, so they stay sharp on dense screens.
+DENSITY = 2
+
+# Encoder quality of the thumbnails, out of 100.
+WEBP_QUALITY = 80
+JPEG_QUALITY = 82
+
+# Prefix of every file the pipeline writes into a dashboard's directory.
+THUMBNAIL_PREFIX = "portrait-"
+
+
+class DisplaySize(NamedTuple):
+    """The box a dashboard shows a portrait in, in CSS pixels.
+
+    width: Box width.
+    height: Box height.
+    """
+
+    width: int
+    height: int
+
+
+class Portrait(NamedTuple):
+    """A portrait's thumbnails, as URLs relative to the dashboard's page.
+
+    jpeg: JPEG thumbnail, which every browser shows.
+    webp: WebP thumbnail, smaller, for browsers that accept it.
+    """
+
+    jpeg: str
+    webp: str
+
+
+class Download(NamedTuple):
+    """A response to a portrait request.
+
+    status: HTTP status; 304 when the stored original is still current.
+    body: Response bytes, empty for a 304.
+    etag: ``ETag`` the server sent, empty when it sent none.
+    last_modified: ``Last-Modified`` the server sent, empty when it sent none.
+    """
+
+    status: int
+    body: bytes
+    etag: str
+    last_modified: str
+
+
+# Requests a URL with extra headers and returns the response.
+Downloader = Callable[[str, dict[str, str]], Download]
+
+
+class SourceEntry(TypedDict):
+    """What a source URL last served.
+
+    url: The portrait's source URL.
+    sha256: Digest of the original it served, the original's name in the store.
+    etag: ``ETag`` the server sent, empty when it sent none.
+    last_modified: ``Last-Modified`` the server sent, empty when it sent none.
+    stored_at: When the original was last confirmed current, in epoch seconds.
+    """
+
+    url: str
+    sha256: str
+    etag: str
+    last_modified: str
+    stored_at: float
+
+
+class PortraitResponse(Protocol):
+    """The parts of a requests response the downloader reads."""
+
+    @property
+    def status_code(self) -> int:
+        """HTTP status."""
+        ...
+
+    @property
+    def content(self) -> bytes:
+        """Response bytes."""
+        ...
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Response headers."""
+        ...
+
+    def raise_for_status(self) -> None:
+        """Raise for an error status."""
+        ...
+
+
+class PortraitSession(Protocol):
+    """Sends portrait requests, as a ``requests.Session`` does."""
+
+    def get(self, url: str, *, headers: dict[str, str], timeout: float) -> PortraitResponse:
+        """Request a URL.
+
+        Args:
+            url: URL to request.
+            headers: Request headers.
+            timeout: Seconds to wait on the server.
+
+        Returns:
+            The response.
+        """
+        ...
+
+
+def session_downloader(session: PortraitSession, timeout: float = DOWNLOAD_TIMEOUT) -> Downloader:
+    """Download portraits over a requests session.
+
+    Args:
+        session: Session to send the requests on.
+        timeout: Seconds to wait on each server.
+
+    Returns:
+        A downloader that raises for any status other than 200 and 304.
+    """
+
+    def download(url: str, headers: dict[str, str]) -> Download:
+        response = session.get(url, headers=headers, timeout=timeout)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return Download(
+            status=response.status_code,
+            body=response.content if response.status_code != 304 else b"",
+            etag=response.headers.get("ETag", ""),
+            last_modified=response.headers.get("Last-Modified", ""),
+        )
+
+    return download
+
+
+def host_downloader(pool_size: int = DEFAULT_WORKERS, timeout: float = DOWNLOAD_TIMEOUT) -> Downloader:
+    """Download each portrait over the interpreter's shared session for its host.
+
+    Portraits spread over many hosts reuse the connections any other request
+    in the run opened to the same host.
+
+    Args:
+        pool_size: Connections kept open to each host, enough for the
+            portraits downloaded at once.
+        timeout: Seconds to wait on each server.
+
+    Returns:
+        A downloader that raises for any status other than 200 and 304.
+    """
+
+    def download(url: str, headers: dict[str, str]) -> Download:
+        host = urlsplit(url if "://" in url else f"https:{url}").hostname or ""
+        return session_downloader(host_session(host, pool_size), timeout)(url, headers)
+
+    return download
+
+
+def _decode_entry(payload: object) -> SourceEntry | None:
+    """Decode an entry file's contents.
+
+    Args:
+        payload: Object parsed from the file's JSON.
+
+    Returns:
+        The entry, or None if the payload does not match the shape.
+    """
+    if not isinstance(payload, dict):
+        return None
+
+    url = payload.get("url")
+    sha256 = payload.get("sha256")
+    etag = payload.get("etag")
+    last_modified = payload.get("last_modified")
+    stored_at = payload.get("stored_at")
+
+    if not (
+        isinstance(url, str)
+        and isinstance(sha256, str)
+        and isinstance(etag, str)
+        and isinstance(last_modified, str)
+        and isinstance(stored_at, int | float)
+        and not isinstance(stored_at, bool)
+    ):
+        return None
+
+    return SourceEntry(
+        url=url, sha256=sha256, etag=etag, last_modified=last_modified, stored_at=float(stored_at)
+    )
+
+
+def _absolute(url: str) -> str:
+    """Give a protocol-relative URL the https scheme.
+
+    Args:
+        url: Absolute or protocol-relative URL.
+
+    Returns:
+        The absolute URL.
+    """
+    return f"https:{url}" if url.startswith("//") else url
+
+
+def _write_atomically(path: Path, data: bytes) -> None:
+    """Replace a file's contents in one step.
+
+    Args:
+        path: File to write; its directory must exist.
+        data: New contents.
+    """
+    staging = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    staging.write_bytes(data)
+    os.replace(staging, path)
+
+
+def thumbnail_size(original: tuple[int, int], size: DisplaySize) -> tuple[int, int]:
+    """Choose a thumbnail's pixel size.
+
+    The thumbnail has the box's proportions at ``DENSITY`` pixels per CSS
+    pixel, shrunk as needed so the original is never enlarged.
+
+    Args:
+        original: The original's width and height in pixels.
+        size: Box the portrait is shown in.
+
+    Returns:
+        Width and height in pixels, each at least one.
+    """
+    width, height = size.width * DENSITY, size.height * DENSITY
+    scale = min(1.0, original[0] / width, original[1] / height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def render_thumbnails(original: bytes, size: DisplaySize) -> tuple[bytes, bytes]:
+    """Crop and shrink an original to fill a box, as the pages' CSS does.
+
+    The pages show portraits with ``object-fit: cover`` anchored at the top,
+    so the crop keeps the full width or height and the top of the image.
+
+    Args:
+        original: The original image's bytes, in any format Pillow reads.
+        size: Box the portrait is shown in.
+
+    Returns:
+        The JPEG and WebP thumbnails' bytes.
+
+    Raises:
+        OSError: If the bytes are not an image Pillow can read.
+    """
+    # Imported here so generators that never resize do not pay for Pillow.
+    from PIL import Image, ImageOps
+
+    with Image.open(BytesIO(original)) as opened:
+        image: Image.Image = ImageOps.exif_transpose(opened).convert("RGBA")
+    fitted = ImageOps.fit(
+        image, thumbnail_size(image.size, size), method=Image.Resampling.LANCZOS, centering=(0.5, 0.0)
+    )
+
+    webp = BytesIO()
+    fitted.save(webp, format="WEBP", quality=WEBP_QUALITY, method=6)
+
+    # JPEG has no transparency, so transparent areas are shown on white.
+    flat = Image.new("RGB", fitted.size, "white")
+    flat.paste(fitted, mask=fitted.getchannel("A"))
+    jpeg = BytesIO()
+    flat.save(jpeg, format="JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+
+    return jpeg.getvalue(), webp.getvalue()
+
+
+class PortraitPipeline:
+    """Stores portraits once and writes thumbnails for one dashboard.
+
+    Safe to share between threads; ``localize_photos`` downloads several
+    portraits at once through one pipeline.
+    """
+
+    def __init__(
+        self,
+        store: Path,
+        output: Path,
+        size: DisplaySize,
+        download: Downloader,
+        url_prefix: str = "portraits/",
+        max_age: float = DEFAULT_MAX_AGE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Configure the pipeline.
+
+        Args:
+            store: Directory of originals and source entries, shared between
+                dashboards and runs; created on first use.
+            output: Directory in the dashboard the thumbnails are written to.
+            size: Box the dashboard shows portraits in.
+            download: Fetches a portrait's source.
+            url_prefix: Path from the dashboard's page to ``output``.
+            max_age: Seconds a stored original is used before its source is
+                asked again.
+            clock: Source of the current time in epoch seconds.
+        """
+        self.store = store
+        self.output = output
+        self.size = size
+        self.url_prefix = url_prefix
+        self.max_age = max_age
+        self._download = download
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.written: set[str] = set()
+        self.outcomes = {"fetched": 0, "revalidated": 0, "fresh": 0, "rendered": 0, "failed": 0}
+
+    def _count(self, outcome: str) -> None:
+        """Tally one outcome.
+
+        Args:
+            outcome: Key of ``outcomes``.
+        """
+        with self._lock:
+            self.outcomes[outcome] += 1
+
+    def _entry_path(self, url: str) -> Path:
+        """Locate a source URL's entry.
+
+        Args:
+            url: Source URL.
+
+        Returns:
+            The entry file's path.
+        """
+        return self.store / "sources" / f"{cache_key(url, {})}.json"
+
+    def _original_path(self, sha256: str) -> Path:
+        """Locate an original.
+
+        Args:
+            sha256: The original's digest.
+
+        Returns:
+            The original's path.
+        """
+        return self.store / "originals" / sha256
+
+    def _lookup(self, url: str) -> SourceEntry | None:
+        """Read a source URL's entry, if its original is still stored.
+
+        Args:
+            url: Source URL.
+
+        Returns:
+            The entry, or None if absent, unreadable, or missing its original.
+            An unreadable entry is removed.
+        """
+        path = self._entry_path(url)
+        try:
+            entry = _decode_entry(json.loads(path.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError:
+            entry = None
+
+        if entry is None:
+            path.unlink(missing_ok=True)
+            return None
+        if not self._original_path(entry["sha256"]).is_file():
+            return None
+        return entry
+
+    def _save(self, url: str, download: Download, sha256: str) -> None:
+        """Record what a source URL served.
+
+        Args:
+            url: Source URL.
+            download: The response that confirmed or delivered the original.
+            sha256: Digest of the original.
+        """
+        entry = SourceEntry(
+            url=url,
+            sha256=sha256,
+            etag=download.etag,
+            last_modified=download.last_modified,
+            stored_at=self._clock(),
+        )
+        path = self._entry_path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomically(path, json.dumps(entry).encode("utf-8"))
+
+    def _original(self, url: str) -> str:
+        """Bring a source's original into the store.
+
+        A stored original younger than ``max_age`` is used without asking
+        the server; an older one is revalidated. When the server cannot be
+        reached, a stored original is used regardless of age.
+
+        Args:
+            url: Source URL.
+
+        Returns:
+            The original's digest.
+
+        Raises:
+            Exception: Whatever the downloader raises, when nothing is stored.
+        """
+        entry = self._lookup(url)
+        if entry is not None and self._clock() - entry["stored_at"] < self.max_age:
+            self._count("fresh")
+            return entry["sha256"]
+
+        headers: dict[str, str] = {}
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            download = self._download(url, headers)
+        except Exception:
+            if entry is None:
+                raise
+            self._count("fresh")
+            return entry["sha256"]
+
+        if download.status == 304 and entry is not None:
+            self._save(url, download, entry["sha256"])
+            self._count("revalidated")
+            return entry["sha256"]
+
+        sha256 = hashlib.sha256(download.body).hexdigest()
+        original = self._original_path(sha256)
+        if not original.is_file():
+            original.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomically(original, download.body)
+        self._save(url, download, sha256)
+        self._count("fetched")
+        return sha256
+
+    def _thumbnails(self, sha256: str) -> Portrait:
+        """Write an original's thumbnails unless they are already written.
+
+        Args:
+            sha256: The original's digest.
+
+        Returns:
+            The thumbnails' URLs.
+
+        Raises:
+            OSError: If the original is not an image Pillow can read.
+        """
+        stem = f"{THUMBNAIL_PREFIX}{sha256[:16]}-{self.size.width}x{self.size.height}"
+        jpeg_name, webp_name = f"{stem}.jpg", f"{stem}.webp"
+        jpeg_path, webp_path = self.output / jpeg_name, self.output / webp_name
+
+        if not (jpeg_path.is_file() and webp_path.is_file()):
+            jpeg, webp = render_thumbnails(self._original_path(sha256).read_bytes(), self.size)
+            self.output.mkdir(parents=True, exist_ok=True)
+            _write_atomically(jpeg_path, jpeg)
+            _write_atomically(webp_path, webp)
+            self._count("rendered")
+
+        with self._lock:
+            self.written.update((jpeg_name, webp_name))
+        return Portrait(jpeg=self.url_prefix + jpeg_name, webp=self.url_prefix + webp_name)
+
+    def localize(self, url: str) -> Portrait | None:
+        """Give a portrait local thumbnails.
+
+        Args:
+            url: The portrait's source URL, absolute or protocol-relative.
+
+        Returns:
+            The thumbnails' URLs, or None if the portrait could not be fetched
+            or read, in which case the source URL should be kept.
+        """
+        try:
+            return self._thumbnails(self._original(_absolute(url)))
+        except Exception:  # noqa: BLE001 - any failure keeps the source URL
+            self._count("failed")
+            return None
+
+    def describe(self) -> str:
+        """Summarise the outcomes so far for a run log.
+
+        Returns:
+            A one-line tally of portraits fetched, revalidated, reused,
+            resized and failed.
+        """
+        outcomes = self.outcomes
+        return (
+            f"{outcomes['fetched']} fetched, {outcomes['revalidated']} revalidated, "
+            f"{outcomes['fresh']} reused, {outcomes['rendered']} resized, {outcomes['failed']} failed"
+        )
+
+    def prune(self) -> list[Path]:
+        """Remove thumbnails this pipeline did not write or reuse.
+
+        Call once every portrait has been localized, so thumbnails of
+        portraits that were replaced or dropped do not accumulate.
+
+        Returns:
+            The files removed.
+        """
+        removed: list[Path] = []
+        if not self.output.is_dir():
+            return removed
+        for path in sorted(self.output.glob(f"{THUMBNAIL_PREFIX}*")):
+            if path.name not in self.written:
+                path.unlink()
+                removed.append(path)
+        return removed
+
+
+def localize_photos(
+    records: Iterable[MutableMapping[str, object]],
+    pipeline: PortraitPipeline,
+    field: str = "photo",
+    webp_field: str = "photo_webp",
+    workers: int = DEFAULT_WORKERS,
+) -> int:
+    """Point records at local thumbnails instead of their source portraits.
+
+    Each record whose ``field`` holds an absolute or protocol-relative URL has
+    it replaced with the JPEG thumbnail, and the WebP thumbnail set under
+    ``webp_field``. Records without a URL, and portraits that could not be
+    localized, are left as they are.
+
+    Args:
+        records: Records to rewrite in place.
+        pipeline: Pipeline writing the thumbnails.
+        field: Key holding the portrait URL.
+        webp_field: Key the WebP thumbnail is written to.
+        workers: Portraits downloaded at once.
+
+    Returns:
+        Number of records rewritten.
+    """
+    pending = [
+        record
+        for record in records
+        if isinstance(url := record.get(field), str) and url.startswith(("http://", "https://", "//"))
+    ]
+    # Spellings of one URL are localized once, so no two workers store it.
+    urls = sorted({_absolute(str(record[field])) for record in pending})
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        portraits = dict(zip(urls, executor.map(pipeline.localize, urls), strict=True))
+
+    rewritten = 0
+    for record in pending:
+        portrait = portraits[_absolute(str(record[field]))]
+        if portrait is not None:
+            record[field] = portrait.jpeg
+            record[webp_field] = portrait.webp
+            rewritten += 1
+    return rewritten
@@ -3,6 +3,11 @@
 The payloads under ``tests/fixtures`` are verbatim captures from the live
 sites. Tests run the real decoding and parsing code against them, so a change
 in the upstream shape shows up here rather than in production.
+
+The Irvine pages are the exception: they were rebuilt offline in the markup
+the city's Granicus listing, agenda viewer and City Council page use, filled
+with the meetings and members the published dashboard last read from them.
+Replace them with captures when the sites are next fetched.
 """
 
 from pathlib import Path
@@ -40,3 +45,33 @@ def minutes_view_json() -> str:
         The raw JSON body.
     """
     return (FIXTURES / "view_minutes_20242025.json").read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def granicus_listing_html() -> str:
+    """Irvine's Granicus ViewPublisher listing, rebuilt from published meetings.
+
+    Returns:
+        The markup of an upcoming table and an archive of council meetings.
+    """
+    return (FIXTURES / "granicus_viewpublisher.html").read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def irvine_agenda_html() -> str:
+    """An Irvine council agenda as the Granicus agenda viewer serves it.
+
+    Returns:
+        The agenda's markup.
+    """
+    return (FIXTURES / "irvine_agenda.html").read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def irvine_council_html() -> str:
+    """The Irvine City Council page listing the members.
+
+    Returns:
+        The markup of cityofirvine.gov/city-council.
+    """
+    return (FIXTURES / "irvine_council.html").read_text(encoding="utf-8")
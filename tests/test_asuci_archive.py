@@ -0,0 +1,308 @@
+"""Tests for the incremental ASUCI archive.
+
+Snapshots are written to a temporary directory and the views are served from
+the captured payloads, so these check which years reach the network on each
+run as well as what the assembled archive holds.
+"""
+
+import json
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from asuci.archive import (
+    archive_fingerprint,
+    is_live,
+    load_snapshot,
+    needs_refresh,
+    refresh_archive,
+    save_snapshot,
+    snapshot_path,
+)
+from asuci.client import AsuciFetchError
+from asuci.models import AGENDA_VIEW_ID, MINUTES_VIEW_ID, AsuciDecodeError, YearSnapshot
+
+# A moment when 25-26 is live and every earlier year has settled.
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+YEARS = ("25-26", "24-25", "23-24")
+
+
+class YearFetcher:
+    """Fetcher serving the captured views for any year and recording requests."""
+
+    def __init__(self, agendas: str, minutes: str) -> None:
+        """Store the bodies to serve.
+
+        Args:
+            agendas: Body to return for the agenda view.
+            minutes: Body to return for the minutes view.
+        """
+        self.agendas = agendas
+        self.minutes = minutes
+        self.years: list[str] = []
+
+    def get_text(self, url: str, params: dict[str, str]) -> str:
+        """Serve the view body for a URL.
+
+        Args:
+            url: Absolute URL being requested.
+            params: Query parameters for the request.
+
+        Returns:
+            The captured body.
+
+        Raises:
+            AsuciFetchError: If the URL is not a known view.
+        """
+        self.years.append(params["year"])
+        if url.endswith(str(AGENDA_VIEW_ID)):
+            return self.agendas
+        if url.endswith(str(MINUTES_VIEW_ID)):
+            return self.minutes
+        raise AsuciFetchError(f"unexpected URL {url}")
+
+
+@pytest.fixture
+def fetcher(agendas_view_json: str, minutes_view_json: str) -> YearFetcher:
+    """A fetcher serving the captured 24-25 views for every year.
+
+    Args:
+        agendas_view_json: Captured agenda view body.
+        minutes_view_json: Captured minutes view body.
+
+    Returns:
+        The fetcher.
+    """
+    return YearFetcher(agendas_view_json, minutes_view_json)
+
+
+def _snapshot(
+    year: str, fetched_at: str = "2026-02-20T00:00:00+00:00", payload_hash: str = "h"
+) -> YearSnapshot:
+    """Build a small snapshot.
+
+    Args:
+        year: Academic year label.
+        fetched_at: When it was read.
+        payload_hash: Hash of the payloads it was read from.
+
+    Returns:
+        The snapshot.
+    """
+    return YearSnapshot(
+        year=year,
+        agendas=[{"date": "May 1, 2024", "iso_date": "2024-05-01", "url": "https://x.test/a"}],
+        minutes=[],
+        payload_hash=payload_hash,
+        fetched_at=fetched_at,
+    )
+
+
+def test_is_live_holds_through_the_settling_date() -> None:
+    """A year stays live through September 30 of its closing calendar year."""
+    assert is_live("24-25", date(2025, 9, 30))
+    assert not is_live("24-25", date(2025, 10, 1))
+
+
+def test_is_live_holds_for_a_year_not_yet_started() -> None:
+    """A future year can only gain documents."""
+    assert is_live("26-27", date(2026, 3, 1))
+
+
+def test_is_live_rejects_a_malformed_label() -> None:
+    """A label that is not two two-digit years is an error."""
+    with pytest.raises(ValueError, match="academic year label"):
+        is_live("2024", date(2026, 3, 1))
+
+
+def test_save_then_load_round_trips(tmp_path: Path) -> None:
+    """A stored snapshot reads back unchanged."""
+    snapshot = _snapshot("24-25")
+
+    save_snapshot(tmp_path, snapshot)
+
+    assert load_snapshot(tmp_path, "24-25") == snapshot
+
+
+def test_load_snapshot_returns_none_when_absent(tmp_path: Path) -> None:
+    """A year never read has no snapshot."""
+    assert load_snapshot(tmp_path, "24-25") is None
+
+
+def test_load_snapshot_rejects_a_non_json_file(tmp_path: Path) -> None:
+    """A truncated snapshot is reported, not silently refetched."""
+    snapshot_path(tmp_path, "24-25").write_text("{", encoding="utf-8")
+
+    with pytest.raises(AsuciDecodeError, match="is not JSON"):
+        load_snapshot(tmp_path, "24-25")
+
+
+def test_load_snapshot_rejects_a_misfiled_year(tmp_path: Path) -> None:
+    """A snapshot stored under another year's name is reported."""
+    save_snapshot(tmp_path, _snapshot("23-24"))
+    snapshot_path(tmp_path, "23-24").rename(snapshot_path(tmp_path, "24-25"))
+
+    with pytest.raises(AsuciDecodeError, match="holds year '23-24'"):
+        load_snapshot(tmp_path, "24-25")
+
+
+def test_load_snapshot_treats_an_earlier_format_as_absent(tmp_path: Path) -> None:
+    """A snapshot from before the current format is read again, not reported."""
+    save_snapshot(tmp_path, _snapshot("24-25"))
+    path = snapshot_path(tmp_path, "24-25")
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    del payload["format"]
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    assert load_snapshot(tmp_path, "24-25") is None
+
+
+def test_needs_refresh_for_a_missing_snapshot() -> None:
+    """A settled year without a snapshot must be read."""
+    assert needs_refresh("23-24", None, NOW, timedelta(days=30))
+
+
+def test_needs_refresh_for_a_live_year() -> None:
+    """A live year is read however fresh its snapshot."""
+    assert needs_refresh("25-26", _snapshot("25-26", NOW.isoformat()), NOW, timedelta(days=30))
+
+
+def test_needs_refresh_only_once_a_settled_snapshot_ages() -> None:
+    """A settled year is reused until its snapshot reaches the threshold."""
+    young = _snapshot("23-24", (NOW - timedelta(days=29)).isoformat())
+    old = _snapshot("23-24", (NOW - timedelta(days=30)).isoformat())
+
+    assert not needs_refresh("23-24", young, NOW, timedelta(days=30))
+    assert needs_refresh("23-24", old, NOW, timedelta(days=30))
+
+
+def test_needs_refresh_rejects_a_malformed_timestamp() -> None:
+    """A snapshot whose timestamp cannot be read is reported."""
+    with pytest.raises(AsuciDecodeError, match="must be an ISO timestamp"):
+        needs_refresh("23-24", _snapshot("23-24", "yesterday"), NOW, timedelta(days=30))
+
+
+def test_needs_refresh_rejects_a_naive_timestamp() -> None:
+    """A timestamp without an offset cannot be compared safely."""
+    with pytest.raises(AsuciDecodeError, match="must carry a UTC offset"):
+        needs_refresh("23-24", _snapshot("23-24", "2026-02-20T00:00:00"), NOW, timedelta(days=30))
+
+
+def test_refresh_archive_reads_every_year_the_first_time(fetcher: YearFetcher, tmp_path: Path) -> None:
+    """With no snapshots, every year is read and stored."""
+    refresh = refresh_archive(fetcher, tmp_path, NOW, years=YEARS)
+
+    assert refresh["refreshed"] == list(YEARS)
+    assert refresh["changed"] == list(YEARS)
+    assert refresh["reused"] == []
+    assert list(refresh["links"]["agendas"]) == list(YEARS)
+    assert all(snapshot_path(tmp_path, year).is_file() for year in YEARS)
+
+
+def test_refresh_archive_then_reads_only_the_live_year(fetcher: YearFetcher, tmp_path: Path) -> None:
+    """A second run reads the live year alone and reuses the settled ones."""
+    first = refresh_archive(fetcher, tmp_path, NOW, years=YEARS)
+    fetcher.years.clear()
+
+    second = refresh_archive(fetcher, tmp_path, NOW + timedelta(days=1), years=YEARS)
+
+    assert fetcher.years == ["20252026", "20252026"]
+    assert second["refreshed"] == ["25-26"]
+    assert second["changed"] == []
+    assert second["reused"] == ["24-25", "23-24"]
+    assert second["links"] == first["links"]
+
+
+def test_refresh_archive_reports_a_changed_payload(fetcher: YearFetcher, tmp_path: Path) -> None:
+    """A live year whose upstream body moved is reported as changed."""
+    refresh_archive(fetcher, tmp_path, NOW, years=YEARS)
+    fetcher.minutes = fetcher.minutes.replace("June", "July", 1)
+
+    refresh = refresh_archive(fetcher, tmp_path, NOW, years=YEARS)
+
+    assert refresh["changed"] == ["25-26"]
+
+
+def test_refresh_archive_rereads_a_stale_settled_year(fetcher: YearFetcher, tmp_path: Path) -> None:
+    """A settled year is read again once its snapshot passes the threshold."""
+    refresh_archive(fetcher, tmp_path, NOW, years=YEARS)
+    fetcher.years.clear()
+
+    refresh = refresh_archive(
+        fetcher, tmp_path, NOW + timedelta(days=2), years=YEARS, max_age=timedelta(days=1)
+    )
+
+    assert refresh["refreshed"] == list(YEARS)
+
+
+def test_refresh_archive_full_ignores_damaged_snapshots(fetcher: YearFetcher, tmp_path: Path) -> None:
+    """A full rebuild reads every year without reading, and so replaces, the snapshots."""
+    refresh_archive(fetcher, tmp_path, NOW, years=YEARS)
+    snapshot_path(tmp_path, "23-24").write_text("{", encoding="utf-8")
+
+    refresh = refresh_archive(fetcher, tmp_path, NOW, years=YEARS, full=True, workers=4)
+
+    assert refresh["refreshed"] == list(YEARS)
+    assert load_snapshot(tmp_path, "23-24") is not None
+
+
+def test_refresh_archive_keeps_year_order_across_sources(fetcher: YearFetcher, tmp_path: Path) -> None:
+    """Reused and refetched years are assembled newest first."""
+    save_snapshot(tmp_path, _snapshot("24-25", NOW.isoformat()))
+
+    refresh = refresh_archive(fetcher, tmp_path, NOW, years=YEARS)
+
+    assert list(refresh["links"]["agendas"]) == list(YEARS)
+    assert refresh["links"]["agendas"]["24-25"] == [
+        {"date": "May 1, 2024", "iso_date": "2024-05-01", "url": "https://x.test/a"}
+    ]
+    assert "24-25" not in refresh["links"]["minutes"]
+    assert [archive["year"] for archive in refresh["archives"]] == list(YEARS)
+
+
+def test_refresh_archive_writes_nothing_when_a_request_fails(tmp_path: Path) -> None:
+    """A failed run leaves the snapshots as they were."""
+    failing = YearFetcher("<html>blocked</html>", "<html>blocked</html>")
+
+    with pytest.raises(AsuciDecodeError, match="body is not JSON"):
+        refresh_archive(failing, tmp_path, NOW, years=YEARS)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_refresh_archive_rejects_a_naive_clock(fetcher: YearFetcher, tmp_path: Path) -> None:
+    """The current time must carry an offset to be stored and compared."""
+    with pytest.raises(ValueError, match="timezone-aware"):
+        refresh_archive(fetcher, tmp_path, datetime(2026, 3, 1), years=YEARS)
+
+
+def test_archive_fingerprint_matches_until_upstream_moves(fetcher: YearFetcher, tmp_path: Path) -> None:
+    """The fingerprint reads only what a refresh would, and follows its payloads."""
+    refresh_archive(fetcher, tmp_path, NOW, years=YEARS)
+    fetcher.years.clear()
+
+    unchanged = archive_fingerprint(fetcher, tmp_path, NOW, years=YEARS)
+    again = archive_fingerprint(fetcher, tmp_path, NOW, years=YEARS)
+    fetcher.minutes = fetcher.minutes.replace("June", "July", 1)
+    moved = archive_fingerprint(fetcher, tmp_path, NOW, years=YEARS)
+
+    assert fetcher.years == ["20252026"] * 6
+    assert unchanged == again != moved
+    assert load_snapshot(tmp_path, "25-26") is not None
+    assert refresh_archive(fetcher, tmp_path, NOW, years=YEARS)["changed"] == ["25-26"]
+
+
+def test_archive_fingerprint_rejects_a_naive_clock(fetcher: YearFetcher, tmp_path: Path) -> None:
+    """The current time must carry an offset to judge which years are live."""
+    with pytest.raises(ValueError, match="timezone-aware"):
+        archive_fingerprint(fetcher, tmp_path, datetime(2026, 3, 1), years=YEARS)
+
+
+def test_saved_snapshot_is_readable_json(tmp_path: Path) -> None:
+    """Snapshots are plain JSON with the documented fields."""
+    save_snapshot(tmp_path, _snapshot("24-25"))
+
+    payload = json.loads(snapshot_path(tmp_path, "24-25").read_text(encoding="utf-8"))
+
+    assert set(payload) == {"format", "year", "fetched_at", "payload_hash", "agendas", "minutes"}
@@ -6,17 +6,22 @@ errors propagate with a message naming what went wrong, rather than being
 turned into empty results.
 """
 
+import threading
 from pathlib import Path
 
 import pytest
 from asuci.client import (
     SENATE_URL,
+    VIEW_URL,
     AsuciFetchError,
+    InstrumentedFetcher,
     create_ssl_context,
+    fetch_archive_years,
     fetch_meeting_links,
     fetch_roster,
     fetch_view_links,
 )
+from asuci.metrics import MetricsRecorder
 from asuci.models import (
     AGENDA_VIEW_ID,
     AGENDA_VIEW_SLUG,
@@ -84,6 +89,67 @@ class FailingFetcher:
         raise AsuciFetchError(f"GET {url} failed: host unreachable")
 
 
+class GatedFetcher:
+    """Fetcher that holds every request until a set number are in flight at once."""
+
+    def __init__(self, inner: RecordedFetcher, parties: int) -> None:
+        """Wrap a fetcher behind a barrier.
+
+        Args:
+            inner: Fetcher that serves the bodies once the barrier opens.
+            parties: Requests that must be in flight together before any returns.
+        """
+        self._inner = inner
+        self._barrier = threading.Barrier(parties, timeout=10)
+
+    def get_text(self, url: str, params: dict[str, str]) -> str:
+        """Wait for the other requests, then serve the body.
+
+        Args:
+            url: Absolute URL being requested.
+            params: Query parameters for the request.
+
+        Returns:
+            The captured body.
+        """
+        self._barrier.wait()
+        return self._inner.get_text(url, params)
+
+
+class OrderedFailureFetcher:
+    """Fetcher whose later request fails before its earlier one does."""
+
+    def __init__(self, inner: RecordedFetcher) -> None:
+        """Wrap a fetcher that serves every request not chosen to fail.
+
+        Args:
+            inner: Fetcher serving the successful requests.
+        """
+        self._inner = inner
+        self._later_failed = threading.Event()
+
+    def get_text(self, url: str, params: dict[str, str]) -> str:
+        """Fail the 23-24 minutes read only after the 22-23 agenda read fails.
+
+        Args:
+            url: Absolute URL being requested.
+            params: Query parameters for the request.
+
+        Returns:
+            The captured body for every other request.
+
+        Raises:
+            AsuciFetchError: For the two chosen requests.
+        """
+        if params == {"year": "20222023"} and url.endswith(str(AGENDA_VIEW_ID)):
+            self._later_failed.set()
+            raise AsuciFetchError("later request failed")
+        if params == {"year": "20232024"} and url.endswith(str(MINUTES_VIEW_ID)):
+            self._later_failed.wait(timeout=10)
+            raise AsuciFetchError("earlier request failed")
+        return self._inner.get_text(url, params)
+
+
 @pytest.fixture
 def fetcher(roster_html: str, agendas_view_json: str, minutes_view_json: str) -> RecordedFetcher:
     """A fetcher serving all three captured payloads.
@@ -193,6 +259,127 @@ def test_fetch_meeting_links_propagates_a_transport_failure() -> None:
         fetch_meeting_links(FailingFetcher(), years=("24-25",))
 
 
+def test_fetch_meeting_links_concurrently_matches_a_sequential_read(fetcher: RecordedFetcher) -> None:
+    """Reading with several workers yields the same archive, in the same year order."""
+    years = ("24-25", "23-24", "22-23")
+
+    sequential = fetch_meeting_links(fetcher, years=years)
+    concurrent = fetch_meeting_links(fetcher, years=years, workers=4)
+
+    assert concurrent == sequential
+    assert list(concurrent["agendas"]) == list(years)
+    assert list(concurrent["minutes"]) == list(years)
+
+
+def test_fetch_meeting_links_keeps_every_request_in_flight_at_once(fetcher: RecordedFetcher) -> None:
+    """With a worker per request, no request waits for another to finish."""
+    years = ("24-25", "23-24", "22-23")
+    gated = GatedFetcher(fetcher, parties=2 * len(years))
+
+    links = fetch_meeting_links(gated, years=years, workers=2 * len(years))
+
+    assert list(links["agendas"]) == list(years)
+
+
+def test_fetch_meeting_links_concurrently_reports_the_earliest_failure(fetcher: RecordedFetcher) -> None:
+    """The error raised is the first in year order, not the first to happen."""
+    failing = OrderedFailureFetcher(fetcher)
+
+    with pytest.raises(AsuciFetchError, match="earlier request failed"):
+        fetch_meeting_links(failing, years=("24-25", "23-24", "22-23"), workers=6)
+
+
+def test_fetch_meeting_links_concurrently_reads_no_years(fetcher: RecordedFetcher) -> None:
+    """An empty year list makes no requests, whatever the worker count."""
+    links = fetch_meeting_links(fetcher, years=(), workers=4)
+
+    assert links == {"agendas": {}, "minutes": {}}
+    assert fetcher.calls == []
+
+
+def test_fetch_meeting_links_rejects_fewer_than_one_worker(fetcher: RecordedFetcher) -> None:
+    """A worker count below one is a caller error."""
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+        fetch_meeting_links(fetcher, years=("24-25",), workers=0)
+
+
+def test_fetch_archive_years_keeps_empty_years(roster_html: str) -> None:
+    """Per-year reads report a year that publishes nothing rather than dropping it."""
+    empty = '{"id": 1620, "slug": "asuci-public-senate-agenda-homepage-view", "renderedHtml": "<p>None.</p>"}'
+    empty_minutes = (
+        '{"id": 1694, "slug": "asuci-public-council-minutes-view", "renderedHtml": "<p>None.</p>"}'
+    )
+
+    archives = fetch_archive_years(RecordedFetcher(roster_html, empty, empty_minutes), years=("24-25",))
+
+    assert [(a["year"], a["agendas"], a["minutes"]) for a in archives] == [("24-25", [], [])]
+
+
+def test_fetch_archive_years_hashes_the_payloads(fetcher: RecordedFetcher, roster_html: str) -> None:
+    """The payload hash is stable for identical bodies and moves when either changes."""
+    first = fetch_archive_years(fetcher, years=("24-25", "23-24"))
+    moved = RecordedFetcher(roster_html, fetcher._agendas, fetcher._minutes.replace("June", "July", 1))
+    changed = fetch_archive_years(moved, years=("24-25",))
+
+    assert first[0]["payload_hash"] == first[1]["payload_hash"]
+    assert len(first[0]["payload_hash"]) == 64
+    assert changed[0]["payload_hash"] != first[0]["payload_hash"]
+
+
+def test_instrumented_fetcher_records_a_captured_payload_request(fetcher: RecordedFetcher) -> None:
+    """A fetcher that notes nothing is recorded with its body size and no connection."""
+    recorder = MetricsRecorder()
+    instrumented = InstrumentedFetcher(fetcher, recorder)
+
+    body = instrumented.get_text(SENATE_URL, {})
+
+    (record,) = recorder.report("now")["requests"]
+    assert record["endpoint"] == SENATE_URL
+    assert record["bytes"] == len(body.encode("utf-8"))
+    assert (record["status"], record["connection"], record["error"]) == (None, "none", "")
+
+
+def test_instrumented_fetcher_records_and_reraises_a_failure() -> None:
+    """A failing request is recorded with its message, then still raised."""
+    recorder = MetricsRecorder()
+
+    with pytest.raises(AsuciFetchError, match="host unreachable"):
+        InstrumentedFetcher(FailingFetcher(), recorder).get_text(SENATE_URL, {})
+
+    (record,) = recorder.report("now")["requests"]
+    assert "host unreachable" in record["error"]
+    assert record["connection"] == "none"
+
+
+def test_fetch_view_links_records_decode_and_parse_times(fetcher: RecordedFetcher) -> None:
+    """Reading a view through an instrumented fetcher times its decode and parse."""
+    recorder = MetricsRecorder()
+
+    links = fetch_view_links(
+        InstrumentedFetcher(fetcher, recorder), AGENDA_VIEW_ID, AGENDA_VIEW_SLUG, "24-25"
+    )
+
+    report = recorder.report("now")
+    endpoint = VIEW_URL.format(view_id=AGENDA_VIEW_ID)
+    assert links == fetch_view_links(fetcher, AGENDA_VIEW_ID, AGENDA_VIEW_SLUG, "24-25")
+    assert [record["endpoint"] for record in report["parses"]] == [endpoint]
+    assert report["parses"][0]["parse_seconds"] > 0
+    assert report["endpoints"][endpoint]["parse_seconds_p50"] > 0
+
+
+def test_fetch_view_links_records_no_parse_for_an_undecodable_body(roster_html: str) -> None:
+    """A body that fails to decode is recorded as a request but not as a parse."""
+    recorder = MetricsRecorder()
+    instrumented = InstrumentedFetcher(RecordedFetcher(roster_html, roster_html, roster_html), recorder)
+
+    with pytest.raises(AsuciDecodeError):
+        fetch_view_links(instrumented, AGENDA_VIEW_ID, AGENDA_VIEW_SLUG, "24-25")
+
+    report = recorder.report("now")
+    assert len(report["requests"]) == 1
+    assert report["parses"] == []
+
+
 def test_create_ssl_context_trusts_the_chain_completion_cert() -> None:
     """The context loads the vendored cross-signed certificate."""
     context = create_ssl_context()
@@ -0,0 +1,341 @@
+"""Tests for harvesting document text into year shards.
+
+Documents are served by a local HTTP server through the real RequestsFetcher,
+so conditional requests, failures, and the reuse of stored documents are
+exercised as they run in production.
+"""
+
+import gzip
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+import requests
+from asuci.client import RequestsFetcher
+from asuci.harvest import (
+    DocumentStore,
+    build_text_shard,
+    document_urls,
+    harvest_archive,
+    harvest_documents,
+    index_tokens,
+    read_shard_fingerprint,
+    shard_path,
+    write_shard,
+    write_year_shards,
+    year_documents,
+)
+from asuci.models import DocumentRecord, MeetingLink, YearArchive
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves printable documents with an ETag, answering 304 when it returns.
+
+    /missing answers 404 and /not-modified answers 304 unconditionally. Every
+    request is counted.
+    """
+
+    bodies: ClassVar[dict[str, str]] = {}
+    requests_seen: ClassVar[list[str]] = []
+
+    def do_GET(self) -> None:
+        """Answer a GET request."""
+        self.requests_seen.append(self.path)
+        if self.path.startswith("/missing"):
+            self.send_response(404)
+            self.end_headers()
+            return
+        if self.path.startswith("/not-modified"):
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = self.bodies.get(self.path, "<p>Empty</p>")
+        etag = f'"{abs(hash(body))}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        encoded = body.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Silence the default request logging."""
+
+
+@pytest.fixture
+def server() -> Iterator[str]:
+    """Run a local HTTP server for the duration of a test.
+
+    Yields:
+        The server's base URL.
+    """
+    _Handler.bodies = {
+        "/a1": "<html><body><h1>Agenda</h1><p>Parking fees and the budget</p></body></html>",
+        "/m1": "<html><body><p>Minutes: parking approved</p><script>var x = 1;</script></body></html>",
+    }
+    _Handler.requests_seen = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def _archive(base: str, year: str = "24-25") -> YearArchive:
+    """Build a year linking one agenda and one set of minutes on the server.
+
+    Args:
+        base: The server's base URL.
+        year: Academic year label.
+
+    Returns:
+        The archive.
+    """
+    return YearArchive(
+        year=year,
+        agendas=[MeetingLink(date="June 5, 2025", iso_date="2025-06-05", url=f"{base}/a1")],
+        minutes=[MeetingLink(date="June 12, 2025", iso_date="2025-06-12", url=f"{base}/m1")],
+        payload_hash="h",
+    )
+
+
+def _record(url: str, text: str) -> DocumentRecord:
+    """Build a stored document without validators.
+
+    Args:
+        url: Document URL.
+        text: Document text, also used as its hash.
+
+    Returns:
+        The record.
+    """
+    return DocumentRecord(url=url, etag="", last_modified="", text_hash=text, text=text)
+
+
+def _fetcher() -> RequestsFetcher:
+    """Build a fetcher over a plain session.
+
+    Returns:
+        The fetcher.
+    """
+    return RequestsFetcher(requests.Session())
+
+
+def test_documents_are_fetched_once_then_reused(server: str, tmp_path: Path) -> None:
+    """A stored document is served again without a request."""
+    store = DocumentStore(tmp_path)
+    urls = [f"{server}/a1", f"{server}/m1", f"{server}/a1"]
+
+    first = harvest_documents(_fetcher(), urls, store, workers=2)
+    seen = len(_Handler.requests_seen)
+    second = harvest_documents(_fetcher(), urls, store, workers=2)
+
+    assert (first["fetched"], first["reused"]) == (2, 0)
+    assert (second["fetched"], second["reused"]) == (0, 2)
+    assert len(_Handler.requests_seen) == seen == 2
+    assert second["records"][f"{server}/a1"]["text"] == "Agenda Parking fees and the budget"
+    assert second["records"][f"{server}/m1"]["text"] == "Minutes: parking approved"
+
+
+def test_revalidation_keeps_a_confirmed_document(server: str, tmp_path: Path) -> None:
+    """With revalidation, an unchanged document costs only a 304."""
+    store = DocumentStore(tmp_path)
+    harvest_documents(_fetcher(), [f"{server}/a1"], store)
+
+    result = harvest_documents(_fetcher(), [f"{server}/a1"], store, revalidate=True)
+
+    assert (result["fetched"], result["revalidated"], result["reused"]) == (0, 1, 0)
+    assert result["records"][f"{server}/a1"]["text"].startswith("Agenda")
+
+
+def test_revalidation_picks_up_a_changed_document(server: str, tmp_path: Path) -> None:
+    """A document corrected in place is downloaded again on revalidation."""
+    store = DocumentStore(tmp_path)
+    harvest_documents(_fetcher(), [f"{server}/a1"], store)
+    _Handler.bodies["/a1"] = "<p>Corrected agenda</p>"
+
+    result = harvest_documents(_fetcher(), [f"{server}/a1"], store, revalidate=True)
+
+    assert result["fetched"] == 1
+    stored = store.load(f"{server}/a1")
+    assert stored is not None
+    assert stored["text"] == "Corrected agenda"
+
+
+def test_failures_are_reported_and_retried_next_run(server: str, tmp_path: Path) -> None:
+    """A failed document is left out of the store, so the next run asks again."""
+    store = DocumentStore(tmp_path)
+    urls = [f"{server}/missing", f"{server}/a1"]
+
+    first = harvest_documents(_fetcher(), urls, store)
+    second = harvest_documents(_fetcher(), urls, store)
+
+    assert list(first["failed"]) == [f"{server}/missing"]
+    assert "404" in first["failed"][f"{server}/missing"]
+    assert list(first["records"]) == [f"{server}/a1"]
+    assert second["failed"] == first["failed"]
+    assert _Handler.requests_seen.count("/missing") == 2
+
+
+def test_a_304_to_an_unconditional_request_is_a_failure(server: str, tmp_path: Path) -> None:
+    """A stored document without validators cannot be confirmed by a 304."""
+    store = DocumentStore(tmp_path)
+    store.save(_record(f"{server}/not-modified", "old"))
+
+    result = harvest_documents(_fetcher(), [f"{server}/not-modified"], store, revalidate=True)
+
+    assert "unconditional" in result["failed"][f"{server}/not-modified"]
+    assert result["records"] == {}
+
+
+def test_a_last_modified_date_alone_is_sent_back(server: str, tmp_path: Path) -> None:
+    """A document stored with only a date is revalidated with that date."""
+    store = DocumentStore(tmp_path)
+    record = _record(f"{server}/not-modified", "old")
+    record["last_modified"] = "Tue, 01 Jul 2025 00:00:00 GMT"
+    store.save(record)
+
+    result = harvest_documents(_fetcher(), [f"{server}/not-modified"], store, revalidate=True)
+
+    assert result["revalidated"] == 1
+    assert result["records"][f"{server}/not-modified"] == record
+
+
+def test_harvest_rejects_fewer_than_one_worker(tmp_path: Path) -> None:
+    """Zero workers is a caller error, reported before any request."""
+    with pytest.raises(ValueError, match="at least 1"):
+        harvest_documents(_fetcher(), ["https://x.test/a"], DocumentStore(tmp_path), workers=0)
+
+
+def test_damaged_or_misfiled_records_are_discarded(server: str, tmp_path: Path) -> None:
+    """The store is a cache, so a record it cannot trust is discarded."""
+    store = DocumentStore(tmp_path)
+    store.path(f"{server}/a1").parent.mkdir(parents=True, exist_ok=True)
+    store.path(f"{server}/a1").write_text("{", encoding="utf-8")
+    store.save(_record(f"{server}/elsewhere", "other"))
+    store.path(f"{server}/elsewhere").rename(store.path(f"{server}/m1"))
+
+    assert store.load(f"{server}/a1") is None
+    assert store.load(f"{server}/m1") is None
+    assert not store.path(f"{server}/a1").exists()
+    assert not store.path(f"{server}/m1").exists()
+
+
+def test_document_urls_keep_absolute_links_once() -> None:
+    """Relative links and repeats across years are dropped."""
+    archive = _archive("https://x.test")
+    relative = YearArchive(
+        year="23-24",
+        agendas=[MeetingLink(date="d", iso_date="", url="/wp-content/a.pdf")],
+        minutes=[MeetingLink(date="d", iso_date="", url="https://x.test/m1")],
+        payload_hash="h",
+    )
+
+    assert document_urls([archive, relative]) == ["https://x.test/a1", "https://x.test/m1"]
+
+
+def test_index_tokens_drop_stop_words_and_single_characters() -> None:
+    """Words that match nearly every document are not indexed."""
+    assert index_tokens("The Budget of A 2025 budget, item 7") == ["budget", "2025", "item"]
+
+
+def test_shards_are_rewritten_only_when_their_documents_change(server: str, tmp_path: Path) -> None:
+    """An unchanged year leaves its published shard alone."""
+    archive = _archive(server)
+    shards = tmp_path / "shards"
+
+    first = harvest_archive(_fetcher(), [archive], DocumentStore(tmp_path / "store"), shards)
+    published = shard_path(shards, "24-25").read_bytes()
+    second = harvest_archive(_fetcher(), [archive], DocumentStore(tmp_path / "store"), shards)
+    republished = shard_path(shards, "24-25").read_bytes()
+    archive["minutes"].append(MeetingLink(date="June 19, 2025", iso_date="2025-06-19", url=f"{server}/m2"))
+    third = harvest_archive(_fetcher(), [archive], DocumentStore(tmp_path / "store"), shards)
+
+    assert first["shards"]["written"] == ["24-25"]
+    assert (second["shards"]["written"], second["shards"]["unchanged"]) == ([], ["24-25"])
+    assert republished == published
+    assert third["shards"]["written"] == ["24-25"]
+
+
+def test_live_years_are_revalidated_every_run(server: str, tmp_path: Path) -> None:
+    """Corrections keep their URL, so a live year's stored documents are asked about again."""
+    live = _archive(server, "25-26")
+    settled = YearArchive(
+        year="23-24",
+        agendas=[MeetingLink(date="June 6, 2024", iso_date="2024-06-06", url=f"{server}/s1")],
+        minutes=[],
+        payload_hash="h",
+    )
+    _Handler.bodies["/s1"] = "<p>Settled agenda</p>"
+    store = DocumentStore(tmp_path / "store")
+    harvest_archive(_fetcher(), [live, settled], store, tmp_path / "shards", live_years=["25-26"])
+    _Handler.bodies["/a1"] = "<p>Corrected agenda</p>"
+    _Handler.bodies["/s1"] = "<p>Corrected settled agenda</p>"
+    _Handler.requests_seen = []
+
+    run = harvest_archive(_fetcher(), [live, settled], store, tmp_path / "shards", live_years=["25-26"])
+
+    documents = run["documents"]
+    assert (documents["fetched"], documents["revalidated"], documents["reused"]) == (1, 1, 1)
+    assert sorted(_Handler.requests_seen) == ["/a1", "/m1"]
+    assert documents["records"][f"{server}/a1"]["text"] == "Corrected agenda"
+    assert documents["records"][f"{server}/s1"]["text"] == "Settled agenda"
+    assert run["shards"]["written"] == ["25-26"]
+
+
+def test_published_shard_locates_documents_by_kind_and_position(server: str, tmp_path: Path) -> None:
+    """The page maps a shard's documents back to the year's meeting links."""
+    harvest_archive(_fetcher(), [_archive(server)], DocumentStore(tmp_path / "store"), tmp_path)
+
+    payload = json.loads(gzip.decompress(shard_path(tmp_path, "24-25").read_bytes()))
+    postings = dict(zip(payload["tokens"], payload["postings"], strict=True))
+
+    assert payload["documents"] == [["agendas", 0], ["minutes", 0]]
+    assert postings["parking"] == [0, 1]
+    assert postings["budget"] == [0]
+    assert "var" not in postings
+
+
+def test_write_shard_is_deterministic(tmp_path: Path) -> None:
+    """The same shard always compresses to the same bytes."""
+    archive = _archive("https://x.test")
+    records = {"https://x.test/a1": _record("https://x.test/a1", "budget hearing")}
+    shard = build_text_shard("24-25", year_documents(archive, records))
+
+    write_shard(tmp_path / "one", shard)
+    write_shard(tmp_path / "two", shard)
+
+    assert (
+        shard_path(tmp_path / "one", "24-25").read_bytes()
+        == shard_path(tmp_path / "two", "24-25").read_bytes()
+    )
+
+
+def test_unreadable_shards_are_rebuilt(tmp_path: Path) -> None:
+    """A truncated or foreign file reads as having no fingerprint."""
+    shard_path(tmp_path, "24-25").write_bytes(b"not gzip")
+    shard_path(tmp_path, "23-24").write_bytes(gzip.compress(b"[1, 2]"))
+
+    assert read_shard_fingerprint(shard_path(tmp_path, "24-25")) is None
+    assert read_shard_fingerprint(shard_path(tmp_path, "23-24")) is None
+    assert read_shard_fingerprint(shard_path(tmp_path, "22-23")) is None
+
+
+def test_years_without_documents_get_no_shard(tmp_path: Path) -> None:
+    """A year none of whose documents were harvested publishes nothing."""
+    outcome = write_year_shards([_archive("https://x.test")], {}, tmp_path)
+
+    assert outcome == {"written": [], "unchanged": []}
+    assert not shard_path(tmp_path, "24-25").exists()
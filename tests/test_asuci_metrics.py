@@ -0,0 +1,154 @@
+"""Tests for the ASUCI run metrics.
+
+The recorder is driven with hand-built records and a fake clock, so these
+check the aggregation and the probe's scoping without timing anything real.
+"""
+
+import json
+from pathlib import Path
+from typing import Literal
+
+from asuci.metrics import (
+    MetricsRecorder,
+    RequestRecord,
+    note_connect,
+    note_response,
+    percentile,
+    probe,
+    write_report,
+)
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self, now: float) -> None:
+        """Start the clock.
+
+        Args:
+            now: Initial reading in seconds.
+        """
+        self.now = now
+
+    def __call__(self) -> float:
+        """Read the clock.
+
+        Returns:
+            The current fake time.
+        """
+        return self.now
+
+
+def _request(
+    endpoint: str,
+    seconds: float,
+    status: int | None = 200,
+    connection: Literal["new", "reused", "none"] = "reused",
+    error: str = "",
+) -> RequestRecord:
+    """Build a request record.
+
+    Args:
+        endpoint: URL requested.
+        seconds: Wall time taken.
+        status: Status received.
+        connection: "new", "reused" or "none".
+        error: Failure message.
+
+    Returns:
+        The record.
+    """
+    return RequestRecord(
+        endpoint=endpoint,
+        seconds=seconds,
+        bytes=100,
+        status=status,
+        connection=connection,
+        connect_seconds=0.25 if connection == "new" else 0.0,
+        error=error,
+    )
+
+
+def test_percentile_picks_the_nearest_rank() -> None:
+    """The p95 of twenty observations is the nineteenth smallest."""
+    values = [float(n) for n in range(20, 0, -1)]
+
+    assert percentile(values, 0.5) == 10.0
+    assert percentile(values, 0.95) == 19.0
+
+
+def test_percentile_of_one_observation_is_that_observation() -> None:
+    """A single request is its own median and tail."""
+    assert percentile([3.0], 0.5) == percentile([3.0], 0.95) == 3.0
+
+
+def test_percentile_of_nothing_is_zero() -> None:
+    """An endpoint with no parses reports zero rather than failing."""
+    assert percentile([], 0.95) == 0.0
+
+
+def test_notes_outside_a_probe_are_dropped() -> None:
+    """With no probe open, the transport's notes cost nothing and go nowhere."""
+    note_response(200, 10)
+    note_connect(0.5)
+
+    with probe() as notes:
+        assert notes.status is None
+        assert notes.connections_opened == 0
+
+
+def test_probe_collects_notes_and_restores_the_outer_probe() -> None:
+    """A nested probe takes the notes while open, then hands back to its parent."""
+    with probe() as outer:
+        with probe() as inner:
+            note_response(304, 0)
+            note_connect(0.5)
+            note_connect(0.25)
+        note_response(200, 42)
+
+    assert (inner.status, inner.received_bytes) == (304, 0)
+    assert (inner.connections_opened, inner.connect_seconds) == (2, 0.75)
+    assert (outer.status, outer.received_bytes, outer.connections_opened) == (200, 42, 0)
+
+
+def test_report_summarises_each_endpoint_in_first_request_order() -> None:
+    """Requests and parses are aggregated per endpoint."""
+    clock = FakeClock(10.0)
+    recorder = MetricsRecorder(clock=clock)
+    recorder.record_request(_request("https://x.test/b", 0.4, connection="new"))
+    for seconds in (0.1, 0.2, 0.3):
+        recorder.record_request(_request("https://x.test/a", seconds))
+    recorder.record_request(_request("https://x.test/a", 0.9, status=None, connection="none", error="boom"))
+    recorder.record_parse("https://x.test/a", 0.01, 0.02)
+    clock.now = 12.5
+
+    report = recorder.report("2026-03-01T00:00:00+00:00")
+
+    assert list(report["endpoints"]) == ["https://x.test/b", "https://x.test/a"]
+    assert report["wall_seconds"] == 2.5
+    summary = report["endpoints"]["https://x.test/a"]
+    assert summary["requests"] == 4
+    assert summary["failures"] == 1
+    assert summary["bytes"] == 400
+    assert summary["statuses"] == {"200": 3, "none": 1}
+    assert summary["connections"] == {"new": 0, "reused": 3, "none": 1}
+    assert summary["seconds_p50"] == 0.2
+    assert summary["seconds_p95"] == 0.9
+    assert (summary["decode_seconds_p50"], summary["parse_seconds_p95"]) == (0.01, 0.02)
+    other = report["endpoints"]["https://x.test/b"]
+    assert other["connect_seconds"] == 0.25
+    assert other["parse_seconds_p50"] == 0.0
+
+
+def test_write_report_produces_readable_json(tmp_path: Path) -> None:
+    """The report is plain JSON carrying every request."""
+    recorder = MetricsRecorder(clock=FakeClock(0.0))
+    recorder.record_request(_request("https://x.test/a", 0.1))
+    path = tmp_path / "run-report.json"
+
+    write_report(path, recorder.report("2026-03-01T00:00:00+00:00"))
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    assert payload["generated_at"] == "2026-03-01T00:00:00+00:00"
+    assert payload["requests"][0]["endpoint"] == "https://x.test/a"
+    assert list(tmp_path.iterdir()) == [path]
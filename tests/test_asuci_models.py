@@ -6,18 +6,37 @@ import pytest
 from asuci.models import (
     AGENDA_VIEW_SLUG,
     MINUTES_VIEW_SLUG,
+    SNAPSHOT_FORMAT,
     AsuciDecodeError,
+    DocumentRecord,
+    IndexEntry,
+    MeetingIndex,
     MeetingLink,
     MeetingLinks,
     SenateRoster,
     Senator,
+    YearArchive,
+    YearIndex,
+    YearSnapshot,
+    assemble_meeting_links,
+    decode_document_record,
+    decode_meeting_links_list,
+    decode_text_shard_fingerprint,
     decode_view_response,
+    decode_year_index,
+    decode_year_snapshot,
+    encode_document_record,
+    encode_meeting_index,
     encode_meeting_link,
     encode_meeting_links,
     encode_roster,
     encode_senator,
+    encode_year_index,
+    encode_year_snapshot,
     require_int,
+    require_object,
     require_str,
+    require_str_list,
 )
 
 
@@ -113,10 +132,14 @@ def test_encode_senator_round_trips_every_field() -> None:
 
 
 def test_encode_meeting_link_round_trips_every_field() -> None:
-    """Encoding a meeting link preserves its date and url."""
-    link = MeetingLink(date="June 5, 2025", url="https://example.test/a")
+    """Encoding a meeting link preserves its dates and url."""
+    link = MeetingLink(date="June 5, 2025", iso_date="2025-06-05", url="https://example.test/a")
 
-    assert encode_meeting_link(link) == {"date": "June 5, 2025", "url": "https://example.test/a"}
+    assert encode_meeting_link(link) == {
+        "date": "June 5, 2025",
+        "iso_date": "2025-06-05",
+        "url": "https://example.test/a",
+    }
 
 
 def test_encode_roster_encodes_both_lists() -> None:
@@ -135,8 +158,12 @@ def test_encode_roster_encodes_both_lists() -> None:
 def test_encode_meeting_links_keeps_year_keys() -> None:
     """Encoding meeting links preserves the academic year grouping."""
     links = MeetingLinks(
-        agendas={"24-25": [MeetingLink(date="June 5, 2025", url="https://example.test/a")]},
-        minutes={"24-25": [MeetingLink(date="June 5, 2025", url="https://example.test/m")]},
+        agendas={
+            "24-25": [MeetingLink(date="June 5, 2025", iso_date="2025-06-05", url="https://example.test/a")]
+        },
+        minutes={
+            "24-25": [MeetingLink(date="June 5, 2025", iso_date="2025-06-05", url="https://example.test/m")]
+        },
     )
 
     encoded = encode_meeting_links(links)
@@ -151,3 +178,162 @@ def test_encode_meeting_links_handles_empty_input() -> None:
         "agendas": {},
         "minutes": {},
     }
+
+
+def test_require_str_names_the_given_context() -> None:
+    """Errors name the object being decoded, not always the view response."""
+    with pytest.raises(AsuciDecodeError, match=r"^year snapshot: 'year'"):
+        require_str({}, "year", "year snapshot")
+
+
+def test_require_object_rejects_a_list() -> None:
+    """A list where an object belongs is an error naming the context."""
+    with pytest.raises(AsuciDecodeError, match="links\\[0\\]: expected an object, got list"):
+        require_object([], "links[0]")
+
+
+def test_decode_meeting_links_list_reads_links_in_order() -> None:
+    """Stored links decode in their stored order."""
+    raw = [
+        {"date": "June 5, 2025", "iso_date": "2025-06-05", "url": "https://x.test/a"},
+        {"date": "May 1, 2025", "iso_date": "2025-05-01", "url": "https://x.test/b"},
+    ]
+
+    assert [link["url"] for link in decode_meeting_links_list(raw, "links")] == [
+        "https://x.test/a",
+        "https://x.test/b",
+    ]
+
+
+def test_decode_meeting_links_list_rejects_a_non_list() -> None:
+    """An object where a list belongs is an error."""
+    with pytest.raises(AsuciDecodeError, match="links: expected a list, got dict"):
+        decode_meeting_links_list({}, "links")
+
+
+def test_decode_meeting_links_list_names_the_bad_item() -> None:
+    """A link missing its url is reported by position."""
+    with pytest.raises(AsuciDecodeError, match="links\\[1\\]: 'url' must be a string"):
+        decode_meeting_links_list(
+            [{"date": "d", "iso_date": "", "url": "u"}, {"date": "d", "iso_date": ""}], "links"
+        )
+
+
+def test_year_snapshot_round_trips_through_json() -> None:
+    """Encoding then decoding a snapshot yields the same record."""
+    snapshot = YearSnapshot(
+        year="24-25",
+        agendas=[MeetingLink(date="June 5, 2025", iso_date="2025-06-05", url="https://x.test/a")],
+        minutes=[],
+        payload_hash="abc",
+        fetched_at="2026-03-01T12:00:00+00:00",
+    )
+
+    assert decode_year_snapshot(json.loads(json.dumps(encode_year_snapshot(snapshot)))) == snapshot
+
+
+def test_decode_year_snapshot_rejects_a_missing_hash() -> None:
+    """A snapshot without its payload hash cannot be compared, so it is an error."""
+    payload = {
+        "format": SNAPSHOT_FORMAT,
+        "year": "24-25",
+        "agendas": [],
+        "minutes": [],
+        "fetched_at": "2026-03-01T12:00:00+00:00",
+    }
+
+    with pytest.raises(AsuciDecodeError, match="'payload_hash' must be a string"):
+        decode_year_snapshot(payload)
+
+
+def test_decode_year_snapshot_rejects_another_format() -> None:
+    """A snapshot stored under another layout is not decoded as this one."""
+    payload = {"format": SNAPSHOT_FORMAT + 1, "year": "24-25"}
+
+    with pytest.raises(
+        AsuciDecodeError, match=f"expected format {SNAPSHOT_FORMAT}, got {SNAPSHOT_FORMAT + 1}"
+    ):
+        decode_year_snapshot(payload)
+
+
+def test_require_str_list_reads_strings_in_order() -> None:
+    """A list of strings is returned as stored."""
+    assert require_str_list({"tokens": ["june", "5"]}, "tokens", "entry") == ["june", "5"]
+
+
+def test_require_str_list_rejects_a_non_list_and_a_non_string() -> None:
+    """Both the list and its items are checked."""
+    with pytest.raises(AsuciDecodeError, match="entry: 'tokens' must be a list, got str"):
+        require_str_list({"tokens": "june"}, "tokens", "entry")
+    with pytest.raises(AsuciDecodeError, match="entry: 'tokens' must hold strings, got int"):
+        require_str_list({"tokens": ["june", 5]}, "tokens", "entry")
+
+
+def test_year_index_round_trips_through_json() -> None:
+    """Encoding then decoding a year index yields the same record."""
+    year_index = YearIndex(
+        year="24-25",
+        payload_hash="abc",
+        entries=[IndexEntry(kind="agendas", position=0, iso_date="2025-06-05", tokens=["june", "5", "2025"])],
+    )
+
+    assert decode_year_index(json.loads(json.dumps(encode_year_index(year_index)))) == year_index
+
+
+def test_decode_year_index_rejects_bad_entries() -> None:
+    """Entries must be a list of complete objects, reported by position."""
+    with pytest.raises(AsuciDecodeError, match="year index: 'entries' must be a list, got dict"):
+        decode_year_index({"year": "24-25", "payload_hash": "abc", "entries": {}})
+    entry = {"kind": "agendas", "iso_date": "", "tokens": []}
+    with pytest.raises(AsuciDecodeError, match=r"year index.entries\[0\]: 'position' must be an integer"):
+        decode_year_index({"year": "24-25", "payload_hash": "abc", "entries": [entry]})
+
+
+def test_document_record_round_trips_through_json() -> None:
+    """Encoding then decoding a stored document yields the same record."""
+    record = DocumentRecord(
+        url="https://x.test/a1", etag='"v1"', last_modified="", text_hash="abc", text="Call to order"
+    )
+
+    assert decode_document_record(json.loads(json.dumps(encode_document_record(record)))) == record
+
+
+def test_decode_text_shard_fingerprint_requires_a_fingerprint() -> None:
+    """Only the fingerprint of a published shard is read back."""
+    assert decode_text_shard_fingerprint({"fingerprint": "abc", "tokens": []}) == "abc"
+    with pytest.raises(AsuciDecodeError, match="text shard: 'fingerprint' must be a string"):
+        decode_text_shard_fingerprint({"fingerprint": 1})
+
+
+def test_encode_meeting_index_writes_documents_as_lists() -> None:
+    """The page reads documents as arrays, so tuples are written as lists."""
+    index = MeetingIndex(
+        ordinals=[20244], documents=[("agendas", "24-25", 0)], tokens=["june"], postings=[[0]]
+    )
+
+    assert json.loads(json.dumps(encode_meeting_index(index))) == {
+        "ordinals": [20244],
+        "documents": [["agendas", "24-25", 0]],
+        "tokens": ["june"],
+        "postings": [[0]],
+    }
+
+
+def test_decode_year_snapshot_rejects_a_non_object() -> None:
+    """A snapshot file holding a list is an error."""
+    with pytest.raises(AsuciDecodeError, match="year snapshot: expected an object"):
+        decode_year_snapshot([])
+
+
+def test_assemble_meeting_links_omits_empty_years_and_keeps_order() -> None:
+    """Years with no documents of a type are left out of that type only."""
+    link = MeetingLink(date="June 5, 2025", iso_date="2025-06-05", url="https://x.test/a")
+    archives = [
+        YearArchive(year="24-25", agendas=[link], minutes=[], payload_hash="a"),
+        YearArchive(year="23-24", agendas=[link], minutes=[link], payload_hash="b"),
+    ]
+
+    links = assemble_meeting_links(archives)
+
+    assert list(links["agendas"]) == ["24-25", "23-24"]
+    assert list(links["minutes"]) == ["23-24"]
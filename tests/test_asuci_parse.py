@@ -6,14 +6,20 @@ markup invented to match the parser.
 """
 
 import json
+from collections.abc import Callable
 
 import pytest
-from asuci.models import AGENDA_VIEW_SLUG, decode_view_response
+from asuci import parse
+from asuci.models import AGENDA_VIEW_SLUG, MINUTES_VIEW_SLUG, MeetingLink, decode_view_response
 from asuci.parse import (
     academic_year_param,
+    extract_document_text,
     is_leadership,
+    meeting_date_iso,
     parse_meeting_links,
+    parse_meeting_links_tree,
     parse_roster,
+    parse_roster_by_block,
     parse_senator_block,
 )
 from bs4 import BeautifulSoup, Tag
@@ -192,6 +198,127 @@ def test_parse_meeting_links_returns_nothing_for_an_empty_fragment() -> None:
     assert parse_meeting_links("<p>No meetings published.</p>") == []
 
 
+# Fragments the streaming reader handles itself.
+STREAMED_FRAGMENTS = (
+    '<a href="/a">June 5, 2025</a>',
+    "<a href>June 5, 2025</a>",
+    '<a href="/a"> <b>June</b> 5, <i>2025</i> </a>',
+    '<a href="/a">June <!-- note --> 5, 2025</a>',
+    '<a href="/a">June<br>5, 2025</a>',
+    '<a href="/a">June<br/>5, 2025</a>',
+    '<a href="/a"><span>June 5, 2025</a>',
+    '<a href="/a"><b><i>June 5</i>, 2025</b></a>',
+    '<a href="/a" href="/b">June 5, 2025</a>',
+    '<a href="/a?x=1&amp;y=2">June 5, 2025</a>',
+    '</a><A HREF="/a">June 5, 2025</A>',
+    '<a/><a href="/a">June 5, 2025</a>',
+)
+
+# Fragments whose reading depends on the tree, so the stream defers.
+TREE_FRAGMENTS = (
+    '<a href="/a">June&nbsp;5, 2025</a>',
+    '<a href="/a">June&#160;5, 2025</a>',
+    '<a href="/a">June 5, 2025',
+    '<p><a href="/a">June 5,</p> 2025</a>',
+    '<a href="/a"><a href="/b">June 5, 2025</a></a>',
+    '<a href="/a"><script>x</script>June 5, 2025</a>',
+    '<a href="/a"><![CDATA[June 5, 2025]]></a>',
+    '<template><a href="/a">June 5, 2025</a></template>',
+    '<a href="/a"><?pi x?>June 5, 2025</a>',
+    '<a href="/a"><!DOCTYPE html>June 5, 2025</a>',
+)
+
+
+def _tree_spy(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record every fragment handed to the tree reader.
+
+    Args:
+        monkeypatch: Fixture used to wrap the reader.
+
+    Returns:
+        The fragments, appended to as the reader is called.
+    """
+    seen: list[str] = []
+    reader: Callable[[str], list[MeetingLink]] = parse.parse_meeting_links_tree
+
+    def spy(rendered_html: str) -> list[MeetingLink]:
+        seen.append(rendered_html)
+        return reader(rendered_html)
+
+    monkeypatch.setattr(parse, "parse_meeting_links_tree", spy)
+    return seen
+
+
+def test_parse_meeting_links_matches_the_tree_on_the_captured_views(
+    agendas_view_json: str, minutes_view_json: str, roster_html: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The stream reads every captured page exactly as the tree does, unaided."""
+    fragments = [
+        decode_view_response(json.loads(agendas_view_json), AGENDA_VIEW_SLUG)["rendered_html"],
+        decode_view_response(json.loads(minutes_view_json), MINUTES_VIEW_SLUG)["rendered_html"],
+        roster_html,
+    ]
+    expected = [parse_meeting_links_tree(fragment) for fragment in fragments]
+    seen = _tree_spy(monkeypatch)
+
+    assert [parse_meeting_links(fragment) for fragment in fragments] == expected
+    assert seen == []
+
+
+def test_parse_meeting_links_streams_the_shapes_it_models(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Inline markup, comments, and void tags inside an anchor need no tree."""
+    expected = [parse_meeting_links_tree(fragment) for fragment in STREAMED_FRAGMENTS]
+    seen = _tree_spy(monkeypatch)
+
+    assert [parse_meeting_links(fragment) for fragment in STREAMED_FRAGMENTS] == expected
+    assert seen == []
+
+
+def test_parse_meeting_links_defers_to_the_tree_on_other_markup(monkeypatch: pytest.MonkeyPatch) -> None:
+    """References, nesting, and stray end tags inside an anchor are read by the tree."""
+    expected = [parse_meeting_links_tree(fragment) for fragment in TREE_FRAGMENTS]
+    seen = _tree_spy(monkeypatch)
+
+    assert [parse_meeting_links(fragment) for fragment in TREE_FRAGMENTS] == expected
+    assert seen == list(TREE_FRAGMENTS)
+
+
+def test_parse_meeting_links_reads_a_valueless_href_as_empty() -> None:
+    """An ``href`` with no value is a link to the empty URL, as in the tree."""
+    assert parse_meeting_links("<a href>March 3, 2024</a>") == [
+        {"date": "March 3, 2024", "iso_date": "2024-03-03", "url": ""}
+    ]
+
+
+def test_parse_meeting_links_joins_stripped_text_runs() -> None:
+    """Text split by inline tags is joined after each run is stripped."""
+    links = parse_meeting_links('<a href="/a"> <b>March 3,</b> <i>2024</i> </a>')
+
+    assert links == [{"date": "March 3,2024", "iso_date": "2024-03-03", "url": "/a"}]
+
+
+def test_meeting_date_iso_reads_the_first_date_in_the_text() -> None:
+    """Surrounding words are ignored and single-digit days are padded."""
+    assert meeting_date_iso("June 5, 2025") == "2025-06-05"
+    assert meeting_date_iso("Special Meeting - November 21 2024 (rescheduled)") == "2024-11-21"
+
+
+def test_meeting_date_iso_is_empty_without_a_calendar_day() -> None:
+    """Text with no date, or a day the month lacks, normalises to nothing."""
+    assert meeting_date_iso("Agenda") == ""
+    assert meeting_date_iso("February 30, 2025") == ""
+
+
+def test_parse_meeting_links_normalises_every_captured_date(agendas_view_json: str) -> None:
+    """Every captured agenda carries the ISO form of its published date."""
+    fragment = decode_view_response(json.loads(agendas_view_json), AGENDA_VIEW_SLUG)["rendered_html"]
+
+    links = parse_meeting_links(fragment)
+
+    assert links[0]["iso_date"] == "2025-06-05"
+    assert all(link["iso_date"] for link in links)
+
+
 def test_academic_year_param_expands_a_label() -> None:
     """A tab label becomes the eight-digit year parameter."""
     assert academic_year_param("24-25") == "20242025"
@@ -261,3 +388,71 @@ def test_parse_roster_drops_a_record_with_no_address() -> None:
     roster = parse_roster(html)
 
     assert roster["senators"] == []
+
+
+# Roster markup exercising the pairing rules the single walk must keep.
+LAYOUT_EDGE_CASES = (
+    # Portrait after the text, and a second image that is not the portrait.
+    '<div class="fusion-layout-column"><div class="fusion-text"><p>Ann Lee</p><p>Senator</p>'
+    '<p>ann@asuci.uci.edu</p></div><img src="/ann.jpg"><img src="/other.jpg"></div>',
+    # A nested column: the inner block takes the inner image, the outer block
+    # the first image anywhere in the outer column.
+    '<div class="outer fusion-layout-column"><div class="fusion-text"><p>Bo Kim</p><p>Senator</p>'
+    '<p>bo@asuci.uci.edu</p></div><div class="fusion-layout-column"><img data-orig-src="/cy.jpg">'
+    '<div class="fusion-text"><p>Cy Ray</p><p>Senator</p><p>cy@asuci.uci.edu</p></div></div></div>',
+    # Comments and scripts inside a block carry no lines.
+    '<div class="fusion-layout-column"><div class="fusion-text"><p>Di Fox<!-- x\ny --></p>'
+    "<script>var a;</script><p>Senate Secretary</p><p>di@asuci.uci.edu</p></div></div>",
+    # A block outside any column, a sourceless image, and copy that is not a record.
+    '<img alt="logo"><div class="fusion-text"><p>Ed Moe</p><p>Senator</p><p>ed@asuci.uci.edu</p></div>'
+    '<div class="fusion-text"><p>Welcome to the senate page.</p></div>',
+)
+
+
+def test_parse_roster_matches_the_block_reading_on_the_captured_page(roster_html: str) -> None:
+    """The single walk reads the captured page exactly as the block-by-block reading does."""
+    assert parse_roster(roster_html) == parse_roster_by_block(roster_html)
+
+
+def test_parse_roster_matches_the_block_reading_on_layout_edge_cases() -> None:
+    """Late, nested, and missing portraits pair with the same blocks either way."""
+    for html in LAYOUT_EDGE_CASES:
+        assert parse_roster(html) == parse_roster_by_block(html)
+
+
+def test_parse_roster_pairs_a_portrait_that_follows_the_text() -> None:
+    """A column's first image belongs to its blocks wherever it sits."""
+    roster = parse_roster(LAYOUT_EDGE_CASES[0])
+
+    assert roster["senators"][0]["photo"] == "/ann.jpg"
+
+
+def test_parse_roster_can_parse_the_columns_alone(roster_html: str) -> None:
+    """Restricting the tree to layout columns loses nothing on the captured page."""
+    assert parse_roster(roster_html, columns_only=True) == parse_roster(roster_html)
+
+
+def test_parse_roster_columns_only_drops_blocks_outside_a_column() -> None:
+    """With the tree restricted to columns, a block outside every column is not read."""
+    roster = parse_roster(LAYOUT_EDGE_CASES[3], columns_only=True)
+
+    assert roster == {"leadership": [], "senators": []}
+
+
+def test_extract_document_text_keeps_visible_words_only() -> None:
+    """Scripts and styles are dropped, entities decoded, and blocks kept apart."""
+    html = (
+        "<html><head><title>Agenda</title><style>p { color: red }</style></head>"
+        "<body><p>Call to Order</p><p>Roll call &amp; minutes</p>"
+        "<script>var hidden = 1;</script><noscript>Enable JS</noscript></body></html>"
+    )
+
+    assert extract_document_text(html) == "Agenda Call to Order Roll call & minutes"
+
+
+def test_extract_document_text_joins_inline_markup() -> None:
+    """Inline tags do not split the words they wrap."""
+    assert (
+        extract_document_text("<p>Re<b>solution</b> 25-01</p>\n\n<td>Passed</td>")
+        == "Resolution 25-01 Passed"
+    )
@@ -0,0 +1,159 @@
+"""Tests for the meeting search index.
+
+The index is built from hand-made year archives, so these check the
+numbering, the postings, and which years are rebuilt without the network.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from asuci.models import AsuciDecodeError, MeetingLink, YearArchive
+from asuci.search import (
+    build_index,
+    day_number,
+    index_path,
+    index_year,
+    load_year_index,
+    merge_index,
+    save_year_index,
+    tokenize,
+)
+
+
+def _link(date: str, iso_date: str, url: str) -> MeetingLink:
+    """Build a meeting link.
+
+    Args:
+        date: Published date.
+        iso_date: The same date in ISO form, or empty.
+        url: Document URL.
+
+    Returns:
+        The link.
+    """
+    return MeetingLink(date=date, iso_date=iso_date, url=url)
+
+
+def _archive(year: str, payload_hash: str = "h") -> YearArchive:
+    """Build a year holding two agendas and one set of minutes.
+
+    Args:
+        year: Academic year label.
+        payload_hash: Hash of the payloads it was read from.
+
+    Returns:
+        The archive.
+    """
+    return YearArchive(
+        year=year,
+        agendas=[
+            _link("June 5, 2025", "2025-06-05", "https://x.test/a1"),
+            _link("February 30, 2025", "", "https://x.test/a2"),
+        ],
+        minutes=[_link("May 1, 2025", "2025-05-01", "https://x.test/m1")],
+        payload_hash=payload_hash,
+    )
+
+
+def test_tokenize_lowercases_and_drops_repeats() -> None:
+    """Words are split on anything but letters and digits."""
+    assert tokenize("June 5, 2025 - June Special") == ["june", "5", "2025", "special"]
+
+
+def test_day_number_counts_from_the_unix_epoch() -> None:
+    """Day numbers match ``Date.UTC(...) / 86400000`` in the page."""
+    assert day_number("1970-01-01") == 0
+    assert day_number("2025-06-05") == 20244
+
+
+def test_index_year_lists_agendas_then_minutes() -> None:
+    """Entries keep their kind and position, and are found by kind."""
+    year_index = index_year(_archive("24-25"))
+
+    assert [(entry["kind"], entry["position"]) for entry in year_index["entries"]] == [
+        ("agendas", 0),
+        ("agendas", 1),
+        ("minutes", 0),
+    ]
+    assert year_index["entries"][2]["tokens"] == ["may", "1", "2025", "minutes"]
+
+
+def test_merge_index_numbers_dated_documents_by_date() -> None:
+    """Dated documents come first in date order; undated ones follow."""
+    index = merge_index([index_year(_archive("24-25"))])
+
+    assert index["ordinals"] == [day_number("2025-05-01"), day_number("2025-06-05")]
+    assert index["documents"] == [("minutes", "24-25", 0), ("agendas", "24-25", 0), ("agendas", "24-25", 1)]
+
+
+def test_merge_index_postings_are_sorted_and_ascending() -> None:
+    """Tokens are sorted, and each lists its documents in number order."""
+    index = merge_index([index_year(_archive("24-25")), index_year(_archive("23-24"))])
+    postings = dict(zip(index["tokens"], index["postings"], strict=True))
+
+    assert index["tokens"] == sorted(index["tokens"])
+    assert postings["june"] == [2, 3]
+    assert postings["30"] == [4, 5]
+    for ids in index["postings"]:
+        assert ids == sorted(ids)
+
+
+def test_merge_index_of_nothing_is_empty() -> None:
+    """Quick runs, which read no archive, embed an empty index."""
+    assert merge_index([]) == {"ordinals": [], "documents": [], "tokens": [], "postings": []}
+
+
+def test_build_index_reuses_years_whose_archive_is_unchanged(tmp_path: Path) -> None:
+    """Only a year whose payload hash moved is indexed again."""
+    first = build_index([_archive("24-25"), _archive("23-24")], tmp_path)
+    second = build_index([_archive("24-25", "changed"), _archive("23-24")], tmp_path)
+
+    assert first["rebuilt"] == ["24-25", "23-24"]
+    assert (second["rebuilt"], second["reused"]) == (["24-25"], ["23-24"])
+    assert second["index"] == first["index"]
+    stored = load_year_index(tmp_path, "24-25")
+    assert stored is not None
+    assert stored["payload_hash"] == "changed"
+
+
+def test_build_index_full_ignores_damaged_entries(tmp_path: Path) -> None:
+    """A full build replaces stored entries without reading them."""
+    index_path(tmp_path, "24-25").write_text("{", encoding="utf-8")
+
+    build = build_index([_archive("24-25")], tmp_path, full=True)
+
+    assert build["rebuilt"] == ["24-25"]
+    assert load_year_index(tmp_path, "24-25") == index_year(_archive("24-25"))
+
+
+def test_load_year_index_returns_none_when_absent(tmp_path: Path) -> None:
+    """A year never indexed has nothing stored."""
+    assert load_year_index(tmp_path, "24-25") is None
+
+
+def test_load_year_index_rejects_a_non_json_file(tmp_path: Path) -> None:
+    """Truncated entries are reported, not silently rebuilt."""
+    index_path(tmp_path, "24-25").write_text("{", encoding="utf-8")
+
+    with pytest.raises(AsuciDecodeError, match="is not JSON"):
+        load_year_index(tmp_path, "24-25")
+
+
+def test_load_year_index_rejects_a_misfiled_year(tmp_path: Path) -> None:
+    """Entries stored under another year's name are reported."""
+    save_year_index(tmp_path, index_year(_archive("23-24")))
+    index_path(tmp_path, "23-24").rename(index_path(tmp_path, "24-25"))
+
+    with pytest.raises(AsuciDecodeError, match="holds year '23-24'"):
+        load_year_index(tmp_path, "24-25")
+
+
+def test_stored_entries_are_plain_json(tmp_path: Path) -> None:
+    """Stored entries carry the documented fields."""
+    save_year_index(tmp_path, index_year(_archive("24-25")))
+
+    payload = json.loads(index_path(tmp_path, "24-25").read_text(encoding="utf-8"))
+
+    assert set(payload) == {"year", "payload_hash", "entries"}
+    assert set(payload["entries"][0]) == {"kind", "position", "iso_date", "tokens"}
@@ -7,32 +7,69 @@ exercised as they run in production.
 
 import threading
 from collections.abc import Iterator
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
+from pathlib import Path
+from typing import ClassVar
 
 import pytest
 import requests
 from asuci.client import (
+    FETCH_WORKERS,
     AsuciFetchError,
+    CachingFetcher,
     ChainCompletingAdapter,
+    InstrumentedFetcher,
     RequestsFetcher,
+    TrackingHTTPSConnectionPool,
     create_fetcher,
     create_ssl_context,
+    shared_session,
 )
+from asuci.metrics import MetricsRecorder
+from shared.utils.http_cache import ResponseCache
+from urllib3.connectionpool import HTTPSConnectionPool
+
+# Validators the local server hands out for its cacheable paths.
+ETAG = '"v1"'
+LAST_MODIFIED = "Tue, 01 Jul 2025 00:00:00 GMT"
 
 
 class _Handler(BaseHTTPRequestHandler):
-    """Serves a fixed body, or a chosen status for /missing."""
+    """Serves a fixed body, or a chosen status for /missing.
+
+    /etag and /lastmod send a validator and answer 304 when it comes back;
+    /not-modified answers 304 unconditionally. Every request is counted.
+    """
+
+    requests_seen: ClassVar[list[str]] = []
 
     def do_GET(self) -> None:
         """Answer a GET request."""
+        self.requests_seen.append(self.path)
         if self.path.startswith("/missing"):
             self.send_response(404)
             self.end_headers()
             return
+        if self.path.startswith("/not-modified"):
+            self.send_response(304)
+            self.end_headers()
+            return
+        if self.path.startswith("/etag") and self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        if self.path.startswith("/lastmod") and self.headers.get("If-Modified-Since") == LAST_MODIFIED:
+            self.send_response(304)
+            self.end_headers()
+            return
         body = f"path={self.path}".encode()
         self.send_response(200)
         self.send_header("Content-Type", "text/plain; charset=utf-8")
         self.send_header("Content-Length", str(len(body)))
+        if self.path.startswith("/etag"):
+            self.send_header("ETag", ETAG)
+        if self.path.startswith("/lastmod"):
+            self.send_header("Last-Modified", LAST_MODIFIED)
         self.end_headers()
         self.wfile.write(body)
 
@@ -47,6 +84,7 @@ def server() -> Iterator[str]:
     Yields:
         The server's base URL.
     """
+    _Handler.requests_seen = []
     httpd = HTTPServer(("127.0.0.1", 0), _Handler)
     thread = threading.Thread(target=httpd.serve_forever, daemon=True)
     thread.start()
@@ -58,6 +96,43 @@ def server() -> Iterator[str]:
         thread.join(timeout=5)
 
 
+class _KeepAliveHandler(_Handler):
+    """Serves the same paths over HTTP/1.1, so connections are kept open."""
+
+    protocol_version = "HTTP/1.1"
+
+
+@pytest.fixture
+def keep_alive_server() -> Iterator[str]:
+    """Run a local HTTP/1.1 server whose connections persist between requests.
+
+    Yields:
+        The server's base URL.
+    """
+    _Handler.requests_seen = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        thread.join(timeout=5)
+
+
+def _tracked_session() -> requests.Session:
+    """Build a session whose plain-HTTP connections are tracked.
+
+    Returns:
+        The session.
+    """
+    session = requests.Session()
+    session.mount("http://", ChainCompletingAdapter(create_ssl_context(), track_connections=True))
+    return session
+
+
 def test_get_text_returns_the_body(server: str) -> None:
     """A successful response is returned as text."""
     fetcher = RequestsFetcher(requests.Session())
@@ -94,18 +169,41 @@ def test_create_fetcher_mounts_the_chain_completing_adapter() -> None:
     """The production fetcher verifies through the chain-completing adapter."""
     fetcher = create_fetcher()
 
+    assert isinstance(fetcher, RequestsFetcher)
+    adapter = fetcher._session.get_adapter("https://asuci.uci.edu/")
+    assert isinstance(adapter, ChainCompletingAdapter)
+
+
+def test_create_fetcher_keeps_a_connection_per_worker() -> None:
+    """The pool holds a connection for every concurrent archive request."""
+    fetcher = create_fetcher()
+
+    assert isinstance(fetcher, RequestsFetcher)
     adapter = fetcher._session.get_adapter("https://asuci.uci.edu/")
     assert isinstance(adapter, ChainCompletingAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == FETCH_WORKERS
 
 
 def test_create_fetcher_sends_a_browser_user_agent() -> None:
     """The session identifies as a browser for the upstream WAF."""
     fetcher = create_fetcher()
 
+    assert isinstance(fetcher, RequestsFetcher)
     assert "Mozilla/5.0" in str(fetcher._session.headers["User-Agent"])
     assert fetcher._session.headers["Referer"] == "https://asuci.uci.edu/"
 
 
+def test_create_fetcher_reuses_the_process_session() -> None:
+    """Fetchers built in one process share connections; tracking gets its own."""
+    first = create_fetcher()
+    second = create_fetcher()
+
+    assert isinstance(first, RequestsFetcher)
+    assert isinstance(second, RequestsFetcher)
+    assert first._session is second._session is shared_session()
+    assert shared_session(track_connections=True) is not shared_session()
+
+
 def test_adapter_applies_its_context_to_new_pools(server: str) -> None:
     """The adapter's context reaches the pool manager and still serves traffic."""
     adapter = ChainCompletingAdapter(create_ssl_context())
@@ -113,3 +211,175 @@ def test_adapter_applies_its_context_to_new_pools(server: str) -> None:
     session.mount("http://", adapter)
 
     assert session.get(f"{server}/ok", timeout=10).text == "path=/ok"
+
+
+def test_create_fetcher_wraps_the_session_in_a_given_cache(tmp_path: Path) -> None:
+    """Passing a cache puts the production session behind it."""
+    fetcher = create_fetcher(cache=ResponseCache(tmp_path))
+
+    assert isinstance(fetcher, CachingFetcher)
+
+
+def test_get_revalidated_accepts_not_modified(server: str) -> None:
+    """A 304 is an answer, not a failure, and carries no body."""
+    fetcher = RequestsFetcher(requests.Session())
+
+    response = fetcher.get_revalidated(f"{server}/etag", {}, {"If-None-Match": ETAG})
+
+    assert response == {"status": 304, "text": "", "etag": "", "last_modified": ""}
+
+
+def test_get_revalidated_rejects_other_statuses(server: str) -> None:
+    """Anything other than 200 or 304 is still an error."""
+    fetcher = RequestsFetcher(requests.Session())
+
+    with pytest.raises(AsuciFetchError, match="returned HTTP 404"):
+        fetcher.get_revalidated(f"{server}/missing", {}, {})
+
+
+def test_caching_fetcher_serves_an_unchanged_body_from_disk(server: str, tmp_path: Path) -> None:
+    """The second read sends the ETag back and is answered 304 from the cache."""
+    fetcher = CachingFetcher(RequestsFetcher(requests.Session()), ResponseCache(tmp_path))
+
+    first = fetcher.get_text(f"{server}/etag", {"year": "20242025"})
+    second = fetcher.get_text(f"{server}/etag", {"year": "20242025"})
+
+    assert first == second == "path=/etag?year=20242025"
+    assert fetcher.outcomes == {"fresh": 0, "revalidated": 1, "fetched": 1}
+    assert len(_Handler.requests_seen) == 2
+
+
+def test_caching_fetcher_revalidates_by_last_modified(server: str, tmp_path: Path) -> None:
+    """A Last-Modified date alone is enough to revalidate."""
+    fetcher = CachingFetcher(RequestsFetcher(requests.Session()), ResponseCache(tmp_path))
+
+    fetcher.get_text(f"{server}/lastmod", {})
+    assert fetcher.get_text(f"{server}/lastmod", {}) == "path=/lastmod"
+
+    assert fetcher.outcomes["revalidated"] == 1
+
+
+def test_caching_fetcher_survives_between_instances(server: str, tmp_path: Path) -> None:
+    """A later run revalidates against what an earlier run stored."""
+    CachingFetcher(RequestsFetcher(requests.Session()), ResponseCache(tmp_path)).get_text(
+        f"{server}/etag", {}
+    )
+    later = CachingFetcher(RequestsFetcher(requests.Session()), ResponseCache(tmp_path))
+
+    assert later.get_text(f"{server}/etag", {}) == "path=/etag"
+    assert later.outcomes["revalidated"] == 1
+
+
+def test_caching_fetcher_refetches_without_validators(server: str, tmp_path: Path) -> None:
+    """A host that sends no validators is downloaded again by default."""
+    fetcher = CachingFetcher(RequestsFetcher(requests.Session()), ResponseCache(tmp_path))
+
+    fetcher.get_text(f"{server}/plain", {})
+    fetcher.get_text(f"{server}/plain", {})
+
+    assert fetcher.outcomes == {"fresh": 0, "revalidated": 0, "fetched": 2}
+
+
+def test_caching_fetcher_reuses_validatorless_bodies_within_max_age(server: str, tmp_path: Path) -> None:
+    """The max-age override serves such a body without asking the server."""
+    fetcher = CachingFetcher(RequestsFetcher(requests.Session()), ResponseCache(tmp_path, max_age=3600))
+
+    fetcher.get_text(f"{server}/plain", {})
+    assert fetcher.get_text(f"{server}/plain", {}) == "path=/plain"
+
+    assert fetcher.outcomes["fresh"] == 1
+    assert len(_Handler.requests_seen) == 1
+
+
+def test_caching_fetcher_rejects_an_unprompted_not_modified(server: str, tmp_path: Path) -> None:
+    """A 304 to a request that carried no validators has no body to fall back on."""
+    fetcher = CachingFetcher(RequestsFetcher(requests.Session()), ResponseCache(tmp_path))
+
+    with pytest.raises(AsuciFetchError, match="304 with nothing cached"):
+        fetcher.get_text(f"{server}/not-modified", {})
+
+
+def test_caching_fetcher_does_not_cache_failures(server: str, tmp_path: Path) -> None:
+    """An error status propagates and leaves nothing on disk."""
+    fetcher = CachingFetcher(RequestsFetcher(requests.Session()), ResponseCache(tmp_path))
+
+    with pytest.raises(AsuciFetchError, match="returned HTTP 404"):
+        fetcher.get_text(f"{server}/missing", {})
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_instrumented_fetcher_tells_a_new_connection_from_a_reused_one(keep_alive_server: str) -> None:
+    """The first request opens a connection and the second rides it."""
+    recorder = MetricsRecorder()
+    session = _tracked_session()
+    fetcher = InstrumentedFetcher(RequestsFetcher(session), recorder)
+
+    fetcher.get_text(f"{keep_alive_server}/one", {})
+    fetcher.get_text(f"{keep_alive_server}/two", {})
+    session.close()
+
+    first, second = recorder.report("now")["requests"]
+    assert (first["connection"], second["connection"]) == ("new", "reused")
+    assert first["connect_seconds"] > 0
+    assert second["connect_seconds"] == 0
+    assert (first["status"], first["bytes"]) == (200, len("path=/one"))
+
+
+def test_instrumented_fetcher_records_a_failed_status(server: str) -> None:
+    """A non-success response is recorded with its status before the error surfaces."""
+    recorder = MetricsRecorder()
+    fetcher = InstrumentedFetcher(RequestsFetcher(_tracked_session()), recorder)
+
+    with pytest.raises(AsuciFetchError, match="returned HTTP 404"):
+        fetcher.get_text(f"{server}/missing", {})
+
+    (record,) = recorder.report("now")["requests"]
+    assert (record["status"], record["connection"]) == (404, "new")
+    assert "HTTP 404" in record["error"]
+
+
+def test_instrumented_fetcher_records_an_unreachable_host() -> None:
+    """A connection that never opens leaves no status and no connection."""
+    recorder = MetricsRecorder()
+    fetcher = InstrumentedFetcher(RequestsFetcher(_tracked_session()), recorder)
+
+    with pytest.raises(AsuciFetchError, match="failed"):
+        fetcher.get_text("http://127.0.0.1:1/unreachable", {})
+
+    (record,) = recorder.report("now")["requests"]
+    assert (record["status"], record["connection"]) == (None, "none")
+
+
+def test_instrumented_fetcher_sees_a_revalidation_through_the_cache(server: str, tmp_path: Path) -> None:
+    """A body served after a 304 is recorded as the 304 it was, with no body received."""
+    recorder = MetricsRecorder()
+    cached = CachingFetcher(RequestsFetcher(requests.Session()), ResponseCache(tmp_path))
+    fetcher = InstrumentedFetcher(cached, recorder)
+
+    fetcher.get_text(f"{server}/etag", {})
+    fetcher.get_text(f"{server}/etag", {})
+
+    statuses = [(record["status"], record["bytes"]) for record in recorder.report("now")["requests"]]
+    assert statuses == [(200, len("path=/etag")), (304, 0)]
+
+
+def test_create_fetcher_records_through_a_given_recorder(tmp_path: Path) -> None:
+    """Passing a recorder wraps the fetcher and tracks the pool's connections."""
+    fetcher = create_fetcher(cache=ResponseCache(tmp_path), recorder=MetricsRecorder())
+
+    assert isinstance(fetcher, InstrumentedFetcher)
+    assert isinstance(fetcher.inner, CachingFetcher)
+    adapter = fetcher.inner._inner._session.get_adapter("https://asuci.uci.edu/")
+    assert isinstance(adapter, ChainCompletingAdapter)
+    assert adapter.poolmanager.pool_classes_by_scheme["https"] is TrackingHTTPSConnectionPool
+
+
+def test_create_fetcher_leaves_connections_untracked_by_default() -> None:
+    """Without a recorder the pool builds urllib3's own connections."""
+    fetcher = create_fetcher()
+
+    assert isinstance(fetcher, RequestsFetcher)
+    adapter = fetcher._session.get_adapter("https://asuci.uci.edu/")
+    assert isinstance(adapter, ChainCompletingAdapter)
+    assert adapter.poolmanager.pool_classes_by_scheme["https"] is HTTPSConnectionPool
@@ -0,0 +1,136 @@
+"""Tests for the build manifest that lets unchanged dashboards be skipped."""
+
+import json
+from pathlib import Path
+
+from shared.utils.build_manifest import (
+    BuildRecord,
+    hash_inputs,
+    hash_output,
+    is_up_to_date,
+    load_manifest,
+    record_build,
+    save_manifest,
+)
+
+
+def _tree(root: Path) -> None:
+    """Lay out a small dashboard: a script, a data directory and a page.
+
+    Args:
+        root: Directory to lay it out in.
+    """
+    (root / "data" / "__pycache__").mkdir(parents=True)
+    (root / "build.py").write_text("print('build')\n", encoding="utf-8")
+    (root / "data" / "a.yaml").write_text("city: a\n", encoding="utf-8")
+    (root / "data" / "__pycache__" / "x.pyc").write_bytes(b"\0")
+    (root / "index.html").write_text("<html></html>\n", encoding="utf-8")
+
+
+def test_hash_inputs_follows_file_contents(tmp_path: Path) -> None:
+    """Editing a file below an input directory changes the fingerprint."""
+    _tree(tmp_path)
+    before = hash_inputs(tmp_path, ("build.py", "data"))
+
+    (tmp_path / "data" / "a.yaml").write_text("city: b\n", encoding="utf-8")
+
+    assert hash_inputs(tmp_path, ("build.py", "data")) != before
+
+
+def test_hash_inputs_ignores_bytecode_caches(tmp_path: Path) -> None:
+    """Compiled bytecode does not make a build look stale."""
+    _tree(tmp_path)
+    before = hash_inputs(tmp_path, ("data",))
+
+    (tmp_path / "data" / "__pycache__" / "x.pyc").write_bytes(b"\1")
+
+    assert hash_inputs(tmp_path, ("data",)) == before
+
+
+def test_hash_inputs_notices_a_file_appearing(tmp_path: Path) -> None:
+    """A pattern that matches nothing yet still counts toward the fingerprint."""
+    _tree(tmp_path)
+    before = hash_inputs(tmp_path, ("data/*.yaml", "schedule.json"))
+
+    (tmp_path / "schedule.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "data" / "b.yaml").write_text("city: b\n", encoding="utf-8")
+
+    assert hash_inputs(tmp_path, ("data/*.yaml",)) != hash_inputs(tmp_path, ("data/a.yaml",))
+    assert hash_inputs(tmp_path, ("data/*.yaml", "schedule.json")) != before
+
+
+def test_hash_inputs_folds_in_extra_values(tmp_path: Path) -> None:
+    """Upstream fingerprints and command lines are part of the inputs."""
+    _tree(tmp_path)
+
+    assert hash_inputs(tmp_path, ("build.py",), ("up-1",)) != hash_inputs(tmp_path, ("build.py",), ("up-2",))
+
+
+def test_hash_output_covers_files_and_directories(tmp_path: Path) -> None:
+    """A directory output changes with any file in it; an absent one has no digest."""
+    _tree(tmp_path)
+    before = hash_output(tmp_path / "data")
+
+    (tmp_path / "data" / "c.yaml").write_text("city: c\n", encoding="utf-8")
+
+    assert hash_output(tmp_path / "data") != before
+    assert hash_output(tmp_path / "index.html") is not None
+    assert hash_output(tmp_path / "missing.html") is None
+
+
+def test_a_recorded_build_is_up_to_date_until_something_moves(tmp_path: Path) -> None:
+    """Changed inputs, or an output that differs from what the build left, force a rebuild."""
+    _tree(tmp_path)
+    fingerprint = hash_inputs(tmp_path, ("build.py",))
+    record = record_build(tmp_path, fingerprint, ("index.html", "never-written.json"))
+
+    assert record["outputs"].keys() == {"index.html"}
+    assert is_up_to_date(tmp_path, record, fingerprint, ("index.html", "never-written.json"))
+    assert not is_up_to_date(tmp_path, record, "other", ("index.html",))
+    assert not is_up_to_date(tmp_path, None, fingerprint, ("index.html",))
+
+    (tmp_path / "never-written.json").write_text("[]", encoding="utf-8")
+    (tmp_path / "index.html").write_text("<html>edited</html>\n", encoding="utf-8")
+
+    assert not is_up_to_date(tmp_path, record, fingerprint, ("never-written.json",))
+    assert not is_up_to_date(tmp_path, record, fingerprint, ("index.html",))
+
+
+def test_manifest_round_trips(tmp_path: Path) -> None:
+    """Saved records are read back unchanged."""
+    manifest = {"asuci": BuildRecord(fingerprint="f", outputs={"asuci/index.html": "d"})}
+    path = tmp_path / "state" / "manifest.json"
+
+    save_manifest(path, manifest)
+
+    assert load_manifest(path) == manifest
+
+
+def test_load_manifest_treats_a_damaged_file_as_empty(tmp_path: Path) -> None:
+    """An absent, truncated or foreign manifest means every dashboard is built."""
+    path = tmp_path / "manifest.json"
+    assert load_manifest(path) == {}
+
+    path.write_text("{", encoding="utf-8")
+    assert load_manifest(path) == {}
+
+    path.write_text("[]", encoding="utf-8")
+    assert load_manifest(path) == {}
+
+
+def test_load_manifest_drops_malformed_records(tmp_path: Path) -> None:
+    """Only the records that do not match the shape are rebuilt."""
+    path = tmp_path / "manifest.json"
+    path.write_text(
+        json.dumps(
+            {
+                "good": {"fingerprint": "f", "outputs": {"index.html": "d"}},
+                "not-an-object": [],
+                "no-fingerprint": {"outputs": {}},
+                "bad-digest": {"fingerprint": "f", "outputs": {"index.html": 1}},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    assert load_manifest(path) == {"good": {"fingerprint": "f", "outputs": {"index.html": "d"}}}
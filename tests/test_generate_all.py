@@ -0,0 +1,169 @@
+"""Tests for the runner that regenerates every dashboard.
+
+The dashboards here are one-line ``-c`` programs and scripts written to a
+temporary directory, so these check the runner's isolation, exit statuses
+and deadlines without running any real generator.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import generate_all
+import pytest
+from generate_all import (
+    Dashboard,
+    DashboardRun,
+    call_in_process,
+    exit_status,
+    record_runs,
+    run_all,
+    run_command,
+    run_dashboard,
+    timing_report,
+)
+from shared.utils.build_manifest import PARTIAL_BUILD_EXIT, BuildRecord
+from shared.utils.phase_timing import DashboardTiming, PhaseTotal, TimingReport
+
+
+def _script(tmp_path: Path, source: str) -> tuple[str, ...]:
+    """Write a generator script and return the arguments that run it.
+
+    Args:
+        tmp_path: Directory to write it in.
+        source: The script's code.
+
+    Returns:
+        The interpreter arguments, an absolute path.
+    """
+    path = tmp_path / "generate.py"
+    path.write_text(source, encoding="utf-8")
+    return (str(path),)
+
+
+def test_exit_status_follows_sys_exit(capsys: pytest.CaptureFixture[str]) -> None:
+    """None is success, an integer is kept, and anything else is printed and fails."""
+    assert exit_status(None) == 0
+    assert exit_status(3) == 3
+    assert exit_status("no upstream") == 1
+    assert capsys.readouterr().err == "no upstream\n"
+
+
+def test_in_process_runs_restore_argv_path_and_cwd(tmp_path: Path) -> None:
+    """A generator that changes the interpreter's state leaves it as it found it."""
+    argv = _script(
+        tmp_path,
+        "import os, sys\n"
+        "print(sys.argv[1:], os.getcwd())\n"
+        "sys.argv.append('extra')\n"
+        "sys.path.insert(0, 'elsewhere')\n"
+        f"os.chdir({str(tmp_path)!r})\n",
+    )
+    saved = (sys.argv[:], sys.path[:], Path.cwd())
+
+    returncode, output, timed_out = call_in_process((*argv, "--quick"), capture=True)
+
+    assert (returncode, timed_out) == (0, False)
+    assert output == f"['--quick'] {generate_all.ROOT}\n"
+    assert (sys.argv, sys.path, Path.cwd()) == saved
+
+
+def test_in_process_failures_become_exit_statuses(tmp_path: Path) -> None:
+    """An exception or ``sys.exit`` in a generator ends its run, not this one."""
+    raising = _script(tmp_path, "raise RuntimeError('upstream down')\n")
+    assert call_in_process(raising, capture=True)[0] == 1
+
+    exiting = _script(tmp_path, "import sys\nsys.exit('no upstream')\n")
+    returncode, output, _ = call_in_process(exiting, capture=True)
+    assert (returncode, output) == (1, "no upstream\n")
+
+
+def test_timeout_kills_the_generator_and_what_it_started() -> None:
+    """A child the generator started dies with it, so its output pipe closes at once."""
+    argv = (
+        "-c",
+        "import subprocess, sys, time\n"
+        "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+        "print('started', flush=True)\n"
+        "time.sleep(60)\n",
+    )
+    started = time.perf_counter()
+
+    returncode, output, timed_out = run_command(argv, 2.0, capture=True)
+
+    assert timed_out
+    assert returncode != 0
+    assert output == "started\n"
+    assert time.perf_counter() - started < 30
+
+
+def test_one_deadline_covers_the_probe_and_the_build() -> None:
+    """Time the probe spent is taken from what the build is given."""
+    dashboard = Dashboard(
+        name="slow",
+        argv=("-c", "import time; time.sleep(1.5)"),
+        inputs=("generate_all.py",),
+        probe=("-c", "import time; time.sleep(1.5); print('fingerprint: x')"),
+    )
+
+    run = run_dashboard(dashboard, timeout=2.5, capture=True)
+
+    assert run.timed_out
+    assert run.commands == 2
+    assert run.seconds < 4
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_a_failing_dashboard_leaves_the_others_alone(jobs: int) -> None:
+    """Every dashboard runs, in the order given, whatever the ones before it did."""
+    dashboards = (
+        Dashboard(name="broken", argv=("-c", "raise SystemExit(2)")),
+        Dashboard(name="fine", argv=("-c", "print('built')")),
+    )
+
+    runs = run_all(dashboards, jobs, None, {})
+
+    assert [(run.name, run.returncode, run.ok) for run in runs] == [("broken", 2, False), ("fine", 0, True)]
+    if jobs > 1:
+        assert runs[1].output == "built\n"
+
+
+def test_skipped_dashboards_keep_the_phases_of_their_last_build() -> None:
+    """A skip reports no phases, so the next build is compared against the last real ones."""
+    built = {"fetch": PhaseTotal(seconds=4.0, count=1)}
+    previous = TimingReport(
+        generated_at="2026-10-15T06:00:00+00:00",
+        dashboards={"asuci": DashboardTiming(seconds=9.0, status="ok", phases=built)},
+    )
+    runs = [
+        DashboardRun(name="asuci", returncode=0, seconds=0.5, timed_out=False, output="", skipped=True),
+        DashboardRun(name="irvine", returncode=0, seconds=0.2, timed_out=False, output="", skipped=True),
+    ]
+
+    report = timing_report(runs, previous)
+
+    assert report["dashboards"]["asuci"] == DashboardTiming(seconds=0.5, status="skipped", phases=built)
+    assert report["dashboards"]["irvine"]["phases"] == {}
+    assert timing_report(runs)["dashboards"]["asuci"]["phases"] == {}
+
+
+def test_only_builds_that_succeeded_in_full_are_recorded() -> None:
+    """An incomplete build counts as done, but is left out of the manifest to be built again."""
+    dashboards = (
+        Dashboard(name="full", argv=("-c", "")),
+        Dashboard(name="partial", argv=("-c", f"raise SystemExit({PARTIAL_BUILD_EXIT})")),
+        Dashboard(name="failed", argv=("-c", "raise SystemExit(1)")),
+    )
+    runs = [
+        DashboardRun(
+            name=dashboard.name, returncode=code, seconds=1.0, timed_out=False, output="", fingerprint="f"
+        )
+        for dashboard, code in zip(dashboards, (0, PARTIAL_BUILD_EXIT, 1), strict=True)
+    ]
+    manifest: dict[str, BuildRecord] = {}
+
+    record_runs(manifest, runs, dashboards)
+
+    assert [(run.ok, run.partial) for run in runs] == [(True, False), (True, True), (False, False)]
+    assert list(manifest) == ["full"]
+    assert run_all(dashboards[1:2], 1, None, {})[0].partial
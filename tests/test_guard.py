@@ -7,6 +7,7 @@ import pytest
 from scripts import _test_hooks as hooks
 from scripts.guard import (
     CHAIN_CERT,
+    GUARDED_MODULES,
     _suppression_patterns,
     check_chain_certificate,
     check_no_browser_automation,
@@ -61,8 +62,9 @@ def _make_project(root: Path, *, browser_import: bool = False, cert: str | None
         cert: Contents for the chain certificate, or None to omit the file.
     """
     (root / "asuci" / "certs").mkdir(parents=True, exist_ok=True)
-    for name in ("models.py", "parse.py", "client.py"):
-        (root / "asuci" / name).write_text("VALUE = 1\n", encoding="utf-8")
+    for relative in GUARDED_MODULES:
+        (root / relative).parent.mkdir(parents=True, exist_ok=True)
+        (root / relative).write_text("VALUE = 1\n", encoding="utf-8")
 
     body = "import playwright\n" if browser_import else "import requests\n"
     (root / "asuci" / "generate.py").write_text(body, encoding="utf-8")
@@ -0,0 +1,247 @@
+"""Tests for the on-disk HTTP response cache.
+
+The cache is an optimisation, so besides the hit and eviction rules these
+check that a damaged entry degrades to a miss rather than to an error.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from shared.utils.http_cache import (
+    CacheEntry,
+    ResponseCache,
+    cache_key,
+    conditional_headers,
+    has_validators,
+)
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self, now: float) -> None:
+        """Start the clock.
+
+        Args:
+            now: Initial time in epoch seconds.
+        """
+        self.now = now
+
+    def __call__(self) -> float:
+        """Read the clock.
+
+        Returns:
+            The current fake time.
+        """
+        return self.now
+
+
+def _entry(etag: str = "", last_modified: str = "", stored_at: float = 1000.0) -> CacheEntry:
+    """Build an entry with chosen validators.
+
+    Args:
+        etag: ETag to record.
+        last_modified: Last-Modified date to record.
+        stored_at: When the entry was stored.
+
+    Returns:
+        The entry.
+    """
+    return CacheEntry(
+        url="https://x.test/", body="b", etag=etag, last_modified=last_modified, stored_at=stored_at
+    )
+
+
+def test_cache_key_ignores_parameter_order() -> None:
+    """The same request keys to the same entry however its parameters are ordered."""
+    assert cache_key("https://x.test/", {"a": "1", "b": "2"}) == cache_key(
+        "https://x.test/", {"b": "2", "a": "1"}
+    )
+
+
+def test_cache_key_separates_distinct_parameters() -> None:
+    """Different academic years are different entries."""
+    assert cache_key("https://x.test/", {"year": "20242025"}) != cache_key(
+        "https://x.test/", {"year": "20232024"}
+    )
+
+
+def test_conditional_headers_carry_both_validators() -> None:
+    """Each validator the server sent becomes its conditional header."""
+    headers = conditional_headers(_entry(etag='"abc"', last_modified="Tue, 01 Jul 2025 00:00:00 GMT"))
+
+    assert headers == {"If-None-Match": '"abc"', "If-Modified-Since": "Tue, 01 Jul 2025 00:00:00 GMT"}
+
+
+def test_conditional_headers_are_empty_without_validators() -> None:
+    """An entry the server gave no validators for cannot be asked about."""
+    assert conditional_headers(_entry()) == {}
+    assert not has_validators(_entry())
+
+
+def test_store_then_lookup_round_trips(tmp_path: Path) -> None:
+    """A stored body and its validators come back unchanged."""
+    cache = ResponseCache(tmp_path, clock=FakeClock(1000.0))
+    key = cache_key("https://x.test/", {})
+
+    cache.store(key, "https://x.test/", "body é", '"v1"', "")
+
+    assert cache.lookup(key) == {
+        "url": "https://x.test/",
+        "body": "body é",
+        "etag": '"v1"',
+        "last_modified": "",
+        "stored_at": 1000.0,
+    }
+
+
+def test_lookup_misses_an_absent_entry(tmp_path: Path) -> None:
+    """Nothing stored means nothing served."""
+    assert ResponseCache(tmp_path).lookup(cache_key("https://x.test/", {})) is None
+
+
+def test_lookup_discards_an_entry_that_is_not_json(tmp_path: Path) -> None:
+    """A truncated entry is a miss, and is removed."""
+    key = cache_key("https://x.test/", {})
+    (tmp_path / f"{key}.json").write_text("{", encoding="utf-8")
+
+    assert ResponseCache(tmp_path).lookup(key) is None
+    assert not (tmp_path / f"{key}.json").exists()
+
+
+def test_lookup_discards_an_entry_that_is_not_utf8(tmp_path: Path) -> None:
+    """An entry with undecodable bytes is a miss, and is removed."""
+    key = cache_key("https://x.test/", {})
+    (tmp_path / f"{key}.json").write_bytes(b'{"url": "\xff"}')
+
+    assert ResponseCache(tmp_path).lookup(key) is None
+    assert not (tmp_path / f"{key}.json").exists()
+
+
+def test_lookup_misses_an_entry_it_cannot_open(tmp_path: Path) -> None:
+    """An entry the run may not read or remove is a miss, not a crash."""
+    key = cache_key("https://x.test/", {})
+    (tmp_path / f"{key}.json").mkdir()
+
+    assert ResponseCache(tmp_path).lookup(key) is None
+
+
+def test_lookup_misses_an_entry_it_cannot_touch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A readable entry whose recency cannot be updated is skipped."""
+    cache = ResponseCache(tmp_path)
+    key = cache_key("https://x.test/", {})
+    cache.store(key, "https://x.test/", "body", "", "")
+
+    def refuse(path: Path, times: tuple[float, float]) -> None:
+        raise PermissionError(path)
+
+    monkeypatch.setattr("shared.utils.http_cache.os.utime", refuse)
+
+    assert cache.lookup(key) is None
+
+
+def test_lookup_discards_an_entry_of_the_wrong_shape(tmp_path: Path) -> None:
+    """An entry missing a field or holding the wrong type is a miss."""
+    cache = ResponseCache(tmp_path)
+    shapes = [
+        [],
+        {"url": "u", "body": "b", "etag": "", "last_modified": ""},
+        {"url": "u", "body": "b", "etag": "", "last_modified": "", "stored_at": True},
+        {"url": "u", "body": 1, "etag": "", "last_modified": "", "stored_at": 1},
+    ]
+
+    for index, shape in enumerate(shapes):
+        key = cache_key("https://x.test/", {"n": str(index)})
+        (tmp_path / f"{key}.json").write_text(json.dumps(shape), encoding="utf-8")
+        assert cache.lookup(key) is None
+
+
+def test_lookup_accepts_an_integer_timestamp(tmp_path: Path) -> None:
+    """A whole-second timestamp written by hand still decodes."""
+    key = cache_key("https://x.test/", {})
+    entry = {"url": "u", "body": "b", "etag": "", "last_modified": "", "stored_at": 5}
+    (tmp_path / f"{key}.json").write_text(json.dumps(entry), encoding="utf-8")
+
+    found = ResponseCache(tmp_path).lookup(key)
+
+    assert found is not None
+    assert found["stored_at"] == 5.0
+
+
+def test_is_fresh_never_holds_for_an_entry_with_validators(tmp_path: Path) -> None:
+    """Anything the server can revalidate is revalidated, however young."""
+    cache = ResponseCache(tmp_path, max_age=3600, clock=FakeClock(1000.0))
+
+    assert not cache.is_fresh(_entry(etag='"v1"', stored_at=1000.0))
+
+
+def test_is_fresh_honours_max_age_without_validators(tmp_path: Path) -> None:
+    """A validator-less entry is reused until it is max_age old."""
+    clock = FakeClock(1000.0)
+    cache = ResponseCache(tmp_path, max_age=60, clock=clock)
+    entry = _entry(stored_at=1000.0)
+
+    clock.now = 1059.0
+    assert cache.is_fresh(entry)
+
+    clock.now = 1060.0
+    assert not cache.is_fresh(entry)
+
+
+def test_is_fresh_is_off_by_default(tmp_path: Path) -> None:
+    """With no max age, a validator-less entry is always refetched."""
+    cache = ResponseCache(tmp_path, clock=FakeClock(1000.0))
+
+    assert not cache.is_fresh(_entry(stored_at=1000.0))
+
+
+def test_store_evicts_the_least_recently_used_entry(tmp_path: Path) -> None:
+    """Beyond the budget, the entry untouched longest goes first."""
+    clock = FakeClock(1000.0)
+    cache = ResponseCache(tmp_path, max_bytes=400, clock=clock)
+    old, used, new = (cache_key("https://x.test/", {"n": n}) for n in ("old", "used", "new"))
+
+    cache.store(old, "https://x.test/", "x" * 100, "", "")
+    clock.now = 1001.0
+    cache.store(used, "https://x.test/", "x" * 100, "", "")
+    clock.now = 1002.0
+    cache.lookup(old)
+    clock.now = 1003.0
+    cache.store(new, "https://x.test/", "x" * 100, "", "")
+
+    assert cache.lookup(used) is None
+    assert cache.lookup(old) is not None
+    assert cache.lookup(new) is not None
+
+
+def test_store_keeps_an_entry_larger_than_the_budget(tmp_path: Path) -> None:
+    """The entry just written survives even when it alone exceeds the budget."""
+    cache = ResponseCache(tmp_path, max_bytes=10, clock=FakeClock(1000.0))
+    key = cache_key("https://x.test/", {})
+
+    cache.store(key, "https://x.test/", "x" * 100, "", "")
+
+    assert cache.lookup(key) is not None
+
+
+def test_store_leaves_unrelated_files_alone(tmp_path: Path) -> None:
+    """Only entry files count toward the budget or are evicted."""
+    notes = tmp_path / "README.txt"
+    notes.write_text("x" * 1000, encoding="utf-8")
+    cache = ResponseCache(tmp_path, max_bytes=10, clock=FakeClock(1000.0))
+
+    cache.store(cache_key("https://x.test/", {}), "https://x.test/", "b", "", "")
+
+    assert notes.exists()
+
+
+def test_store_marks_the_entry_as_just_used(tmp_path: Path) -> None:
+    """Recency is the entry file's modification time, set from the cache clock."""
+    cache = ResponseCache(tmp_path, clock=FakeClock(1234.0))
+    key = cache_key("https://x.test/", {})
+
+    cache.store(key, "https://x.test/", "b", "", "")
+
+    assert os.stat(tmp_path / f"{key}.json").st_mtime == 1234.0
@@ -0,0 +1,31 @@
+"""Tests for the keep-alive sessions shared by every run in an interpreter."""
+
+import runpy
+from pathlib import Path
+
+from requests.adapters import HTTPAdapter
+from shared.utils.http_sessions import host_session
+
+
+def test_a_host_gets_one_session_however_it_is_asked_for() -> None:
+    """Calls for the same host and pool share a session; other hosts get their own."""
+    session = host_session("sessions.test", 4)
+
+    assert host_session("sessions.test", pool_size=4) is session
+    assert host_session("other.sessions.test", 4) is not session
+    adapter = session.get_adapter("https://sessions.test/")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 4
+
+
+def test_sessions_survive_a_script_run_afresh(tmp_path: Path) -> None:
+    """A script run twice by path, as generate_all runs a generator in process, gets one session."""
+    script = tmp_path / "generate.py"
+    script.write_text(
+        'from shared.utils.http_sessions import host_session\nSESSION = host_session("script.test")\n',
+        encoding="utf-8",
+    )
+
+    first = runpy.run_path(str(script))["SESSION"]
+
+    assert runpy.run_path(str(script))["SESSION"] is first
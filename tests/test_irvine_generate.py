@@ -0,0 +1,154 @@
+"""Tests for the Irvine generator's page readers.
+
+The generator lives in a directory that is not importable, so it is run by
+path, as benchmarks/granicus_listing.py runs it, and its readers are taken
+from the resulting namespace.
+"""
+
+import runpy
+
+import pytest
+from benchmarks.granicus_listing import BASE_URL, GENERATOR, synthetic_listing
+
+IRVINE = runpy.run_path(str(GENERATOR), run_name="irvine_generate_tests")
+
+
+def test_listing_readers_agree_on_the_viewpublisher_page(granicus_listing_html: str) -> None:
+    """The row and link readers read the same meetings, in the same order, from the listing."""
+    meetings = IRVINE["_parse_granicus_rows"](granicus_listing_html, BASE_URL)
+
+    assert meetings == IRVINE["_parse_granicus_links"](granicus_listing_html, BASE_URL)
+    assert len(meetings) == 17
+    assert meetings[0] == {
+        "name": "CITY COUNCIL REGULAR MEETING",
+        "date": "September 22, 2026",
+        "agenda_url": f"{BASE_URL}/AgendaViewer.php?view_id=68&event_id=99999",
+        "minutes_url": None,
+        "video_url": None,
+        "event_id": None,
+    }
+    assert meetings[2] == {
+        "name": "CITY COUNCIL REGULAR MEETING - CANCELLED",
+        "date": "August 25, 2026",
+        "agenda_url": f"{BASE_URL}/AgendaViewer.php?view_id=68&clip_id=7487",
+        "minutes_url": (
+            f"{BASE_URL}/MinutesViewer.php?view_id=68&clip_id=7487&doc_id=687e1f99-9b5d-11f1-bb61-005056a89546"
+        ),
+        "video_url": f"{BASE_URL}/player/clip/7487?view_id=68",
+        "event_id": None,
+    }
+    assert meetings[1]["event_id"] == "2900"
+    assert [meeting["date"] for meeting in meetings[-3:]] == [
+        "March 10, 2026",
+        "March 10, 2026",
+        "February 24, 2026",
+    ]
+
+
+def test_listing_readers_agree_on_the_synthetic_archive() -> None:
+    """The benchmark's archive, with its placeholders, repeats and other bodies, reads the same both ways."""
+    markup = synthetic_listing(400)
+
+    meetings = IRVINE["_parse_granicus_rows"](markup, BASE_URL)
+
+    assert meetings == IRVINE["_parse_granicus_links"](markup, BASE_URL)
+    assert meetings
+    assert all("CITY COUNCIL" in meeting["name"].upper() for meeting in meetings)
+
+
+def test_agenda_items_are_read_in_order_once(irvine_agenda_html: str) -> None:
+    """Items numbered inline or in a cell of their own are read once, addresses and scripts skipped."""
+    items = IRVINE["parse_agenda_items"](irvine_agenda_html)
+
+    assert [item["number"] for item in items] == [
+        "1",
+        "2",
+        "3",
+        "1.1",
+        "3.1",
+        "3.2",
+        "3.3",
+        "4",
+        "4.1",
+        "5",
+        "5.1",
+    ]
+    assert items[0] == {"number": "1", "title": "PRESENTATIONS"}
+    assert items[4] == {"number": "3.1", "title": "MINUTES OF CITY COUNCIL MEETINGS"}
+    assert items[-1] == {
+        "number": "5.1",
+        "title": "Council Member Request to Consider an Expanded Youth Sports Field Allocation Policy",
+    }
+
+
+def test_council_roster_reads_every_member(irvine_council_html: str) -> None:
+    """Each profile card gives a member, named from its link or, for "Read more", its path."""
+    members = IRVINE["parse_council_roster"](irvine_council_html)
+
+    assert [(member["name"], member["position"], member["district"]) for member in members] == [
+        ("Larry Agran", "Mayor", "At-Large"),
+        ("James Mai", "Vice Mayor", "District 3"),
+        ("Melinda Liu", "Councilmember", "District 1"),
+        ("William Go", "Councilmember", "District 2"),
+        ("Mike Carroll", "Councilmember", "District 4"),
+        ("Betty Martinez Franco", "Councilmember", "District 5"),
+        ("Kathleen Treseder", "Councilmember", "At-Large"),
+    ]
+    assert members[1] == {
+        "name": "James Mai",
+        "position": "Vice Mayor",
+        "district": "District 3",
+        "photo": "https://cityofirvine.gov/sites/default/files/file-repository/CM%20Mai_5x7.jpg",
+        "city_page": "https://cityofirvine.gov/city-council/vice-mayor-james-mai-district-3",
+    }
+    assert all(
+        member["photo"].startswith("https://cityofirvine.gov/sites/default/files/") for member in members
+    )
+
+
+def test_probe_reads_only_the_listing_and_the_roster(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    granicus_listing_html: str,
+    irvine_council_html: str,
+) -> None:
+    """The probe neither reads agendas nor touches portraits, and moves when the roster page does."""
+    namespace = IRVINE["probe"].__globals__
+    pages = {IRVINE["ROSTER_URL"]: irvine_council_html}
+
+    def untouched(*args: object) -> None:
+        raise AssertionError("the probe read agendas or portraits")
+
+    monkeypatch.setitem(
+        namespace, "fetch_granicus_listing", lambda use_cache: (granicus_listing_html, "fetched")
+    )
+    monkeypatch.setitem(namespace, "fetch_page", lambda url, params, cache, session: (pages[url], "fetched"))
+    monkeypatch.setitem(namespace, "fetch_agenda_items", untouched)
+    monkeypatch.setitem(namespace, "localize_portraits", untouched)
+
+    IRVINE["probe"](use_cache=False)
+    first = capsys.readouterr().out
+    IRVINE["probe"](use_cache=False)
+    again = capsys.readouterr().out
+    pages[IRVINE["ROSTER_URL"]] = irvine_council_html.replace("James Mai", "Jim Mai")
+    IRVINE["probe"](use_cache=False)
+
+    assert first.startswith("fingerprint: ")
+    assert again == first
+    assert capsys.readouterr().out != first
+
+
+def test_a_curated_roster_or_failed_agendas_leave_the_build_incomplete(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """What the page was read without is reported, so the run can exit as a partial build."""
+    namespace = IRVINE["collect_data"].__globals__
+    monkeypatch.setitem(namespace, "fetch_meetings_granicus", lambda use_cache: ([], "listing fetched"))
+    monkeypatch.setitem(namespace, "_timed_roster", lambda use_cache: ([], "curated roster", True))
+    monkeypatch.setitem(namespace, "fetch_agenda_items", lambda meetings, use_cache: ("2 upcoming", 2))
+
+    data, incomplete = IRVINE["collect_data"](use_cache=False)
+
+    assert incomplete == ["the city roster", "2 agendas"]
+    assert data["meetings"] == []
+    assert IRVINE["collect_data"](quick_mode=True)[1] == []
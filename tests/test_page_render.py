@@ -0,0 +1,109 @@
+"""Tests for template rendering and change-aware page writes.
+
+Pages are rendered from a throwaway template in a temporary directory, so
+these check the compile-once cache and the skip rule without the dashboard.
+"""
+
+from pathlib import Path
+
+from shared.utils.page_render import (
+    CONTENT_DIGEST_MARK,
+    GENERATED_AT_MARK,
+    content_digest,
+    load_template,
+    read_page_digest,
+    write_page,
+)
+
+_TEMPLATE = (
+    "<!DOCTYPE html>\n"
+    "<!-- content-digest: {{ content_digest }} -->\n"
+    "<p>{{ generated_at }}</p>\n"
+    "<p>{{ body }}</p>\n"
+)
+
+
+def _render(tmp_path: Path, body: str) -> str:
+    """Render the test template with placeholders, as the generator does.
+
+    Args:
+        tmp_path: Directory holding the template and its bytecode.
+        body: Text to place in the page.
+
+    Returns:
+        The stable page.
+    """
+    templates = tmp_path / "templates"
+    templates.mkdir(exist_ok=True)
+    (templates / "page.j2").write_text(_TEMPLATE, encoding="utf-8")
+    template = load_template(templates, "page.j2", tmp_path / "bytecode")
+    return template.render(content_digest=CONTENT_DIGEST_MARK, generated_at=GENERATED_AT_MARK, body=body)
+
+
+def test_template_is_compiled_once_and_kept_as_bytecode(tmp_path: Path) -> None:
+    """Repeated loads return the same template, and its bytecode lands on disk."""
+    _render(tmp_path, "a")
+    templates = tmp_path / "templates"
+
+    first = load_template(templates, "page.j2", tmp_path / "bytecode")
+    second = load_template(templates, "page.j2", tmp_path / "bytecode")
+
+    assert first is second
+    assert list((tmp_path / "bytecode").iterdir())
+
+
+def test_template_escapes_markup(tmp_path: Path) -> None:
+    """Values are HTML-escaped unless the template marks them safe."""
+    assert "<p>&lt;b&gt;</p>" in _render(tmp_path, "<b>")
+
+
+def test_first_write_fills_in_digest_and_timestamp(tmp_path: Path) -> None:
+    """A new page is written with both placeholders replaced."""
+    stable = _render(tmp_path, "a")
+    path = tmp_path / "index.html"
+
+    outcome = write_page(path, stable, "2026-03-01 06:00:00")
+
+    assert outcome["status"] == "written"
+    assert outcome["digest"] == content_digest(stable)
+    page = path.read_text(encoding="utf-8")
+    assert f"<!-- content-digest: {outcome['digest']} -->" in page
+    assert "<p>2026-03-01 06:00:00</p>" in page
+    assert GENERATED_AT_MARK not in page
+    assert CONTENT_DIGEST_MARK not in page
+    assert sorted(tmp_path.iterdir()) == sorted([path, tmp_path / "templates", tmp_path / "bytecode"])
+
+
+def test_unchanged_content_leaves_the_page_alone(tmp_path: Path) -> None:
+    """A later run with the same data keeps the earlier page and its timestamp."""
+    path = tmp_path / "index.html"
+    write_page(path, _render(tmp_path, "a"), "2026-03-01 06:00:00")
+
+    outcome = write_page(path, _render(tmp_path, "a"), "2026-03-02 06:00:00")
+
+    assert outcome["status"] == "unchanged"
+    assert "<p>2026-03-01 06:00:00</p>" in path.read_text(encoding="utf-8")
+
+
+def test_changed_content_replaces_the_page(tmp_path: Path) -> None:
+    """New data is written along with the new timestamp."""
+    path = tmp_path / "index.html"
+    first = write_page(path, _render(tmp_path, "a"), "2026-03-01 06:00:00")
+
+    second = write_page(path, _render(tmp_path, "b"), "2026-03-02 06:00:00")
+
+    assert second["status"] == "written"
+    assert second["digest"] != first["digest"]
+    page = path.read_text(encoding="utf-8")
+    assert "<p>b</p>" in page
+    assert "<p>2026-03-02 06:00:00</p>" in page
+
+
+def test_page_without_a_digest_reads_as_none(tmp_path: Path) -> None:
+    """An absent page, or one written before digests, is always rewritten."""
+    path = tmp_path / "index.html"
+    assert read_page_digest(path) is None
+
+    path.write_text("<!DOCTYPE html>\n<p>old</p>\n", encoding="utf-8")
+    assert read_page_digest(path) is None
+    assert write_page(path, _render(tmp_path, "a"), "2026-03-01 06:00:00")["status"] == "written"
@@ -0,0 +1,185 @@
+"""Tests for the phase timings generators report to generate_all."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from shared.utils import phase_timing
+from shared.utils.phase_timing import (
+    TIMINGS_ENV,
+    DashboardTiming,
+    PhaseTotal,
+    Slowdown,
+    TimingReport,
+    find_slowdowns,
+    load_report,
+    read_phases,
+    reset,
+    save_report,
+    snapshot,
+    span,
+    write_phases,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_totals() -> Iterator[None]:
+    """Start and end every test with no totals recorded."""
+    reset()
+    yield
+    reset()
+
+
+def _clock(*readings: float) -> Iterator[float]:
+    """A clock returning the given readings in turn.
+
+    Args:
+        readings: Seconds to return, one per call.
+
+    Returns:
+        An iterator whose ``__next__`` serves as the clock.
+    """
+    return iter(readings)
+
+
+def _report(**phases: float) -> TimingReport:
+    """A report of one dashboard with the given phase times.
+
+    Args:
+        phases: Seconds keyed by phase.
+
+    Returns:
+        The report.
+    """
+    totals = {phase: PhaseTotal(seconds=seconds, count=1) for phase, seconds in phases.items()}
+    return TimingReport(
+        generated_at="2026-10-16T00:00:00+00:00",
+        dashboards={"asuci": DashboardTiming(seconds=10.0, status="ok", phases=totals)},
+    )
+
+
+def test_spans_of_one_phase_add_up() -> None:
+    """Each span adds its time to its phase, in the order phases were entered."""
+    with span("fetch", _clock(0.0, 2.0).__next__):
+        pass
+    with span("render", _clock(2.0, 2.5).__next__):
+        pass
+    with span("fetch", _clock(3.0, 4.0).__next__):
+        pass
+
+    assert snapshot() == {
+        "fetch": PhaseTotal(seconds=3.0, count=2),
+        "render": PhaseTotal(seconds=0.5, count=1),
+    }
+
+
+def test_span_records_a_block_that_raises() -> None:
+    """A failing phase still reports how long it ran."""
+    with pytest.raises(RuntimeError), span("fetch", _clock(0.0, 1.5).__next__):
+        raise RuntimeError("upstream down")
+
+    assert snapshot() == {"fetch": PhaseTotal(seconds=1.5, count=1)}
+
+
+def test_reset_forgets_every_total() -> None:
+    """A generator run in-process starts from nothing."""
+    with span("fetch"):
+        pass
+
+    reset()
+
+    assert snapshot() == {}
+
+
+def test_phases_round_trip(tmp_path: Path) -> None:
+    """Totals written by a generator read back unchanged."""
+    path = tmp_path / "phases" / "asuci.json"
+    phases = {"fetch": PhaseTotal(seconds=1.25, count=3)}
+
+    write_phases(path, phases)
+
+    assert read_phases(path) == phases
+
+
+def test_read_phases_tolerates_missing_and_malformed_files(tmp_path: Path) -> None:
+    """Unreadable totals count as none, and malformed entries are dropped."""
+    path = tmp_path / "phases.json"
+    assert read_phases(path) == {}
+
+    path.write_text("not json", encoding="utf-8")
+    assert read_phases(path) == {}
+
+    path.write_text("[1, 2]", encoding="utf-8")
+    assert read_phases(path) == {}
+
+    path.write_text(
+        '{"fetch": {"seconds": 2, "count": 1}, "parse": {"seconds": "x", "count": 1}, "write": 3}',
+        encoding="utf-8",
+    )
+    assert read_phases(path) == {"fetch": PhaseTotal(seconds=2.0, count=1)}
+
+
+def test_flush_writes_where_the_environment_says(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A generator in its own interpreter hands its totals over on exit."""
+    target = tmp_path / "asuci.json"
+    with span("render", _clock(0.0, 0.25).__next__):
+        pass
+
+    monkeypatch.delenv(TIMINGS_ENV, raising=False)
+    phase_timing._flush()
+    assert not target.exists()
+
+    monkeypatch.setenv(TIMINGS_ENV, str(target))
+    phase_timing._flush()
+    assert read_phases(target) == {"render": PhaseTotal(seconds=0.25, count=1)}
+
+
+def test_report_round_trips(tmp_path: Path) -> None:
+    """A stored report reads back unchanged."""
+    path = tmp_path / "timings.json"
+    report = _report(fetch=4.0, render=0.5)
+
+    save_report(path, report)
+
+    assert load_report(path) == report
+
+
+def test_load_report_tolerates_missing_and_malformed_files(tmp_path: Path) -> None:
+    """An unreadable report counts as absent; malformed dashboards are dropped."""
+    path = tmp_path / "timings.json"
+    assert load_report(path) is None
+
+    path.write_text("{", encoding="utf-8")
+    assert load_report(path) is None
+
+    path.write_text("[]", encoding="utf-8")
+    assert load_report(path) is None
+
+    path.write_text('{"generated_at": 1, "dashboards": {}}', encoding="utf-8")
+    assert load_report(path) is None
+
+    path.write_text(
+        '{"generated_at": "t", "dashboards": {"a": {"seconds": 1, "status": "ok", "phases": []},'
+        ' "b": {"seconds": "x", "status": "ok"}, "c": 5}}',
+        encoding="utf-8",
+    )
+    assert load_report(path) == TimingReport(
+        generated_at="t", dashboards={"a": DashboardTiming(seconds=1.0, status="ok", phases={})}
+    )
+
+
+def test_find_slowdowns_flags_only_real_regressions() -> None:
+    """A phase is flagged when it is both proportionally and absolutely slower."""
+    previous = _report(fetch=10.0, parse=0.1, render=2.0, write=1.0)
+    current = _report(fetch=13.0, parse=0.4, render=2.3, write=1.0, harvest=30.0)
+
+    assert find_slowdowns(previous, current) == [
+        Slowdown(dashboard="asuci", phase="fetch", previous=10.0, current=13.0)
+    ]
+
+
+def test_find_slowdowns_ignores_dashboards_without_an_earlier_run() -> None:
+    """A dashboard new to the report has nothing to be compared against."""
+    previous = TimingReport(generated_at="t", dashboards={})
+
+    assert find_slowdowns(previous, _report(fetch=100.0)) == []
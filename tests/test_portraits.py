@@ -0,0 +1,374 @@
+"""Tests for the local portrait pipeline.
+
+Downloads are served by a fake that records every request, so these check
+that a portrait is fetched, revalidated and resized only when it must be, and
+that anything going wrong leaves the source URL in place.
+"""
+
+import json
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+import shared.utils.portraits
+from PIL import Image
+from shared.utils.portraits import (
+    DisplaySize,
+    Download,
+    Portrait,
+    PortraitPipeline,
+    host_downloader,
+    localize_photos,
+    render_thumbnails,
+    session_downloader,
+    thumbnail_size,
+)
+
+SIZE = DisplaySize(width=140, height=175)
+URL = "https://city.test/mayor.jpg"
+
+
+def _image(width: int, height: int, mode: str = "RGB", image_format: str = "JPEG") -> bytes:
+    """Encode a blank image.
+
+    Args:
+        width: Width in pixels.
+        height: Height in pixels.
+        mode: Pillow colour mode.
+        image_format: Pillow format name.
+
+    Returns:
+        The encoded bytes.
+    """
+    buffer = BytesIO()
+    Image.new(mode, (width, height), "red").save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+class FakeServer:
+    """Serves portraits by URL and records each request."""
+
+    def __init__(self, bodies: dict[str, bytes], etag: str = "") -> None:
+        """Start the server.
+
+        Args:
+            bodies: Response body for each URL it knows.
+            etag: ETag sent with every body; a request that presents it gets a
+                304.
+        """
+        self.bodies = bodies
+        self.etag = etag
+        self.requests: list[tuple[str, dict[str, str]]] = []
+
+    def __call__(self, url: str, headers: dict[str, str]) -> Download:
+        """Answer a request.
+
+        Args:
+            url: URL requested.
+            headers: Request headers.
+
+        Returns:
+            The response.
+
+        Raises:
+            ConnectionError: For a URL the server does not know.
+        """
+        self.requests.append((url, headers))
+        if url not in self.bodies:
+            raise ConnectionError(url)
+        if self.etag and headers.get("If-None-Match") == self.etag:
+            return Download(status=304, body=b"", etag=self.etag, last_modified="")
+        return Download(status=200, body=self.bodies[url], etag=self.etag, last_modified="Tue, 1 Sep 2026")
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self, now: float) -> None:
+        """Start the clock.
+
+        Args:
+            now: Initial time in epoch seconds.
+        """
+        self.now = now
+
+    def __call__(self) -> float:
+        """Read the clock.
+
+        Returns:
+            The current fake time.
+        """
+        return self.now
+
+
+def _pipeline(tmp_path: Path, server: FakeServer, clock: FakeClock | None = None) -> PortraitPipeline:
+    """Build a pipeline over a temporary store and dashboard.
+
+    Args:
+        tmp_path: Test directory.
+        server: Downloader to use.
+        clock: Clock to use; a fixed one when omitted.
+
+    Returns:
+        The pipeline.
+    """
+    return PortraitPipeline(
+        tmp_path / "store",
+        tmp_path / "dashboard" / "portraits",
+        SIZE,
+        server,
+        clock=clock or FakeClock(1000.0),
+    )
+
+
+def test_thumbnail_size_never_enlarges() -> None:
+    """Thumbnails are drawn at twice the box, unless the original is smaller."""
+    assert thumbnail_size((2000, 3000), SIZE) == (280, 350)
+    assert thumbnail_size((140, 1000), SIZE) == (140, 175)
+    assert thumbnail_size((1, 1), SIZE) == (1, 1)
+
+
+def test_render_thumbnails_crops_to_the_box() -> None:
+    """Both thumbnails have the box's proportions, whatever the original's."""
+    jpeg, webp = render_thumbnails(_image(1000, 300, "RGBA", "PNG"), SIZE)
+
+    with Image.open(BytesIO(jpeg)) as image:
+        assert (image.format, image.size) == ("JPEG", (240, 300))
+    with Image.open(BytesIO(webp)) as image:
+        assert (image.format, image.size) == ("WEBP", (240, 300))
+
+
+def test_localize_stores_and_renders_once(tmp_path: Path) -> None:
+    """A portrait is downloaded and resized on first sight, then reused."""
+    server = FakeServer({URL: _image(800, 1000)})
+    pipeline = _pipeline(tmp_path, server)
+
+    portrait = pipeline.localize(URL)
+    again = pipeline.localize(URL)
+
+    assert portrait == again
+    assert portrait is not None
+    assert portrait.jpeg.startswith("portraits/portrait-") and portrait.jpeg.endswith("-140x175.jpg")
+    assert (tmp_path / "dashboard" / portrait.webp).is_file()
+    assert len(server.requests) == 1
+    assert pipeline.outcomes == {"fetched": 1, "revalidated": 0, "fresh": 1, "rendered": 1, "failed": 0}
+    assert pipeline.describe() == "1 fetched, 0 revalidated, 1 reused, 1 resized, 0 failed"
+
+
+def test_a_new_run_reuses_the_stored_original_and_thumbnails(tmp_path: Path) -> None:
+    """Thumbnails already in the dashboard are not drawn again."""
+    server = FakeServer({URL: _image(800, 1000)})
+    _pipeline(tmp_path, server).localize(URL)
+
+    later = _pipeline(tmp_path, server)
+    later.localize(URL)
+
+    assert later.outcomes["rendered"] == 0
+    assert len(server.requests) == 1
+
+
+def test_stale_originals_are_revalidated(tmp_path: Path) -> None:
+    """Past max_age the server is asked, and a 304 keeps the stored original."""
+    server = FakeServer({URL: _image(800, 1000)}, etag='"v1"')
+    clock = FakeClock(1000.0)
+    pipeline = _pipeline(tmp_path, server, clock)
+    first = pipeline.localize(URL)
+
+    clock.now += pipeline.max_age + 1
+    second = pipeline.localize(URL)
+
+    assert first == second
+    assert server.requests[1] == (URL, {"If-None-Match": '"v1"', "If-Modified-Since": "Tue, 1 Sep 2026"})
+    assert pipeline.outcomes["revalidated"] == 1
+
+    # The 304 sent no Last-Modified, so only the ETag is presented next time.
+    clock.now += pipeline.max_age + 1
+    pipeline.localize(URL)
+    assert server.requests[2] == (URL, {"If-None-Match": '"v1"'})
+
+
+def test_a_changed_portrait_gets_new_thumbnails(tmp_path: Path) -> None:
+    """A source that serves a different image is resized under new names."""
+    server = FakeServer({URL: _image(800, 1000)})
+    clock = FakeClock(1000.0)
+    pipeline = _pipeline(tmp_path, server, clock)
+    first = pipeline.localize(URL)
+
+    server.bodies[URL] = _image(900, 1000)
+    clock.now += pipeline.max_age + 1
+    second = pipeline.localize(URL)
+
+    assert second is not None and second != first
+    assert server.requests[1] == (URL, {"If-Modified-Since": "Tue, 1 Sep 2026"})
+    assert pipeline.outcomes["rendered"] == 2
+
+
+def test_an_unreachable_source_falls_back_to_the_stored_original(tmp_path: Path) -> None:
+    """A server that is down does not lose a portrait already stored."""
+    server = FakeServer({URL: _image(800, 1000)})
+    clock = FakeClock(1000.0)
+    pipeline = _pipeline(tmp_path, server, clock)
+    first = pipeline.localize(URL)
+
+    del server.bodies[URL]
+    clock.now += pipeline.max_age + 1
+
+    assert pipeline.localize(URL) == first
+
+
+def test_failures_keep_the_source(tmp_path: Path) -> None:
+    """Unreachable sources and bodies that are not images localize to nothing."""
+    server = FakeServer({"https://city.test/page.html": b"<html>"})
+    pipeline = _pipeline(tmp_path, server)
+
+    assert pipeline.localize("https://city.test/missing.jpg") is None
+    assert pipeline.localize("https://city.test/page.html") is None
+    assert pipeline.outcomes["failed"] == 2
+
+
+def test_damaged_entries_count_as_absent(tmp_path: Path) -> None:
+    """An entry that cannot be read, or whose original is gone, is fetched again."""
+    server = FakeServer({URL: _image(800, 1000)})
+    pipeline = _pipeline(tmp_path, server)
+    pipeline.localize(URL)
+    (entry,) = (tmp_path / "store" / "sources").iterdir()
+
+    entry.write_text("{", encoding="utf-8")
+    pipeline.localize(URL)
+    entry.write_text("[]", encoding="utf-8")
+    pipeline.localize(URL)
+    entry.write_text(json.dumps({"url": URL}), encoding="utf-8")
+    pipeline.localize(URL)
+    for original in (tmp_path / "store" / "originals").iterdir():
+        original.unlink()
+    pipeline.localize(URL)
+
+    assert pipeline.outcomes["fetched"] == 5
+
+
+def test_localize_photos_rewrites_records(tmp_path: Path) -> None:
+    """Records with a source URL point at the thumbnails; the rest are untouched."""
+    server = FakeServer({URL: _image(800, 1000)})
+    pipeline = _pipeline(tmp_path, server)
+    records: list[dict[str, object]] = [
+        {"name": "Mayor", "photo": "//city.test/mayor.jpg"},
+        {"name": "Twin", "photo": URL},
+        {"name": "Missing", "photo": "https://city.test/missing.jpg"},
+        {"name": "Local", "photo": "portraits/portrait-0.jpg"},
+        {"name": "None", "photo": None},
+    ]
+
+    assert localize_photos(records, pipeline) == 2
+
+    portrait = pipeline.localize(URL)
+    assert portrait is not None
+    assert records[0] == {"name": "Mayor", "photo": portrait.jpeg, "photo_webp": portrait.webp}
+    assert records[1]["photo"] == portrait.jpeg
+    assert records[2] == {"name": "Missing", "photo": "https://city.test/missing.jpg"}
+    assert records[3:] == [
+        {"name": "Local", "photo": "portraits/portrait-0.jpg"},
+        {"name": "None", "photo": None},
+    ]
+    assert sorted(url for url, _ in server.requests) == [
+        "https://city.test/mayor.jpg",
+        "https://city.test/missing.jpg",
+    ]
+
+
+def test_prune_removes_only_unused_thumbnails(tmp_path: Path) -> None:
+    """Thumbnails of dropped portraits go; other files in the directory stay."""
+    server = FakeServer({URL: _image(800, 1000)})
+    pipeline = _pipeline(tmp_path, server)
+    assert pipeline.prune() == []
+
+    portrait = pipeline.localize(URL)
+    assert isinstance(portrait, Portrait)
+    stale = pipeline.output / "portrait-0123456789abcdef-140x175.jpg"
+    stale.write_bytes(b"old")
+    (pipeline.output / "README").write_text("kept", encoding="utf-8")
+
+    assert pipeline.prune() == [stale]
+    assert sorted(path.name for path in pipeline.output.iterdir()) == sorted(
+        ["README", Path(portrait.jpeg).name, Path(portrait.webp).name]
+    )
+
+
+class _Response:
+    """The parts of a requests response the downloader reads."""
+
+    def __init__(self, status_code: int, content: bytes, headers: dict[str, str]) -> None:
+        """Build the response.
+
+        Args:
+            status_code: HTTP status.
+            content: Body bytes.
+            headers: Response headers.
+        """
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+
+    def raise_for_status(self) -> None:
+        """Raise for an error status, as requests does.
+
+        Raises:
+            OSError: For a status of 400 or more.
+        """
+        if self.status_code >= 400:
+            raise OSError(self.status_code)
+
+
+class _Session:
+    """Answers every request with the next queued response."""
+
+    def __init__(self, *responses: _Response) -> None:
+        """Queue the responses.
+
+        Args:
+            responses: Responses to return, in order.
+        """
+        self.responses = list(responses)
+
+    def get(self, url: str, headers: dict[str, str], timeout: float) -> _Response:
+        """Return the next response.
+
+        Args:
+            url: URL requested.
+            headers: Request headers.
+            timeout: Seconds to wait.
+
+        Returns:
+            The response.
+        """
+        return self.responses.pop(0)
+
+
+def test_session_downloader_reads_responses() -> None:
+    """Bodies and validators are read; a 304 has no body and errors raise."""
+    session = _Session(
+        _Response(200, b"img", {"ETag": '"v1"'}),
+        _Response(304, b"", {"ETag": '"v1"'}),
+        _Response(404, b"", {}),
+    )
+    download = session_downloader(session)
+
+    assert download(URL, {}) == Download(status=200, body=b"img", etag='"v1"', last_modified="")
+    assert download(URL, {}) == Download(status=304, body=b"", etag='"v1"', last_modified="")
+    with pytest.raises(OSError):
+        download(URL, {})
+
+
+def test_host_downloader_sends_each_portrait_over_its_hosts_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Each host gets its own shared session, sized for the downloads made at once."""
+    sessions = {
+        ("city.test", 3): _Session(_Response(200, b"a", {})),
+        ("other.test", 3): _Session(_Response(200, b"b", {}), _Response(200, b"c", {})),
+    }
+    monkeypatch.setattr(
+        shared.utils.portraits, "host_session", lambda host, pool_size: sessions[host, pool_size]
+    )
+    download = host_downloader(pool_size=3)
+
+    assert download(URL, {}).body == b"a"
+    assert download("https://other.test/vice-mayor.jpg", {}).body == b"b"
+    assert download("//other.test/member.jpg", {}).body == b"c"
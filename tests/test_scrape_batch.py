@@ -0,0 +1,250 @@
+"""Tests for the multi-city scrape orchestrator.
+
+The scrapers are fakes that record how many of them run at once per host, so
+these check the caps, the isolation of failures and the snapshot without any
+network.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from shared.scrapers.base import BaseScraper, Meeting
+from shared.scrapers.batch import (
+    CityScrape,
+    ScrapeJob,
+    ScraperFactory,
+    default_factory,
+    describe,
+    interleave_by_host,
+    load_city_configs,
+    scrape_cities,
+    scraping_config,
+    write_snapshot,
+)
+
+
+class _Tracker:
+    """Counts fake scrapes running at once, per host and overall."""
+
+    def __init__(self) -> None:
+        """Start with nothing running."""
+        self.lock = threading.Lock()
+        self.running: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.total = 0
+        self.peak_total = 0
+
+    def enter(self, host: str) -> None:
+        """Record a scrape starting.
+
+        Args:
+            host: Host it reads.
+        """
+        with self.lock:
+            self.running[host] = self.running.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.running[host])
+            self.total += 1
+            self.peak_total = max(self.peak_total, self.total)
+
+    def leave(self, host: str) -> None:
+        """Record a scrape finishing.
+
+        Args:
+            host: Host it read.
+        """
+        with self.lock:
+            self.running[host] -= 1
+            self.total -= 1
+
+
+class _FakeScraper(BaseScraper):
+    """Reads one meeting named after its city, after a short pause, or fails if told to."""
+
+    tracker = _Tracker()
+
+    def __init__(self, config: dict[str, dict[str, object]], browser: object = None) -> None:
+        """Configure the scraper.
+
+        Args:
+            config: Scraper config.
+            browser: Shared browser, recorded.
+
+        Raises:
+            ValueError: For a city named "Broken Config".
+        """
+        super().__init__(config)
+        if self.city_name == "Broken Config":
+            raise ValueError("no view_id")
+        scraping = config["scraping"]
+        self.browser = browser
+        if "granicus" in scraping:
+            self.archive_url = f"https://{scraping['granicus']}.granicus.com/ViewPublisher.php"
+        else:
+            self.api_base = f"https://webapi.legistar.com/v1/{scraping['legistar']}"
+
+    def fetch_meetings(self) -> list[Meeting]:
+        """Read the city's one meeting.
+
+        Returns:
+            The meeting.
+
+        Raises:
+            RuntimeError: For a city named "Down".
+        """
+        host = "granicus" if hasattr(self, "archive_url") else "legistar"
+        self.tracker.enter(host)
+        try:
+            time.sleep(0.05)
+            if self.city_name == "Down":
+                raise RuntimeError("listing unreachable")
+            return [Meeting(name=f"{self.city_name} Council", date="January 13, 2026")]
+        finally:
+            self.tracker.leave(host)
+
+    def fetch_agenda_items(self, event_id: str) -> list[dict[str, str]]:
+        """Read no agenda items.
+
+        Args:
+            event_id: Meeting id.
+
+        Returns:
+            Nothing.
+        """
+        return []
+
+
+def _city(name: str, platform: str) -> dict[str, object]:
+    """A city config naming its platform.
+
+    Args:
+        name: City name.
+        platform: "granicus" or "legistar".
+
+    Returns:
+        The config.
+    """
+    return {"city_name": name, "scraping": {platform: name.lower().replace(" ", "")}}
+
+
+FACTORIES: dict[str, ScraperFactory] = {"granicus": _FakeScraper, "legistar": _FakeScraper}
+
+
+def test_platforms_are_read_from_portal_links() -> None:
+    """Cities without a scraping section are matched by their agenda or archive links."""
+    assert scraping_config({"portals": {"agendas": "https://costamesa.legistar.com/Calendar.aspx"}}) == {
+        "legistar": {"client_name": "costamesa"}
+    }
+    assert scraping_config(
+        {
+            "portals": {
+                "agendas": "https://city.example/agendas",
+                "document_center": "https://cityofrsm.granicus.com/Viewpublisher.php?view_id=2",
+            }
+        }
+    ) == {"granicus": {"subdomain": "cityofrsm", "view_id": 2}}
+    assert scraping_config({"scraping": {"granicus": {"mode": "browser"}}}) == {
+        "granicus": {"mode": "browser"}
+    }
+    assert (
+        scraping_config({"portals": {"agendas": "https://city.primegov.com/portal", "youtube": None}}) is None
+    )
+    assert scraping_config({}) is None
+
+
+def test_every_city_config_in_the_tree_reads() -> None:
+    """The curated city files load, and Granicus and Legistar cities are found among them."""
+    cities = load_city_configs()
+    platforms = {slug: scraping_config(city) for slug, city in cities.items()}
+
+    assert platforms["irvine"] == {"granicus": {"subdomain": "irvine", "view_id": 68}}
+    assert platforms["fullerton"] == {"legistar": {"client_name": "fullerton"}}
+    assert list(load_city_configs(slugs=["irvine"])) == ["irvine"]
+
+
+def test_cities_are_scraped_within_the_caps_and_failures_stay_local() -> None:
+    """No host sees more than its cap, and a failing city leaves the others' meetings intact."""
+    _FakeScraper.tracker = _Tracker()
+    cities = {f"g{index}": _city(f"G{index}", "granicus") for index in range(6)}
+    cities |= {f"l{index}": _city(f"L{index}", "legistar") for index in range(3)}
+    cities["down"] = _city("Down", "granicus")
+    cities["broken"] = _city("Broken Config", "legistar")
+    cities["none"] = {"city_name": "Nowhere", "portals": {}}
+
+    results = scrape_cities(cities, workers=4, per_host=2, browser="pool", factories=FACTORIES)
+    by_slug = {result.slug: result for result in results}
+
+    assert [result.slug for result in results] == sorted(cities)
+    assert _FakeScraper.tracker.peak == {"granicus": 2, "legistar": 2}
+    assert _FakeScraper.tracker.peak_total == 4
+    assert by_slug["g0"].meetings == [Meeting(name="G0 Council", date="January 13, 2026")]
+    assert by_slug["g0"].error is None and by_slug["g0"].seconds > 0
+    assert (by_slug["down"].meetings, by_slug["down"].error) == ([], "RuntimeError: listing unreachable")
+    assert (by_slug["broken"].platform, by_slug["broken"].error) == ("legistar", "ValueError: no view_id")
+    assert by_slug["none"] == CityScrape("none", "Nowhere", None, [], 0.0, None)
+
+
+def test_jobs_alternate_between_hosts() -> None:
+    """Workers are handed cities from each host in turn."""
+    scrapers = {
+        slug: _FakeScraper({"city": {"name": slug}, "scraping": {platform: slug}})
+        for slug, platform in [("a", "granicus"), ("b", "granicus"), ("c", "granicus"), ("d", "legistar")]
+    }
+    jobs = [ScrapeJob(slug, slug, "", scraper) for slug, scraper in scrapers.items()]
+
+    order = [job.slug for job in interleave_by_host(jobs)]
+
+    assert order == ["a", "d", "b", "c"]
+
+
+def test_default_factories_hand_the_browser_only_to_granicus() -> None:
+    """The package's scrapers are built from the config, Granicus with the shared browser."""
+    granicus = default_factory("granicus")(
+        {"city": {"name": "Irvine"}, "scraping": {"granicus": {"subdomain": "irvine", "view_id": 68}}}, None
+    )
+    legistar = default_factory("legistar")(
+        {"city": {"name": "Fullerton"}, "scraping": {"legistar": {"client_name": "fullerton"}}}, None
+    )
+
+    assert type(granicus).__name__ == "GranicusScraper"
+    assert type(legistar).__name__ == "LegistarClient"
+
+
+def test_snapshot_is_keyed_by_city_slug(tmp_path: Path) -> None:
+    """The snapshot carries every city's platform, timing, error and meetings."""
+    results = [
+        CityScrape(
+            "irvine", "Irvine", "granicus", [Meeting(name="Council", date="January 13, 2026")], 1.23456, None
+        ),
+        CityScrape("brea", "Brea", None, [], 0.0, None),
+        CityScrape("down", "Down", "granicus", [], 0.5, "RuntimeError: listing unreachable"),
+    ]
+    path = tmp_path / "out" / "meetings_snapshot.json"
+
+    write_snapshot(path, results, "2026-10-16T12:00:00+00:00")
+
+    snapshot = json.loads(path.read_text(encoding="utf-8"))
+    assert snapshot["generated_at"] == "2026-10-16T12:00:00+00:00"
+    assert snapshot["cities"]["irvine"] == {
+        "city_name": "Irvine",
+        "platform": "granicus",
+        "seconds": 1.235,
+        "error": None,
+        "meetings": [
+            {
+                "name": "Council",
+                "date": "January 13, 2026",
+                "agenda_url": None,
+                "minutes_url": None,
+                "video_url": None,
+                "event_id": None,
+            }
+        ],
+    }
+    assert list(path.parent.iterdir()) == [path]
+    assert describe(results).splitlines() == [
+        "irvine                   granicus     1.2s  1 meetings",
+        "down                     granicus     0.5s  failed: RuntimeError: listing unreachable",
+        "2 of 3 cities scraped, 1 failed",
+    ]
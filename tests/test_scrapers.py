@@ -0,0 +1,560 @@
+"""Tests for the scrapers: their lazily loaded exports, the Granicus readers and the browser pool."""
+
+import asyncio
+import subprocess
+import sys
+import threading
+from collections.abc import Awaitable, Callable, Coroutine
+from pathlib import Path
+from typing import TypeVar
+
+import pytest
+from shared.scrapers.browser_pool import BrowserError, BrowserPool
+from shared.scrapers.granicus import (
+    _ROWS_SCRIPT,
+    _TEXT_SCRIPT,
+    GranicusScraper,
+    PageLoad,
+    wait_until_stable,
+)
+
+T = TypeVar("T")
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_legistar_client_loads_without_the_granicus_scraper() -> None:
+    """Asking for one scraper does not import the others or their dependencies."""
+    statement = (
+        "import sys; from shared.scrapers import LegistarClient; "
+        "print(LegistarClient.__name__, 'shared.scrapers.granicus' in sys.modules, "
+        "'playwright' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", statement], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.split() == ["LegistarClient", "False", "False"]
+
+
+LISTING = """<html><body><table>
+<tr class="listingRow">
+  <td class="listItem">City Council Regular Meeting</td>
+  <td class="listItem">Jan&nbsp;13,&nbsp;2026</td>
+  <td><a href="//city.granicus.com/AgendaViewer.php?view_id=2&amp;clip_id=41">Agenda</a></td>
+  <td><a href="//city.granicus.com/MinutesViewer.php?view_id=2&amp;clip_id=41">Minutes</a></td>
+</tr>
+<tr class="listingRow">
+  <td class="listItem">City Council Special Meeting</td>
+  <td class="listItem">February 3, 2026</td>
+  <td><a href="//city.granicus.com/AgendaViewer.php?view_id=2&amp;event_id=77">Agenda</a></td>
+</tr>
+<tr class="listingRow">
+  <td class="listItem">Planning Commission</td>
+  <td class="listItem">Feb 4, 2026</td>
+  <td><a href="//city.granicus.com/AgendaViewer.php?view_id=2&amp;clip_id=42">Agenda</a></td>
+</tr>
+</table></body></html>"""
+
+AGENDA = """<html><head><script>var x = "9.9 Not an item";</script></head><body>
+<h2>3. CONSENT CALENDAR</h2>
+<p>3.1 Minutes of the January meeting</p>
+<p>3.2 Warrant register</p>
+<h2>PUBLIC HEARINGS</h2>
+<p>4.1 Zoning amendment</p>
+</body></html>"""
+
+
+class _Response:
+    """The parts of a requests response the Granicus scraper reads."""
+
+    def __init__(self, text: str, content_type: str = "text/html; charset=utf-8") -> None:
+        """Build the response.
+
+        Args:
+            text: Body.
+            content_type: Content-Type header.
+        """
+        self.text = text
+        self.headers = {"Content-Type": content_type}
+
+    def raise_for_status(self) -> None:
+        """Succeed, as requests does for a 200."""
+
+
+class _Session:
+    """Answers each URL with a fixed response and records what was asked for."""
+
+    def __init__(self, responses: dict[str, _Response]) -> None:
+        """Hold the responses.
+
+        Args:
+            responses: Response for each URL.
+        """
+        self.responses = responses
+        self.requested: list[str] = []
+
+    def get(self, url: str, timeout: float) -> _Response:
+        """Return the response for a URL.
+
+        Args:
+            url: URL requested.
+            timeout: Seconds to wait.
+
+        Returns:
+            The response.
+        """
+        self.requested.append(url)
+        return self.responses[url]
+
+
+def _scraper(session: _Session, browser: "_Pool | None" = None, mode: str = "http") -> GranicusScraper:
+    """Build a Granicus scraper for a test city.
+
+    Args:
+        session: Session it fetches with.
+        browser: Shared browser it is given, if any.
+        mode: How it reads the city's pages.
+
+    Returns:
+        The scraper.
+    """
+    config = {
+        "city": {"name": "Test City"},
+        "scraping": {"granicus": {"subdomain": "city", "view_id": 2, "mode": mode}},
+    }
+    return GranicusScraper(config, session=session, browser=browser)
+
+
+def test_granicus_listing_is_read_over_http() -> None:
+    """A server-rendered listing is read without a browser, newest first."""
+    session = _Session({"https://city.granicus.com/ViewPublisher.php?view_id=2": _Response(LISTING)})
+    scraper = _scraper(session)
+
+    meetings = [meeting.to_dict() for meeting in scraper.fetch_meetings()]
+
+    assert scraper.last_mode == "http"
+    assert meetings == [
+        {
+            "name": "City Council Special Meeting",
+            "date": "February 3, 2026",
+            "agenda_url": "https://city.granicus.com/AgendaViewer.php?view_id=2&event_id=77",
+            "minutes_url": None,
+            "video_url": None,
+            "event_id": "77",
+        },
+        {
+            "name": "City Council Regular Meeting",
+            "date": "January 13, 2026",
+            "agenda_url": "https://city.granicus.com/AgendaViewer.php?view_id=2&clip_id=41",
+            "minutes_url": "https://city.granicus.com/MinutesViewer.php?view_id=2&clip_id=41",
+            "video_url": "https://city.granicus.com/player/clip/41?view_id=2",
+            "event_id": None,
+        },
+    ]
+
+
+def test_granicus_agenda_items_are_read_over_http() -> None:
+    """Numbered items are read with their sections; scripts are not read."""
+    url = "https://city.granicus.com/AgendaViewer.php?view_id=2&event_id=77"
+    scraper = _scraper(_Session({url: _Response(AGENDA)}))
+
+    assert scraper.fetch_agenda_items("77") == [
+        {"number": "3.1", "title": "Minutes of the January meeting", "section": "3. CONSENT CALENDAR"},
+        {"number": "3.2", "title": "Warrant register", "section": "3. CONSENT CALENDAR"},
+        {"number": "4.1", "title": "Zoning amendment", "section": "PUBLIC HEARINGS"},
+    ]
+
+
+def test_granicus_browser_rows_read_as_the_http_listing_does() -> None:
+    """Rows read in the browser, as JSON arrays of innerText, give the same meetings."""
+    scraper = _scraper(_Session({}))
+    rows = [
+        [
+            ["City Council Regular Meeting", "Jan\xa013,\xa02026", "Agenda", "Minutes"],
+            "//city.granicus.com/AgendaViewer.php?view_id=2&clip_id=41",
+            "//city.granicus.com/MinutesViewer.php?view_id=2&clip_id=41",
+        ],
+        [
+            ["City Council Special Meeting", "February 3, 2026", "Agenda"],
+            "//city.granicus.com/AgendaViewer.php?view_id=2&event_id=77",
+            None,
+        ],
+        [["Planning Commission", "Feb 4, 2026", "Agenda"], "//city.granicus.com/AgendaViewer.php", None],
+    ]
+
+    assert scraper._meetings_from_rows(rows) == scraper.parse_listing(LISTING)
+
+
+class _LoadingPage:
+    """An async page whose measure takes each value in turn, one per check, on a fake clock."""
+
+    def __init__(self, sizes: list[int], answers: dict[str, object] | None = None) -> None:
+        """Queue the measures.
+
+        Args:
+            sizes: Value of the measure at each check; the last one holds.
+            answers: Fixed result of other scripts.
+        """
+        self.sizes = sizes
+        self.answers = answers or {}
+        self.now = 0.0
+        self.steps = 0
+        self.visited: list[str] = []
+
+    def clock(self) -> float:
+        """Read the fake clock.
+
+        Returns:
+            Seconds since the page opened.
+        """
+        return self.now
+
+    async def goto(self, url: str, wait_until: str) -> None:
+        """Open a URL.
+
+        Args:
+            url: URL to open.
+            wait_until: Load state to wait for.
+        """
+        self.visited.append(url)
+
+    async def evaluate(self, script: str) -> object:
+        """Run a script: a scroll counts a step, a known script gets its answer,
+        and anything else reads the measure.
+
+        Args:
+            script: Script to run.
+
+        Returns:
+            The script's result.
+        """
+        if script in self.answers:
+            return self.answers[script]
+        if "scroll" in script:
+            self.steps += 1
+            return None
+        return self.sizes.pop(0) if len(self.sizes) > 1 else self.sizes[0]
+
+    async def wait_for_timeout(self, milliseconds: int) -> None:
+        """Let time pass on the fake clock, and a little on the real one.
+
+        Args:
+            milliseconds: How long.
+        """
+        self.now += milliseconds / 1000
+        await asyncio.sleep(milliseconds / 1000 / 50)
+
+
+def test_scrolling_stops_once_rows_stop_arriving() -> None:
+    """A listing is scrolled only until a quiet period passes without new rows."""
+    page = _LoadingPage([10, 20, 30, 30])
+
+    load = asyncio.run(
+        wait_until_stable(page, "measure", step="scroll", poll_ms=250, quiet=1.0, clock=page.clock)
+    )
+
+    assert load == PageLoad(size=30, seconds=1.5, settled=True)
+    assert page.steps == 6
+
+
+def test_scrolling_gives_up_at_the_ceiling() -> None:
+    """A listing still growing at the ceiling is read as it stands, and says so."""
+    page = _LoadingPage(list(range(100)))
+
+    load = asyncio.run(
+        wait_until_stable(
+            page, "measure", step="scroll", poll_ms=500, quiet=1.0, ceiling=3.0, clock=page.clock
+        )
+    )
+
+    assert load == PageLoad(size=6, seconds=3.0, settled=False)
+
+
+class _Pool:
+    """Runs page tasks on one fake page, as BrowserPool.run does on fresh ones."""
+
+    def __init__(self, page: _LoadingPage, error: BrowserError | None = None) -> None:
+        """Hold the page.
+
+        Args:
+            page: Page every task gets.
+            error: Raised by every task instead of running it, if given.
+        """
+        self.page = page
+        self.error = error
+        self.tasks = 0
+
+    def run(self, task: Callable[[_LoadingPage], Awaitable[T]]) -> T:
+        """Run a task to completion.
+
+        Args:
+            task: Coroutine function taking a page.
+
+        Returns:
+            What the task returned.
+
+        Raises:
+            BrowserError: If the pool was given one to raise.
+        """
+        self.tasks += 1
+        if self.error is not None:
+            raise self.error
+
+        async def main() -> T:
+            return await task(self.page)
+
+        return asyncio.run(main())
+
+
+def test_browser_mode_reads_the_listing_through_the_shared_browser() -> None:
+    """A city set to the browser reads its listing on a page from the pool it was given."""
+    rows = [
+        [
+            ["City Council Special Meeting", "February 3, 2026"],
+            "//city.granicus.com/AgendaViewer.php?view_id=2&event_id=77",
+            None,
+        ]
+    ]
+    page = _LoadingPage([1], answers={_ROWS_SCRIPT: rows})
+    pool = _Pool(page)
+    session = _Session({})
+    scraper = _scraper(session, pool, mode="browser")
+
+    meetings = scraper.fetch_meetings()
+
+    assert [meeting.event_id for meeting in meetings] == ["77"]
+    assert scraper.last_mode == "browser"
+    assert scraper.last_load is not None and scraper.last_load.size == 1 and scraper.last_load.settled
+    assert (pool.tasks, page.visited, session.requested) == (
+        1,
+        ["https://city.granicus.com/ViewPublisher.php?view_id=2"],
+        [],
+    )
+
+
+AGENDA_URL = "https://city.granicus.com/AgendaViewer.php?view_id=2&event_id=77"
+
+
+def test_an_agenda_that_is_not_html_has_no_items() -> None:
+    """A PDF agenda is neither parsed nor opened in the browser."""
+    pool = _Pool(_LoadingPage([0]))
+    scraper = _scraper(_Session({AGENDA_URL: _Response("%PDF-1.7", "application/pdf")}), pool)
+
+    assert scraper.fetch_agenda_items("77") == []
+    assert pool.tasks == 0
+
+
+def test_an_agenda_without_items_is_opened_in_the_browser_only_if_filled_by_script() -> None:
+    """A static page with no items is taken at its word; a script shell is read in the browser."""
+    notice = "<html><body><p>" + "This meeting has been cancelled. " * 10 + "</p></body></html>"
+    shell = '<html><head><script src="agenda.js"></script></head><body><div id="app"></div></body></html>'
+    page = _LoadingPage([1], answers={_TEXT_SCRIPT: "3. CONSENT CALENDAR\n3.1 Warrant register"})
+    pool = _Pool(page)
+
+    static = _scraper(_Session({AGENDA_URL: _Response(notice)}), pool)
+    assert static.fetch_agenda_items("77") == []
+    assert pool.tasks == 0
+
+    scripted = _scraper(_Session({AGENDA_URL: _Response(shell)}), pool)
+    assert scripted.fetch_agenda_items("77") == [
+        {"number": "3.1", "title": "Warrant register", "section": "3. CONSENT CALENDAR"}
+    ]
+    assert (pool.tasks, page.visited) == (1, [AGENDA_URL])
+
+
+def test_browser_mode_reads_agendas_in_the_browser() -> None:
+    """A city set to the browser does not fetch its agendas over HTTP first."""
+    page = _LoadingPage([1], answers={_TEXT_SCRIPT: "4.1 Zoning amendment"})
+    session = _Session({})
+
+    items = _scraper(session, _Pool(page), mode="browser").fetch_agenda_items("77")
+
+    assert items == [{"number": "4.1", "title": "Zoning amendment", "section": None}]
+    assert session.requested == []
+
+
+def test_browser_failures_read_as_no_meetings_or_items() -> None:
+    """A page that times out in the browser costs that read, not the scrape."""
+    pool = _Pool(_LoadingPage([1]), error=BrowserError("Timeout 30000ms exceeded"))
+    scraper = _scraper(_Session({}), pool, mode="browser")
+
+    assert scraper.fetch_meetings() == []
+    assert scraper.fetch_agenda_items("77") == []
+    assert pool.tasks == 2
+
+
+class _Request:
+    """The request a route intercepts."""
+
+    def __init__(self, resource_type: str) -> None:
+        """Describe the request.
+
+        Args:
+            resource_type: Playwright resource type.
+        """
+        self.resource_type = resource_type
+
+
+class _Route:
+    """An intercepted request, recording whether it was let through."""
+
+    def __init__(self, resource_type: str) -> None:
+        """Intercept a request.
+
+        Args:
+            resource_type: Playwright resource type.
+        """
+        self.request = _Request(resource_type)
+        self.outcome = ""
+
+    async def abort(self) -> None:
+        """Drop the request."""
+        self.outcome = "aborted"
+
+    async def continue_(self) -> None:
+        """Let the request through."""
+        self.outcome = "continued"
+
+
+class _Context:
+    """A browser context recording its routes and whether it was closed."""
+
+    def __init__(self) -> None:
+        """Open the context."""
+        self.routes: list[str] = []
+        self.closed = False
+
+    async def route(self, pattern: str, handler: Callable[[_Route], Coroutine[object, object, None]]) -> None:
+        """Intercept requests.
+
+        Args:
+            pattern: URLs to intercept.
+            handler: What to do with each.
+        """
+        self.routes.append(pattern)
+
+    async def new_page(self) -> str:
+        """Open a page.
+
+        Returns:
+            A stand-in for the page.
+        """
+        return "page"
+
+    async def close(self) -> None:
+        """Close the context."""
+        self.closed = True
+
+
+class _Browser:
+    """A browser handing out contexts."""
+
+    def __init__(self) -> None:
+        """Launch the browser."""
+        self.contexts: list[_Context] = []
+
+    async def new_context(self) -> _Context:
+        """Open a context.
+
+        Returns:
+            The context.
+        """
+        self.contexts.append(_Context())
+        return self.contexts[-1]
+
+
+def test_browser_pool_gives_each_task_a_fresh_context() -> None:
+    """Every task gets its own intercepted context, closed after it even if the task fails."""
+    pool = BrowserPool(max_pages=2)
+    browser = _Browser()
+    pool._browser = browser
+
+    async def tasks() -> tuple[str | BaseException, str | BaseException]:
+        pool._pages = asyncio.Semaphore(pool.max_pages)
+
+        async def read(page: str) -> str:
+            return f"read {page}"
+
+        async def fail(page: str) -> str:
+            raise ValueError(page)
+
+        return await asyncio.gather(pool._run(read), pool._run(fail), return_exceptions=True)
+
+    first, second = asyncio.run(tasks())
+
+    assert first == "read page"
+    assert isinstance(second, ValueError)
+    assert [(context.routes, context.closed) for context in browser.contexts] == [(["**/*"], True)] * 2
+    assert pool.pages_opened == 2
+
+
+def test_browser_pool_raises_playwright_failures_as_browser_errors() -> None:
+    """A task that fails inside Playwright is reported as a BrowserError; other errors pass through."""
+    pool = BrowserPool()
+    pool._browser = _Browser()
+    pool._pages = asyncio.Semaphore(1)
+    # Stands in for Playwright's error type, which start() records.
+    pool._errors = (TimeoutError,)
+    pool._loop = asyncio.new_event_loop()
+    pool._thread = threading.Thread(target=pool._loop.run_forever, daemon=True)
+    pool._thread.start()
+
+    async def time_out(page: str) -> None:
+        raise TimeoutError("Timeout 30000ms exceeded")
+
+    async def fail(page: str) -> None:
+        raise ValueError(page)
+
+    try:
+        with pytest.raises(BrowserError, match="30000ms"):
+            pool.run(time_out)
+        with pytest.raises(ValueError):
+            pool.run(fail)
+    finally:
+        pool._stop_loop()
+
+
+def test_browser_pool_blocks_images_fonts_and_media() -> None:
+    """Requests for resources no scraper reads are aborted, and counted."""
+    pool = BrowserPool()
+    routes = [_Route(kind) for kind in ("document", "image", "font", "media", "xhr")]
+
+    async def route_all() -> None:
+        for route in routes:
+            await pool._route(route)
+
+    asyncio.run(route_all())
+
+    assert [route.outcome for route in routes] == ["continued", "aborted", "aborted", "aborted", "continued"]
+    assert pool.requests_blocked == 3
+
+
+def test_browser_pool_reports_the_launch_time_saved() -> None:
+    """Every page after the first would otherwise have launched a browser of its own."""
+    pool = BrowserPool()
+    pool.launch_seconds = 0.8
+    pool.pages_opened = 6
+
+    assert pool.saved_seconds == pytest.approx(4.0)
+    assert pool.describe() == (
+        "6 pages in one browser launched in 0.8s, saving about 4.0s of launches; "
+        "0 image, font and media requests blocked"
+    )
+
+
+def test_browser_pool_must_be_started_and_sized() -> None:
+    """A pool is only usable once started, and needs room for a page."""
+
+    async def read(page: object) -> None:
+        """Read nothing.
+
+        Args:
+            page: Page handed out.
+        """
+
+    with pytest.raises(RuntimeError):
+        BrowserPool().run(read)
+    with pytest.raises(ValueError):
+        BrowserPool(max_pages=0)
+    BrowserPool().close()